@@ -0,0 +1,229 @@
+"""
+엔드포인트 마이크로 벤치마크 (in-process ASGI)
+
+uvicorn 서버를 띄우지 않고 세 앱(app, app_basic_form, app_new_form)을 httpx.ASGITransport로
+같은 프로세스에서 호출합니다. 네트워크/서버 기동 시간 없이 핸들러 + DB 구간만 측정합니다.
+DB 연결은 환경변수(DB_HOST / DB_PORT / DB_USER / DB_PASSWORD)로 주입하며,
+기본값은 TEST/docker-compose.bench.yml 의 로컬 MySQL(127.0.0.1:3307) 입니다.
+
+결과를 JSON으로 저장해 두고 --compare 로 비교하면 p50이 --threshold 이상 느려진
+엔드포인트를 회귀로 표시하고 종료 코드 1을 반환합니다.
+
+사용법 (backend 폴더에서):
+    docker compose -f TEST/docker-compose.bench.yml up -d
+    python TEST/bench_asgi_endpoints.py --seed                      # app_new_form 데이터 생성 후 실행
+    python TEST/bench_asgi_endpoints.py --output bench/baseline.json
+    python TEST/bench_asgi_endpoints.py --compare bench/baseline.json --threshold 0.2
+    python TEST/bench_asgi_endpoints.py --app app_new_form --filter full_detail -n 500
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# 앱별 벤치마크 대상: (이름, method, path, 요청 옵션)
+# path의 {id}는 반복마다 1 ~ ID_RANGE 로 바뀜 (캐시 한 건만 측정하지 않도록)
+ID_RANGE = 5
+CASES = {
+    'app': [
+        ('customers', 'GET', '/api/customers', {}),
+        ('customer', 'GET', '/api/customers/{id}', {}),
+        ('products', 'GET', '/api/products', {}),
+        ('products_with_base', 'GET', '/api/products/list/with_base', {}),
+        ('purchases', 'GET', '/api/purchases', {}),
+        ('login_histories_by_cid', 'GET', '/api/login_histories', {'params': {'cid': 1}}),
+        ('login_summary', 'GET', '/api/login_histories/by_customer/{id}/summary', {}),
+    ],
+    'app_basic_form': [
+        ('customers', 'GET', '/api/customers', {}),
+        ('product_full_detail', 'GET', '/api/products/{id}/full_detail', {}),
+        ('product_bases_full_detail', 'GET', '/api/product_bases/full_detail', {}),
+        ('purchases_with_customer', 'GET', '/api/purchases/with_customer', {}),
+        ('purchase_items_by_pcid_full', 'GET', '/api/purchase_items/by_pcid/{id}/full_detail', {}),
+        ('purchase_summary', 'GET', '/api/purchase_items/summary/{id}', {}),
+    ],
+    'app_new_form': [
+        ('branches', 'GET', '/api/branches', {}),
+        ('kind_categories', 'GET', '/api/kind_categories', {}),
+        ('product', 'GET', '/api/products/{id}', {}),
+        ('product_full_detail', 'GET', '/api/products/products/{id}/full_detail', {}),
+        ('products_with_categories', 'GET', '/api/products/products/with_categories', {'params': {'maker_seq': 1}}),
+        ('products_by_category', 'GET', '/api/products/products/by_category', {'params': {'kind_seq': 1}}),
+        ('user_purchases', 'GET', '/api/purchase_items/purchase_items/by_user/{id}/with_details', {}),
+        ('user_orders', 'GET', '/api/purchase_items/purchase_items/by_user/{id}/orders', {}),
+        ('request_full_detail', 'GET', '/api/requests/requests/{id}/full_detail', {}),
+        ('user_login', 'POST', '/api/users/login', {'data': {'u_id': 'user00000001', 'u_password': 'pass1234'}}),
+    ],
+}
+
+ERROR_MARKER = b'"result":"Error"'
+
+
+def configure_db(args):
+    """앱 import 전에 DB 접속 정보를 환경변수로 주입 (각 app의 database/connection.py가 읽음)"""
+    os.environ['DB_HOST'] = args.db_host
+    os.environ['DB_PORT'] = str(args.db_port)
+    os.environ['DB_USER'] = args.db_user
+    os.environ['DB_PASSWORD'] = args.db_password
+
+
+def load_app(name: str):
+    module = __import__(f'{name}.main', fromlist=['app'])
+    return module.app
+
+
+def wait_for_db(timeout: float):
+    """DB가 접속 가능해질 때까지 대기 (고정 sleep 대신 준비 상태 확인)"""
+    from app_new_form.database.connection import connect_db
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connect_db().close()
+            return
+        except Exception as e:
+            if time.monotonic() > deadline:
+                raise SystemExit(f"❌ DB 접속 실패 ({os.environ['DB_HOST']}:{os.environ['DB_PORT']}): {e}")
+            time.sleep(1)
+
+
+def seed_new_form(scale: float):
+    """app_new_form 데이터 생성 (고정 seed/날짜 → 실행마다 같은 데이터)"""
+    print(f"🌱 shoes_shop_db 데이터 생성 (SF={scale})")
+    subprocess.run([
+        sys.executable, os.path.join(BACKEND_DIR, 'app_new_form', 'TEST', 'generate_scale_data.py'),
+        '--scale', str(scale), '--seed', '42', '--end', '2025-01-01',
+    ], check=True, cwd=BACKEND_DIR, env=os.environ)
+
+
+# ============================================
+# 측정
+# ============================================
+def percentile(sorted_values: list, p: float) -> float:
+    index = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return round(sorted_values[index], 3)
+
+
+async def bench_case(client: httpx.AsyncClient, case, iterations: int, warmup: int) -> dict:
+    _, method, path, options = case
+    times, errors = [], 0
+    for i in range(warmup + iterations):
+        url = path.format(id=i % ID_RANGE + 1)
+        started = time.perf_counter()
+        response = await client.request(method, url, **options)
+        elapsed = (time.perf_counter() - started) * 1000
+        if i < warmup:
+            continue
+        times.append(elapsed)
+        if response.status_code >= 400 or ERROR_MARKER in response.content[:64]:
+            errors += 1
+    times.sort()
+    return {
+        'iterations': iterations,
+        'errors': errors,
+        'p50_ms': percentile(times, 50),
+        'p95_ms': percentile(times, 95),
+        'p99_ms': percentile(times, 99),
+        'mean_ms': round(sum(times) / len(times), 3),
+        'ops_per_sec': round(1000 * len(times) / sum(times), 1),
+    }
+
+
+async def bench_app(name: str, cases, iterations: int, warmup: int) -> dict:
+    app = load_app(name)
+    results = {}
+    # lifespan 실행 (write-behind 버퍼 등 시작/종료 처리 포함)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            for case in cases:
+                results[case[0]] = await bench_case(client, case, iterations, warmup)
+                stats = results[case[0]]
+                print(f"   {case[0]:<30} p50 {stats['p50_ms']:8.3f}  p95 {stats['p95_ms']:8.3f}  "
+                      f"p99 {stats['p99_ms']:8.3f} ms  {stats['ops_per_sec']:9.1f} ops/s"
+                      + (f"  ❌ 에러 {stats['errors']}" if stats['errors'] else ''))
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """p50이 threshold 비율 이상 느려진 (앱, 엔드포인트) 목록"""
+    regressions = []
+    print(f"\n📈 이전 결과와 비교 (p50, 회귀 기준 +{threshold:.0%})")
+    for app_name, cases in results['apps'].items():
+        for case_name, stats in cases.items():
+            before = baseline.get('apps', {}).get(app_name, {}).get(case_name)
+            if not before:
+                continue
+            change = (stats['p50_ms'] - before['p50_ms']) / before['p50_ms']
+            regressed = change > threshold
+            if regressed:
+                regressions.append(f'{app_name}.{case_name}')
+            print(f"   {'❌' if regressed else '✅'} {app_name}.{case_name:<30} "
+                  f"{before['p50_ms']:8.3f} → {stats['p50_ms']:8.3f} ms ({change:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="in-process ASGI 엔드포인트 벤치마크")
+    parser.add_argument('--app', choices=list(CASES), action='append', help='대상 앱 (여러 번 지정 가능, 기본 전체)')
+    parser.add_argument('--filter', help='이름에 이 문자열이 포함된 케이스만 실행')
+    parser.add_argument('-n', '--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--db-host', default=os.environ.get('DB_HOST', '127.0.0.1'))
+    parser.add_argument('--db-port', type=int, default=int(os.environ.get('DB_PORT', 3307)))
+    parser.add_argument('--db-user', default=os.environ.get('DB_USER', 'root'))
+    parser.add_argument('--db-password', default=os.environ.get('DB_PASSWORD', 'bench'))
+    parser.add_argument('--wait', type=float, default=60, help='DB 준비 대기 최대 시간(초)')
+    parser.add_argument('--seed', action='store_true', help='실행 전 app_new_form 데이터 생성')
+    parser.add_argument('--scale', type=float, default=0.01, help='--seed 데이터 규모')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.2, help='회귀로 판단할 p50 증가 비율')
+    args = parser.parse_args()
+
+    configure_db(args)
+    wait_for_db(args.wait)
+    if args.seed:
+        seed_new_form(args.scale)
+
+    results = {
+        'meta': {
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'db': f'{args.db_host}:{args.db_port}',
+            'iterations': args.iterations,
+            'python': sys.version.split()[0],
+        },
+        'apps': {},
+    }
+    for app_name in args.app or list(CASES):
+        cases = [case for case in CASES[app_name] if not args.filter or args.filter in case[0]]
+        if not cases:
+            continue
+        print(f"\n🧪 {app_name} ({len(cases)}개, {args.iterations}회)")
+        results['apps'][app_name] = asyncio.run(bench_app(app_name, cases, args.iterations, args.warmup))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n❌ 회귀 {len(regressions)}건: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
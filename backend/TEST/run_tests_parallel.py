@@ -0,0 +1,290 @@
+"""
+전체 테스트 병렬 실행 (app_new_form / app_basic_form)
+
+각 앱의 TEST/run_all_tests.py 는 파일마다 서버 실행 → 대기 → 테스트 → 종료를 순서대로 반복합니다.
+이 스크립트는 같은 테스트(TEST_FILES)를 워커 프로세스 여러 개에서 동시에 실행합니다.
+  - 서버: 워커 안에서 uvicorn을 스레드로 실행 (파이썬 재시작/고정 sleep 없음, 미리 바인딩한 임시 포트 사용)
+  - 준비 확인: uvicorn started 플래그 + HTTP 응답 확인 (고정 sleep 없음)
+  - DB 격리: 워커마다 원본 DB를 복사한 스키마(<DB이름>_w<pid>)를 만들어 사용, 종료 후 삭제
+    (CREATE TABLE ... LIKE 로 복사하므로 외래키 제약은 복사되지 않음)
+워커 수(--workers, 기본 CPU 수)를 늘리면 전체 실행 시간이 줄어듭니다.
+
+DB 접속 정보는 각 앱의 database/connection.py 와 같은 설정(환경변수 / config/db.<DB_PROFILE>.env)을 사용하며,
+스키마 생성/삭제 권한이 필요합니다. 권한이 없으면 --shared-db 로 원본 DB를 함께 사용하세요.
+
+사용법 (backend 폴더에서):
+    python TEST/run_tests_parallel.py
+    python TEST/run_tests_parallel.py --workers 4 --app app_new_form
+    python TEST/run_tests_parallel.py --filter product
+    python TEST/run_tests_parallel.py --shared-db          # 스키마 복사 없이 원본 DB 사용
+    python TEST/run_tests_parallel.py --keep-schemas       # 실패 분석용으로 워커 스키마 유지
+"""
+
+import argparse
+import contextlib
+import importlib
+import importlib.util
+import io
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import httpx
+import pymysql
+import uvicorn
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+APPS = ['app_new_form', 'app_basic_form']
+
+# 워커 프로세스 안에서 재사용 (앱별 테스트 모듈 / 앱별 복사 스키마)
+_test_modules = {}
+_schemas = {}
+
+
+# ============================================
+# DB 스키마 복사
+# ============================================
+def db_config(app_name: str) -> dict:
+    """앱의 database/connection.py 설정 (환경변수 반영)"""
+    return dict(importlib.import_module(f'{app_name}.database.connection').DB_CONFIG)
+
+
+def admin_connect(config: dict):
+    return pymysql.connect(host=config['host'], port=config['port'], user=config['user'],
+                           password=config['password'], charset=config['charset'])
+
+
+def clone_schema(config: dict, target: str):
+    """원본 DB의 테이블 구조와 데이터를 target 스키마로 복사"""
+    source = config['database']
+    conn = admin_connect(config)
+    try:
+        curs = conn.cursor()
+        curs.execute("""
+            SELECT TABLE_NAME FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = %s AND TABLE_TYPE = 'BASE TABLE'
+        """, (source,))
+        tables = [row[0] for row in curs.fetchall()]
+        curs.execute(f"DROP DATABASE IF EXISTS `{target}`")
+        curs.execute(f"CREATE DATABASE `{target}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci")
+        curs.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for table in tables:
+            curs.execute(f"CREATE TABLE `{target}`.`{table}` LIKE `{source}`.`{table}`")
+            curs.execute(f"INSERT INTO `{target}`.`{table}` SELECT * FROM `{source}`.`{table}`")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def drop_schemas(schemas):
+    """워커가 만든 스키마 삭제 (앱별 접속 정보 사용)"""
+    for app_name, schema in sorted(schemas):
+        conn = admin_connect(db_config(app_name))
+        try:
+            conn.cursor().execute(f"DROP DATABASE IF EXISTS `{schema}`")
+        finally:
+            conn.close()
+
+
+def worker_schema(app_name: str, shared_db: bool) -> str:
+    """이 워커가 사용할 스키마 (앱별로 처음 한 번만 복사)"""
+    if shared_db:
+        return db_config(app_name)['database']
+    if app_name not in _schemas:
+        config = db_config(app_name)
+        schema = f"{config['database']}_w{os.getpid()}"
+        clone_schema(config, schema)
+        _schemas[app_name] = schema
+    return _schemas[app_name]
+
+
+# ============================================
+# 서버 (워커 안에서 스레드로 실행)
+# ============================================
+def load_server_app(app_name: str, filename: str, schema: str):
+    """앱 폴더의 단독 서버 파일(branch.py 등)을 import 해서 FastAPI app 반환"""
+    app_dir = os.path.join(BACKEND_DIR, app_name)
+    # 서버 파일은 'from database.connection import connect_db' 로 앱 폴더 기준 import
+    # → 다른 앱의 database 모듈이 남아 있지 않도록 정리하고, DB_NAME 을 바꾼 뒤 다시 import
+    previous = sys.modules.get('database.connection')
+    if previous is not None:
+        previous.primary_pool.clear()
+    for name in [name for name in sys.modules if name == 'database' or name.startswith('database.')]:
+        del sys.modules[name]
+    # DB_NAME 은 import 하는 동안만 바꿈 (다른 앱 설정을 읽을 때 영향 없도록)
+    saved_db_name = os.environ.get('DB_NAME')
+    os.environ['DB_NAME'] = schema
+    sys.path.insert(0, app_dir)
+    try:
+        spec = importlib.util.spec_from_file_location(f'{app_name}_{filename[:-3]}_server', os.path.join(app_dir, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(app_dir)
+        if saved_db_name is None:
+            os.environ.pop('DB_NAME', None)
+        else:
+            os.environ['DB_NAME'] = saved_db_name
+    return module.app
+
+
+@contextlib.contextmanager
+def serve(app, timeout: float = 10):
+    """임시 포트에 uvicorn 실행 → 준비되면 base_url 반환, 끝나면 종료"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(('127.0.0.1', 0))
+    base_url = f'http://127.0.0.1:{sock.getsockname()[1]}'
+    server = uvicorn.Server(uvicorn.Config(app, log_level='warning', access_log=False))
+    thread = threading.Thread(target=server.run, kwargs={'sockets': [sock]}, daemon=True)
+    thread.start()
+    try:
+        wait_until_ready(server, thread, base_url, timeout)
+        yield base_url
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+        sock.close()
+
+
+def wait_until_ready(server, thread, base_url: str, timeout: float):
+    deadline = time.monotonic() + timeout
+    while not server.started:
+        if not thread.is_alive():
+            raise RuntimeError('서버 시작 실패')
+        if time.monotonic() > deadline:
+            raise RuntimeError(f'서버 준비 시간 초과 ({timeout}초)')
+        time.sleep(0.01)
+    # 라우팅까지 응답하는지 확인 (404도 응답으로 간주)
+    while True:
+        try:
+            httpx.get(base_url, timeout=1)
+            return
+        except httpx.TransportError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f'서버 응답 없음 ({timeout}초)')
+            time.sleep(0.01)
+
+
+# ============================================
+# 테스트 실행 (워커)
+# ============================================
+def load_test_module(app_name: str):
+    """앱의 TEST/run_all_tests.py (TEST_FILES, 테스트 함수, BASE_URL)"""
+    if app_name not in _test_modules:
+        path = os.path.join(BACKEND_DIR, app_name, 'TEST', 'run_all_tests.py')
+        spec = importlib.util.spec_from_file_location(f'{app_name}_run_all_tests', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _test_modules[app_name] = module
+    return _test_modules[app_name]
+
+
+def run_suite(app_name: str, filename: str, shared_db: bool) -> dict:
+    """서버 파일 하나의 테스트 실행 → 결과 + 출력 + 소요 시간"""
+    started = time.perf_counter()
+    output = io.StringIO()
+    schema = None
+    try:
+        schema = worker_schema(app_name, shared_db)
+        module = load_test_module(app_name)
+        test_func = dict(module.TEST_FILES)[filename]
+        with serve(load_server_app(app_name, filename, schema)) as base_url:
+            # 테스트 함수의 api_get 등은 모듈 전역 BASE_URL 을 사용
+            module.BASE_URL = base_url
+            with contextlib.redirect_stdout(output):
+                results = test_func()
+    except Exception as e:
+        output.write(f'   ❌ 실행 실패: {e}\n')
+        results = {'passed': 0, 'failed': 1, 'tests': [{'name': '실행', 'success': False}]}
+    return {
+        'app': app_name,
+        'file': filename,
+        'passed': results['passed'],
+        'failed': results['failed'],
+        'output': output.getvalue(),
+        'seconds': time.perf_counter() - started,
+        'schema': None if shared_db else schema,
+        'pid': os.getpid(),
+    }
+
+
+# ============================================
+# 메인 실행
+# ============================================
+def collect_jobs(apps, keyword):
+    jobs = []
+    for app_name in apps:
+        for filename, _ in load_test_module(app_name).TEST_FILES:
+            if not keyword or keyword in filename:
+                jobs.append((app_name, filename))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="app_new_form / app_basic_form 테스트 병렬 실행")
+    parser.add_argument('--app', choices=APPS, action='append', help='대상 앱 (여러 번 지정 가능, 기본 전체)')
+    parser.add_argument('--filter', help='파일 이름에 이 문자열이 포함된 테스트만 실행')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='동시에 실행할 워커 프로세스 수')
+    parser.add_argument('--shared-db', action='store_true', help='워커별 스키마 복사 없이 원본 DB 사용')
+    parser.add_argument('--keep-schemas', action='store_true', help='종료 후 워커 스키마 삭제하지 않음')
+    args = parser.parse_args()
+
+    jobs = collect_jobs(args.app or APPS, args.filter)
+    if not jobs:
+        print('ℹ️  실행할 테스트가 없습니다.')
+        return
+    workers = max(1, min(args.workers, len(jobs)))
+    print('=' * 60)
+    print(f'🚀 테스트 병렬 실행 ({len(jobs)}개 파일, 워커 {workers}개, '
+          f"{'원본 DB 공유' if args.shared_db else '워커별 스키마'})")
+    print('=' * 60)
+
+    started = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_suite, app_name, filename, args.shared_db) for app_name, filename in jobs]
+        # 끝난 순서대로 출력 (워커 출력이 섞이지 않도록 파일 단위로 모아서 출력)
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"\n📂 {result['app']}/{result['file']} ({result['seconds']:.1f}초, pid {result['pid']})")
+            print(result['output'], end='')
+    wall = time.perf_counter() - started
+
+    schemas = {(r['app'], r['schema']) for r in results if r['schema']}
+    if schemas and not args.keep_schemas:
+        try:
+            drop_schemas(schemas)
+        except Exception as e:
+            print(f"\n⚠️ 워커 스키마 삭제 실패: {e}")
+
+    # 최종 결과
+    total_passed = sum(r['passed'] for r in results)
+    total_failed = sum(r['failed'] for r in results)
+    serial = sum(r['seconds'] for r in results)
+    print("\n" + "=" * 60)
+    print("📊 전체 테스트 결과")
+    print("=" * 60)
+    for r in sorted(results, key=lambda r: (r['app'], r['file'])):
+        icon = '✅' if r['failed'] == 0 else '⚠️'
+        print(f"   {icon} {r['app']}/{r['file']}: {r['passed']}개 성공, {r['failed']}개 실패 ({r['seconds']:.1f}초)")
+    total = total_passed + total_failed
+    print('\n' + '-' * 60)
+    print(f"✅ 성공: {total_passed}개")
+    print(f"❌ 실패: {total_failed}개")
+    if total > 0:
+        print(f"📈 성공률: {total_passed / total * 100:.1f}%")
+    print(f"⏱️  소요 시간: {wall:.1f}초 (파일별 합계 {serial:.1f}초, {serial / wall:.1f}배)")
+    if schemas and args.keep_schemas:
+        print(f"🗄️  유지된 스키마: {', '.join(sorted(schema for _, schema in schemas))}")
+    sys.exit(1 if total_failed else 0)
+
+
+if __name__ == "__main__":
+    main()
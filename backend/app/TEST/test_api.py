@@ -463,16 +463,30 @@ def test_filter_and_patch_apis():
         except Exception as e:
             print_test('LoginHistory 시간 PATCH', False, str(e))
     
-    # 5. 업데이트 확인
-    if login_id:
+    # 5. 업데이트 확인 (PATCH 는 이력 행이 아니라 LoginSummary 를 갱신)
+    if cust_id:
         try:
-            result = api_get(f'/login_histories/{login_id}')
-            login = result.get('result', {})
-            success = login.get('lStatus') == 'logged_out'
-            print_test('PATCH 결과 확인', success, f"상태: {login.get('lStatus')}")
+            result = api_get(f'/login_histories/by_customer/{cust_id}/summary')
+            summary = result.get('result', {})
+            success = (
+                summary.get('lStatus') == 'logged_out'
+                and summary.get('lastLoginTime') == '2025-12-25 15:00'
+            )
+            print_test('PATCH 결과 확인', success, f"상태: {summary.get('lStatus')}, 시간: {summary.get('lastLoginTime')}")
         except Exception as e:
             print_test('PATCH 결과 확인', False, str(e))
     
+    # 6. 이전 시간으로 PATCH 하면 최신 로그인 시간이 뒤로 가지 않음
+    if cust_id:
+        try:
+            api_patch(f'/login_histories/by_customer/{cust_id}/login_time?login_time=2025-12-24 09:00')
+            result = api_get(f'/login_histories/by_customer/{cust_id}/summary')
+            last_login = result.get('result', {}).get('lastLoginTime')
+            success = last_login == '2025-12-25 15:00'
+            print_test('이전 시간 PATCH 무시', success, f"시간: {last_login}")
+        except Exception as e:
+            print_test('이전 시간 PATCH 무시', False, str(e))
+    
     # ---- 정리: 테스트 데이터 삭제 ----
     print('\n   --- 테스트 데이터 정리 ---')
     
@@ -541,7 +555,23 @@ def test_signup_and_login():
         print_test('로그인 이력 생성 (POST)', success, f"ID: {login_id}")
     except Exception as e:
         print_test('로그인 이력 생성 (POST)', False, str(e))
-    
+
+    # 2-1. queued=true: 큐에 넣고 바로 응답 (id 없음)
+    try:
+        result = api_post('/login_histories?queued=true', login_data)
+        success = result.get('result') == 'OK' and result.get('queued') is True and 'id' not in result
+        print_test('로그인 이력 생성 (POST queued)', success, str(result) if not success else '')
+    except Exception as e:
+        print_test('로그인 이력 생성 (POST queued)', False, str(e))
+
+    # 2-2. queued=true 에서 없는 고객 ID는 큐에 넣기 전에 거부 (write-behind 에서 FK 오류로 버려지지 않도록)
+    try:
+        result = api_post('/login_histories?queued=true', {**login_data, 'cid': 999999999})
+        success = result.get('result') == 'Error' and result.get('message') == 'Customer not found'
+        print_test('없는 고객 로그인 이력 거부', success, str(result) if not success else '')
+    except Exception as e:
+        print_test('없는 고객 로그인 이력 거부', False, str(e))
+
     # 3. 고객 정보 수정 (Customer PUT)
     rand_num2 = random.randint(10000, 99999)
     update_customer = {
@@ -3,10 +3,14 @@ LoginHistory API
 RESTful 기본 CRUD
 """
 
+import os
 from fastapi import APIRouter, Query
 from typing import Optional
+from starlette.concurrency import run_in_threadpool
 from app.models.all_models import LoginHistory
 from app.database.connection import connect_db
+from common.cache import TTLCache
+from common.write_behind import WriteBehindBuffer
 
 router = APIRouter()
 
@@ -61,19 +65,94 @@ async def get_login_histories(
         conn.close()
 
 
+# ============================================
+# 고객별 최신 로그인 상태 (LoginSummary)
+# LoginHistory는 추가만 하는 이력, 고객의 "현재" 상태는 고객당 1행인 LoginSummary에 저장
+# ============================================
+SUMMARY_UPSERT_SQL = """
+INSERT INTO LoginSummary 
+(cid, lastLoginTime, lStatus, lVersion, lAddress, lPaymentMethod, loginCount)
+VALUES (%s, %s, %s, %s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    lStatus = IF(VALUES(lastLoginTime) >= IFNULL(lastLoginTime, ''), VALUES(lStatus), lStatus),
+    lVersion = IF(VALUES(lastLoginTime) >= IFNULL(lastLoginTime, ''), VALUES(lVersion), lVersion),
+    lAddress = IF(VALUES(lastLoginTime) >= IFNULL(lastLoginTime, ''), VALUES(lAddress), lAddress),
+    lPaymentMethod = IF(VALUES(lastLoginTime) >= IFNULL(lastLoginTime, ''), VALUES(lPaymentMethod), lPaymentMethod),
+    lastLoginTime = GREATEST(IFNULL(lastLoginTime, ''), IFNULL(VALUES(lastLoginTime), '')),
+    loginCount = loginCount + VALUES(loginCount)
+"""
+
+
+def upsert_login_summary(curs, rows):
+    """
+    새 로그인 이력 rows(cid, loginTime, lStatus, lVersion, lAddress, lPaymentMethod)를 LoginSummary에 반영
+    고객별로 가장 최근 행 + 건수로 묶어서 고객당 1행만 upsert (이력 INSERT와 같은 트랜잭션에서 호출)
+    """
+    latest = {}
+    for row in rows:
+        cid = row[0]
+        current = latest.get(cid)
+        if current is None:
+            latest[cid] = [row, 1]
+        else:
+            if (row[1] or '') >= (current[0][1] or ''):
+                current[0] = row
+            current[1] += 1
+    curs.executemany(SUMMARY_UPSERT_SQL, [tuple(row) + (count,) for row, count in latest.values()])
+
+
 # ============================================
 # 부분 업데이트 API (고객 ID 기준) - /{login_history_id} 보다 먼저 정의해야 함
+# 이력 전체를 UPDATE하지 않고 LoginSummary 1행만 갱신 (고객당 O(1))
 # ============================================
 
+@router.get("/by_customer/{cid}/summary")
+async def get_login_summary_by_customer_id(cid: int):
+    """고객 ID로 최신 로그인 상태 조회"""
+    conn = connect_db()
+    curs = conn.cursor()
+    
+    try:
+        sql = """
+        SELECT cid, lastLoginTime, lStatus, lVersion, lAddress, lPaymentMethod, loginCount, updatedAt 
+        FROM LoginSummary WHERE cid = %s
+        """
+        curs.execute(sql, (cid,))
+        row = curs.fetchone()
+        
+        if row is None:
+            return {'result': 'Error', 'message': 'LoginSummary not found'}
+        
+        result = {
+            'cid': row[0],
+            'lastLoginTime': row[1],
+            'lStatus': row[2],
+            'lVersion': row[3],
+            'lAddress': row[4],
+            'lPaymentMethod': row[5],
+            'loginCount': row[6],
+            'updatedAt': row[7]
+        }
+        
+        return {'result': result}
+    except Exception as e:
+        return {'result': 'Error', 'message': str(e)}
+    finally:
+        conn.close()
+
+
 @router.patch("/by_customer/{cid}/status")
 async def update_status_by_customer_id(cid: int, status: str = Query(..., description="새로운 상태 값")):
-    """고객 ID로 로그인 이력 상태 업데이트"""
+    """고객 ID로 최신 로그인 상태 업데이트 (LoginSummary 만 변경, LoginHistory 이력 행은 그대로)"""
     conn = connect_db()
     curs = conn.cursor()
     
     try:
-        sql = "UPDATE LoginHistory SET lStatus = %s WHERE cid = %s"
-        curs.execute(sql, (status, cid))
+        sql = """
+        INSERT INTO LoginSummary (cid, lStatus) VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE lStatus = VALUES(lStatus)
+        """
+        curs.execute(sql, (cid, status))
         conn.commit()
         affected_rows = curs.rowcount
         return {"result": "OK", "affected_rows": affected_rows}
@@ -85,13 +164,19 @@ async def update_status_by_customer_id(cid: int, status: str = Query(..., descri
 
 @router.patch("/by_customer/{cid}/login_time")
 async def update_login_time_by_customer_id(cid: int, login_time: str = Query(..., description="새로운 로그인 시간")):
-    """고객 ID로 로그인 시간 업데이트"""
+    """
+    고객 ID로 최신 로그인 시간 업데이트
+    SUMMARY_UPSERT_SQL / backfill 과 같이 GREATEST 로 갱신 → 지금보다 이전 시간이면 변경 없음 (affected_rows 0)
+    """
     conn = connect_db()
     curs = conn.cursor()
     
     try:
-        sql = "UPDATE LoginHistory SET loginTime = %s WHERE cid = %s"
-        curs.execute(sql, (login_time, cid))
+        sql = """
+        INSERT INTO LoginSummary (cid, lastLoginTime) VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE lastLoginTime = GREATEST(IFNULL(lastLoginTime, ''), VALUES(lastLoginTime))
+        """
+        curs.execute(sql, (cid, login_time))
         conn.commit()
         affected_rows = curs.rowcount
         return {"result": "OK", "affected_rows": affected_rows}
@@ -135,31 +220,90 @@ async def get_login_history(login_history_id: int):
         conn.close()
 
 
+# ============================================
+# 로그인 이력 생성 (기본: 바로 INSERT 후 id 반환 / queued=true: write-behind)
+# queued=true 면 INSERT + commit 을 기다리지 않도록 큐에 넣고 바로 응답 (id 없음),
+# 백그라운드에서 모아서 multi-row INSERT + LoginSummary 갱신 (app/main.py lifespan에서 start/stop)
+# ============================================
+login_history_writer = WriteBehindBuffer(
+    """
+    INSERT INTO LoginHistory 
+    (cid, loginTime, lStatus, lVersion, lAddress, lPaymentMethod)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    """,
+    connect_db,
+    max_queue=10000,
+    batch_size=500,
+    flush_interval=0.5,
+    on_flush=upsert_login_summary,
+    spill_path=os.environ.get(
+        'LOGIN_HISTORY_SPILL',
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'spill', 'login_history.jsonl')
+    ),
+)
+
+
+# 큐에 넣은 뒤에는 FK 오류를 응답으로 돌려줄 수 없으므로 cid 는 submit 전에 확인
+# (있는 고객만 캐시, 확인 후 삭제된 고객의 이력은 write-behind 에서 dead-letter 로 기록됨)
+known_customers = TTLCache(max_entries=10000, ttl=600)
+
+
+def customer_exists(cid: int) -> bool:
+    hit, _ = known_customers.get(cid)
+    if hit:
+        return True
+    conn = connect_db()
+    try:
+        curs = conn.cursor()
+        curs.execute("SELECT 1 FROM Customer WHERE id = %s", (cid,))
+        found = curs.fetchone() is not None
+    finally:
+        conn.close()
+    if found:
+        known_customers.set(cid, True)
+    return found
+
+
 @router.post("")
-async def create_login_history(login_history: LoginHistory):
+async def create_login_history(
+    login_history: LoginHistory,
+    queued: bool = Query(False, description="true면 큐에 넣고 바로 응답 (write-behind, id 없음)")
+):
     """로그인 이력 생성"""
+    if login_history.cid is None:
+        return {"result": "Error", "message": "cid is required"}
+    
+    row = (
+        login_history.cid,
+        login_history.loginTime,
+        login_history.lStatus,
+        login_history.lVersion,
+        login_history.lAddress,
+        login_history.lPaymentMethod
+    )
+    
+    if queued:
+        try:
+            if not await run_in_threadpool(customer_exists, login_history.cid):
+                return {"result": "Error", "message": "Customer not found"}
+            await login_history_writer.submit(row)
+            return {"result": "OK", "queued": True}
+        except Exception as e:
+            return {"result": "Error", "message": str(e)}
+    
     conn = connect_db()
     curs = conn.cursor()
     
     try:
-        if login_history.cid is None:
-            return {"result": "Error", "message": "cid is required"}
-        
         sql = """
         INSERT INTO LoginHistory 
         (cid, loginTime, lStatus, lVersion, lAddress, lPaymentMethod)
         VALUES (%s, %s, %s, %s, %s, %s)
         """
-        curs.execute(sql, (
-            login_history.cid,
-            login_history.loginTime,
-            login_history.lStatus,
-            login_history.lVersion,
-            login_history.lAddress,
-            login_history.lPaymentMethod
-        ))
-        conn.commit()
+        curs.execute(sql, row)
         inserted_id = curs.lastrowid
+        upsert_login_summary(curs, [row])
+        conn.commit()
         return {"result": "OK", "id": inserted_id}
     except Exception as e:
         return {"result": "Error", "message": str(e)}
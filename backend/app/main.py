@@ -3,8 +3,10 @@ FastAPI 메인 애플리케이션
 모든 모델의 CRUD API 제공
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.database.connection import connect_db
+from common.compression import add_compression
 
 # 라우터 import
 from app.api import customers
@@ -17,9 +19,21 @@ from app.api import purchases
 from app.api import purchase_items
 from app.api import login_histories
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 로그인 이력 write-behind 버퍼: 시작 시 spill 파일 재처리, 종료 시 남은 큐 flush
+    await login_histories.login_history_writer.start()
+    yield
+    await login_histories.login_history_writer.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 ip_address = '127.0.0.1'
 
+# 응답 압축 (gzip/br/zstd, 1KB 이상 JSON 응답)
+add_compression(app)
+
 # 모든 라우터 등록
 app.include_router(customers.router, prefix="/api/customers", tags=["customers"])
 app.include_router(employees.router, prefix="/api/employees", tags=["employees"])
@@ -52,6 +66,12 @@ async def root():
     }
 
 
+@app.get("/metrics/login_history_writer", tags=["metrics"])
+async def get_login_history_writer_metrics():
+    """로그인 이력 write-behind 큐 길이 / flush 지연 시간"""
+    return {"result": login_histories.login_history_writer.stats()}
+
+
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
@@ -82,7 +82,21 @@ def wait_for_server(timeout=10):
             httpx.get(BASE_URL, timeout=1)
             return True
         except:
-            time.sleep(0.5)
+            time.sleep(0.05)
+    return False
+
+
+def wait_for_port_release(timeout=5):
+    """이전 서버가 포트를 놓을 때까지 대기 (고정 sleep 대신 접속 거부 확인)"""
+    start = time.time()
+    while time.time() - start < timeout:
+        try:
+            httpx.get(BASE_URL, timeout=0.2)
+            time.sleep(0.05)
+        except httpx.ConnectError:
+            return True
+        except:
+            time.sleep(0.05)
     return False
 
 
@@ -116,7 +130,7 @@ def run_server_and_test(filename: str, test_func):
     except:
         proc.kill()
     
-    time.sleep(1)  # 포트 해제 대기
+    wait_for_port_release()
     
     return results
 
@@ -508,6 +522,24 @@ def test_purchase_items_join():
     return results
 
 
+# 테스트 대상: (서버 파일, 테스트 함수) - TEST/run_tests_parallel.py 에서도 사용
+TEST_FILES = [
+    ('customers.py', test_customers),
+    ('employees.py', test_employees),
+    ('manufacturers.py', test_manufacturers),
+    ('product_bases.py', test_product_bases),
+    ('product_images.py', test_product_images),
+    ('products.py', test_products),
+    ('purchases.py', test_purchases),
+    ('purchase_items.py', test_purchase_items),
+    ('login_histories.py', test_login_histories),
+    ('product_bases_join.py', test_product_bases_join),
+    ('products_join.py', test_products_join),
+    ('purchases_join.py', test_purchases_join),
+    ('purchase_items_join.py', test_purchase_items_join),
+]
+
+
 # ============================================
 # 메인 실행
 # ============================================
@@ -516,27 +548,10 @@ def main():
     print('\n   app_basic_form 전체 테스트')
     print('\n' + '🚀' * 20)
     
-    # 단일 CRUD 테스트
-    test_files = [
-        ('customers.py', test_customers),
-        ('employees.py', test_employees),
-        ('manufacturers.py', test_manufacturers),
-        ('product_bases.py', test_product_bases),
-        ('product_images.py', test_product_images),
-        ('products.py', test_products),
-        ('purchases.py', test_purchases),
-        ('purchase_items.py', test_purchase_items),
-        ('login_histories.py', test_login_histories),
-        ('product_bases_join.py', test_product_bases_join),
-        ('products_join.py', test_products_join),
-        ('purchases_join.py', test_purchases_join),
-        ('purchase_items_join.py', test_purchase_items_join),
-    ]
-    
     total_passed = 0
     total_failed = 0
     
-    for filename, test_func in test_files:
+    for filename, test_func in TEST_FILES:
         results = run_server_and_test(filename, test_func)
         all_results[filename] = results
         total_passed += results['passed']
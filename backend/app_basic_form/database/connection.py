@@ -3,35 +3,29 @@
 예제 코드 스타일로 간단하게 구현
 """
 
-import pymysql
+import os
+import sys
 
+# 단독 실행 파일(app_basic_form 폴더에서 python <파일>.py)에서도 common 패키지를 찾도록 backend 폴더 추가
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
 
-# 데이터베이스 설정 (나중에 환경변수로 변경)
-# DB_CONFIG = {
-#     'host': '127.0.0.1',
-#     'user': 'root',
-#     'password': 'qwer1234',  # 실제 사용 시 환경변수로 변경
-#     'database': 'shoes_store_db',  # 데이터베이스 이름 (init.sql에서 생성한 이름)
-#     'charset': 'utf8mb4'
-# }
+from common.db_config import make_pool
 
-DB_CONFIG = {
-    'host': 'cheng80.myqnapcloud.com',
-    'user': 'team0101',
-    'password': 'qwer1234',  # 실제 사용 시 환경변수로 변경
-    'database': 'shoes_store_db',  # 데이터베이스 이름 (init.sql에서 생성한 이름)
-    'charset': 'utf8mb4',
-    'port': 13306
-}
+
+# 접속 정보/풀 크기/타임아웃은 환경변수 또는 backend/config/db.<DB_PROFILE>.env 에서 읽음 (common/db_config.py 참고)
+primary_pool = make_pool('primary', default_database='shoes_store_db')
+
+# pymysql.connect 인자 (직접 연결하는 스크립트용)
+DB_CONFIG = primary_pool.config
 
 
 def connect_db():
     """
-    데이터베이스 연결
+    데이터베이스 연결 (primary 풀, conn.close() 하면 풀로 반납)
     
     Returns:
         pymysql.Connection: 데이터베이스 연결 객체
     """
-    conn = pymysql.connect(**DB_CONFIG)
-    return conn
-
+    return primary_pool.connect()
@@ -5,6 +5,7 @@ FastAPI 메인 애플리케이션 - Form 방식
 
 from fastapi import FastAPI
 from app_basic_form.database.connection import connect_db
+from common.compression import add_compression
 
 # 기본 라우터 import
 from app_basic_form.api import customers
@@ -26,6 +27,9 @@ from app_basic_form.api import purchase_items_join
 app = FastAPI(title="Shoes Store API - Form 방식")
 ip_address = '127.0.0.1'
 
+# 응답 압축 (gzip/br/zstd, 1KB 이상 JSON 응답)
+add_compression(app)
+
 # 기본 CRUD 라우터 등록
 app.include_router(customers.router, prefix="/api/customers", tags=["customers"])
 app.include_router(employees.router, prefix="/api/employees", tags=["employees"])
@@ -0,0 +1,88 @@
+"""
+로그인 비밀번호 검증 처리량 / 이벤트 루프 지연 벤치마크
+
+동시 로그인 N건을 처리할 때
+  1) async 핸들러 안에서 바로 verify_password() 호출 (이벤트 루프에서 KDF 계산)
+  2) verify_password_async() (common/credentials.py 전용 스레드풀 + 동시 실행 제한)
+두 방식의 로그인 처리량과, 같은 시간에 다른 요청이 겪는 이벤트 루프 지연(10ms 주기 heartbeat)을 비교합니다.
+DB 없이 검증 비용만 측정합니다.
+
+사용법 (backend 폴더에서):
+    python app_new_form/TEST/bench_password_login.py
+    python app_new_form/TEST/bench_password_login.py 200      # 동시 로그인 수
+    KDF_WORKERS=8 python app_new_form/TEST/bench_password_login.py
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from common import credentials
+from common.credentials import hash_password, verify_password, verify_password_async
+
+LOGIN_COUNT = 64
+HEARTBEAT_INTERVAL = 0.01
+PASSWORD = 'qwer1234!'
+
+
+async def heartbeat(lags: list, stop: asyncio.Event):
+    """다른 요청 역할: 10ms마다 깨어나서 예정보다 늦어진 시간 기록"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def login_inline(stored: str):
+    return verify_password(PASSWORD, stored)
+
+
+async def login_pool(stored: str):
+    return await verify_password_async(PASSWORD, stored)
+
+
+async def run(login, stored: str, count: int):
+    lags = []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(lags, stop))
+    await asyncio.sleep(HEARTBEAT_INTERVAL * 2)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[login(stored) for _ in range(count)])
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await beat
+    assert all(results)
+    return elapsed, lags
+
+
+def report(name: str, count: int, elapsed: float, lags: list):
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(f'   {name:<24} {count / elapsed:8.1f} 로그인/초   '
+          f'루프 지연 p50 {statistics.median(lags_ms):7.1f} ms   p99 {p99:7.1f} ms   max {lags_ms[-1]:7.1f} ms')
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else LOGIN_COUNT
+    stored = hash_password(PASSWORD)
+
+    print('=' * 60)
+    print(f'🧪 로그인 검증 벤치마크 (동시 {count}건, scrypt N=2^{credentials.LOG2_N}, r={credentials.R})')
+    print(f'   KDF 스레드: {credentials.KDF_WORKERS}, CPU: {os.cpu_count()}')
+    print('=' * 60)
+
+    elapsed, lags = asyncio.run(run(login_inline, stored, count))
+    report('이벤트 루프에서 직접', count, elapsed, lags)
+    elapsed, lags = asyncio.run(run(login_pool, stored, count))
+    report('KDF 스레드풀', count, elapsed, lags)
+
+
+if __name__ == "__main__":
+    main()
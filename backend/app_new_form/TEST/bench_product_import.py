@@ -0,0 +1,135 @@
+"""
+제품 카탈로그 일괄 등록(app_new_form/api/product_import.py) 처리량 벤치마크
+
+1) 기본: DB 없이 파일 읽기 + 청크 검증(이름 → seq 변환, 숫자 변환) 단계만 측정
+2) --db: 현재 DB 프로필(DB_PROFILE)의 product 테이블에 실제 upsert 까지 측정
+   (카테고리/제조사 이름은 DB 에서 읽은 값을 사용, 색상/사이즈/제조사 조합 수보다 행이 많으면
+    나머지 행은 중복 오류로 보고됨, 이미 있는 제품은 이름이 같으면 갱신 / 다르면 충돌 오류)
+   ⚠️ product 데이터가 바뀌므로 벤치마크용 DB(DB_PROFILE=bench)에서만 실행
+
+사용법 (backend 폴더에서):
+    python app_new_form/TEST/bench_product_import.py
+    python app_new_form/TEST/bench_product_import.py 100000 --chunk 2000
+    DB_PROFILE=bench python app_new_form/TEST/bench_product_import.py 100000 --db
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app_new_form.api.product_import import CHUNK_ROWS, NAME_COLUMNS, read_records, validate_chunk
+
+ROW_COUNT = 100_000
+ERROR_EVERY = 500  # N행마다 오류 행 1개 (없는 제조사 이름)
+KEY_COLUMNS = ('cc_name', 'sc_name', 'm_name')  # 제품 고유 조합 (uq_product_color_size_maker)
+
+# DB 없이 측정할 때 쓰는 이름 → seq (색상 40 x 사이즈 16 x 제조사 200 = 128,000 조합)
+SAMPLE_MAPS = {
+    'kc_name': {'러닝화': 1, '스니커즈': 2, '구두': 3, '샌들': 4, '부츠': 5},
+    'cc_name': {f'Color{seq}': seq for seq in range(1, 41)},
+    'sc_name': {str(size): seq for seq, size in enumerate(range(220, 300, 5), 1)},
+    'gc_name': {'남성': 1, '여성': 2, '공용': 3},
+    'm_name': {f'Maker{seq}': seq for seq in range(1, 201)},
+}
+
+
+def make_records(count: int, maps: dict):
+    names = {column: list(lookup) for column, lookup in maps.items()}
+    for i in range(count):
+        record = {column: values[i % len(values)] for column, values in names.items()}
+        # 색상/사이즈/제조사 조합이 행마다 다르도록 (조합 수를 넘으면 중복 오류)
+        rest = i
+        for column in KEY_COLUMNS:
+            values = names[column]
+            record[column] = values[rest % len(values)]
+            rest //= len(values)
+        if i % ERROR_EVERY == ERROR_EVERY - 1:
+            record['m_name'] = 'Unknown Maker'
+        record.update({
+            'p_name': f'Catalog Runner {i}',
+            'p_price': str(89000 + i % 50 * 1000),
+            'p_stock': str(i % 40),
+            'p_image': f'images/catalog/{i}.avif',
+            'p_description': '시즌 카탈로그 일괄 등록 상품',
+        })
+        yield record
+
+
+def make_file(count: int, fmt: str, maps: dict) -> str:
+    if fmt == 'jsonl':
+        return ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in make_records(count, maps))
+    columns = list(NAME_COLUMNS) + ['p_name', 'p_price', 'p_stock', 'p_image', 'p_description']
+    lines = [','.join(columns)]
+    lines.extend(','.join(record[column] for column in columns) for record in make_records(count, maps))
+    return '\n'.join(lines) + '\n'
+
+
+def bench_validate(text: str, fmt: str, chunk_rows: int, maps: dict):
+    started = time.perf_counter()
+    valid = failed = 0
+    chunk = []
+    for item in read_records(io.StringIO(text, newline=''), fmt):
+        chunk.append(item)
+        if len(chunk) >= chunk_rows:
+            rows, errors = validate_chunk(chunk, maps)
+            valid += len(rows)
+            failed += len(errors)
+            chunk = []
+    if chunk:
+        rows, errors = validate_chunk(chunk, maps)
+        valid += len(rows)
+        failed += len(errors)
+    return time.perf_counter() - started, valid, failed
+
+
+def bench_db(text: str, fmt: str, chunk_rows: int):
+    from app_new_form.database.connection import connect_db
+    from app_new_form.api.product_import import import_stream
+    conn = connect_db()
+    try:
+        return import_stream(io.StringIO(text, newline=''), fmt, conn, chunk_rows=chunk_rows)
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제품 일괄 등록 벤치마크")
+    parser.add_argument('rows', nargs='?', type=int, default=ROW_COUNT)
+    parser.add_argument('--chunk', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--db', action='store_true', help='DB upsert 까지 측정')
+    args = parser.parse_args()
+
+    maps = SAMPLE_MAPS
+    if args.db:
+        from app_new_form.database.connection import connect_db
+        from app_new_form.api.product_import import load_name_maps
+        conn = connect_db()
+        try:
+            maps = load_name_maps(conn.cursor())
+        finally:
+            conn.close()
+        if not all(maps.values()):
+            print('❌ 카테고리/제조사 데이터가 없습니다. 더미 데이터를 먼저 넣어 주세요.')
+            return
+
+    print('=' * 64)
+    print(f'🧪 제품 일괄 등록 벤치마크 ({args.rows:,} rows, chunk {args.chunk:,})')
+    print('=' * 64)
+    for fmt in ('csv', 'jsonl'):
+        text = make_file(args.rows, fmt, maps)
+        elapsed, valid, failed = bench_validate(text, fmt, args.chunk, maps)
+        print(f'   {fmt:<5} 읽기+검증   {elapsed * 1000:9.1f} ms   {args.rows / elapsed:10,.0f} rows/s'
+              f'   (성공 {valid:,}, 오류 {failed:,}, {len(text) / 1024 / 1024:.1f} MB)')
+        if args.db:
+            report = bench_db(text, fmt, args.chunk)
+            print(f'   {fmt:<5} 전체(upsert) {report["elapsed_ms"]:9.1f} ms   {report["rows_per_sec"]:10,} rows/s'
+                  f'   (성공 {report["upserted"]:,}, 오류 {report["failed"]:,})')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+purchase_item 월 파티션 벤치마크 (최근 주문 조회)
+
+같은 데이터를 가진 두 테이블을 만들어 최근 주문 조회 시간을 비교합니다.
+  - bench_purchase_item_plain: 일반 테이블 (현재 스키마와 같은 인덱스)
+  - bench_purchase_item_part : b_date 월 RANGE 파티션 (partition_purchase_item.sql 과 같은 구조)
+쿼리마다 EXPLAIN의 partitions 컬럼으로 실제로 읽는 파티션 수도 출력합니다.
+
+데이터는 DB 서버 안에서 INSERT ... SELECT 로 2배씩 늘려 생성합니다 (5천만 건 기준 수십 분 소요).
+운영 DB가 아닌 벤치마크용 DB에서 실행하세요.
+
+사용법 (backend 폴더에서):
+    python app_new_form/TEST/bench_purchase_item_partitions.py                     # 5천만 건
+    python app_new_form/TEST/bench_purchase_item_partitions.py --rows 1000000
+    python app_new_form/TEST/bench_purchase_item_partitions.py --skip-load         # 기존 벤치마크 테이블 재사용
+    python app_new_form/TEST/bench_purchase_item_partitions.py --drop              # 벤치마크 테이블 삭제
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app_new_form.database.connection import connect_db
+from database.manage_purchase_item_partitions import add_months, month_start, partition_clause
+
+PLAIN = 'bench_purchase_item_plain'
+PART = 'bench_purchase_item_part'
+COLUMNS = 'br_seq, u_seq, p_seq, b_price, b_quantity, b_date, b_status'
+
+SEED_ROWS = 10000
+BRANCHES = 10
+USERS = 200000
+PRODUCTS = 2000
+REPEAT = 20
+
+TABLE_BODY = """
+  b_seq      INT AUTO_INCREMENT,
+  br_seq     INT NOT NULL,
+  u_seq      INT NOT NULL,
+  p_seq      INT NOT NULL,
+  b_price    INT DEFAULT 0,
+  b_quantity INT DEFAULT 1,
+  b_date     DATETIME NOT NULL,
+  b_tnum     VARCHAR(100),
+  b_status   VARCHAR(50),
+  {primary_key},
+  INDEX idx_b_date (b_date),
+  INDEX idx_u_seq_date (u_seq, b_date),
+  INDEX idx_br_seq_date (br_seq, b_date)
+"""
+
+# (이름, SQL, 파라미터 생성 함수)
+QUERIES = [
+    ("최근 30일 주문 50건",
+     "SELECT * FROM {table} WHERE b_date >= NOW() - INTERVAL 30 DAY ORDER BY b_date DESC LIMIT 50",
+     lambda: ()),
+    ("고객별 최근 90일 주문",
+     "SELECT * FROM {table} WHERE u_seq = %s AND b_date >= NOW() - INTERVAL 90 DAY ORDER BY b_date DESC",
+     lambda: (random.randint(1, USERS),)),
+    ("최근 7일 지점별 매출",
+     "SELECT br_seq, COUNT(*), SUM(b_price * b_quantity) FROM {table} "
+     "WHERE b_date >= NOW() - INTERVAL 7 DAY GROUP BY br_seq",
+     lambda: ()),
+    ("최근 1개월 특정 지점 주문 수",
+     "SELECT COUNT(*) FROM {table} WHERE br_seq = %s AND b_date >= NOW() - INTERVAL 1 MONTH",
+     lambda: (random.randint(1, BRANCHES),)),
+    ("고객 전체 이력 20건 (b_date 조건 없음)",
+     "SELECT * FROM {table} WHERE u_seq = %s ORDER BY b_date DESC LIMIT 20",
+     lambda: (random.randint(1, USERS),)),
+]
+
+
+# ============================================
+# 테이블 생성 / 데이터 적재
+# ============================================
+def create_tables(conn, months: int):
+    curs = conn.cursor()
+    curs.execute(f"DROP TABLE IF EXISTS {PLAIN}")
+    curs.execute(f"DROP TABLE IF EXISTS {PART}")
+    curs.execute(f"CREATE TABLE {PLAIN} ({TABLE_BODY.format(primary_key='PRIMARY KEY (b_seq)')}) ENGINE=InnoDB")
+
+    current = month_start(date.today())
+    clauses = [partition_clause(add_months(current, offset)) for offset in range(-months, 4)]
+    clauses.append("PARTITION pmax VALUES LESS THAN (MAXVALUE)")
+    curs.execute(
+        f"CREATE TABLE {PART} ({TABLE_BODY.format(primary_key='PRIMARY KEY (b_seq, b_date)')}) ENGINE=InnoDB "
+        f"PARTITION BY RANGE COLUMNS(b_date) ({', '.join(clauses)})"
+    )
+    conn.commit()
+
+
+def load_data(conn, rows: int, months: int):
+    curs = conn.cursor()
+    days = months * 30
+    started = time.perf_counter()
+
+    # 1) 시드 행
+    seed = [(
+        random.randint(1, BRANCHES), random.randint(1, USERS), random.randint(1, PRODUCTS),
+        random.randint(5, 30) * 10000, random.randint(1, 3),
+        random.randint(0, days * 86400), random.choice(['0', '1', '2']),
+    ) for _ in range(min(SEED_ROWS, rows))]
+    curs.executemany(
+        f"INSERT INTO {PLAIN} ({COLUMNS}) VALUES (%s, %s, %s, %s, %s, NOW() - INTERVAL %s SECOND, %s)", seed
+    )
+    conn.commit()
+    count = len(seed)
+
+    # 2) 서버 안에서 2배씩 증가 (값은 새로 무작위 생성)
+    while count < rows:
+        curs.execute(f"""
+            INSERT INTO {PLAIN} ({COLUMNS})
+            SELECT FLOOR(1 + RAND() * %s), FLOOR(1 + RAND() * %s), FLOOR(1 + RAND() * %s),
+                   b_price, b_quantity, NOW() - INTERVAL FLOOR(RAND() * %s) SECOND, b_status
+            FROM {PLAIN} LIMIT %s
+        """, (BRANCHES, USERS, PRODUCTS, days * 86400, min(count, rows - count)))
+        conn.commit()
+        count += curs.rowcount
+        print(f"   {PLAIN}: {count:,}/{rows:,}건 ({time.perf_counter() - started:.0f}초)")
+
+    # 3) 같은 데이터를 파티션 테이블로 복사
+    curs.execute(f"INSERT INTO {PART} SELECT * FROM {PLAIN}")
+    conn.commit()
+    curs.execute(f"ANALYZE TABLE {PLAIN}, {PART}")
+    curs.fetchall()
+    print(f"   {PART}: 복사 완료 ({time.perf_counter() - started:.0f}초)")
+
+
+# ============================================
+# 측정
+# ============================================
+def partitions_read(curs, sql: str, params) -> str:
+    curs.execute("EXPLAIN " + sql, params)
+    columns = [column[0] for column in curs.description]
+    value = curs.fetchone()[columns.index('partitions')]
+    return str(len(value.split(','))) if value else '-'
+
+
+def measure(curs, sql: str, make_params):
+    times = []
+    for _ in range(REPEAT):
+        params = make_params()
+        started = time.perf_counter()
+        curs.execute(sql, params)
+        curs.fetchall()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), max(times)
+
+
+def run_queries(conn):
+    curs = conn.cursor()
+    curs.execute("SELECT COUNT(*) FROM {}".format(PART))
+    total = curs.fetchone()[0]
+    print(f"\n📊 최근 주문 조회 ({total:,}건, 쿼리당 {REPEAT}회, 중앙값/최대 ms)")
+    print(f"   {'쿼리':<34} {'일반 테이블':>18} {'월 파티션':>18} {'읽은 파티션':>10}")
+    for name, sql, make_params in QUERIES:
+        plain = measure(curs, sql.format(table=PLAIN), make_params)
+        part = measure(curs, sql.format(table=PART), make_params)
+        read = partitions_read(curs, sql.format(table=PART), make_params())
+        print(f"   {name:<34} {plain[0]:8.1f} / {plain[1]:7.1f} {part[0]:8.1f} / {part[1]:7.1f} {read:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="purchase_item 월 파티션 벤치마크")
+    parser.add_argument('--rows', type=int, default=50_000_000, help='생성할 행 수')
+    parser.add_argument('--months', type=int, default=36, help='데이터 기간(개월)')
+    parser.add_argument('--skip-load', action='store_true', help='기존 벤치마크 테이블 재사용')
+    parser.add_argument('--drop', action='store_true', help='벤치마크 테이블 삭제 후 종료')
+    args = parser.parse_args()
+
+    conn = connect_db()
+    try:
+        if args.drop:
+            curs = conn.cursor()
+            curs.execute(f"DROP TABLE IF EXISTS {PLAIN}, {PART}")
+            print("🧹 벤치마크 테이블 삭제")
+            return
+        print('=' * 60)
+        print(f'🧪 purchase_item 월 파티션 벤치마크 ({args.rows:,}건, {args.months}개월)')
+        print('=' * 60)
+        if not args.skip_load:
+            create_tables(conn, args.months)
+            load_data(conn, args.rows, args.months)
+        run_queries(conn)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Row → JSON 직렬화 마이크로 벤치마크
+
+기존 방식(손으로 만든 dict comprehension + jsonable_encoder + JSONResponse)과
+공통 RowCodec(common/serialization.py) 방식의 row당 비용을 비교합니다.
+DB 없이 product 테이블 형태의 더미 row로 측정합니다.
+
+사용법 (backend 폴더에서):
+    python app_new_form/TEST/bench_serialization.py
+    python app_new_form/TEST/bench_serialization.py 200000
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from common import serialization
+from common.serialization import RowCodec
+
+ROW_COUNT = 100_000
+REPEAT = 3
+
+PRODUCT_CODEC = RowCodec([
+    'p_seq', 'kc_seq', 'cc_seq', 'sc_seq', 'gc_seq', 'm_seq', 'p_name', 'p_price',
+    'p_stock', 'p_image', 'p_description', 'created_at',
+])
+
+
+def make_rows(count: int):
+    """product SELECT 결과와 같은 형태의 튜플 목록 생성"""
+    base = datetime(2025, 1, 1, 9, 0, 0)
+    return [
+        (i, i % 5 + 1, i % 7 + 1, i % 11 + 1, i % 3 + 1, i % 4 + 1,
+         f'Nike Pegasus {i}', 129000 + i % 50, i % 30,
+         f'images/Nike_Pegasus/Nike_Pegasus_Black_0{i % 3 + 1}.avif',
+         '가볍고 반응성이 좋은 러닝화', base + timedelta(minutes=i))
+        for i in range(count)
+    ]
+
+
+# ============================================
+# 기존 방식
+# ============================================
+def encode_current(rows) -> bytes:
+    result = [{
+        'p_seq': row[0],
+        'kc_seq': row[1],
+        'cc_seq': row[2],
+        'sc_seq': row[3],
+        'gc_seq': row[4],
+        'm_seq': row[5],
+        'p_name': row[6],
+        'p_price': row[7],
+        'p_stock': row[8],
+        'p_image': row[9],
+        'p_description': row[10],
+        'created_at': row[11].isoformat() if row[11] else None
+    } for row in rows]
+    # FastAPI가 dict 반환값을 처리하는 경로와 동일
+    return JSONResponse(content=jsonable_encoder({"results": result})).body
+
+
+# ============================================
+# RowCodec 방식
+# ============================================
+def encode_codec(rows) -> bytes:
+    return PRODUCT_CODEC.dumps_results(rows)
+
+
+def measure(name: str, func, rows):
+    best = None
+    size = 0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        body = func(rows)
+        elapsed = time.perf_counter() - start
+        size = len(body)
+        best = elapsed if best is None else min(best, elapsed)
+    per_row_us = best / len(rows) * 1_000_000
+    print(f'   {name:<28} {best * 1000:9.1f} ms   {per_row_us:6.2f} us/row   {size / 1024:9.1f} KB')
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else ROW_COUNT
+    rows = make_rows(count)
+
+    print('=' * 60)
+    print(f'🧪 직렬화 벤치마크 ({count:,} rows, best of {REPEAT})')
+    print(f'   JSON 인코더: {"orjson" if serialization.orjson else "json (표준 라이브러리)"}')
+    print('=' * 60)
+
+    current = measure('dict + jsonable_encoder', encode_current, rows)
+    codec = measure('RowCodec.dumps_results', encode_codec, rows)
+    print(f'\n📈 속도 향상: {current / codec:.1f}x')
+
+
+if __name__ == "__main__":
+    main()
@@ -18,20 +18,17 @@
     11. request (발주)
 """
 
+import os
+import sys
 import pymysql
 import random
 from datetime import datetime, timedelta
 import io
 
-# 데이터베이스 연결 설정
-DB_CONFIG = {
-    'host': 'cheng80.myqnapcloud.com',
-    'user': 'team0101',
-    'password': 'qwer1234',
-    'database': 'shoes_shop_db',
-    'charset': 'utf8mb4',
-    'port': 13306
-}
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# 데이터베이스 연결 설정 (환경변수 / backend/config/db.<DB_PROFILE>.env)
+from app_new_form.database.connection import DB_CONFIG
 
 
 def connect_db():
@@ -524,13 +521,15 @@ def create_requests(conn, staff_ids, product_ids, maker_ids):
             if random.random() > 0.3:
                 req_dirappdate = req_manappdate + timedelta(days=random.randint(1, 3))
         
+        req_state = 'director_approved' if req_dirappdate else 'manager_approved' if req_manappdate else 'pending'
+        
         s_superseq = staff_ids[0] if len(staff_ids) > 0 else None
         
         sql = """
-            INSERT INTO request (req_date, req_content, req_quantity, req_manappdate, req_dirappdate, s_seq, p_seq, m_seq, s_superseq)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            INSERT INTO request (req_date, req_content, req_quantity, req_manappdate, req_dirappdate, req_state, s_seq, p_seq, m_seq, s_superseq)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
-        curs.execute(sql, (req_date, req_content, req_quantity, req_manappdate, req_dirappdate, s_seq, p_seq, m_seq, s_superseq))
+        curs.execute(sql, (req_date, req_content, req_quantity, req_manappdate, req_dirappdate, req_state, s_seq, p_seq, m_seq, s_superseq))
         request_ids.append(curs.lastrowid)
     
     conn.commit()
@@ -548,7 +547,7 @@ def clear_all_data(conn):
     
     # 역순으로 삭제 (외래 키 의존성 고려)
     tables = [
-        'request', 'receive', 'refund', 'pickup', 'purchase_item',
+        'request', 'receive_manifest', 'receive', 'refund', 'pickup', 'purchase_item',
         'product', 'staff', 'user', 'gender_category', 'size_category',
         'color_category', 'kind_category', 'maker', 'branch'
     ]
@@ -0,0 +1,429 @@
+"""
+대용량 더미 데이터 생성 (scale factor 방식, 부하 테스트용)
+
+create_dummy_data.py는 한 행씩 중복 확인 후 INSERT 하므로 수십 건 수준에만 적합합니다.
+이 스크립트는 scale factor(SF)에 비례하는 데이터를 생성합니다.
+  - PK를 직접 지정해서 생성하므로 참조 관계(FK)가 항상 맞음 (lastrowid / 조회 없음)
+  - 테이블을 고정 크기 shard로 나누고 shard마다 (seed, 테이블, shard 번호)로 난수 생성
+    → 같은 seed면 worker 수와 관계없이 항상 같은 데이터
+  - shard 단위로 여러 프로세스가 병렬 생성/적재
+  - 적재 방식: multi-row INSERT (기본) 또는 LOAD DATA LOCAL INFILE (TSV 파일 생성 후 적재)
+  - 적재 중에는 세션의 FOREIGN_KEY_CHECKS / UNIQUE_CHECKS 를 끄고, 마지막에 참조 무결성을 검사
+
+SF=1 기준 행 수 (대략):
+    branch 20, maker 50, product 2,450, user 100,000, staff 200,
+    purchase_item 1,000,000, pickup ~250,000, refund ~20,000, receive 20,000, request 10,000
+
+⚠️ 대상 테이블의 기존 데이터를 모두 삭제(TRUNCATE)합니다. 운영 DB에서 실행하지 마세요.
+
+사용법 (backend 폴더에서):
+    python app_new_form/TEST/generate_scale_data.py --scale 0.01            # 빠른 확인용 (구매 1만 건)
+    python app_new_form/TEST/generate_scale_data.py --scale 10 --workers 8  # 구매 1천만 건
+    python app_new_form/TEST/generate_scale_data.py --scale 1 --method load # LOAD DATA (서버 local_infile=ON 필요)
+    python app_new_form/TEST/generate_scale_data.py --seed 7 --end 2025-06-30
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+import pymysql
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app_new_form.database.connection import DB_CONFIG
+from common.credentials import hash_password
+
+# ============================================
+# 규모 설정 (SF=1 기준)
+# ============================================
+BASE_ROWS = {
+    'branch': 20,
+    'maker': 50,
+    'user': 100_000,
+    'purchase_item': 1_000_000,
+    'receive': 20_000,
+    'request': 10_000,
+}
+STAFF_PER_BRANCH = 10
+SHARD_ROWS = 50_000          # shard 하나의 행 수 (결정성 단위, 바꾸면 생성 데이터가 달라짐)
+INSERT_CHUNK = 2_000         # multi-row INSERT 한 문장의 행 수
+PASSWORD = 'pass1234'
+
+KINDS = ['러닝화', '스니커즈', '부츠', '로퍼', '샌들']
+COLORS = ['블랙', '화이트', '그레이', '레드', '블루', '그린', '옐로우']
+SIZES = ['230', '240', '250', '260', '270', '280', '290']
+GENDERS = ['남성', '여성', '공용']
+REFUND_REASONS = ['사이즈 불일치', '색상 불일치', '제품 불량', '단순 변심', '배송 지연']
+CITIES = ['서울시 강남구', '서울시 마포구', '서울시 송파구', '부산시 해운대구', '대구시 중구', '인천시 남동구', '광주시 서구']
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임']
+GIVEN_NAMES = ['민준', '서연', '도윤', '지우', '하준', '서윤', '시우', '하은', '주원', '지민']
+PRODUCT_NAMES = ['에어맥스', '에어포스', '스탠스미스', '슈퍼스타', '클래식', '척 테일러', '올드스쿨', '어센틱']
+ORDER_STATUS = ['주문완료', '배송중', '배송완료', '수령완료', '수령완료', '수령완료']
+REQUEST_CONTENTS = ['재고 부족으로 인한 발주 요청', '신제품 입고 요청', '인기 상품 추가 발주', '계절 상품 발주', '프로모션 상품 발주']
+
+# 적재 순서 (TRUNCATE는 역순)
+TABLES = [
+    'branch', 'maker', 'kind_category', 'color_category', 'size_category', 'gender_category',
+    'refund_reason_category', 'user', 'staff', 'product', 'purchase_item', 'pickup', 'refund',
+    'receive', 'request',
+]
+
+COLUMNS = {
+    'branch': ('br_seq', 'br_name', 'br_phone', 'br_address', 'br_lat', 'br_lng'),
+    'maker': ('m_seq', 'm_name', 'm_phone', 'm_address'),
+    'kind_category': ('kc_seq', 'kc_name'),
+    'color_category': ('cc_seq', 'cc_name'),
+    'size_category': ('sc_seq', 'sc_name'),
+    'gender_category': ('gc_seq', 'gc_name'),
+    'refund_reason_category': ('ref_re_seq', 'ref_re_name'),
+    'user': ('u_seq', 'u_id', 'u_password', 'u_name', 'u_phone', 'u_address', 'created_at'),
+    'staff': ('s_seq', 's_id', 'br_seq', 's_password', 's_name', 's_phone', 's_rank', 's_superseq', 'created_at'),
+    'product': ('p_seq', 'kc_seq', 'cc_seq', 'sc_seq', 'gc_seq', 'm_seq', 'p_name', 'p_price', 'p_stock',
+                'p_image', 'created_at'),
+    'purchase_item': ('b_seq', 'br_seq', 'u_seq', 'p_seq', 'b_price', 'b_quantity', 'b_date', 'b_tnum', 'b_status'),
+    'pickup': ('pic_seq', 'b_seq', 'u_seq', 'created_at'),
+    'refund': ('ref_seq', 'ref_date', 'ref_reason', 'ref_re_seq', 'ref_re_content', 'u_seq', 's_seq', 'pic_seq'),
+    'receive': ('rec_seq', 'rec_quantity', 'rec_date', 's_seq', 'p_seq', 'm_seq'),
+    'request': ('req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate', 'req_dirappdate',
+                'req_state', 's_seq', 'p_seq', 'm_seq', 's_superseq'),
+}
+
+# 참조 무결성 검사 (고아 행 수 = 0 이어야 함)
+INTEGRITY_CHECKS = [
+    ('staff → branch', "SELECT COUNT(*) FROM staff s LEFT JOIN branch b ON b.br_seq = s.br_seq WHERE b.br_seq IS NULL"),
+    ('product → maker', "SELECT COUNT(*) FROM product p LEFT JOIN maker m ON m.m_seq = p.m_seq WHERE m.m_seq IS NULL"),
+    ('purchase_item → user', "SELECT COUNT(*) FROM purchase_item pi LEFT JOIN user u ON u.u_seq = pi.u_seq WHERE u.u_seq IS NULL"),
+    ('purchase_item → product', "SELECT COUNT(*) FROM purchase_item pi LEFT JOIN product p ON p.p_seq = pi.p_seq WHERE p.p_seq IS NULL"),
+    ('purchase_item → branch', "SELECT COUNT(*) FROM purchase_item pi LEFT JOIN branch b ON b.br_seq = pi.br_seq WHERE b.br_seq IS NULL"),
+    ('pickup → purchase_item', "SELECT COUNT(*) FROM pickup pk LEFT JOIN purchase_item pi ON pi.b_seq = pk.b_seq WHERE pi.b_seq IS NULL"),
+    ('refund → pickup', "SELECT COUNT(*) FROM refund r LEFT JOIN pickup pk ON pk.pic_seq = r.pic_seq WHERE pk.pic_seq IS NULL"),
+    ('refund → staff', "SELECT COUNT(*) FROM refund r LEFT JOIN staff s ON s.s_seq = r.s_seq WHERE s.s_seq IS NULL"),
+    ('receive → product', "SELECT COUNT(*) FROM receive r LEFT JOIN product p ON p.p_seq = r.p_seq WHERE p.p_seq IS NULL"),
+    ('request → staff', "SELECT COUNT(*) FROM request r LEFT JOIN staff s ON s.s_seq = r.s_seq WHERE s.s_seq IS NULL"),
+]
+
+
+# ============================================
+# 규모 / 공통 계산 (모든 worker가 같은 값을 계산)
+# ============================================
+class Plan:
+    """scale factor → 테이블별 행 수, 날짜 범위, 공통 비밀번호 해시"""
+
+    def __init__(self, scale: float, seed: int, end: datetime, days: int):
+        self.scale = scale
+        self.seed = seed
+        self.end = end
+        self.days = days
+        self.branches = max(5, round(BASE_ROWS['branch'] * scale))
+        self.makers = max(5, round(BASE_ROWS['maker'] * scale))
+        self.products = self.makers * len(COLORS) * len(SIZES)    # (색상, 사이즈, 제조사) 조합 전부 (UNIQUE 제약)
+        self.users = max(10, round(BASE_ROWS['user'] * scale))
+        self.staffs = self.branches * STAFF_PER_BRANCH
+        self.purchases = max(10, round(BASE_ROWS['purchase_item'] * scale))
+        self.receives = max(10, round(BASE_ROWS['receive'] * scale))
+        self.requests = max(10, round(BASE_ROWS['request'] * scale))
+        # 모든 계정이 같은 비밀번호 해시 사용 (seed로 salt 고정 → 결정적)
+        salt = hashlib.sha256(f'{seed}:salt'.encode()).digest()[:16]
+        self.password_hash = hash_password(PASSWORD, salt)
+
+    def rng(self, table: str, shard: int = 0) -> random.Random:
+        return random.Random(f'{self.seed}:{table}:{shard}')
+
+    def shards(self, count: int) -> int:
+        return math.ceil(count / SHARD_ROWS)
+
+    def random_time(self, rng: random.Random, days: int = None) -> datetime:
+        return self.end - timedelta(seconds=rng.randrange((days or self.days) * 86400))
+
+    def product(self, p_seq: int):
+        """p_seq → (m_seq, cc_seq, sc_seq): 조합을 순서대로 배정해서 조회 없이 계산"""
+        index = p_seq - 1
+        per_maker = len(COLORS) * len(SIZES)
+        return index // per_maker + 1, index % per_maker // len(SIZES) + 1, index % len(SIZES) + 1
+
+    def product_price(self, p_seq: int) -> int:
+        return random.Random(f'{self.seed}:price:{p_seq}').randint(5, 20) * 10000
+
+    def staff_of_branch(self, rng: random.Random, br_seq: int) -> int:
+        return (br_seq - 1) * STAFF_PER_BRANCH + rng.randint(1, STAFF_PER_BRANCH)
+
+    def manager_of(self, s_seq: int) -> int:
+        """각 지점의 첫 번째 직원이 점장"""
+        return (s_seq - 1) // STAFF_PER_BRANCH * STAFF_PER_BRANCH + 1
+
+
+def person_name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+
+
+def phone(prefix: str, seq: int) -> str:
+    return f'{prefix}-{seq // 10000 % 10000:04d}-{seq % 10000:04d}'
+
+
+# ============================================
+# 행 생성
+# ============================================
+def dimension_rows(plan: Plan):
+    """작은 테이블들 (메인 프로세스에서 생성)"""
+    rng = plan.rng('dimension')
+    rows = {
+        'branch': [
+            (i, f'{CITIES[i % len(CITIES)].split()[-1]} {i}호점', phone('02', 1000 + i),
+             f'{CITIES[i % len(CITIES)]} 매장로 {i}', round(33 + rng.random() * 5, 7), round(126 + rng.random() * 3, 7))
+            for i in range(1, plan.branches + 1)
+        ],
+        'maker': [
+            (i, f'제조사{i:03d}', phone('02', 5000 + i), f'{rng.choice(CITIES)} 산업로 {i}')
+            for i in range(1, plan.makers + 1)
+        ],
+        'kind_category': list(enumerate(KINDS, 1)),
+        'color_category': list(enumerate(COLORS, 1)),
+        'size_category': list(enumerate(SIZES, 1)),
+        'gender_category': list(enumerate(GENDERS, 1)),
+        'refund_reason_category': list(enumerate(REFUND_REASONS, 1)),
+        'staff': [],
+        'product': [],
+    }
+    for s_seq in range(1, plan.staffs + 1):
+        manager = plan.manager_of(s_seq)
+        rows['staff'].append((
+            s_seq, f'staff{s_seq:06d}', (s_seq - 1) // STAFF_PER_BRANCH + 1, plan.password_hash, person_name(rng),
+            phone('011', s_seq), '점장' if manager == s_seq else rng.choice(['부점장', '사원', '사원']),
+            None if manager == s_seq else manager, plan.random_time(rng, plan.days * 2),
+        ))
+    for p_seq in range(1, plan.products + 1):
+        m_seq, cc_seq, sc_seq = plan.product(p_seq)
+        rows['product'].append((
+            p_seq, rng.randint(1, len(KINDS)), cc_seq, sc_seq, rng.randint(1, len(GENDERS)), m_seq,
+            f'{rng.choice(PRODUCT_NAMES)} {rng.choice(["프리미엄", "클래식", "에디션"])}', plan.product_price(p_seq),
+            rng.randint(0, 200), f'/images/product_{p_seq}.jpg', plan.random_time(rng, plan.days * 2),
+        ))
+    return rows
+
+
+def user_shard(plan: Plan, shard: int):
+    rng = plan.rng('user', shard)
+    first = shard * SHARD_ROWS + 1
+    last = min(plan.users, first + SHARD_ROWS - 1)
+    return {'user': [
+        (u_seq, f'user{u_seq:08d}', plan.password_hash, person_name(rng), phone('010', u_seq),
+         f'{rng.choice(CITIES)} {rng.randint(1, 999)}번길', plan.random_time(rng, plan.days * 2))
+        for u_seq in range(first, last + 1)
+    ]}
+
+
+def purchase_shard(plan: Plan, shard: int):
+    """
+    구매 + 수령 + 반품
+    - 같은 주문(같은 분, 고객, 지점)의 항목 1~3개를 연속된 b_seq로 생성 (shard 경계에서는 새 주문)
+    - 수령/반품은 구매 1건당 최대 1건이므로 pic_seq = ref_seq = b_seq (빈 번호 허용)
+    """
+    rng = plan.rng('purchase_item', shard)
+    first = shard * SHARD_ROWS + 1
+    last = min(plan.purchases, first + SHARD_ROWS - 1)
+    purchases, pickups, refunds = [], [], []
+    b_seq = first
+    while b_seq <= last:
+        u_seq = rng.randint(1, plan.users)
+        br_seq = rng.randint(1, plan.branches)
+        order_time = plan.random_time(rng).replace(second=0, microsecond=0)
+        status = rng.choice(ORDER_STATUS)
+        tnum = f'T{plan.seed}-{b_seq:010d}'
+        for _ in range(min(rng.randint(1, 3), last - b_seq + 1)):
+            p_seq = rng.randint(1, plan.products)
+            b_date = order_time.replace(second=rng.randint(0, 59))
+            purchases.append((b_seq, br_seq, u_seq, p_seq, plan.product_price(p_seq), rng.randint(1, 3),
+                              b_date, tnum, status))
+            if status == '수령완료':
+                picked_at = b_date + timedelta(hours=rng.randint(1, 120))
+                pickups.append((b_seq, b_seq, u_seq, picked_at))
+                if rng.random() < 0.08:
+                    reason = rng.randint(1, len(REFUND_REASONS))
+                    refunds.append((b_seq, picked_at + timedelta(hours=rng.randint(1, 240)), REFUND_REASONS[reason - 1],
+                                    reason, None, u_seq, plan.staff_of_branch(rng, br_seq), b_seq))
+            b_seq += 1
+    return {'purchase_item': purchases, 'pickup': pickups, 'refund': refunds}
+
+
+def receive_shard(plan: Plan, shard: int):
+    rng = plan.rng('receive', shard)
+    first = shard * SHARD_ROWS + 1
+    rows = []
+    for rec_seq in range(first, min(plan.receives, first + SHARD_ROWS - 1) + 1):
+        p_seq = rng.randint(1, plan.products)
+        rows.append((rec_seq, rng.randint(10, 100), plan.random_time(rng), rng.randint(1, plan.staffs),
+                     p_seq, plan.product(p_seq)[0]))
+    return {'receive': rows}
+
+
+def request_shard(plan: Plan, shard: int):
+    rng = plan.rng('request', shard)
+    first = shard * SHARD_ROWS + 1
+    rows = []
+    for req_seq in range(first, min(plan.requests, first + SHARD_ROWS - 1) + 1):
+        s_seq = rng.randint(1, plan.staffs)
+        p_seq = rng.randint(1, plan.products)
+        req_date = plan.random_time(rng)
+        manapp = req_date + timedelta(days=rng.randint(1, 5)) if rng.random() < 0.5 else None
+        dirapp = manapp + timedelta(days=rng.randint(1, 3)) if manapp and rng.random() < 0.7 else None
+        state = 'director_approved' if dirapp else 'manager_approved' if manapp else 'pending'
+        rows.append((req_seq, req_date, rng.choice(REQUEST_CONTENTS), rng.randint(20, 200), manapp, dirapp, state,
+                     s_seq, p_seq, plan.product(p_seq)[0], plan.manager_of(s_seq)))
+    return {'request': rows}
+
+
+SHARD_GENERATORS = {
+    'user': (user_shard, lambda plan: plan.users),
+    'purchase_item': (purchase_shard, lambda plan: plan.purchases),
+    'receive': (receive_shard, lambda plan: plan.receives),
+    'request': (request_shard, lambda plan: plan.requests),
+}
+
+
+# ============================================
+# 적재 (multi-row INSERT / LOAD DATA)
+# ============================================
+def connect(method: str):
+    conn = pymysql.connect(**DB_CONFIG, local_infile=(method == 'load'))
+    curs = conn.cursor()
+    # PK를 직접 지정하고 참조 관계를 생성 시점에 보장하므로 적재 중에는 검사 생략
+    curs.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+    return conn
+
+
+def tsv_value(value) -> str:
+    if value is None:
+        return '\\N'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def write_rows(conn, table: str, rows, method: str):
+    if not rows:
+        return 0
+    columns = COLUMNS[table]
+    curs = conn.cursor()
+    if method == 'load':
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.tsv', delete=False) as f:
+            for row in rows:
+                f.write('\t'.join(tsv_value(value) for value in row) + '\n')
+            path = f.name
+        try:
+            curs.execute(f"""
+                LOAD DATA LOCAL INFILE %s INTO TABLE `{table}` CHARACTER SET utf8mb4
+                FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({', '.join(columns)})
+            """, (path,))
+        finally:
+            os.remove(path)
+    else:
+        sql = f"INSERT INTO `{table}` ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        for start in range(0, len(rows), INSERT_CHUNK):
+            # pymysql executemany는 INSERT ... VALUES 를 multi-row 한 문장으로 묶음
+            curs.executemany(sql, rows[start:start + INSERT_CHUNK])
+    conn.commit()
+    return len(rows)
+
+
+def run_shard(args):
+    """worker 프로세스: shard 하나 생성 + 적재 → {테이블: 행 수}"""
+    scale, seed, end, days, table, shard, method = args
+    plan = Plan(scale, seed, end, days)
+    generate, _ = SHARD_GENERATORS[table]
+    conn = connect(method)
+    try:
+        return {name: write_rows(conn, name, rows, method) for name, rows in generate(plan, shard).items()}
+    finally:
+        conn.close()
+
+
+# ============================================
+# 실행
+# ============================================
+def truncate_all(conn):
+    print("🗑️  기존 데이터 삭제 중...")
+    curs = conn.cursor()
+    for table in ['user_auth_identities'] + TABLES[::-1]:
+        try:
+            curs.execute(f"TRUNCATE TABLE `{table}`")
+        except pymysql.err.ProgrammingError:
+            pass    # 소셜 로그인 마이그레이션 전 DB 등 테이블이 없는 경우
+    conn.commit()
+
+
+def verify(conn):
+    print("\n🔍 참조 무결성 검사")
+    curs = conn.cursor()
+    ok = True
+    for name, sql in INTEGRITY_CHECKS:
+        curs.execute(sql)
+        orphans = curs.fetchone()[0]
+        ok = ok and orphans == 0
+        print(f"   {'✅' if orphans == 0 else '❌'} {name}: 고아 행 {orphans}건")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="scale factor 기반 대용량 더미 데이터 생성")
+    parser.add_argument('--scale', type=float, default=1.0, help='규모 (1 = 구매 100만 건)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 seed (같으면 같은 데이터)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='병렬 프로세스 수')
+    parser.add_argument('--method', choices=['insert', 'load'], default='insert',
+                        help='insert: multi-row INSERT, load: LOAD DATA LOCAL INFILE')
+    parser.add_argument('--days', type=int, default=365, help='구매/입고/발주 데이터 기간(일)')
+    parser.add_argument('--end', default=datetime.now().strftime('%Y-%m-%d'),
+                        help='데이터 기간의 마지막 날짜 (결정성을 위해 고정 날짜 지정 권장)')
+    args = parser.parse_args()
+
+    end = datetime.fromisoformat(args.end).replace(hour=23, minute=59, second=0, microsecond=0)
+    plan = Plan(args.scale, args.seed, end, args.days)
+
+    print("=" * 60)
+    print(f"🎯 대용량 더미 데이터 생성 (SF={args.scale}, seed={args.seed}, workers={args.workers}, {args.method})")
+    print(f"   고객 {plan.users:,} / 제품 {plan.products:,} / 구매 {plan.purchases:,} / 기간 ~{end:%Y-%m-%d} {args.days}일")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    counts = {}
+    conn = connect(args.method)
+    try:
+        truncate_all(conn)
+        print("📍 지점/제조사/카테고리/직원/제품 생성 중...")
+        for table, rows in dimension_rows(plan).items():
+            counts[table] = write_rows(conn, table, rows, args.method)
+
+        tasks = [
+            (args.scale, args.seed, end, args.days, table, shard, args.method)
+            for table, (_, total) in SHARD_GENERATORS.items()
+            for shard in range(plan.shards(total(plan)))
+        ]
+        print(f"🛒 고객/구매/수령/반품/입고/발주 생성 중... ({len(tasks)}개 shard)")
+        done = 0
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for future in as_completed([pool.submit(run_shard, task) for task in tasks]):
+                for table, count in future.result().items():
+                    counts[table] = counts.get(table, 0) + count
+                done += 1
+                total_rows = sum(counts.values())
+                print(f"   ✅ shard {done}/{len(tasks)} ({total_rows:,}행, {total_rows / (time.perf_counter() - started):,.0f}행/초)")
+
+        ok = verify(conn)
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "=" * 60)
+    print(f"{'✅' if ok else '❌'} 생성 완료: {sum(counts.values()):,}행, {elapsed:.1f}초")
+    print("=" * 60)
+    for table in TABLES:
+        print(f"   - {table}: {counts.get(table, 0):,}")
+
+
+if __name__ == "__main__":
+    main()
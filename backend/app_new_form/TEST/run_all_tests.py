@@ -83,7 +83,21 @@ def wait_for_server(timeout=10):
             httpx.get(BASE_URL, timeout=1)
             return True
         except:
-            time.sleep(0.5)
+            time.sleep(0.05)
+    return False
+
+
+def wait_for_port_release(timeout=5):
+    """이전 서버가 포트를 놓을 때까지 대기 (고정 sleep 대신 접속 거부 확인)"""
+    start = time.time()
+    while time.time() - start < timeout:
+        try:
+            httpx.get(BASE_URL, timeout=0.2)
+            time.sleep(0.05)
+        except httpx.ConnectError:
+            return True
+        except:
+            time.sleep(0.05)
     return False
 
 
@@ -117,7 +131,7 @@ def run_server_and_test(filename: str, test_func):
     except:
         proc.kill()
     
-    time.sleep(1)  # 포트 해제 대기
+    wait_for_port_release()
     
     return results
 
@@ -289,6 +303,17 @@ def test_product_join():
     return results
 
 
+# 테스트 대상: (서버 파일, 테스트 함수) - TEST/run_tests_parallel.py 에서도 사용
+TEST_FILES = [
+    ('branch.py', test_branch),
+    ('maker.py', test_maker),
+    ('kind_category.py', test_kind_category),
+    ('users.py', test_users),
+    ('product.py', test_product),
+    ('product_join.py', test_product_join),
+]
+
+
 # ============================================
 # 메인 실행
 # ============================================
@@ -297,19 +322,11 @@ def main():
     print("🚀 app_new_form 전체 테스트 시작")
     print("=" * 60)
     
-    test_files = [
-        ('branch.py', test_branch),
-        ('maker.py', test_maker),
-        ('kind_category.py', test_kind_category),
-        ('users.py', test_users),
-        ('product.py', test_product),
-        ('product_join.py', test_product_join),
-    ]
     
     total_passed = 0
     total_failed = 0
     
-    for filename, test_func in test_files:
+    for filename, test_func in TEST_FILES:
         results = run_server_and_test(filename, test_func)
         total_passed += results['passed']
         total_failed += results['failed']
@@ -0,0 +1,372 @@
+"""
+app_new_form 부하 테스트 (엔드포인트별 지연 시간 백분위수)
+
+실제 API 엔드포인트를 비율(mix)에 맞춰 동시에 호출하고
+엔드포인트별 p50/p95/p99 지연 시간, 처리량, 에러율을 측정해 JSON으로 저장합니다.
+저장한 JSON을 --compare 로 넘기면 이전 빌드 결과와 비교합니다.
+
+부하 방식:
+  - 동시성 고정 (--concurrency N): N개 가상 사용자가 응답을 받자마자 다음 요청 (closed loop)
+  - 요청률 고정 (--rps R): 응답과 관계없이 초당 R개 요청 시작 (open loop)
+    지연 시간은 "예정 시작 시각"부터 측정하므로 서버가 밀리면 대기 시간까지 포함됨
+    (동시 요청은 --concurrency 개로 제한)
+
+데이터: generate_scale_data.py 로 생성한 DB 기준 (ID 범위, 계정 user00000001 / pass1234)
+        다른 데이터면 --users / --products / --requests / --branches 로 범위 지정
+결재: 시작 전에 by_status 로 결재 가능한 발주(pending / manager_approved)를 읽어 두고 그 중에서 선택
+      (대상이 떨어지면 무작위 req_seq, 상태가 맞지 않아 거부된 결재는 에러가 아니라 rejected 로 따로 집계)
+
+사용법 (backend 폴더에서, 서버 실행 후):
+    python app_new_form/TEST/run_load_test.py --mix browse --concurrency 50 --duration 60
+    python app_new_form/TEST/run_load_test.py --mix mixed --rps 300 --duration 120 --output results/build_a.json
+    python app_new_form/TEST/run_load_test.py --mix mixed --rps 300 --compare results/build_a.json
+    python app_new_form/TEST/run_load_test.py --list      # 엔드포인트 / mix 목록
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+import httpx
+
+BASE_URL = 'http://127.0.0.1:8000'
+PASSWORD = 'pass1234'
+ERROR_MARKER = b'"result":"Error"'
+# 상태 전이 조건에 맞지 않아 거부된 결재 응답 (request.py transition_request)
+REJECTED_TRANSITION_PREFIX = '현재 상태('
+ELIGIBLE_PAGE = 200
+
+
+# ============================================
+# 엔드포인트 정의: 이름 → (rng, args) 로 (method, path, 요청 옵션) 생성
+# ============================================
+def since_days(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def eligible_request(rng, a, state: str, next_state: str = None) -> int:
+    """
+    state 상태인 발주 하나를 꺼냄 (결재 후 상태는 next_state 목록으로 이동)
+    미리 읽어 둔 대상이 없으면 무작위 req_seq (대부분 rejected 로 집계됨)
+    """
+    pool = a.eligible_seqs.get(state)
+    if not pool:
+        return rng.randint(1, a.requests)
+    index = rng.randrange(len(pool))
+    pool[index], pool[-1] = pool[-1], pool[index]
+    request_seq = pool.pop()
+    if next_state:
+        a.eligible_seqs[next_state].append(request_seq)
+    return request_seq
+
+
+ENDPOINTS = {
+    # 카탈로그
+    'catalog_browse': lambda rng, a: (
+        'GET', '/api/products/products/with_categories', {'params': {'maker_seq': rng.randint(1, a.makers)}}),
+    'category_browse': lambda rng, a: (
+        'GET', '/api/products/products/by_category',
+        {'params': {'kind_seq': rng.randint(1, 5), 'gender_seq': rng.randint(1, 3)}}),
+    'product_detail': lambda rng, a: (
+        'GET', f'/api/products/{rng.randint(1, a.products)}', {}),
+    'product_full_detail': lambda rng, a: (
+        'GET', f'/api/products/products/{rng.randint(1, a.products)}/full_detail', {}),
+    # 고객
+    'login': lambda rng, a: (
+        'POST', '/api/users/login', {'data': {'u_id': f'user{rng.randint(1, a.users):08d}', 'u_password': PASSWORD}}),
+    'order_history': lambda rng, a: (
+        'GET', f'/api/purchase_items/purchase_items/by_user/{rng.randint(1, a.users)}/with_details',
+        {'params': {'since': since_days(90)}}),
+    'user_orders': lambda rng, a: (
+        'GET', f'/api/purchase_items/purchase_items/by_user/{rng.randint(1, a.users)}/orders',
+        {'params': {'since': since_days(90)}}),
+    'checkout': lambda rng, a: (
+        'POST', '/api/purchase_items', {'data': {
+            'br_seq': rng.randint(1, a.branches), 'u_seq': rng.randint(1, a.users),
+            'p_seq': rng.randint(1, a.products), 'b_price': rng.randint(5, 20) * 10000,
+            'b_quantity': rng.randint(1, 3), 'b_date': datetime.now().isoformat(timespec='seconds'),
+            'b_status': '주문완료',
+        }}),
+    # 직원
+    'request_detail': lambda rng, a: (
+        'GET', f'/api/requests/requests/{rng.randint(1, a.requests)}/full_detail', {}),
+    'approval_inbox': lambda rng, a: (
+        'GET', '/api/requests/requests/by_status',
+        {'params': {'status': rng.choice(['pending', 'manager_approved']), 'limit': 50}}),
+    'approve_manager': lambda rng, a: (
+        'POST', '/api/requests/request_seq/approve_manager',
+        {'params': {'request_seq': eligible_request(rng, a, 'pending', 'manager_approved')}}),
+    'approve_director': lambda rng, a: (
+        'POST', '/api/requests/request_seq/approve_director',
+        {'params': {'request_seq': eligible_request(rng, a, 'manager_approved')}}),
+}
+TRANSITION_ENDPOINTS = ('approve_manager', 'approve_director')
+
+# mix: {엔드포인트: 가중치}
+MIXES = {
+    'browse': {'catalog_browse': 30, 'category_browse': 20, 'product_detail': 30, 'product_full_detail': 20},
+    'checkout': {'product_detail': 30, 'login': 10, 'checkout': 30, 'user_orders': 30},
+    'staff': {'request_detail': 40, 'approval_inbox': 30, 'approve_manager': 15, 'approve_director': 15},
+    'mixed': {
+        'catalog_browse': 20, 'category_browse': 10, 'product_detail': 20, 'product_full_detail': 10,
+        'login': 5, 'order_history': 10, 'user_orders': 5, 'checkout': 10,
+        'request_detail': 5, 'approve_manager': 3, 'approve_director': 2,
+    },
+}
+
+
+# ============================================
+# 측정 결과
+# ============================================
+class Recorder:
+    def __init__(self):
+        self.latencies = {}    # 엔드포인트 → [ms, ...]
+        self.errors = {}       # 엔드포인트 → {에러 종류: 건수}
+        self.rejected = {}     # 엔드포인트 → 상태 조건으로 거부된 결재 건수 (에러율에서 제외)
+        self.recording = False
+
+    def add(self, name: str, latency_ms: float, error: str = None, rejected: bool = False):
+        if not self.recording:
+            return
+        self.latencies.setdefault(name, []).append(latency_ms)
+        if rejected:
+            self.rejected[name] = self.rejected.get(name, 0) + 1
+        elif error:
+            errors = self.errors.setdefault(name, {})
+            errors[error] = errors.get(error, 0) + 1
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return round(sorted_values[index], 2)
+
+
+def summarize(latencies: list, errors: dict, elapsed: float, rejected: int = 0) -> dict:
+    values = sorted(latencies)
+    error_count = sum(errors.values())
+    return {
+        'requests': len(values),
+        'throughput_rps': round(len(values) / elapsed, 2) if elapsed else 0,
+        'rejected': rejected,
+        'errors': error_count,
+        'error_rate': round(error_count / len(values), 4) if values else 0,
+        'error_kinds': errors,
+        'p50_ms': percentile(values, 50),
+        'p95_ms': percentile(values, 95),
+        'p99_ms': percentile(values, 99),
+        'max_ms': round(values[-1], 2) if values else None,
+        'mean_ms': round(sum(values) / len(values), 2) if values else None,
+    }
+
+
+# ============================================
+# 요청 실행
+# ============================================
+async def call(client: httpx.AsyncClient, recorder: Recorder, rng: random.Random, args, names, weights,
+               scheduled: float = None):
+    name = rng.choices(names, weights)[0]
+    method, path, options = ENDPOINTS[name](rng, args)
+    started = scheduled if scheduled is not None else time.perf_counter()
+    error = None
+    rejected = False
+    try:
+        response = await client.request(method, path, **options)
+        if response.status_code >= 400:
+            error = f'HTTP {response.status_code}'
+        elif ERROR_MARKER in response.content[:64]:
+            error = 'result=Error'
+            rejected = (name in TRANSITION_ENDPOINTS
+                        and str(response.json().get('errorMsg', '')).startswith(REJECTED_TRANSITION_PREFIX))
+    except httpx.HTTPError as e:
+        error = type(e).__name__
+    recorder.add(name, (time.perf_counter() - started) * 1000, error, rejected)
+
+
+async def closed_loop(client, recorder, args, names, weights, stop_at: float):
+    async def user(index: int):
+        rng = random.Random(f'{args.seed}:{index}')
+        while time.perf_counter() < stop_at:
+            await call(client, recorder, rng, args, names, weights)
+
+    await asyncio.gather(*[user(i) for i in range(args.concurrency)])
+
+
+async def open_loop(client, recorder, args, names, weights, stop_at: float):
+    rng = random.Random(args.seed)
+    in_flight = asyncio.Semaphore(args.concurrency)
+    tasks = set()
+    interval = 1.0 / args.rps
+    next_at = time.perf_counter()
+
+    async def fire(scheduled: float):
+        async with in_flight:
+            await call(client, recorder, rng, args, names, weights, scheduled)
+
+    while next_at < stop_at:
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.create_task(fire(next_at))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        next_at += interval
+    await asyncio.gather(*tasks)
+
+
+async def load_eligible(client: httpx.AsyncClient, args) -> dict:
+    """결재 가능한 발주 req_seq 목록 (상태별 최대 --eligible 건, by_status 커서 페이지 조회)"""
+    eligible = {}
+    for state in ('pending', 'manager_approved'):
+        seqs = []
+        cursor = None
+        while len(seqs) < args.eligible:
+            params = {'status': state, 'limit': ELIGIBLE_PAGE}
+            if cursor:
+                params['cursor'] = cursor
+            body = (await client.get('/api/requests/requests/by_status', params=params)).json()
+            seqs.extend(row['req_seq'] for row in body.get('results', []))
+            cursor = body.get('next_cursor')
+            if not cursor:
+                break
+        eligible[state] = seqs[:args.eligible]
+    return eligible
+
+
+async def run(args) -> dict:
+    mix = MIXES[args.mix]
+    names, weights = list(mix), list(mix.values())
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        args.eligible_seqs = {'pending': [], 'manager_approved': []}
+        if any(name in TRANSITION_ENDPOINTS for name in names):
+            args.eligible_seqs = await load_eligible(client, args)
+            print(f"📋 결재 대상: pending {len(args.eligible_seqs['pending'])}건, "
+                  f"manager_approved {len(args.eligible_seqs['manager_approved'])}건")
+        driver = open_loop if args.rps else closed_loop
+        # 워밍업 (연결/캐시/커넥션 풀 준비, 결과에서 제외)
+        if args.warmup > 0:
+            await driver(client, recorder, args, names, weights, time.perf_counter() + args.warmup)
+        recorder.recording = True
+        started = time.perf_counter()
+        await driver(client, recorder, args, names, weights, started + args.duration)
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [value for values in recorder.latencies.values() for value in values]
+    all_errors = {}
+    for errors in recorder.errors.values():
+        for kind, count in errors.items():
+            all_errors[kind] = all_errors.get(kind, 0) + count
+    return {
+        'meta': {
+            'started_at': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'base_url': args.base_url,
+            'mix': args.mix,
+            'mode': f'rps={args.rps}' if args.rps else f'concurrency={args.concurrency}',
+            'concurrency': args.concurrency,
+            'rps': args.rps,
+            'duration_s': args.duration,
+            'seed': args.seed,
+        },
+        'total': summarize(all_latencies, all_errors, elapsed, sum(recorder.rejected.values())),
+        'endpoints': {
+            name: summarize(recorder.latencies[name], recorder.errors.get(name, {}), elapsed,
+                            recorder.rejected.get(name, 0))
+            for name in names if name in recorder.latencies
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+# ============================================
+# 출력 / 비교
+# ============================================
+def print_report(result: dict, baseline: dict = None):
+    meta = result['meta']
+    print('=' * 100)
+    print(f"🚀 부하 테스트 결과: mix={meta['mix']}, {meta['mode']}, {meta['duration_s']}초, commit={meta['git_commit']}")
+    print('=' * 100)
+    print(f"   {'엔드포인트':<22} {'요청':>8} {'rps':>9} {'에러율':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+          + ('   p95 변화   rps 변화' if baseline else ''))
+    rows = list(result['endpoints'].items()) + [('TOTAL', result['total'])]
+    for name, stats in rows:
+        line = (f"   {name:<22} {stats['requests']:>8} {stats['throughput_rps']:>9.1f} {stats['error_rate']:>8.2%} "
+                f"{stats['p50_ms'] or 0:>9.1f} {stats['p95_ms'] or 0:>9.1f} {stats['p99_ms'] or 0:>9.1f} "
+                f"{stats['max_ms'] or 0:>9.1f}")
+        if baseline:
+            base = baseline['total'] if name == 'TOTAL' else baseline['endpoints'].get(name)
+            line += f"   {change(base and base['p95_ms'], stats['p95_ms']):>8} {change(base and base['throughput_rps'], stats['throughput_rps']):>9}"
+        print(line)
+    if result['total']['error_kinds']:
+        print(f"   에러 종류: {result['total']['error_kinds']}")
+    if result['total'].get('rejected'):
+        print(f"   상태 조건으로 거부된 결재: {result['total']['rejected']}건 (에러율에서 제외)")
+
+
+def change(before, after) -> str:
+    if not before or after is None:
+        return '-'
+    return f'{(after - before) / before:+.1%}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="app_new_form 부하 테스트")
+    parser.add_argument('--base-url', default=BASE_URL)
+    parser.add_argument('--mix', choices=list(MIXES), default='mixed', help='엔드포인트 호출 비율')
+    parser.add_argument('--concurrency', type=int, default=20, help='가상 사용자 수 (--rps 사용 시 최대 동시 요청 수)')
+    parser.add_argument('--rps', type=float, default=None, help='초당 요청 수 고정 (open loop)')
+    parser.add_argument('--duration', type=float, default=30, help='측정 시간(초)')
+    parser.add_argument('--warmup', type=float, default=5, help='워밍업 시간(초, 결과에서 제외)')
+    parser.add_argument('--timeout', type=float, default=10, help='요청 타임아웃(초)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--users', type=int, default=100_000, help='u_seq 범위')
+    parser.add_argument('--products', type=int, default=2_450, help='p_seq 범위')
+    parser.add_argument('--makers', type=int, default=50, help='m_seq 범위')
+    parser.add_argument('--branches', type=int, default=20, help='br_seq 범위')
+    parser.add_argument('--requests', type=int, default=10_000, help='req_seq 범위')
+    parser.add_argument('--eligible', type=int, default=2_000, help='결재 대상으로 미리 읽어 둘 발주 수 (상태별)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    parser.add_argument('--list', action='store_true', help='엔드포인트 / mix 목록 출력')
+    args = parser.parse_args()
+
+    if args.list:
+        for name, mix in MIXES.items():
+            print(f"{name}: {', '.join(f'{endpoint}({weight})' for endpoint, weight in mix.items())}")
+        return
+
+    result = asyncio.run(run(args))
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(result, baseline)
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+    # 에러율이 높으면 CI에서 감지할 수 있도록 종료 코드 1
+    sys.exit(1 if result['total']['error_rate'] > 0.01 else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+소셜 로그인 동시 첫 로그인(더블 탭) 테스트
+
+같은 (provider, provider_subject)로 첫 로그인 요청을 동시에 여러 개 보내고
+user / user_auth_identities 행이 정확히 1개만 생기는지 DB에서 확인합니다.
+Idempotency-Key 재시도 시 같은 응답이 오는지도 확인합니다.
+
+사용법 (backend 폴더에서):
+    1. 서버 실행: python -m app_new_form.main
+    2. 테스트 실행: python app_new_form/TEST/run_social_login_concurrency_test.py
+       python app_new_form/TEST/run_social_login_concurrency_test.py 50   # 동시 요청 수
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from app_new_form.database.connection import connect_db
+
+# ============================================
+# 설정
+# ============================================
+BASE_URL = 'http://127.0.0.1:8000'
+CONCURRENCY = 20
+
+test_results = {
+    'passed': 0,
+    'failed': 0,
+}
+
+
+def print_test(name: str, success: bool, detail: str = ''):
+    icon = '✅' if success else '❌'
+    print(f'   {icon} {name}')
+    if detail:
+        print(f'      {detail}')
+    if success:
+        test_results['passed'] += 1
+    else:
+        test_results['failed'] += 1
+
+
+async def social_login(client: httpx.AsyncClient, subject: str, email: str, idempotency_key: str = None) -> dict:
+    headers = {'Idempotency-Key': idempotency_key} if idempotency_key else {}
+    response = await client.post(
+        f'{BASE_URL}/api/auth/social/login',
+        data={'provider': 'google', 'provider_subject': subject, 'email': email, 'name': '동시로그인테스트'},
+        headers=headers,
+        timeout=30,
+    )
+    return response.json()
+
+
+def count_rows(subject: str, email: str):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute("""
+            SELECT COUNT(*) FROM user_auth_identities
+            WHERE provider = 'google' AND provider_subject = %s
+        """, (subject,))
+        identities = curs.fetchone()[0]
+        curs.execute("SELECT COUNT(*) FROM user WHERE u_email = %s", (email,))
+        users = curs.fetchone()[0]
+        return identities, users
+    finally:
+        conn.close()
+
+
+def cleanup(email: str):
+    # user 삭제 시 user_auth_identities 는 FK CASCADE로 함께 삭제
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute("DELETE FROM user WHERE u_email = %s", (email,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ============================================
+# 테스트
+# ============================================
+async def test_concurrent_first_login(concurrency: int):
+    print('\n' + '=' * 60)
+    print(f'🧪 동시 첫 로그인 {concurrency}건')
+    print('=' * 60)
+
+    subject = f'concurrency-{uuid.uuid4().hex}'
+    email = f'{subject}@test.local'
+    try:
+        async with httpx.AsyncClient() as client:
+            results = await asyncio.gather(*[social_login(client, subject, email) for _ in range(concurrency)])
+
+        errors = [r for r in results if r.get('result') != 'OK']
+        print_test('모든 요청 성공', not errors, f'오류 {len(errors)}건: {errors[:1]}' if errors else '')
+
+        user_seqs = {r.get('user_seq') for r in results if r.get('result') == 'OK'}
+        print_test('모든 응답이 같은 user_seq', len(user_seqs) == 1, f'user_seq: {sorted(user_seqs)}')
+
+        identities, users = count_rows(subject, email)
+        print_test('user_auth_identities 행 1개', identities == 1, f'{identities}개')
+        print_test('user 행 1개', users == 1, f'{users}개')
+    finally:
+        cleanup(email)
+
+
+async def test_idempotency_key_retry():
+    print('\n' + '=' * 60)
+    print('🧪 Idempotency-Key 재시도')
+    print('=' * 60)
+
+    subject = f'idempotency-{uuid.uuid4().hex}'
+    email = f'{subject}@test.local'
+    key = uuid.uuid4().hex
+    try:
+        async with httpx.AsyncClient() as client:
+            first = await social_login(client, subject, email, idempotency_key=key)
+            retries = await asyncio.gather(*[social_login(client, subject, email, idempotency_key=key) for _ in range(5)])
+
+        print_test('첫 요청 신규 가입', first.get('result') == 'OK' and first.get('registration_completed') is False,
+                   first.get('message', first.get('errorMsg', '')))
+        print_test('재시도 응답이 첫 응답과 동일', all(r == first for r in retries))
+
+        identities, users = count_rows(subject, email)
+        print_test('user 행 1개', users == 1 and identities == 1, f'user {users}개, identity {identities}개')
+    finally:
+        cleanup(email)
+
+
+def main():
+    concurrency = int(sys.argv[1]) if len(sys.argv) > 1 else CONCURRENCY
+
+    asyncio.run(test_concurrent_first_login(concurrency))
+    asyncio.run(test_idempotency_key_retry())
+
+    print('\n' + '=' * 60)
+    print('📊 테스트 결과 요약')
+    print('=' * 60)
+    print(f"✅ 성공: {test_results['passed']}개")
+    print(f"❌ 실패: {test_results['failed']}개")
+    sys.exit(1 if test_results['failed'] else 0)
+
+
+if __name__ == "__main__":
+    main()
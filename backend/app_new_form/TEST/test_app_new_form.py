@@ -86,6 +86,14 @@ def api_post_form_with_file(endpoint: str, data: dict, file_path: str = None) ->
         return {'error': str(e)}
 
 
+def api_post_json(endpoint: str, data: dict) -> dict:
+    try:
+        response = httpx.post(f'{BASE_URL}{endpoint}', json=data, timeout=10)
+        return response.json()
+    except Exception as e:
+        return {'error': str(e)}
+
+
 def api_delete(endpoint: str) -> dict:
     try:
         response = httpx.delete(f'{BASE_URL}{endpoint}', timeout=10)
@@ -613,6 +621,428 @@ def test_purchase_item_join():
                 print_test('분 단위 기반 주문 조회', success)
 
 
+# ============================================
+# 입고 명세서 테스트 (main.py 로 실행: uvicorn app_new_form.main:app)
+# ============================================
+def product_stock(p_seq: int):
+    result = api_get(f'/api/products/{p_seq}?fields=p_stock')
+    return result.get('result', {}).get('p_stock')
+
+
+def receive_seqs() -> set:
+    return {row['rec_seq'] for row in api_get('/api/receives').get('results', [])}
+
+
+def test_receive_manifest():
+    print_header('입고 명세서 (Receive Manifest) API 테스트')
+
+    product_result = api_get('/api/products?fields=p_seq,m_seq')
+    staff_result = api_get('/api/staffs')
+    if len(product_result.get('results', [])) < 2 or not staff_result.get('results'):
+        print_test('필수 데이터 조회 (제품 2개, 직원)', False, '더미 데이터를 먼저 넣어 주세요')
+        return
+    p1, p2 = product_result['results'][0], product_result['results'][1]
+    s_seq = staff_result['results'][0]['s_seq']
+    stock1, stock2 = product_stock(p1['p_seq']), product_stock(p2['p_seq'])
+    receives_before = receive_seqs()
+    rand_num = random.randint(100000, 999999)
+
+    # 1. 새 명세서: 제품별 수량 합계만큼 재고 증가
+    manifest = {
+        'manifest_id': f'TEST-MANIFEST-{rand_num}',
+        's_seq': s_seq,
+        'items': [
+            {'p_seq': p1['p_seq'], 'rec_quantity': 3},
+            {'p_seq': p1['p_seq'], 'rec_quantity': 2},
+            {'p_seq': p2['p_seq'], 'rec_quantity': 4},
+        ],
+    }
+    result = api_post_json('/api/receives/manifest/process', manifest)
+    success = (result.get('result') == 'OK' and result.get('duplicate') is False
+               and result.get('manifest', {}).get('line_count') == 3
+               and result.get('manifest', {}).get('total_quantity') == 9
+               and product_stock(p1['p_seq']) == stock1 + 5 and product_stock(p2['p_seq']) == stock2 + 4)
+    print_test('명세서 처리 (재고 = 수량 합계만큼 증가)', success, str(result) if not success else '')
+    stock1, stock2 = stock1 + 5, stock2 + 4
+
+    # 2. 같은 manifest_id 재전송: duplicate, 재고 변화 없음
+    result = api_post_json('/api/receives/manifest/process', manifest)
+    success = (result.get('result') == 'OK' and result.get('duplicate') is True
+               and product_stock(p1['p_seq']) == stock1 and product_stock(p2['p_seq']) == stock2)
+    print_test('같은 명세서 재전송 (duplicate, 재고 그대로)', success, str(result) if not success else '')
+
+    # 3. 없는 제품이 섞인 명세서: 전체 rollback (입고 행/재고/명세서 기록 모두 없음)
+    receives_mid = receive_seqs()
+    bad_manifest = {
+        'manifest_id': f'TEST-MANIFEST-{rand_num}-BAD',
+        's_seq': s_seq,
+        'items': [{'p_seq': p1['p_seq'], 'rec_quantity': 7}, {'p_seq': 999999999, 'rec_quantity': 1}],
+    }
+    result = api_post_json('/api/receives/manifest/process', bad_manifest)
+    success = (result.get('result') == 'Error' and product_stock(p1['p_seq']) == stock1
+               and receive_seqs() == receives_mid)
+    print_test('없는 제품 포함 → 전체 rollback', success, str(result) if not success else '')
+
+    # 4. 이미 처리된 입고 행이 섞인 명세서: 전체 rollback
+    pending = api_post_form('/api/receives', {
+        's_seq': s_seq, 'p_seq': p2['p_seq'], 'm_seq': p2['m_seq'], 'rec_quantity': '6',
+    })
+    rec_seq = pending.get('rec_seq')
+    result = api_post_json('/api/receives/manifest/process', {
+        'manifest_id': f'TEST-MANIFEST-{rand_num}-PENDING', 's_seq': s_seq, 'items': [{'rec_seq': rec_seq}],
+    })
+    success = result.get('result') == 'OK' and product_stock(p2['p_seq']) == stock2 + 6
+    print_test('입고 예정 행 처리 (재고 증가)', success, str(result) if not success else '')
+    stock2 += 6
+
+    receives_mid = receive_seqs()
+    result = api_post_json('/api/receives/manifest/process', {
+        'manifest_id': f'TEST-MANIFEST-{rand_num}-AGAIN',
+        's_seq': s_seq,
+        'items': [{'p_seq': p1['p_seq'], 'rec_quantity': 1}, {'rec_seq': rec_seq}],
+    })
+    success = (result.get('result') == 'Error' and product_stock(p1['p_seq']) == stock1
+               and product_stock(p2['p_seq']) == stock2 and receive_seqs() == receives_mid)
+    print_test('이미 처리된 입고 행 포함 → 전체 rollback', success, str(result) if not success else '')
+
+    # 3번의 명세서 기록도 rollback 되었으므로 같은 ID로 다시 보내면 새로 처리됨
+    bad_manifest['items'] = [{'p_seq': p1['p_seq'], 'rec_quantity': 1}]
+    result = api_post_json('/api/receives/manifest/process', bad_manifest)
+    success = result.get('result') == 'OK' and result.get('duplicate') is False
+    print_test('rollback 된 명세서 ID 재사용 가능', success, str(result) if not success else '')
+    stock1 += 1
+
+    # 정리: 테스트로 추가된 입고 행 삭제, 재고 원래대로
+    for seq in receive_seqs() - receives_before:
+        api_delete(f'/api/receives/{seq}')
+    api_post_form(f"/api/products/{p1['p_seq']}/stock", {'p_stock': str(stock1 - 6)})
+    api_post_form(f"/api/products/{p2['p_seq']}/stock", {'p_stock': str(stock2 - 10)})
+
+
+# ============================================
+# 발주 일괄 결재 테스트 (main.py 로 실행: uvicorn app_new_form.main:app)
+# ============================================
+def request_state(req_seq: int):
+    return api_get(f'/api/requests/{req_seq}?fields=req_state').get('result', {}).get('req_state')
+
+
+def test_request_bulk():
+    print_header('발주 일괄 결재 (Request Bulk) API 테스트')
+
+    product_result = api_get('/api/products?fields=p_seq,m_seq')
+    staff_result = api_get('/api/staffs')
+    if not product_result.get('results') or not staff_result.get('results'):
+        print_test('필수 데이터 조회 (제품, 직원)', False, '더미 데이터를 먼저 넣어 주세요')
+        return
+    product = product_result['results'][0]
+    new_request = {
+        's_seq': staff_result['results'][0]['s_seq'],
+        'p_seq': product['p_seq'],
+        'm_seq': product['m_seq'],
+        'req_content': '일괄 결재 테스트',
+        'req_quantity': '5',
+    }
+    req_seqs = [api_post_form('/api/requests', new_request).get('req_seq') for _ in range(3)]
+    if None in req_seqs:
+        print_test('테스트 발주 추가', False, str(req_seqs))
+        return
+    pending1, pending2, approved = req_seqs
+
+    # approved 는 미리 팀장 결재 → 팀장 일괄 결재 대상이 아님
+    api_post_form(f'/api/requests/request_seq/approve_manager?request_seq={approved}', {})
+    missing = 999999999
+
+    # 1. 섞인 요청: pending 2건 + 이미 결재된 1건 + 없는 발주
+    result = api_post_json('/api/requests/bulk/approve_manager', {'req_seqs': [pending1, approved, pending2, missing]})
+    outcomes = {item['req_seq']: item for item in result.get('results', [])}
+    success = (result.get('result') == 'OK' and result.get('updated') == 2
+               and outcomes.get(pending1, {}).get('outcome') == 'updated'
+               and outcomes.get(pending2, {}).get('outcome') == 'updated'
+               and outcomes.get(approved, {}).get('outcome') == 'invalid_state'
+               and outcomes.get(approved, {}).get('req_state') == 'manager_approved'
+               and outcomes.get(missing, {}).get('outcome') == 'not_found')
+    print_test('일괄 팀장 결재 (발주별 결과)', success, str(result) if not success else '')
+
+    # 2. 처리 후 각 발주 상태
+    states = [request_state(seq) for seq in req_seqs]
+    success = states == ['manager_approved', 'manager_approved', 'manager_approved']
+    print_test('일괄 결재 후 상태', success, str(states))
+
+    # 3. 일괄 반려: pending1 반려, 이미 반려된 발주는 invalid_state
+    api_post_json('/api/requests/bulk/reject', {'req_seqs': [pending1]})
+    result = api_post_json('/api/requests/bulk/approve_director', {'req_seqs': [pending1, pending2]})
+    outcomes = {item['req_seq']: item for item in result.get('results', [])}
+    success = (result.get('updated') == 1
+               and outcomes.get(pending1, {}).get('outcome') == 'invalid_state'
+               and outcomes.get(pending1, {}).get('req_state') == 'rejected'
+               and request_state(pending1) == 'rejected' and request_state(pending2) == 'director_approved')
+    print_test('반려된 발주는 이사 결재 불가', success, str(result) if not success else '')
+
+    # 4. 잘못된 처리 이름
+    result = api_post_json('/api/requests/bulk/approve_everything', {'req_seqs': [pending2]})
+    success = result.get('result') == 'Error' and request_state(pending2) == 'director_approved'
+    print_test('알 수 없는 처리 거부', success)
+
+    for seq in req_seqs:
+        api_delete(f'/api/requests/{seq}')
+
+
+# ============================================
+# 응답 컬럼 선택 (fields=) 테스트 (main.py 로 실행: uvicorn app_new_form.main:app)
+# ============================================
+# (경로, PK, 요청 fields, 기대 key 순서: PK 포함 + 화이트리스트 순서)
+FIELDS_CASES = (
+    ('/api/products', 'p_seq', 'p_price,p_name', ['p_seq', 'p_name', 'p_price']),
+    ('/api/makers', 'm_seq', 'm_name', ['m_seq', 'm_name']),
+    ('/api/branches', 'br_seq', 'br_name', ['br_seq', 'br_name']),
+    ('/api/users', 'u_seq', 'u_name', ['u_seq', 'u_name']),
+    ('/api/requests', 'req_seq', 'req_state', ['req_seq', 'req_state']),
+)
+
+
+def test_fields():
+    print_header('응답 컬럼 선택 (fields=) 테스트')
+
+    for path, key, fields, expected in FIELDS_CASES:
+        # 1. 목록: 요청한 컬럼 + PK 만, 화이트리스트 순서
+        rows = api_get(f'{path}?fields={fields}').get('results', [])
+        success = bool(rows) and all(list(row) == expected for row in rows)
+        print_test(f'{path}?fields={fields} 목록', success, str(rows[:2]) if not success else '')
+
+        # 2. 상세: 같은 규칙 (PK 만 요청해도 PK 는 1번만)
+        if rows:
+            seq = rows[0][key]
+            result = api_get(f'{path}/{seq}?fields={fields}').get('result', {})
+            print_test(f'{path}/{{id}}?fields= 상세', list(result) == expected, str(result))
+            result = api_get(f'{path}/{seq}?fields={key}').get('result', {})
+            print_test(f'{path}/{{id}}?fields={key} (PK만)', list(result) == [key], str(result))
+
+        # 3. 화이트리스트에 없는 필드는 거부 (목록/상세)
+        result = api_get(f'{path}?fields={fields},no_such_column')
+        success = result.get('result') == 'Error' and 'no_such_column' in result.get('errorMsg', '')
+        print_test(f'{path} 알 수 없는 필드 거부', success, result.get('errorMsg', str(result)))
+        if rows:
+            result = api_get(f'{path}/{rows[0][key]}?fields=no_such_column')
+            print_test(f'{path}/{{id}} 알 수 없는 필드 거부', result.get('result') == 'Error', result.get('errorMsg', ''))
+
+    # 4. 제조사별 제품 + 다건 조회에도 적용 (커버링 인덱스 대상 컬럼)
+    products = api_get('/api/products?fields=m_seq').get('results', [])
+    if products:
+        m_seq = products[0]['m_seq']
+        rows = api_get(f'/api/products/by_maker/{m_seq}?fields=p_name,p_price,p_image').get('results', [])
+        success = bool(rows) and all(list(row) == ['p_seq', 'p_name', 'p_price', 'p_image'] for row in rows)
+        print_test('제조사별 제품 fields=', success, str(rows[:2]) if not success else '')
+        p_seq = products[0]['p_seq']
+        result = api_get(f'/api/products?ids={p_seq}&fields=p_name').get('results', {}).get(str(p_seq), {})
+        print_test('다건 조회 fields=', list(result) == ['p_seq', 'p_name'], str(result))
+
+    # 5. 빈 fields 는 전체 컬럼
+    rows = api_get('/api/makers?fields=').get('results', [])
+    success = bool(rows) and all(list(row)[:2] == ['m_seq', 'm_name'] and len(row) > 2 for row in rows)
+    print_test('빈 fields → 전체 컬럼', success, str(rows[:1]) if not success else '')
+
+
+# ============================================
+# 다건 조회 (?ids=) 테스트 (main.py 로 실행: uvicorn app_new_form.main:app)
+# ============================================
+MULTI_GET_PATHS = ('/api/products', '/api/users', '/api/branches', '/api/makers')
+MISSING_SEQ = 999999999
+
+
+def test_multi_get():
+    print_header('다건 조회 (?ids=) 테스트')
+
+    uid = random.randint(10000, 99999)
+    m1 = api_post_form('/api/makers', {'m_name': f'다건조회1_{uid}', 'm_phone': '02-0000-0001'}).get('m_seq')
+    m2 = api_post_form('/api/makers', {'m_name': f'다건조회2_{uid}', 'm_phone': '02-0000-0002'}).get('m_seq')
+    if m1 is None or m2 is None:
+        print_test('테스트 제조사 추가', False, str((m1, m2)))
+        return
+
+    # 1. 중복 제거 + 요청 순서 유지, 없는 id는 missing
+    result = api_get(f'/api/makers?ids={m2},{m1},{m2},{MISSING_SEQ}')
+    success = (list(result.get('results', {})) == [str(m2), str(m1)]
+               and result['results'][str(m1)].get('m_name') == f'다건조회1_{uid}'
+               and result.get('missing') == [MISSING_SEQ])
+    print_test('중복 제거 / 순서 / missing', success, str(result) if not success else '')
+
+    # 2. 모든 다건 조회 경로: 없는 id만 요청하면 results 비어 있고 missing 에 표시
+    for path in MULTI_GET_PATHS:
+        result = api_get(f'{path}?ids={MISSING_SEQ}')
+        success = result.get('results') == {} and result.get('missing') == [MISSING_SEQ]
+        print_test(f'{path}?ids= 없는 id', success, str(result) if not success else '')
+
+    # 3. 개수 초과 / 형식 오류
+    too_many = ','.join(str(seq) for seq in range(1, 102))
+    for path in MULTI_GET_PATHS:
+        result = api_get(f'{path}?ids={too_many}')
+        print_test(f'{path}?ids= 101개 거부', result.get('result') == 'Error', result.get('errorMsg', ''))
+    result = api_get('/api/makers?ids=1,abc')
+    print_test('ids 형식 오류 거부', result.get('result') == 'Error', result.get('errorMsg', ''))
+
+    # 4. 수정 후 바로 반영 (dimension_cache 무효화)
+    api_get(f'/api/makers?ids={m1}')
+    api_post_form(f'/api/makers/{m1}', {'m_seq': m1, 'm_name': f'다건조회수정_{uid}', 'm_phone': '02-0000-0003'})
+    result = api_get(f'/api/makers?ids={m1}')
+    name = result.get('results', {}).get(str(m1), {}).get('m_name')
+    print_test('제조사 수정 후 다건 조회 반영', name == f'다건조회수정_{uid}', str(name))
+
+    # 삭제 후에는 missing
+    api_delete(f'/api/makers/{m2}')
+    result = api_get(f'/api/makers?ids={m1},{m2}')
+    print_test('삭제 후 missing', result.get('missing') == [m2], str(result) if result.get('missing') != [m2] else '')
+    api_delete(f'/api/makers/{m1}')
+
+    products = api_get('/api/products?fields=p_seq').get('results', [])
+    if products:
+        p_seq = products[0]['p_seq']
+        stock = product_stock(p_seq)
+        api_get(f'/api/products?ids={p_seq}&fields=p_stock')
+        api_post_form(f'/api/products/{p_seq}/stock', {'p_stock': str(stock + 1)})
+        result = api_get(f'/api/products?ids={p_seq}&fields=p_stock')
+        fresh = result.get('results', {}).get(str(p_seq), {}).get('p_stock')
+        print_test('재고 수정 후 다건 조회 반영', fresh == stock + 1, f'{stock} → {fresh}')
+        api_post_form(f'/api/products/{p_seq}/stock', {'p_stock': str(stock)})
+
+
+# ============================================
+# 지점 대시보드 테스트 (main.py 로 실행: uvicorn app_new_form.main:app)
+# ============================================
+DASHBOARD_SECTIONS = ('pending_pickups', 'open_refunds', 'low_stock_products', 'pending_requests')
+
+
+def test_branch_dashboard():
+    print_header('지점 대시보드 API 테스트')
+
+    branches = api_get('/api/branches').get('results', [])
+    if not branches:
+        print_test('필수 데이터 조회 (지점)', False, '더미 데이터를 먼저 넣어 주세요')
+        return
+    br_seq = branches[0]['br_seq']
+
+    # 1. 네 섹션 모두 results / has_more / elapsed_ms, Server-Timing 헤더에 섹션별 시간 + total
+    response = httpx.get(f'{BASE_URL}/api/branches/{br_seq}/dashboard', timeout=10)
+    body = response.json()
+    sections = body.get('sections', {})
+    success = (body.get('result') == 'OK' and body.get('br_seq') == br_seq
+               and tuple(sections) == DASHBOARD_SECTIONS
+               and all(isinstance(sections[name].get('results'), list)
+                       and isinstance(sections[name].get('has_more'), bool)
+                       and sections[name].get('elapsed_ms') is not None for name in DASHBOARD_SECTIONS))
+    print_test('대시보드 섹션 4개', success, str(body)[:300] if not success else '')
+    timing = response.headers.get('server-timing', '')
+    success = all(f'{name};dur=' in timing for name in DASHBOARD_SECTIONS) and 'total;dur=' in timing
+    print_test('Server-Timing 헤더', success, timing)
+
+    # 2. has_more: limit=1 이면 섹션별 최대 1건, 2건 이상 있는 섹션은 has_more=True
+    #    (low_stock 기준을 크게 주면 재고 부족 제품 섹션은 제품이 2개 이상일 때 항상 2건 이상)
+    products = api_get('/api/products?fields=p_seq').get('results', [])
+    body = api_get(f'/api/branches/{br_seq}/dashboard?limit=1&low_stock=1000000000')
+    sections = body.get('sections', {})
+    low_stock = sections.get('low_stock_products', {})
+    success = (all(len(sections.get(name, {}).get('results', [])) <= 1 for name in DASHBOARD_SECTIONS)
+               and len(low_stock.get('results', [])) == min(1, len(products))
+               and low_stock.get('has_more') == (len(products) > 1))
+    print_test('limit=1 → has_more', success, str({name: sections.get(name, {}).get('has_more') for name in DASHBOARD_SECTIONS}))
+
+    # 3. 재고 부족 섹션은 low_stock 이하 제품만
+    body = api_get(f'/api/branches/{br_seq}/dashboard?low_stock=0&limit=100')
+    stocks = [row.get('p_stock') for row in body.get('sections', {}).get('low_stock_products', {}).get('results', [])]
+    success = 'low_stock_products' in body.get('sections', {}) and all(stock <= 0 for stock in stocks)
+    print_test('재고 기준 이하 제품만', success, str(stocks[:10]))
+
+    # 4. 잘못된 파라미터는 422
+    response = httpx.get(f'{BASE_URL}/api/branches/{br_seq}/dashboard?limit=0', timeout=10)
+    print_test('limit=0 거부 (422)', response.status_code == 422, str(response.status_code))
+
+
+# ============================================
+# 비밀번호 저장/노출 테스트 (main.py 로 실행: uvicorn app_new_form.main:app)
+# ============================================
+def test_credentials():
+    print_header('비밀번호 저장/노출 테스트')
+
+    uid = random.randint(100000, 999999)
+    user = {'u_id': f'cred{uid}', 'u_password': 'testpass', 'u_name': '비밀번호테스트', 'u_phone': f'010-{uid % 10000:04d}-7777'}
+    result = api_post_form_with_file('/api/users', user, file_path='dummy')
+    u_seq = result.get('u_seq')
+    print_test('고객 추가', u_seq is not None, str(result) if u_seq is None else '')
+    if u_seq is None:
+        return
+
+    # 1. 조회 응답에 비밀번호 해시가 없음 (상세/다건/전체, 직원 목록)
+    detail = api_get(f'/api/users/{u_seq}').get('result', {})
+    multi = api_get(f'/api/users?ids={u_seq}').get('results', {}).get(str(u_seq), {})
+    users = api_get('/api/users').get('results', [])
+    staffs = api_get('/api/staffs').get('results', [])
+    success = (bool(detail) and 'u_password' not in detail and 'u_password' not in multi
+               and all('u_password' not in row for row in users)
+               and all('s_password' not in row for row in staffs))
+    print_test('조회 응답에 비밀번호 해시 없음', success)
+    result = api_get(f'/api/users/{u_seq}?fields=u_password')
+    print_test('fields=u_password 거부', result.get('result') == 'Error', str(result) if result.get('result') != 'Error' else '')
+
+    # 2. 평문 비밀번호로 로그인
+    result = api_post_form('/api/users/login', {'u_id': user['u_id'], 'u_password': 'testpass'})
+    print_test('로그인', result.get('result') == 'OK', str(result) if result.get('result') != 'OK' else '')
+
+    # 3. 현재 설정과 다른(KDF 비용이 큰) 해시 문자열은 그대로 저장되지 않고 평문처럼 해시됨
+    costly = 'scrypt$16$4$16$AAAAAAAAAAAAAAAAAAAAAA$' + 'A' * 43
+    api_post_form(f'/api/users/{u_seq}', {**user, 'u_password': costly})
+    result = api_post_form('/api/users/login', {'u_id': user['u_id'], 'u_password': costly})
+    print_test('해시 형식 입력도 해시해서 저장', result.get('result') == 'OK', str(result) if result.get('result') != 'OK' else '')
+
+    api_delete(f'/api/users/{u_seq}')
+
+
+# ============================================
+# Batch 테스트 (main.py 로 실행: uvicorn app_new_form.main:app)
+# ============================================
+def test_batch():
+    print_header('Batch API 테스트')
+
+    # 1. 정상 요청: 요청 순서대로 id/status/body
+    result = api_post_json('/api/batch', {'requests': [
+        {'id': 'makers', 'path': '/api/makers'},
+        {'id': 'colors', 'path': '/api/color_categories'},
+        {'path': '/api/products', 'params': {'fields': 'p_seq,p_name'}},
+    ]})
+    items = result.get('results', [])
+    success = ([item.get('id') for item in items] == ['makers', 'colors', 2]
+               and all(item.get('status') == 200 and 'results' in item.get('body', {}) for item in items))
+    print_test('하위 요청 3개 (순서/상태/본문)', success, str(result)[:300] if not success else '')
+
+    # 2. 없는 경로는 하위 요청만 404, 나머지는 정상
+    result = api_post_json('/api/batch', {'requests': [
+        {'id': 'missing', 'path': '/api/no_such_resource'},
+        {'id': 'makers', 'path': '/api/makers'},
+    ]})
+    statuses = [item.get('status') for item in result.get('results', [])]
+    success = statuses == [404, 200]
+    print_test('없는 경로 → 하위 요청 404', success, str(statuses))
+
+    # 3. 잘못된 경로/메서드는 batch 전체 거부
+    for name, sub in (('/api/ 밖 경로', {'path': '/docs'}),
+                      ('경로에 쿼리 포함', {'path': '/api/makers?ids=1'}),
+                      ('batch 자신', {'path': '/api/batch'}),
+                      ('조회 외 메서드', {'method': 'DELETE', 'path': '/api/makers/1'})):
+        result = api_post_json('/api/batch', {'requests': [sub]})
+        print_test(f'거부: {name}', result.get('result') == 'Error', str(result) if result.get('result') != 'Error' else '')
+
+    # 4. 개수 제한 (최대 20개), 빈 요청
+    result = api_post_json('/api/batch', {'requests': [{'path': '/api/makers'}] * 21})
+    print_test('하위 요청 21개 거부', result.get('result') == 'Error', result.get('errorMsg', ''))
+    result = api_post_json('/api/batch', {'requests': []})
+    print_test('빈 요청 거부', result.get('result') == 'Error')
+
+    # 5. 제한 시간: timeout=0 이면 모든 하위 요청이 504, 최대값 초과 timeout 은 거부
+    result = api_post_json('/api/batch', {'timeout': 0, 'requests': [{'path': '/api/makers'}, {'path': '/api/branches'}]})
+    statuses = [item.get('status') for item in result.get('results', [])]
+    print_test('제한 시간 초과 → 504', statuses == [504, 504], str(statuses))
+    result = api_post_json('/api/batch', {'timeout': 60, 'requests': [{'path': '/api/makers'}]})
+    print_test('최대값 초과 timeout 거부', result.get('result') == 'Error', result.get('errorMsg', ''))
+
+
 # ============================================
 # 메인 함수
 # ============================================
@@ -632,6 +1062,13 @@ def main():
         print("  - purchase_item")
         print("  - product_join")
         print("  - purchase_item_join")
+        print("  - receive_manifest   (main.py 로 실행한 서버)")
+        print("  - request_bulk       (main.py 로 실행한 서버)")
+        print("  - fields             (main.py 로 실행한 서버)")
+        print("  - multi_get          (main.py 로 실행한 서버)")
+        print("  - branch_dashboard   (main.py 로 실행한 서버)")
+        print("  - credentials        (main.py 로 실행한 서버)")
+        print("  - batch              (main.py 로 실행한 서버)")
         print("\n예시: python test_app_new_form.py branch")
         return
     
@@ -650,6 +1087,13 @@ def main():
         'purchase_item': test_purchase_item,
         'product_join': test_product_join,
         'purchase_item_join': test_purchase_item_join,
+        'receive_manifest': test_receive_manifest,
+        'request_bulk': test_request_bulk,
+        'fields': test_fields,
+        'multi_get': test_multi_get,
+        'branch_dashboard': test_branch_dashboard,
+        'credentials': test_credentials,
+        'batch': test_batch,
     }
     
     if test_name not in test_functions:
@@ -5,10 +5,15 @@
 - 회원가입 상태 확인
 """
 
-from fastapi import APIRouter, Form, HTTPException
+import pymysql
+from fastapi import APIRouter, Form, Header, HTTPException
 from pydantic import BaseModel
 from typing import Optional
+from starlette.concurrency import run_in_threadpool
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from app_new_form.database.identity_cache import identity_cache, idempotency_cache, invalidate_identity
+from common.locks import KeyedLock
 
 router = APIRouter()
 
@@ -30,88 +35,150 @@ class CompleteRegistrationRequest(BaseModel):
     u_address: Optional[str] = None
 
 
+# ============================================
+# 소셜 로그인 identity 조회 (1회 JOIN + 캐시)
+# ============================================
+IDENTITY_SQL = """
+    SELECT u.u_seq, u.u_name, u.u_email, u.u_phone, u.u_address, u.registration_completed
+    FROM user_auth_identities a
+    JOIN user u ON u.u_seq = a.u_seq
+    WHERE a.provider = %s AND a.provider_subject = %s
+"""
+
+
+def fetch_identity(provider: str, provider_subject: str):
+    """(provider, provider_subject)로 사용자 요약 row 조회 (없으면 None)"""
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute(IDENTITY_SQL, (provider, provider_subject))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
+def identity_tags(row):
+    return [('user', row[0])]
+
+
+def login_response(row, message: str) -> dict:
+    return {
+        "result": "OK",
+        "user_seq": row[0],
+        "u_name": row[1],
+        "u_email": row[2],
+        "u_phone": row[3],
+        "u_address": row[4],
+        "registration_completed": bool(row[5]),
+        "message": message
+    }
+
+
+def signup_identity(provider: str, provider_subject: str, email, name, provider_issuer):
+    """
+    신규 소셜 사용자 생성 (다른 워커/서버와 동시에 가입해도 사용자는 1명만 생김)
+    - user INSERT 후 identity를 (provider, provider_subject) 기준으로 upsert
+    - 이미 다른 요청이 가입시켰으면(중복 키) 트랜잭션을 롤백해 방금 만든 user를 지우고 기존 사용자 반환
+
+    Returns:
+        tuple: (사용자 요약 row, 신규 생성 여부)
+    """
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        try:
+            curs.execute("""
+                INSERT INTO user (u_email, u_name, u_phone, registration_completed)
+                VALUES (%s, %s, NULL, FALSE)
+            """, (email, name))
+            user_seq = curs.lastrowid
+            
+            # 같은 identity가 먼저 커밋되면 rowcount = 0 (unique 키 대기 후 중복 판정)
+            curs.execute("""
+                INSERT INTO user_auth_identities 
+                (u_seq, provider, provider_subject, provider_issuer, email_at_provider)
+                VALUES (%s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE id = id
+            """, (user_seq, provider, provider_subject, provider_issuer, email))
+            created = curs.rowcount == 1
+        except pymysql.err.IntegrityError:
+            # 동시 가입으로 u_email 중복 등 → 먼저 가입한 쪽을 사용
+            created = False
+        
+        if created:
+            conn.commit()
+            return (user_seq, name, email, None, None, False), True
+        
+        conn.rollback()
+        curs.execute(IDENTITY_SQL, (provider, provider_subject))
+        row = curs.fetchone()
+        if row is None:
+            raise RuntimeError("소셜 로그인 정보 저장에 실패했습니다")
+        return row, False
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 # ============================================
 # 소셜 로그인 (1단계: 사용자 생성/조회)
 # ============================================
+# 같은 워커에서 같은 identity 첫 로그인이 동시에 들어오면 한 요청씩 처리
+signup_locks = KeyedLock()
+
+
 @router.post("/auth/social/login")
 async def social_login(
     provider: str = Form(...),
     provider_subject: str = Form(...),
     email: Optional[str] = Form(None),
     name: Optional[str] = Form(None),
-    provider_issuer: Optional[str] = Form(None)
+    provider_issuer: Optional[str] = Form(None),
+    idempotency_key: Optional[str] = Header(None)
 ):
     """
     소셜 로그인 후 사용자 생성 또는 조회
-    - 기존 사용자면 조회하여 반환
+    - 기존 사용자면 조회하여 반환 (identity 캐시 → 없으면 JOIN 1회)
     - 신규 사용자면 기본 정보만 저장하고 미완료 상태로 반환
+    - Idempotency-Key 헤더가 있으면 같은 key 재시도에 처음 응답을 그대로 반환
     """
-    conn = connect_db()
-    curs = conn.cursor()
-    
+    key = (provider, provider_subject)
     try:
-        # 1. user_auth_identities에서 기존 사용자 확인
-        curs.execute("""
-            SELECT user_id 
-            FROM user_auth_identities 
-            WHERE provider = %s AND provider_subject = %s
-        """, (provider, provider_subject))
-        existing_auth = curs.fetchone()
-        
-        if existing_auth:
-            # 기존 사용자: user 정보 조회
-            user_id = existing_auth[0]
-            curs.execute("""
-                SELECT u_seq, u_name, u_email, u_phone, u_address, registration_completed
-                FROM user 
-                WHERE u_seq = %s
-            """, (user_id,))
-            user_row = curs.fetchone()
-            
-            if user_row:
-                return {
-                    "result": "OK",
-                    "user_seq": user_row[0],
-                    "u_name": user_row[1],
-                    "u_email": user_row[2],
-                    "u_phone": user_row[3],
-                    "u_address": user_row[4],
-                    "registration_completed": bool(user_row[5]),
-                    "message": "기존 사용자 로그인 성공"
-                }
+        if idempotency_key:
+            hit, response = idempotency_cache.get((idempotency_key,) + key)
+            if hit:
+                return response
         
-        # 2. 신규 사용자: user 테이블에 기본 정보만 저장
-        curs.execute("""
-            INSERT INTO user (u_email, u_name, u_phone, registration_completed)
-            VALUES (%s, %s, NULL, FALSE)
-        """, (email, name))
-        user_seq = curs.lastrowid
+        # 1. 기존 사용자 확인 (user_auth_identities + user JOIN)
+        row = await identity_cache.get_or_load(
+            key, fetch_identity, provider, provider_subject, tags=identity_tags
+        )
+        if row:
+            return login_response(row, "기존 사용자 로그인 성공")
         
-        # 3. user_auth_identities에 소셜 로그인 정보 저장
-        curs.execute("""
-            INSERT INTO user_auth_identities 
-            (user_id, provider, provider_subject, provider_issuer, email_at_provider)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (user_seq, provider, provider_subject, provider_issuer, email))
-        
-        conn.commit()
+        # 2. 신규 사용자: user + user_auth_identities 저장
+        async with signup_locks.hold(key):
+            # 기다리는 동안 먼저 온 요청이 가입을 끝냈으면 그 결과 사용
+            hit, row = identity_cache.get(key)
+            created = False
+            if not hit:
+                row, created = await run_in_threadpool(
+                    signup_identity, provider, provider_subject, email, name, provider_issuer
+                )
+                identity_cache.set(key, row, identity_tags(row))
         
-        return {
-            "result": "OK",
-            "user_seq": user_seq,
-            "u_name": name,
-            "u_email": email,
-            "u_phone": None,
-            "u_address": None,
-            "registration_completed": False,
-            "message": "소셜 로그인 성공. 추가 정보 입력이 필요합니다."
-        }
+        if created:
+            response = login_response(row, "소셜 로그인 성공. 추가 정보 입력이 필요합니다.")
+        else:
+            response = login_response(row, "기존 사용자 로그인 성공")
+        if idempotency_key:
+            idempotency_cache.set((idempotency_key,) + key, response)
+        return response
         
     except Exception as e:
-        conn.rollback()
         return {"result": "Error", "errorMsg": str(e)}
-    finally:
-        conn.close()
 
 
 # ============================================
@@ -167,6 +234,8 @@ async def complete_registration(
             """, (u_phone, u_address, user_seq))
         
         conn.commit()
+        invalidate_identity(user_seq)
+        invalidate_detail('user', user_seq)
         
         return {
             "result": "OK",
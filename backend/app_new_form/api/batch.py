@@ -0,0 +1,177 @@
+"""
+Batch API - 여러 조회 요청을 한 번에 처리
+모바일 화면에서 순서대로 보내던 조회(제품, 카테고리, 제조사 등)를 요청 1번으로 묶는다.
+
+- 하위 요청은 HTTP를 거치지 않고 같은 프로세스의 라우터(app.router)로 바로 실행
+- 하위 요청마다 전용 스레드에서 이벤트 루프를 따로 돌려 실행 (동시 실행)
+  핸들러 대부분이 async def 안에서 pymysql 을 바로 호출하므로, 메인 이벤트 루프에서 돌리면
+  하위 요청이 하나씩 순서대로 실행되고 그동안 서버 전체가 멈춤 (제한 시간도 동작하지 않음)
+- 조회(GET)만 허용, 경로는 /api/ 하위만 (batch 자신은 제외)
+- 하위 요청마다 DB 연결은 primary 풀에서 빌려 쓰고 반납 (pymysql 연결 1개를 동시에 공유할 수 없으므로 풀로 재사용)
+- 제한: 하위 요청 MAX_SUB_REQUESTS 개, 전체 BATCH_TIMEOUT 초 (초과한 하위 요청은 504)
+  요청에 timeout(초)을 주면 BATCH_TIMEOUT 이하에서 더 짧게 제한 가능
+  스레드는 중단할 수 없으므로 시간 초과된 하위 요청은 결과만 버리고 끝날 때까지 스레드에서 계속 실행됨
+- 하위 응답 본문(JSON)은 다시 파싱하지 않고 그대로 이어 붙여서 반환
+
+요청:
+    POST /api/batch
+    {"requests": [
+        {"id": "product", "path": "/api/products/12"},
+        {"id": "colors", "path": "/api/color_categories"},
+        {"id": "related", "path": "/api/products/products/with_categories", "params": {"maker_seq": 1}}
+    ]}
+
+응답:
+    {"results": [
+        {"id": "product", "status": 200, "body": {"result": {...}}},
+        ...
+    ]}
+"""
+
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Request
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException
+from common.serialization import RawJSONResponse, dumps
+
+router = APIRouter()
+
+MAX_SUB_REQUESTS = 20
+BATCH_TIMEOUT = 10.0
+ALLOWED_METHODS = ('GET',)
+BATCH_PATH = '/api/batch'
+# 하위 요청 실행 스레드 (동시에 처리 중인 batch 요청 2개분, 초과분은 스레드가 빌 때까지 대기)
+SUB_REQUEST_THREADS = MAX_SUB_REQUESTS * 2
+
+# 하위 요청에 그대로 넘기는 부모 요청 헤더 (압축은 batch 응답 전체에만 적용)
+FORWARD_HEADERS = (b'cookie', b'authorization', b'user-agent', b'accept-language')
+# 부모 scope 에서 복사하는 항목 (앱/예외 처리기 등, 라우팅 결과와 부모 루프의 정리 스택은 제외)
+SCOPE_KEYS = ('type', 'asgi', 'http_version', 'scheme', 'server', 'client', 'root_path', 'app', 'state',
+              'starlette.exception_handlers')
+
+executor = ThreadPoolExecutor(max_workers=SUB_REQUEST_THREADS, thread_name_prefix='batch')
+
+
+# ============================================
+# 모델 정의
+# ============================================
+class SubRequest(BaseModel):
+    id: Optional[Union[str, int]] = None  # 응답에서 하위 요청 구분용 (없으면 순서 번호)
+    method: str = 'GET'
+    path: str
+    params: Dict[str, Any] = {}
+
+
+class BatchRequest(BaseModel):
+    requests: List[SubRequest]
+    timeout: Optional[float] = None  # 전체 제한 시간(초), 없으면 BATCH_TIMEOUT
+
+
+# ============================================
+# 하위 요청 실행
+# ============================================
+def validate(sub: SubRequest):
+    if sub.method.upper() not in ALLOWED_METHODS:
+        raise ValueError(f"{sub.path}: {sub.method} 은(는) 사용할 수 없습니다 (조회만 가능)")
+    if not sub.path.startswith('/api/') or '?' in sub.path or sub.path.startswith(BATCH_PATH):
+        raise ValueError(f"{sub.path}: 잘못된 경로입니다 (/api/ 하위 경로, 쿼리는 params 로 전달)")
+
+
+async def dispatch(parent_scope: dict, sub: SubRequest) -> tuple:
+    """app.router 로 바로 실행 → (status, content-type, body bytes)"""
+    headers = [(name, value) for name, value in parent_scope['headers'] if name in FORWARD_HEADERS]
+    headers.append((b'accept', b'application/json'))
+    scope = {key: parent_scope[key] for key in SCOPE_KEYS if key in parent_scope}
+    scope.update({
+        'method': sub.method.upper(),
+        'path': sub.path,
+        'raw_path': sub.path.encode('utf-8'),
+        'query_string': urlencode(sub.params, doseq=True).encode('latin-1'),
+        'headers': headers,
+    })
+    status = 500
+    content_type = b''
+    chunks = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        nonlocal status, content_type
+        if message['type'] == 'http.response.start':
+            status = message['status']
+            content_type = dict(message.get('headers', [])).get(b'content-type', b'')
+        elif message['type'] == 'http.response.body':
+            chunks.append(message.get('body', b''))
+
+    try:
+        # 업로드 파일 정리 스택은 하위 요청의 이벤트 루프 안에서 따로 만들고 닫음
+        async with AsyncExitStack() as stack:
+            scope['fastapi_middleware_astack'] = stack
+            await parent_scope['app'].router(scope, receive, send)
+    except HTTPException as e:
+        # 라우터 단계 오류(경로 없음 등)는 예외 처리 미들웨어를 거치지 않으므로 여기서 응답으로 변환
+        return e.status_code, b'application/json', dumps({"detail": e.detail})
+    return status, content_type, b''.join(chunks)
+
+
+def run_sub_request(parent_scope: dict, sub: SubRequest) -> tuple:
+    """하위 요청 1개를 이 스레드의 새 이벤트 루프에서 실행 (executor 스레드에서 호출)"""
+    return asyncio.run(dispatch(parent_scope, sub))
+
+
+def encode_result(sub_id, status: int, content_type: bytes, body: bytes) -> bytes:
+    # JSON 응답은 그대로 삽입, 그 외(이미지 등)는 문자열로
+    if not content_type.startswith(b'application/json') or not body:
+        body = dumps(body.decode('utf-8', errors='replace'))
+    return b'{"id":' + dumps(sub_id) + b',"status":' + str(status).encode() + b',"body":' + body + b'}'
+
+
+def error_result(sub_id, status: int, message: str) -> bytes:
+    return encode_result(sub_id, status, b'application/json', dumps({"result": "Error", "errorMsg": message}))
+
+
+# ============================================
+# Batch 엔드포인트
+# ============================================
+@router.post("/batch")
+async def batch(body: BatchRequest, request: Request):
+    if not body.requests:
+        return {"result": "Error", "errorMsg": "requests가 비어 있습니다"}
+    if len(body.requests) > MAX_SUB_REQUESTS:
+        return {"result": "Error", "errorMsg": f"하위 요청은 최대 {MAX_SUB_REQUESTS}개까지 가능합니다 (요청 {len(body.requests)}개)"}
+    timeout = BATCH_TIMEOUT if body.timeout is None else body.timeout
+    if not 0 <= timeout <= BATCH_TIMEOUT:
+        return {"result": "Error", "errorMsg": f"timeout은 0 ~ {BATCH_TIMEOUT}초 사이여야 합니다"}
+    try:
+        for sub in body.requests:
+            validate(sub)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
+
+    # contextvars(읽기 replica 고정 여부 등)는 하위 요청 스레드로 복사해서 전달
+    loop = asyncio.get_running_loop()
+    tasks = [
+        loop.run_in_executor(executor, contextvars.copy_context().run, run_sub_request, request.scope, sub)
+        for sub in body.requests
+    ]
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+
+    results = []
+    for index, (sub, task) in enumerate(zip(body.requests, tasks)):
+        sub_id = sub.id if sub.id is not None else index
+        if task in pending:
+            results.append(error_result(sub_id, 504, f"batch 제한 시간({timeout}초) 초과"))
+        elif task.exception() is not None:
+            results.append(error_result(sub_id, 500, str(task.exception())))
+        else:
+            results.append(encode_result(sub_id, *task.result()))
+    return RawJSONResponse(b'{"results":[' + b','.join(results) + b']}')
@@ -2,10 +2,15 @@
 Branch API - 지점 CRUD (Router 버전)
 """
 
-from fastapi import APIRouter, Form
+from fastapi import APIRouter, Form, Query
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import dimension_cache, invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.multiget import MAX_IDS, dumps_keyed, load_rows, parse_ids
+from common.fieldsets import FieldSet
+from common.serialization import RawJSONResponse
 
 router = APIRouter()
 
@@ -22,60 +27,90 @@ class Branch(BaseModel):
     br_lng: Optional[float] = None
 
 
+# ============================================
+# 조회 가능 컬럼 (fields= 화이트리스트, 기본 SELECT 순서와 동일)
+# ============================================
+BRANCH_FIELDS = FieldSet([
+    'br_seq', 'br_phone', 'br_address', 'br_name', 'br_lat', 'br_lng',
+])
+FIELDS_DESCRIPTION = "쉼표로 구분한 응답 컬럼 (예: br_name,br_lat,br_lng), br_seq는 항상 포함. 생략하면 전체 컬럼"
+
+
 # ============================================
 # 전체 지점 조회
 # ============================================
 @router.get("")
-async def select_branches():
+async def select_branches(
+    ids: Optional[str] = Query(None, description=f"쉼표로 구분한 br_seq 목록 (최대 {MAX_IDS}개), 지정하면 br_seq별 결과 반환"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    if ids is not None:
+        return await select_branches_by_ids(ids, fields)
+    try:
+        projection = BRANCH_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
     try:
-        curs.execute("""
-            SELECT br_seq, br_phone, br_address, br_name, br_lat, br_lng 
+        curs.execute(f"""
+            SELECT {projection.columns} 
             FROM branch 
             ORDER BY br_seq
         """)
         rows = curs.fetchall()
-        result = [{
-            'br_seq': row[0],
-            'br_phone': row[1],
-            'br_address': row[2],
-            'br_name': row[3],
-            'br_lat': float(row[4]) if row[4] else None,
-            'br_lng': float(row[5]) if row[5] else None
-        } for row in rows]
-        return {"results": result}
+        return RawJSONResponse(projection.codec.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
         conn.close()
 
 
+# ============================================
+# 여러 ID로 지점 조회 (?ids=1,2,3)
+# ============================================
+BRANCH_BY_IDS_SQL = """
+    SELECT br_seq, br_phone, br_address, br_name, br_lat, br_lng
+    FROM branch
+    WHERE br_seq IN ({ids})
+"""
+
+
+async def select_branches_by_ids(ids: str, fields: Optional[str] = None):
+    """캐시(dimension_cache)에 없는 id만 IN (...) 1번으로 조회, 결과는 br_seq를 key로 반환"""
+    try:
+        projection = BRANCH_FIELDS.resolve(fields)
+        seqs = parse_ids(ids)
+        rows = await load_rows(dimension_cache, 'branch', seqs, connect_db, BRANCH_BY_IDS_SQL)
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+    return RawJSONResponse(dumps_keyed(projection.codec, seqs, rows, pick=projection.pick))
+
+
 # ============================================
 # ID로 지점 조회
 # ============================================
 @router.get("/{branch_seq}")
-async def select_branch(branch_seq: int):
+async def select_branch(
+    branch_seq: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    try:
+        projection = BRANCH_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
     try:
-        curs.execute("""
-            SELECT br_seq, br_phone, br_address, br_name, br_lat, br_lng 
+        curs.execute(f"""
+            SELECT {projection.columns} 
             FROM branch 
             WHERE br_seq = %s
         """, (branch_seq,))
         row = curs.fetchone()
         if row is None:
             return {"result": "Error", "message": "Branch not found"}
-        result = {
-            'br_seq': row[0],
-            'br_phone': row[1],
-            'br_address': row[2],
-            'br_name': row[3],
-            'br_lat': float(row[4]) if row[4] else None,
-            'br_lng': float(row[5]) if row[5] else None
-        }
-        return {"result": result}
+        return RawJSONResponse(projection.codec.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -102,6 +137,7 @@ async def insert_branch(
         """
         curs.execute(sql, (br_name, br_phone, br_address, br_lat, br_lng))
         conn.commit()
+        table_versions.bump('branch')
         inserted_id = curs.lastrowid
         return {"result": "OK", "br_seq": inserted_id}
     except Exception as e:
@@ -132,6 +168,8 @@ async def update_branch(
         """
         curs.execute(sql, (br_name, br_phone, br_address, br_lat, br_lng, branch_seq))
         conn.commit()
+        table_versions.bump('branch')
+        invalidate_detail('branch', branch_seq)
         return {"result": "OK"}
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
@@ -150,6 +188,8 @@ async def delete_branch(branch_seq: int):
         sql = "DELETE FROM branch WHERE br_seq=%s"
         curs.execute(sql, (branch_seq,))
         conn.commit()
+        table_versions.bump('branch')
+        invalidate_detail('branch', branch_seq)
         return {"result": "OK"}
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
@@ -0,0 +1,201 @@
+"""
+Branch Dashboard API - 지점 직원 업무 시작 화면
+수령 대기 / 처리 전 반품 / 재고 부족 제품 / 결재 대기 발주를 요청 1번으로 조회한다.
+
+- 섹션마다 풀에서 연결을 따로 빌려(connect_read_db) 스레드풀에서 동시에 실행
+  → 응답 시간은 섹션 합계가 아니라 가장 느린 섹션 시간에 가까움
+- 섹션별 소요 시간(elapsed_ms)을 응답과 Server-Timing 헤더에 포함 (어느 조회가 느린지 확인용)
+- 한 섹션이 실패해도 나머지 섹션은 반환 (실패한 섹션에는 error)
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Query
+from starlette.concurrency import run_in_threadpool
+from app_new_form.database.replicas import connect_read_db
+from common.serialization import RowCodec, RawJSONResponse, dumps
+
+router = APIRouter()
+
+SECTION_LIMIT = 20
+LOW_STOCK_THRESHOLD = 10
+PICKUP_DAYS = 30
+
+
+# ============================================
+# 섹션 쿼리 / Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+# 지점에서 구매했지만 아직 수령 기록이 없는 주문 (오래된 주문부터, 최근 PICKUP_DAYS 일 → 최근 파티션만 읽음)
+PENDING_PICKUPS_SQL = """
+    SELECT
+        pi.b_seq,
+        pi.b_date,
+        pi.b_quantity,
+        pi.b_status,
+        u.u_seq,
+        u.u_name,
+        u.u_phone,
+        p.p_seq,
+        p.p_name,
+        p.p_image
+    FROM purchase_item pi
+    JOIN user u ON pi.u_seq = u.u_seq
+    JOIN product p ON pi.p_seq = p.p_seq
+    WHERE pi.br_seq = %s
+      AND pi.b_date >= %s
+      AND NOT EXISTS (SELECT 1 FROM pickup pic WHERE pic.b_seq = pi.b_seq)
+    ORDER BY pi.b_date, pi.b_seq
+    LIMIT %s
+"""
+
+PENDING_PICKUPS_CODEC = RowCodec([
+    'b_seq', 'b_date', 'b_quantity', 'b_status',
+    ('user', ['u_seq', 'u_name', 'u_phone']),
+    ('product', ['p_seq', 'p_name', 'p_image']),
+])
+
+# 지점에서 수령한 주문의 반품 중 처리 일시(ref_date)가 없는 것
+OPEN_REFUNDS_SQL = """
+    SELECT
+        ref.ref_seq,
+        ref.ref_reason,
+        ref.ref_re_content,
+        pic.pic_seq,
+        pic.created_at,
+        u.u_seq,
+        u.u_name,
+        u.u_phone,
+        p.p_seq,
+        p.p_name
+    FROM refund ref
+    JOIN pickup pic ON ref.pic_seq = pic.pic_seq
+    JOIN purchase_item pi ON pic.b_seq = pi.b_seq
+    JOIN user u ON ref.u_seq = u.u_seq
+    JOIN product p ON pi.p_seq = p.p_seq
+    WHERE pi.br_seq = %s
+      AND ref.ref_date IS NULL
+    ORDER BY pic.created_at, ref.ref_seq
+    LIMIT %s
+"""
+
+OPEN_REFUNDS_CODEC = RowCodec([
+    'ref_seq', 'ref_reason', 'ref_re_content',
+    ('pickup', ['pic_seq', 'created_at']),
+    ('user', ['u_seq', 'u_name', 'u_phone']),
+    ('product', ['p_seq', 'p_name']),
+])
+
+# 재고(p_stock, 중앙 재고)가 기준 이하인 제품 (적은 순)
+LOW_STOCK_SQL = """
+    SELECT
+        p.p_seq,
+        p.p_name,
+        p.p_stock,
+        p.p_image,
+        m.m_seq,
+        m.m_name
+    FROM product p
+    JOIN maker m ON p.m_seq = m.m_seq
+    WHERE p.p_stock <= %s
+    ORDER BY p.p_stock, p.p_seq
+    LIMIT %s
+"""
+
+LOW_STOCK_CODEC = RowCodec([
+    'p_seq', 'p_name', 'p_stock', 'p_image',
+    ('maker', ['m_seq', 'm_name']),
+])
+
+# 지점 직원이 올린 발주 중 결재가 끝나지 않은 것 (idx_request_state_date)
+PENDING_REQUESTS_SQL = """
+    SELECT
+        req.req_seq,
+        req.req_date,
+        req.req_quantity,
+        req.req_state,
+        s.s_seq,
+        s.s_name,
+        s.s_rank,
+        p.p_seq,
+        p.p_name
+    FROM request req
+    JOIN staff s ON req.s_seq = s.s_seq
+    JOIN product p ON req.p_seq = p.p_seq
+    WHERE s.br_seq = %s
+      AND req.req_state IN ('pending', 'manager_approved')
+    ORDER BY req.req_date DESC, req.req_seq DESC
+    LIMIT %s
+"""
+
+PENDING_REQUESTS_CODEC = RowCodec([
+    'req_seq', 'req_date', 'req_quantity', 'req_state',
+    ('staff', ['s_seq', 's_name', 's_rank']),
+    ('product', ['p_seq', 'p_name']),
+])
+
+
+# ============================================
+# 섹션 실행
+# ============================================
+def fetch_section(sql: str, params: tuple) -> tuple:
+    """섹션 1개 조회 (스레드풀에서 실행, 연결은 섹션마다 따로) → (rows, 소요 ms)"""
+    started = time.perf_counter()
+    conn = connect_read_db()
+    try:
+        curs = conn.cursor()
+        curs.execute(sql, params)
+        rows = curs.fetchall()
+    finally:
+        conn.close()
+    return rows, (time.perf_counter() - started) * 1000
+
+
+def encode_section(codec: RowCodec, outcome, limit: int) -> dict:
+    if isinstance(outcome, Exception):
+        return {"error": str(outcome), "elapsed_ms": None}
+    rows, elapsed = outcome
+    # 다음 데이터 유무 확인용으로 limit + 1 건 조회
+    return {
+        "results": codec.to_list(rows[:limit]),
+        "has_more": len(rows) > limit,
+        "elapsed_ms": round(elapsed, 1),
+    }
+
+
+# ============================================
+# 지점 대시보드
+# ============================================
+@router.get("/{branch_seq}/dashboard")
+async def get_branch_dashboard(
+    branch_seq: int,
+    limit: int = Query(SECTION_LIMIT, ge=1, le=100, description="섹션별 최대 건수"),
+    low_stock: int = Query(LOW_STOCK_THRESHOLD, ge=0, description="이 수량 이하를 재고 부족으로 표시"),
+    days: int = Query(PICKUP_DAYS, ge=1, le=365, description="수령 대기: 최근 며칠 주문까지"),
+):
+    started = time.perf_counter()
+    since = datetime.now() - timedelta(days=days)
+    sections = {
+        'pending_pickups': (PENDING_PICKUPS_SQL, (branch_seq, since, limit + 1), PENDING_PICKUPS_CODEC),
+        'open_refunds': (OPEN_REFUNDS_SQL, (branch_seq, limit + 1), OPEN_REFUNDS_CODEC),
+        'low_stock_products': (LOW_STOCK_SQL, (low_stock, limit + 1), LOW_STOCK_CODEC),
+        'pending_requests': (PENDING_REQUESTS_SQL, (branch_seq, limit + 1), PENDING_REQUESTS_CODEC),
+    }
+    outcomes = await asyncio.gather(
+        *(run_in_threadpool(fetch_section, sql, params) for sql, params, _ in sections.values()),
+        return_exceptions=True,
+    )
+
+    body = {
+        name: encode_section(codec, outcome, limit)
+        for (name, (_, _, codec)), outcome in zip(sections.items(), outcomes)
+    }
+    elapsed = (time.perf_counter() - started) * 1000
+    timings = ', '.join(
+        f"{name};dur={section['elapsed_ms']}" for name, section in body.items() if section['elapsed_ms'] is not None
+    )
+    return RawJSONResponse(
+        dumps({"result": "OK", "br_seq": branch_seq, "elapsed_ms": round(elapsed, 1), "sections": body}),
+        headers={"Server-Timing": f"{timings}, total;dur={elapsed:.1f}" if timings else f"total;dur={elapsed:.1f}"},
+    )
@@ -7,6 +7,9 @@ from fastapi import APIRouter, Form
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -19,6 +22,14 @@ class ColorCategory(BaseModel):
     cc_name: str
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+COLOR_CATEGORY_CODEC = RowCodec([
+    'cc_seq', 'cc_name',
+])
+
+
 # ============================================
 # 전체 색상 카테고리 조회
 # ============================================
@@ -33,11 +44,7 @@ async def select_color_categories():
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'cc_seq': row[0],
-        'cc_name': row[1]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(COLOR_CATEGORY_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -56,11 +63,7 @@ async def select_color_category(color_category_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "ColorCategory not found"}
-    result = {
-        'cc_seq': row[0],
-        'cc_name': row[1]
-    }
-    return {"result": result}
+    return RawJSONResponse(COLOR_CATEGORY_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -76,6 +79,7 @@ async def insert_color_category(
         sql = "INSERT INTO color_category (cc_name) VALUES (%s)"
         curs.execute(sql, (cc_name,))
         conn.commit()
+        table_versions.bump('color_category')
         inserted_id = curs.lastrowid
         conn.close()
         return {"result": "OK", "cc_seq": inserted_id}
@@ -97,6 +101,8 @@ async def update_color_category(
         sql = "UPDATE color_category SET cc_name=%s WHERE cc_seq=%s"
         curs.execute(sql, (cc_name, cc_seq))
         conn.commit()
+        table_versions.bump('color_category')
+        invalidate_detail('color_category', cc_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -114,6 +120,8 @@ async def delete_color_category(color_category_seq: int):
         sql = "DELETE FROM color_category WHERE cc_seq=%s"
         curs.execute(sql, (color_category_seq,))
         conn.commit()
+        table_versions.bump('color_category')
+        invalidate_detail('color_category', color_category_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -7,6 +7,9 @@ from fastapi import APIRouter, Form
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -19,6 +22,14 @@ class GenderCategory(BaseModel):
     gc_name: str
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+GENDER_CATEGORY_CODEC = RowCodec([
+    'gc_seq', 'gc_name',
+])
+
+
 # ============================================
 # 전체 성별 카테고리 조회
 # ============================================
@@ -33,11 +44,7 @@ async def select_gender_categories():
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'gc_seq': row[0],
-        'gc_name': row[1]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(GENDER_CATEGORY_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -56,11 +63,7 @@ async def select_gender_category(gender_category_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "GenderCategory not found"}
-    result = {
-        'gc_seq': row[0],
-        'gc_name': row[1]
-    }
-    return {"result": result}
+    return RawJSONResponse(GENDER_CATEGORY_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -76,6 +79,7 @@ async def insert_gender_category(
         sql = "INSERT INTO gender_category (gc_name) VALUES (%s)"
         curs.execute(sql, (gc_name,))
         conn.commit()
+        table_versions.bump('gender_category')
         inserted_id = curs.lastrowid
         conn.close()
         return {"result": "OK", "gc_seq": inserted_id}
@@ -97,6 +101,8 @@ async def update_gender_category(
         sql = "UPDATE gender_category SET gc_name=%s WHERE gc_seq=%s"
         curs.execute(sql, (gc_name, gc_seq))
         conn.commit()
+        table_versions.bump('gender_category')
+        invalidate_detail('gender_category', gc_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -114,6 +120,8 @@ async def delete_gender_category(gender_category_seq: int):
         sql = "DELETE FROM gender_category WHERE gc_seq=%s"
         curs.execute(sql, (gender_category_seq,))
         conn.commit()
+        table_versions.bump('gender_category')
+        invalidate_detail('gender_category', gender_category_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
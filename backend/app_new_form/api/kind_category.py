@@ -7,6 +7,9 @@ from fastapi import APIRouter, Form
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -19,6 +22,14 @@ class KindCategory(BaseModel):
     kc_name: str
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+KIND_CATEGORY_CODEC = RowCodec([
+    'kc_seq', 'kc_name',
+])
+
+
 # ============================================
 # 전체 종류 카테고리 조회
 # ============================================
@@ -33,11 +44,7 @@ async def select_kind_categories():
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'kc_seq': row[0],
-        'kc_name': row[1]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(KIND_CATEGORY_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -56,11 +63,7 @@ async def select_kind_category(kind_category_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "KindCategory not found"}
-    result = {
-        'kc_seq': row[0],
-        'kc_name': row[1]
-    }
-    return {"result": result}
+    return RawJSONResponse(KIND_CATEGORY_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -76,6 +79,7 @@ async def insert_kind_category(
         sql = "INSERT INTO kind_category (kc_name) VALUES (%s)"
         curs.execute(sql, (kc_name,))
         conn.commit()
+        table_versions.bump('kind_category')
         inserted_id = curs.lastrowid
         conn.close()
         return {"result": "OK", "kc_seq": inserted_id}
@@ -97,6 +101,8 @@ async def update_kind_category(
         sql = "UPDATE kind_category SET kc_name=%s WHERE kc_seq=%s"
         curs.execute(sql, (kc_name, kc_seq))
         conn.commit()
+        table_versions.bump('kind_category')
+        invalidate_detail('kind_category', kc_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -114,6 +120,8 @@ async def delete_kind_category(kind_category_seq: int):
         sql = "DELETE FROM kind_category WHERE kc_seq=%s"
         curs.execute(sql, (kind_category_seq,))
         conn.commit()
+        table_versions.bump('kind_category')
+        invalidate_detail('kind_category', kind_category_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
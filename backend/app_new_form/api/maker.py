@@ -3,10 +3,15 @@ Maker API - 제조사 CRUD
 개별 실행: python maker.py
 """
 
-from fastapi import APIRouter, Form
+from fastapi import APIRouter, Form, Query
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import dimension_cache, invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.multiget import MAX_IDS, dumps_keyed, load_rows, parse_ids
+from common.fieldsets import FieldSet
+from common.serialization import RawJSONResponse
 
 router = APIRouter()
 
@@ -21,38 +26,78 @@ class Maker(BaseModel):
     m_address: Optional[str] = None
 
 
+# ============================================
+# 조회 가능 컬럼 (fields= 화이트리스트, 기본 SELECT 순서와 동일)
+# ============================================
+MAKER_FIELDS = FieldSet([
+    'm_seq', 'm_name', 'm_phone', 'm_address',
+])
+FIELDS_DESCRIPTION = "쉼표로 구분한 응답 컬럼 (예: m_name), m_seq는 항상 포함. 생략하면 전체 컬럼"
+
+
 # ============================================
 # 전체 제조사 조회
 # ============================================
 @router.get("")
-async def select_makers():
+async def select_makers(
+    ids: Optional[str] = Query(None, description=f"쉼표로 구분한 m_seq 목록 (최대 {MAX_IDS}개), 지정하면 m_seq별 결과 반환"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    if ids is not None:
+        return await select_makers_by_ids(ids, fields)
+    try:
+        projection = MAKER_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT m_seq, m_name, m_phone, m_address 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM maker 
         ORDER BY m_seq
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'm_seq': row[0],
-        'm_name': row[1],
-        'm_phone': row[2],
-        'm_address': row[3]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(projection.codec.dumps_results(rows))
+
+
+# ============================================
+# 여러 ID로 제조사 조회 (?ids=1,2,3)
+# ============================================
+MAKER_BY_IDS_SQL = """
+    SELECT m_seq, m_name, m_phone, m_address
+    FROM maker
+    WHERE m_seq IN ({ids})
+"""
+
+
+async def select_makers_by_ids(ids: str, fields: Optional[str] = None):
+    """캐시(dimension_cache)에 없는 id만 IN (...) 1번으로 조회, 결과는 m_seq를 key로 반환"""
+    try:
+        projection = MAKER_FIELDS.resolve(fields)
+        seqs = parse_ids(ids)
+        rows = await load_rows(dimension_cache, 'maker', seqs, connect_db, MAKER_BY_IDS_SQL)
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+    return RawJSONResponse(dumps_keyed(projection.codec, seqs, rows, pick=projection.pick))
 
 
 # ============================================
 # ID로 제조사 조회
 # ============================================
 @router.get("/{maker_seq}")
-async def select_maker(maker_seq: int):
+async def select_maker(
+    maker_seq: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    try:
+        projection = MAKER_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT m_seq, m_name, m_phone, m_address 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM maker 
         WHERE m_seq = %s
     """, (maker_seq,))
@@ -60,13 +105,7 @@ async def select_maker(maker_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "Maker not found"}
-    result = {
-        'm_seq': row[0],
-        'm_name': row[1],
-        'm_phone': row[2],
-        'm_address': row[3]
-    }
-    return {"result": result}
+    return RawJSONResponse(projection.codec.dumps_result(row))
 
 
 # ============================================
@@ -84,6 +123,7 @@ async def insert_maker(
         sql = "INSERT INTO maker (m_name, m_phone, m_address) VALUES (%s, %s, %s)"
         curs.execute(sql, (m_name, m_phone, m_address))
         conn.commit()
+        table_versions.bump('maker')
         inserted_id = curs.lastrowid
         conn.close()
         return {"result": "OK", "m_seq": inserted_id}
@@ -107,6 +147,8 @@ async def update_maker(
         sql = "UPDATE maker SET m_name=%s, m_phone=%s, m_address=%s WHERE m_seq=%s"
         curs.execute(sql, (m_name, m_phone, m_address, m_seq))
         conn.commit()
+        table_versions.bump('maker')
+        invalidate_detail('maker', m_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -124,6 +166,8 @@ async def delete_maker(maker_seq: int):
         sql = "DELETE FROM maker WHERE m_seq=%s"
         curs.execute(sql, (maker_seq,))
         conn.commit()
+        table_versions.bump('maker')
+        invalidate_detail('maker', maker_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -8,6 +8,8 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -22,6 +24,14 @@ class Pickup(BaseModel):
     created_at: Optional[datetime] = None
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+PICKUP_CODEC = RowCodec([
+    'pic_seq', 'b_seq', 'u_seq', 'created_at',
+])
+
+
 # ============================================
 # 전체 수령 내역 조회
 # ============================================
@@ -36,13 +46,7 @@ async def select_pickups():
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'pic_seq': row[0],
-        'b_seq': row[1],
-        'u_seq': row[2],
-        'created_at': row[3].isoformat() if row[3] else None
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(PICKUP_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -61,13 +65,7 @@ async def select_pickup(pickup_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "Pickup not found"}
-    result = {
-        'pic_seq': row[0],
-        'b_seq': row[1],
-        'u_seq': row[2],
-        'created_at': row[3].isoformat() if row[3] else None
-    }
-    return {"result": result}
+    return RawJSONResponse(PICKUP_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -86,13 +84,16 @@ async def select_pickup_by_purchase(purchase_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "Pickup not found"}
-    result = {
-        'pic_seq': row[0],
-        'b_seq': row[1],
-        'u_seq': row[2],
-        'created_at': row[3].isoformat() if row[3] else None
-    }
-    return {"result": result}
+    return RawJSONResponse(PICKUP_CODEC.dumps_result(row))
+
+
+# ============================================
+# 구매 내역 존재 확인
+# purchase_item이 파티션 테이블이면 fk_pickup_purchase를 쓸 수 없으므로 직접 확인
+# ============================================
+def purchase_exists(curs, b_seq: int) -> bool:
+    curs.execute("SELECT 1 FROM purchase_item WHERE b_seq = %s LIMIT 1 FOR SHARE", (b_seq,))
+    return curs.fetchone() is not None
 
 
 # ============================================
@@ -111,6 +112,9 @@ async def insert_pickup(
         
         conn = connect_db()
         curs = conn.cursor()
+        if not purchase_exists(curs, b_seq):
+            conn.close()
+            return {"result": "Error", "errorMsg": "PurchaseItem not found"}
         if created_at_dt:
             sql = "INSERT INTO pickup (b_seq, u_seq, created_at) VALUES (%s, %s, %s)"
             curs.execute(sql, (b_seq, u_seq, created_at_dt))
@@ -142,6 +146,9 @@ async def update_pickup(
         
         conn = connect_db()
         curs = conn.cursor()
+        if not purchase_exists(curs, b_seq):
+            conn.close()
+            return {"result": "Error", "errorMsg": "PurchaseItem not found"}
         if created_at_dt:
             sql = "UPDATE pickup SET b_seq=%s, u_seq=%s, created_at=%s WHERE pic_seq=%s"
             curs.execute(sql, (b_seq, u_seq, created_at_dt, pic_seq))
@@ -149,6 +156,7 @@ async def update_pickup(
             sql = "UPDATE pickup SET b_seq=%s, u_seq=%s WHERE pic_seq=%s"
             curs.execute(sql, (b_seq, u_seq, pic_seq))
         conn.commit()
+        invalidate_detail('pickup', pic_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -169,6 +177,7 @@ async def complete_pickup(pickup_seq: int):
         sql = "UPDATE pickup SET created_at=%s WHERE pic_seq=%s"
         curs.execute(sql, (created_at_dt, pickup_seq))
         conn.commit()
+        invalidate_detail('pickup', pickup_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -186,6 +195,7 @@ async def delete_pickup(pickup_seq: int):
         sql = "DELETE FROM pickup WHERE pic_seq=%s"
         curs.execute(sql, (pickup_seq,))
         conn.commit()
+        invalidate_detail('pickup', pickup_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
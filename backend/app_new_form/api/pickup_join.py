@@ -9,10 +9,50 @@ Pickup 복합 쿼리 API
 from fastapi import APIRouter, Query
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.replicas import connect_read_db
+from app_new_form.database.detail_cache import detail_cache, CATALOG_NAME_TAGS
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+PICKUP_WITH_DETAILS_CODEC = RowCodec([
+    'pic_seq', 'created_at',
+    ('purchase_item', ['b_seq', 'b_price', 'b_quantity', 'b_date', 'b_status']),
+    ('user', ['u_seq', 'u_name', 'u_phone']),
+    ('product', ['p_seq', 'p_name', 'p_price', 'p_image']),
+    ('branch', ['br_seq', 'br_name', 'br_address', 'br_phone']),
+])
+
+PICKUP_FULL_DETAIL_CODEC = RowCodec([
+    'pic_seq', 'created_at',
+    ('purchase_item', ['b_seq', 'b_price', 'b_quantity', 'b_date', 'b_status']),
+    ('user', ['u_seq', 'u_name', 'u_phone']),
+    ('product', [
+        'p_seq', 'p_name', 'p_price', 'p_image', 'kind_name', 'color_name',
+        'size_name', 'gender_name', 'maker_name',
+    ]),
+    ('branch', ['br_seq', 'br_name', 'br_address', 'br_phone']),
+])
+
+PICKUPS_BY_USER_WITH_DETAILS_CODEC = RowCodec([
+    'pic_seq', 'created_at',
+    ('purchase_item', ['b_seq', 'b_price', 'b_quantity', 'b_date']),
+    ('product', ['p_name', 'p_image']),
+    'branch_name',
+])
+
+PICKUPS_BY_BRANCH_WITH_DETAILS_CODEC = RowCodec([
+    'pic_seq', 'created_at',
+    ('purchase_item', ['b_seq', 'b_price', 'b_quantity']),
+    ('user', ['u_name', 'u_phone']),
+    ('product', ['p_name', 'p_image']),
+])
+
+
 # ============================================
 # Pickup + PurchaseItem + User + Product + Branch
 # ============================================
@@ -22,7 +62,7 @@ async def get_pickup_with_details(pickup_seq: int):
     특정 Pickup + PurchaseItem + User + Product + Branch 정보
     JOIN: Pickup + PurchaseItem + User + Product + Branch (5테이블)
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -59,36 +99,7 @@ async def get_pickup_with_details(pickup_seq: int):
         if row is None:
             return {"result": "Error", "message": "Pickup not found"}
         
-        result = {
-            'pic_seq': row[0],
-            'created_at': row[1].isoformat() if row[1] else None,
-            'purchase_item': {
-                'b_seq': row[2],
-                'b_price': row[3],
-                'b_quantity': row[4],
-                'b_date': row[5].isoformat() if row[5] else None,
-                'b_status': row[6]
-            },
-            'user': {
-                'u_seq': row[7],
-                'u_name': row[8],
-                'u_phone': row[9]
-            },
-            'product': {
-                'p_seq': row[10],
-                'p_name': row[11],
-                'p_price': row[12],
-                'p_image': row[13]
-            },
-            'branch': {
-                'br_seq': row[14],
-                'br_name': row[15],
-                'br_address': row[16],
-                'br_phone': row[17]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(PICKUP_WITH_DETAILS_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -98,6 +109,63 @@ async def get_pickup_with_details(pickup_seq: int):
 # ============================================
 # Pickup 전체 상세 (Product의 모든 카테고리 포함)
 # ============================================
+PICKUP_FULL_DETAIL_SQL = """
+    SELECT 
+        pic.pic_seq,
+        pic.created_at,
+        pi.b_seq,
+        pi.b_price,
+        pi.b_quantity,
+        pi.b_date,
+        pi.b_status,
+        u.u_seq,
+        u.u_name,
+        u.u_phone,
+        p.p_seq,
+        p.p_name,
+        p.p_price,
+        p.p_image,
+        kc.kc_name,
+        cc.cc_name,
+        sc.sc_name,
+        gc.gc_name,
+        m.m_name,
+        br.br_seq,
+        br.br_name,
+        br.br_address,
+        br.br_phone
+    FROM pickup pic
+    JOIN purchase_item pi ON pic.b_seq = pi.b_seq
+    JOIN user u ON pi.u_seq = u.u_seq
+    JOIN product p ON pi.p_seq = p.p_seq
+    JOIN kind_category kc ON p.kc_seq = kc.kc_seq
+    JOIN color_category cc ON p.cc_seq = cc.cc_seq
+    JOIN size_category sc ON p.sc_seq = sc.sc_seq
+    JOIN gender_category gc ON p.gc_seq = gc.gc_seq
+    JOIN maker m ON p.m_seq = m.m_seq
+    JOIN branch br ON pi.br_seq = br.br_seq
+    WHERE pic.pic_seq = %s
+"""
+
+
+def fetch_pickup_full_detail(pickup_seq: int):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute(PICKUP_FULL_DETAIL_SQL, (pickup_seq,))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
+def pickup_detail_tags(row):
+    """상세 결과가 참조하는 행 (쓰기 라우터의 invalidate_detail 대상)"""
+    return [
+        ('pickup', row[0]), ('purchase_item', row[2]), ('user', row[7]),
+        ('product', row[10]), ('branch', row[19]), ('maker', None),
+    ] + list(CATALOG_NAME_TAGS)
+
+
 @router.get("/pickups/{pickup_seq}/full_detail")
 async def get_pickup_full_detail(pickup_seq: int):
     """
@@ -105,92 +173,17 @@ async def get_pickup_full_detail(pickup_seq: int):
     JOIN: Pickup + PurchaseItem + User + Product + Branch + 모든 카테고리 + Maker (10테이블)
     용도: 수령 상세 화면
     """
-    conn = connect_db()
-    curs = conn.cursor()
-    
     try:
-        sql = """
-        SELECT 
-            pic.pic_seq,
-            pic.created_at,
-            pi.b_seq,
-            pi.b_price,
-            pi.b_quantity,
-            pi.b_date,
-            pi.b_status,
-            u.u_seq,
-            u.u_name,
-            u.u_phone,
-            p.p_seq,
-            p.p_name,
-            p.p_price,
-            p.p_image,
-            kc.kc_name,
-            cc.cc_name,
-            sc.sc_name,
-            gc.gc_name,
-            m.m_name,
-            br.br_seq,
-            br.br_name,
-            br.br_address,
-            br.br_phone
-        FROM pickup pic
-        JOIN purchase_item pi ON pic.b_seq = pi.b_seq
-        JOIN user u ON pi.u_seq = u.u_seq
-        JOIN product p ON pi.p_seq = p.p_seq
-        JOIN kind_category kc ON p.kc_seq = kc.kc_seq
-        JOIN color_category cc ON p.cc_seq = cc.cc_seq
-        JOIN size_category sc ON p.sc_seq = sc.sc_seq
-        JOIN gender_category gc ON p.gc_seq = gc.gc_seq
-        JOIN maker m ON p.m_seq = m.m_seq
-        JOIN branch br ON pi.br_seq = br.br_seq
-        WHERE pic.pic_seq = %s
-        """
-        curs.execute(sql, (pickup_seq,))
-        row = curs.fetchone()
+        row = await detail_cache.get_or_load(
+            ('pickup', pickup_seq), fetch_pickup_full_detail, pickup_seq, tags=pickup_detail_tags
+        )
         
         if row is None:
             return {"result": "Error", "message": "Pickup not found"}
         
-        result = {
-            'pic_seq': row[0],
-            'created_at': row[1].isoformat() if row[1] else None,
-            'purchase_item': {
-                'b_seq': row[2],
-                'b_price': row[3],
-                'b_quantity': row[4],
-                'b_date': row[5].isoformat() if row[5] else None,
-                'b_status': row[6]
-            },
-            'user': {
-                'u_seq': row[7],
-                'u_name': row[8],
-                'u_phone': row[9]
-            },
-            'product': {
-                'p_seq': row[10],
-                'p_name': row[11],
-                'p_price': row[12],
-                'p_image': row[13],
-                'kind_name': row[14],
-                'color_name': row[15],
-                'size_name': row[16],
-                'gender_name': row[17],
-                'maker_name': row[18]
-            },
-            'branch': {
-                'br_seq': row[19],
-                'br_name': row[20],
-                'br_address': row[21],
-                'br_phone': row[22]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(PICKUP_FULL_DETAIL_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
-    finally:
-        conn.close()
 
 
 # ============================================
@@ -203,7 +196,7 @@ async def get_pickups_by_user_with_details(user_seq: int):
     JOIN: Pickup + PurchaseItem + User + Product + Branch
     용도: 고객 수령 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -228,23 +221,7 @@ async def get_pickups_by_user_with_details(user_seq: int):
         curs.execute(sql, (user_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'pic_seq': row[0],
-            'created_at': row[1].isoformat() if row[1] else None,
-            'purchase_item': {
-                'b_seq': row[2],
-                'b_price': row[3],
-                'b_quantity': row[4],
-                'b_date': row[5].isoformat() if row[5] else None
-            },
-            'product': {
-                'p_name': row[6],
-                'p_image': row[7]
-            },
-            'branch_name': row[8]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(PICKUPS_BY_USER_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -261,7 +238,7 @@ async def get_pickups_by_branch_with_details(branch_seq: int):
     JOIN: Pickup + PurchaseItem + User + Product + Branch
     용도: 지점별 수령 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -286,25 +263,7 @@ async def get_pickups_by_branch_with_details(branch_seq: int):
         curs.execute(sql, (branch_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'pic_seq': row[0],
-            'created_at': row[1].isoformat() if row[1] else None,
-            'purchase_item': {
-                'b_seq': row[2],
-                'b_price': row[3],
-                'b_quantity': row[4]
-            },
-            'user': {
-                'u_name': row[5],
-                'u_phone': row[6]
-            },
-            'product': {
-                'p_name': row[7],
-                'p_image': row[8]
-            }
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(PICKUPS_BY_BRANCH_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -3,10 +3,16 @@ Product API - 제품 CRUD
 개별 실행: python product.py
 """
 
-from fastapi import APIRouter, Form
+from fastapi import APIRouter, Form, Query
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import dimension_cache, invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.fieldsets import FieldSet
+from common.multiget import MAX_IDS, dumps_keyed, load_rows, parse_ids
+from common.serialization import RawJSONResponse
+from common.singleflight import SingleFlight
 
 router = APIRouter()
 
@@ -29,100 +35,127 @@ class Product(BaseModel):
     created_at: Optional[str] = None
 
 
+# ============================================
+# 조회 가능 컬럼 (fields= 화이트리스트, 기본 SELECT 순서와 동일)
+# ============================================
+PRODUCT_FIELDS = FieldSet([
+    'p_seq', 'kc_seq', 'cc_seq', 'sc_seq', 'gc_seq', 'm_seq', 'p_name',
+    'p_price', 'p_stock', 'p_image', 'p_description', 'created_at',
+])
+FIELDS_DESCRIPTION = "쉼표로 구분한 응답 컬럼 (예: p_name,p_price), p_seq는 항상 포함. 생략하면 전체 컬럼"
+
+
 # ============================================
 # 전체 제품 조회
 # ============================================
 @router.get("")
-async def select_products():
+async def select_products(
+    ids: Optional[str] = Query(None, description=f"쉼표로 구분한 p_seq 목록 (최대 {MAX_IDS}개), 지정하면 p_seq별 결과 반환"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    if ids is not None:
+        return await select_products_by_ids(ids, fields)
+    try:
+        projection = PRODUCT_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT p_seq, kc_seq, cc_seq, sc_seq, gc_seq, m_seq, p_name, p_price, p_stock, p_image, p_description, created_at 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM product 
         ORDER BY p_seq
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'p_seq': row[0],
-        'kc_seq': row[1],
-        'cc_seq': row[2],
-        'sc_seq': row[3],
-        'gc_seq': row[4],
-        'm_seq': row[5],
-        'p_name': row[6],
-        'p_price': row[7],
-        'p_stock': row[8],
-        'p_image': row[9],
-        'p_description': row[10],
-        'created_at': row[11].isoformat() if row[11] else None
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(projection.codec.dumps_results(rows))
+
+
+# ============================================
+# 여러 ID로 제품 조회 (?ids=1,2,3)
+# ============================================
+PRODUCT_BY_IDS_SQL = """
+    SELECT p_seq, kc_seq, cc_seq, sc_seq, gc_seq, m_seq, p_name, p_price, p_stock, p_image, p_description, created_at
+    FROM product
+    WHERE p_seq IN ({ids})
+"""
+
+
+async def select_products_by_ids(ids: str, fields: Optional[str] = None):
+    """
+    캐시(dimension_cache)에 없는 id만 IN (...) 1번으로 조회, 결과는 p_seq를 key로 반환
+    캐시에는 전체 컬럼 row를 두고, fields 는 응답 만들 때만 적용
+    """
+    try:
+        projection = PRODUCT_FIELDS.resolve(fields)
+        seqs = parse_ids(ids)
+        rows = await load_rows(dimension_cache, 'product', seqs, connect_db, PRODUCT_BY_IDS_SQL)
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+    return RawJSONResponse(dumps_keyed(projection.codec, seqs, rows, pick=projection.pick))
 
 
 # ============================================
 # ID로 제품 조회
 # ============================================
-@router.get("/{product_seq}")
-async def select_product(product_seq: int):
+# 같은 제품 동시 조회 병합 + 1초 재사용 (product 수정 시 key가 바뀜)
+product_flight = SingleFlight(ttl=1.0)
+
+
+def fetch_product(product_seq: int, columns: str):
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT p_seq, kc_seq, cc_seq, sc_seq, gc_seq, m_seq, p_name, p_price, p_stock, p_image, p_description, created_at 
-        FROM product 
-        WHERE p_seq = %s
-    """, (product_seq,))
-    row = curs.fetchone()
-    conn.close()
+    try:
+        curs.execute(f"""
+            SELECT {columns}
+            FROM product
+            WHERE p_seq = %s
+        """, (product_seq,))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
+@router.get("/{product_seq}")
+async def select_product(
+    product_seq: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    try:
+        projection = PRODUCT_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
+    # 컬럼 구성이 다르면 row 모양도 다르므로 key에 포함
+    key = ('product', product_seq, projection.names, table_versions.versions(('product',)))
+    row = await product_flight.do(key, fetch_product, product_seq, projection.columns)
     if row is None:
         return {"result": "Error", "message": "Product not found"}
-    result = {
-        'p_seq': row[0],
-        'kc_seq': row[1],
-        'cc_seq': row[2],
-        'sc_seq': row[3],
-        'gc_seq': row[4],
-        'm_seq': row[5],
-        'p_name': row[6],
-        'p_price': row[7],
-        'p_stock': row[8],
-        'p_image': row[9],
-        'p_description': row[10],
-        'created_at': row[11].isoformat() if row[11] else None
-    }
-    return {"result": result}
+    return RawJSONResponse(projection.codec.dumps_result(row))
 
 
 # ============================================
 # 제조사별 제품 조회
 # ============================================
 @router.get("/by_maker/{maker_seq}")
-async def select_products_by_maker(maker_seq: int):
+async def select_products_by_maker(
+    maker_seq: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    try:
+        projection = PRODUCT_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT p_seq, kc_seq, cc_seq, sc_seq, gc_seq, m_seq, p_name, p_price, p_stock, p_image, p_description, created_at 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM product 
         WHERE m_seq = %s
         ORDER BY p_seq
     """, (maker_seq,))
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'p_seq': row[0],
-        'kc_seq': row[1],
-        'cc_seq': row[2],
-        'sc_seq': row[3],
-        'gc_seq': row[4],
-        'm_seq': row[5],
-        'p_name': row[6],
-        'p_price': row[7],
-        'p_stock': row[8],
-        'p_image': row[9],
-        'p_description': row[10],
-        'created_at': row[11].isoformat() if row[11] else None
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(projection.codec.dumps_results(rows))
 
 
 # ============================================
@@ -150,6 +183,7 @@ async def insert_product(
         """
         curs.execute(sql, (kc_seq, cc_seq, sc_seq, gc_seq, m_seq, p_name, p_price, p_stock, p_image, p_description))
         conn.commit()
+        table_versions.bump('product')
         inserted_id = curs.lastrowid
         conn.close()
         return {"result": "OK", "p_seq": inserted_id}
@@ -185,6 +219,8 @@ async def update_product(
         """
         curs.execute(sql, (kc_seq, cc_seq, sc_seq, gc_seq, m_seq, p_name, p_price, p_stock, p_image, p_description, product_seq))
         conn.commit()
+        table_versions.bump('product')
+        invalidate_detail('product', product_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -205,6 +241,8 @@ async def update_product_stock(
         sql = "UPDATE product SET p_stock=%s WHERE p_seq=%s"
         curs.execute(sql, (p_stock, product_seq))
         conn.commit()
+        table_versions.bump('product')
+        invalidate_detail('product', product_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -222,6 +260,8 @@ async def delete_product(product_seq: int):
         sql = "DELETE FROM product WHERE p_seq=%s"
         curs.execute(sql, (product_seq,))
         conn.commit()
+        table_versions.bump('product')
+        invalidate_detail('product', product_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
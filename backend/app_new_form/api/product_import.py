@@ -0,0 +1,356 @@
+"""
+Product Import API - 제품 카탈로그 일괄 등록 (CSV / JSONL)
+제조사 시즌 카탈로그(수천 SKU)를 insert_product 반복 호출 대신 파일 1개로 등록한다.
+
+- 업로드 파일을 한 줄씩 읽으면서 CHUNK_ROWS 행 단위로 처리 (파일 전체를 메모리에 올리지 않음)
+- 카테고리/제조사 이름 → seq 는 시작할 때 한 번 읽어 둔 dict 로 변환 (행마다 조회하지 않음)
+- 검증은 청크 단위로 컬럼별 한 번에 (이름 변환, 숫자 변환, 필수값) → 오류 행은 줄 번호와 함께 보고
+- 통과한 행은 청크마다 multi-row INSERT ... ON DUPLICATE KEY UPDATE 1번 + commit
+  같은 색상/사이즈/제조사 제품(uq_product_color_size_maker)이 이미 있을 때:
+    - p_name 이 같으면 파일에 값이 있는 컬럼(p_price, p_image, p_description)과 kc/gc 만 갱신
+    - p_name 이 다르면 다른 제품을 덮어쓰지 않도록 충돌 오류로 보고
+    - p_stock 은 갱신하지 않음 (재고는 입고/발주 흐름에서만 변경, 새 제품의 초기 재고로만 사용)
+- 파일 안에서 색상/사이즈/제조사가 같은 행이 또 나오면 첫 행만 처리하고 나머지는 오류로 보고
+- 처리 중 오류가 나면 이미 commit 된 청크는 유지되고, 응답에 commit 된 마지막 줄 번호(committed_through_line)를
+  담는다 (그 다음 줄부터 다시 올리면 이어서 등록)
+
+입력 컬럼:
+    필수: kc_name, cc_name, sc_name, gc_name, m_name, p_name
+    선택: p_price, p_stock (0 이상 정수), p_image, p_description
+          (비어 있으면 기존 제품은 값 유지, 새 제품은 가격/재고 0)
+
+CLI: python database/import_products.py catalog.csv
+"""
+
+import csv
+import io
+import json
+import time
+from typing import Optional
+
+from fastapi import APIRouter, File, Query, UploadFile
+from starlette.concurrency import run_in_threadpool
+from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import detail_cache, dimension_cache
+from app_new_form.database.versions import table_versions
+from common.serialization import RawJSONResponse, dumps
+
+router = APIRouter()
+
+CHUNK_ROWS = 1000
+MAX_ERRORS = 1000   # 응답에 담는 오류 행 수 (전체 개수는 failed)
+FORMATS = ('csv', 'jsonl')
+
+# 이름 컬럼 → (테이블, seq 컬럼)
+NAME_COLUMNS = {
+    'kc_name': ('kind_category', 'kc_seq'),
+    'cc_name': ('color_category', 'cc_seq'),
+    'sc_name': ('size_category', 'sc_seq'),
+    'gc_name': ('gender_category', 'gc_seq'),
+    'm_name': ('maker', 'm_seq'),
+}
+INT_COLUMNS = ('p_price', 'p_stock')
+TEXT_COLUMNS = ('p_image', 'p_description')
+
+# 기존 제품: p_name 은 같은 경우만 여기까지 오므로 갱신하지 않고, p_stock 은 갱신하지 않음
+# 파일에 값이 없는 컬럼(None)은 기존 값 유지
+UPSERT_SQL = """
+    INSERT INTO product (kc_seq, cc_seq, sc_seq, gc_seq, m_seq, p_name, p_price, p_stock, p_image, p_description)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        kc_seq = VALUES(kc_seq),
+        gc_seq = VALUES(gc_seq),
+        p_price = COALESCE(VALUES(p_price), p_price),
+        p_image = COALESCE(VALUES(p_image), p_image),
+        p_description = COALESCE(VALUES(p_description), p_description)
+"""
+
+# UPSERT_SQL row 에서 uq_product_color_size_maker (cc_seq, sc_seq, m_seq) 위치
+KEY_INDEXES = (1, 2, 4)
+NAME_INDEX, PRICE_INDEX, STOCK_INDEX = 5, 6, 7
+
+
+# ============================================
+# 입력 읽기
+# ============================================
+def detect_format(filename: Optional[str], fmt: Optional[str] = None) -> str:
+    if fmt is None and filename:
+        fmt = filename.rsplit('.', 1)[-1].lower() if '.' in filename else None
+        fmt = 'jsonl' if fmt in ('jsonl', 'ndjson') else fmt
+    if fmt not in FORMATS:
+        raise ValueError(f"파일 형식을 알 수 없습니다: {fmt} (사용 가능: {', '.join(FORMATS)})")
+    return fmt
+
+
+def read_records(stream, fmt: str):
+    """텍스트 스트림 → (줄 번호, dict 또는 None, 읽기 오류) 를 한 행씩"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record, None
+        return
+    for line_no, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, None, f"JSON 형식 오류: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "JSON 객체가 아닙니다"
+            continue
+        yield line_no, record, None
+
+
+def load_name_maps(curs) -> dict:
+    """{'kc_name': {'러닝화': 1, ...}, ...} (import 시작 시 1번)"""
+    maps = {}
+    for column, (table, seq_column) in NAME_COLUMNS.items():
+        curs.execute(f"SELECT {column}, {seq_column} FROM {table}")
+        maps[column] = {str(name).strip(): seq for name, seq in curs.fetchall()}
+    return maps
+
+
+# ============================================
+# 청크 검증 (컬럼 단위)
+# ============================================
+def _text(value) -> str:
+    return '' if value is None else str(value).strip()
+
+
+def _to_int(value):
+    """정수가 아니거나 음수면 None ('' / None 은 호출 전에 '값 없음'으로 처리)"""
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return None
+        if not number.is_integer():
+            return None
+        number = int(number)
+    return number if number >= 0 else None
+
+
+def row_key(row) -> tuple:
+    return tuple(row[index] for index in KEY_INDEXES)
+
+
+def validate_chunk(chunk: list, maps: dict, seen: Optional[dict] = None) -> tuple:
+    """
+    chunk: [(줄 번호, record, 읽기 오류), ...]
+    seen: 앞 청크까지 처리한 {(cc_seq, sc_seq, m_seq): 줄 번호} (파일 전체 중복 확인용, 이 함수가 갱신)
+
+    Returns:
+        tuple: ([(줄 번호, UPSERT_SQL 파라미터 row), ...], {줄 번호: [오류 메시지, ...]})
+               p_price/p_image/p_description 은 파일에 값이 없으면 None
+    """
+    seen = {} if seen is None else seen
+    lines = [line for line, _, _ in chunk]
+    records = [record or {} for _, record, _ in chunk]
+    errors = {line: [error] for line, _, error in chunk if error}
+    unreadable = set(errors)
+
+    def fail(index, message):
+        if lines[index] not in unreadable:  # 읽기 오류 행은 컬럼 오류를 덧붙이지 않음
+            errors.setdefault(lines[index], []).append(message)
+
+    columns = {}
+    for column in NAME_COLUMNS:
+        lookup = maps[column]
+        names = [_text(record.get(column)) for record in records]
+        seqs = [lookup.get(name) for name in names]
+        for index, (name, seq) in enumerate(zip(names, seqs)):
+            if seq is None:
+                fail(index, f"{column}: 필수" if not name else f"{column}: 없는 이름 '{name}'")
+        columns[column] = seqs
+
+    p_names = [_text(record.get('p_name')) for record in records]
+    for index, name in enumerate(p_names):
+        if not name:
+            fail(index, "p_name: 필수")
+        elif len(name) > 255:
+            fail(index, "p_name: 255자 초과")
+
+    for column in INT_COLUMNS:
+        raw = [_text(record.get(column)) for record in records]
+        values = [_to_int(value) if value else None for value in raw]
+        for index, value in enumerate(values):
+            if value is None and raw[index]:
+                fail(index, f"{column}: 0 이상 정수가 아님 '{raw[index]}'")
+        columns[column] = values
+
+    for column in TEXT_COLUMNS:
+        columns[column] = [_text(record.get(column)) or None for record in records]
+
+    rows = []
+    for i, line in enumerate(lines):
+        if line in errors:
+            continue
+        row = (columns['kc_name'][i], columns['cc_name'][i], columns['sc_name'][i], columns['gc_name'][i],
+               columns['m_name'][i], p_names[i], columns['p_price'][i], columns['p_stock'][i],
+               columns['p_image'][i], columns['p_description'][i])
+        # 같은 제품(색상/사이즈/제조사)이 파일에 여러 번 있으면 마지막 행이 이기지 않도록 첫 행만 처리
+        first = seen.setdefault(row_key(row), line)
+        if first != line:
+            errors[line] = [f"{first}행과 색상/사이즈/제조사가 같음 (같은 제품 중복)"]
+            continue
+        rows.append((line, row))
+    return rows, errors
+
+
+def find_existing(curs, rows: list, lock: bool = True) -> dict:
+    """청크의 (cc_seq, sc_seq, m_seq) 중 이미 있는 제품 → {key: (p_seq, p_name)}"""
+    if not rows:
+        return {}
+    placeholders = ', '.join(['(%s, %s, %s)'] * len(rows))
+    params = [value for _, row in rows for value in row_key(row)]
+    curs.execute(
+        f"SELECT cc_seq, sc_seq, m_seq, p_seq, p_name FROM product "
+        f"WHERE (cc_seq, sc_seq, m_seq) IN ({placeholders}){' FOR UPDATE' if lock else ''}",
+        params,
+    )
+    return {(cc_seq, sc_seq, m_seq): (p_seq, p_name) for cc_seq, sc_seq, m_seq, p_seq, p_name in curs.fetchall()}
+
+
+def plan_upsert(rows: list, existing: dict, errors: dict) -> tuple:
+    """
+    검증된 row → (UPSERT_SQL 파라미터 목록, 새 제품 수, 갱신 수)
+    기존 제품과 p_name 이 다른 행은 errors 에 충돌로 추가하고 제외
+    """
+    params = []
+    inserted = 0
+    for line, row in rows:
+        found = existing.get(row_key(row))
+        row = list(row)
+        if found is None:
+            # 새 제품: 값이 없으면 가격/재고 0
+            row[PRICE_INDEX] = row[PRICE_INDEX] or 0
+            row[STOCK_INDEX] = row[STOCK_INDEX] or 0
+            inserted += 1
+        elif found[1] != row[NAME_INDEX]:
+            errors[line] = [f"p_name: 색상/사이즈/제조사가 같은 기존 제품(p_seq {found[0]}, '{found[1]}')과 이름이 다름 "
+                            f"(덮어쓰지 않음, 이름 변경은 제품 수정 API 사용)"]
+            continue
+        else:
+            row[STOCK_INDEX] = 0  # 갱신 시 사용하지 않음 (NOT NULL 컬럼이라 자리만 채움)
+        params.append(tuple(row))
+    return params, inserted, len(params) - inserted
+
+
+# ============================================
+# Import 실행
+# ============================================
+def import_stream(stream, fmt: str, conn, chunk_rows: int = CHUNK_ROWS, dry_run: bool = False, progress=None) -> dict:
+    """
+    스트림을 청크 단위로 검증 + upsert (청크마다 commit, 동기 함수)
+
+    처리 중 오류(DB 오류 등)가 나도 예외를 올리지 않고 report["error"] 에 담아 반환한다.
+    이미 commit 된 청크는 유지되므로 committed_chunks / committed_through_line 으로 어디까지 저장됐는지 확인
+
+    Args:
+        dry_run: 검증(기존 제품과의 이름 충돌 확인 포함)만 하고 쓰지 않음
+        progress: 청크 처리 후 호출할 함수 (report dict 전달, CLI 진행 표시용)
+    """
+    started = time.perf_counter()
+    report = {"total": 0, "upserted": 0, "inserted": 0, "updated": 0, "failed": 0, "chunks": 0,
+              "committed_chunks": 0, "committed_through_line": None, "errors": []}
+    seen = {}
+
+    def flush(chunk):
+        rows, errors = validate_chunk(chunk, maps, seen)
+        existing = find_existing(curs, rows, lock=not dry_run)
+        params, inserted, updated = plan_upsert(rows, existing, errors)
+        if dry_run:
+            conn.rollback()
+        else:
+            if params:
+                curs.executemany(UPSERT_SQL, params)
+            conn.commit()
+            report["committed_chunks"] += 1
+            report["committed_through_line"] = chunk[-1][0]
+        report["total"] += len(chunk)
+        report["upserted"] += len(params)
+        report["inserted"] += inserted
+        report["updated"] += updated
+        report["failed"] += len(errors)
+        report["chunks"] += 1
+        for line in sorted(errors):
+            if len(report["errors"]) >= MAX_ERRORS:
+                break
+            report["errors"].append({"line": line, "errors": errors[line]})
+        if progress:
+            progress(report)
+
+    try:
+        curs = conn.cursor()
+        maps = load_name_maps(curs)
+        chunk = []
+        for item in read_records(stream, fmt):
+            chunk.append(item)
+            if len(chunk) >= chunk_rows:
+                flush(chunk)
+                chunk = []
+        if chunk:
+            flush(chunk)
+    except Exception as e:
+        conn.rollback()
+        report["error"] = str(e)
+
+    elapsed = time.perf_counter() - started
+    report["errors_truncated"] = report["failed"] > len(report["errors"])
+    report["dry_run"] = dry_run
+    report["elapsed_ms"] = round(elapsed * 1000, 1)
+    report["rows_per_sec"] = round(report["total"] / elapsed) if elapsed > 0 else None
+    return report
+
+
+def invalidate_products():
+    """
+    upsert 된 p_seq 를 따로 모으지 않으므로 제품 관련 캐시는 통째로 비운다
+    (카탈로그 일괄 등록은 드문 작업이라 캐시를 다시 채우는 비용이 작음)
+    """
+    table_versions.bump('product')
+    detail_cache.clear()
+    dimension_cache.clear()
+
+
+# ============================================
+# 업로드 엔드포인트
+# ============================================
+@router.post("")
+async def import_products(
+    file: UploadFile = File(..., description="CSV(헤더 포함) 또는 JSONL 파일 (UTF-8)"),
+    format: Optional[str] = Query(None, description="csv / jsonl (생략하면 파일 확장자로 판단)"),
+    dry_run: bool = Query(False, description="검증만 하고 저장하지 않음"),
+):
+    try:
+        fmt = detect_format(file.filename, format)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
+
+    def run():
+        # 업로드 본문은 임시 파일(SpooledTemporaryFile)에 있으므로 줄 단위로 읽는다
+        stream = io.TextIOWrapper(file.file, encoding='utf-8-sig', newline='')
+        conn = connect_db()
+        try:
+            return import_stream(stream, fmt, conn, dry_run=dry_run)
+        finally:
+            stream.detach()
+            conn.close()
+
+    report = None
+    try:
+        report = await run_in_threadpool(run)
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+    finally:
+        # 중간에 실패해도 commit 된 청크가 있으면 캐시/ETag 버전을 갱신
+        if report and report["committed_chunks"]:
+            invalidate_products()
+    if "error" in report:
+        # 부분 저장 결과를 같이 반환 → committed_through_line 다음 줄부터 다시 올리면 됨
+        return RawJSONResponse(dumps({"result": "Error", "errorMsg": report.pop("error"), **report}))
+    return RawJSONResponse(dumps({"result": "OK", **report}))
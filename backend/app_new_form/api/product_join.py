@@ -2,6 +2,8 @@
 Product 복합 쿼리 API
 - Product 중심의 JOIN 쿼리들
 - Product + 모든 카테고리 (kind, color, size, gender) + Maker
+- /products/* 는 ConditionalGetMiddleware(ETag) 대상이므로 replica 가 아닌 primary(connect_db)에서 조회
+  (replica 에서 읽으면 버전이 올라간 뒤 복제 전 데이터가 새 ETag 로 응답되어 다음 쓰기까지 304 로 고정됨)
 
 개별 실행: python product_join.py
 """
@@ -9,13 +11,77 @@ Product 복합 쿼리 API
 from fastapi import APIRouter, Query
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.versions import table_versions, CATALOG_TABLES
+from common.singleflight import SingleFlight
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+PRODUCT_FULL_DETAIL_CODEC = RowCodec([
+    'p_seq', 'p_name', 'p_price', 'p_stock', 'p_image',
+    ('kind_category', ['kc_seq', 'kc_name']),
+    ('color_category', ['cc_seq', 'cc_name']),
+    ('size_category', ['sc_seq', 'sc_name']),
+    ('gender_category', ['gc_seq', 'gc_name']),
+    ('maker', ['m_seq', 'm_name', 'm_phone', 'm_address']),
+])
+
+PRODUCTS_WITH_CATEGORIES_CODEC = RowCodec([
+    'p_seq', 'p_name', 'p_price', 'p_stock', 'p_image', 'kind_name',
+    'color_name', 'size_name', 'gender_name', 'maker_name',
+])
+
+
 # ============================================
 # Product + 모든 카테고리 + Maker (6테이블 JOIN)
 # ============================================
+PRODUCT_FULL_DETAIL_SQL = """
+    SELECT 
+        p.p_seq,
+        p.p_name,
+        p.p_price,
+        p.p_stock,
+        p.p_image,
+        kc.kc_seq,
+        kc.kc_name,
+        cc.cc_seq,
+        cc.cc_name,
+        sc.sc_seq,
+        sc.sc_name,
+        gc.gc_seq,
+        gc.gc_name,
+        m.m_seq,
+        m.m_name,
+        m.m_phone,
+        m.m_address
+    FROM product p
+    JOIN kind_category kc ON p.kc_seq = kc.kc_seq
+    JOIN color_category cc ON p.cc_seq = cc.cc_seq
+    JOIN size_category sc ON p.sc_seq = sc.sc_seq
+    JOIN gender_category gc ON p.gc_seq = gc.gc_seq
+    JOIN maker m ON p.m_seq = m.m_seq
+    WHERE p.p_seq = %s
+"""
+
+# 같은 제품 동시 조회는 JOIN 1번만 실행, 결과는 1초간 재사용
+# (key에 테이블 버전이 들어가므로 제품/카테고리/제조사 수정 직후에는 새로 조회)
+product_detail_flight = SingleFlight(ttl=1.0)
+
+
+def fetch_product_full_detail(product_seq: int):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute(PRODUCT_FULL_DETAIL_SQL, (product_seq,))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
 @router.get("/products/{product_seq}/full_detail")
 async def get_product_full_detail(product_seq: int):
     """
@@ -23,78 +89,16 @@ async def get_product_full_detail(product_seq: int):
     JOIN: Product + KindCategory + ColorCategory + SizeCategory + GenderCategory + Maker (6테이블)
     용도: 제품 상세 화면
     """
-    conn = connect_db()
-    curs = conn.cursor()
-    
     try:
-        sql = """
-        SELECT 
-            p.p_seq,
-            p.p_name,
-            p.p_price,
-            p.p_stock,
-            p.p_image,
-            kc.kc_seq,
-            kc.kc_name,
-            cc.cc_seq,
-            cc.cc_name,
-            sc.sc_seq,
-            sc.sc_name,
-            gc.gc_seq,
-            gc.gc_name,
-            m.m_seq,
-            m.m_name,
-            m.m_phone,
-            m.m_address
-        FROM product p
-        JOIN kind_category kc ON p.kc_seq = kc.kc_seq
-        JOIN color_category cc ON p.cc_seq = cc.cc_seq
-        JOIN size_category sc ON p.sc_seq = sc.sc_seq
-        JOIN gender_category gc ON p.gc_seq = gc.gc_seq
-        JOIN maker m ON p.m_seq = m.m_seq
-        WHERE p.p_seq = %s
-        """
-        curs.execute(sql, (product_seq,))
-        row = curs.fetchone()
+        key = ('full_detail', product_seq, table_versions.versions(CATALOG_TABLES))
+        row = await product_detail_flight.do(key, fetch_product_full_detail, product_seq)
         
         if row is None:
             return {"result": "Error", "message": "Product not found"}
         
-        result = {
-            'p_seq': row[0],
-            'p_name': row[1],
-            'p_price': row[2],
-            'p_stock': row[3],
-            'p_image': row[4],
-            'kind_category': {
-                'kc_seq': row[5],
-                'kc_name': row[6]
-            },
-            'color_category': {
-                'cc_seq': row[7],
-                'cc_name': row[8]
-            },
-            'size_category': {
-                'sc_seq': row[9],
-                'sc_name': row[10]
-            },
-            'gender_category': {
-                'gc_seq': row[11],
-                'gc_name': row[12]
-            },
-            'maker': {
-                'm_seq': row[13],
-                'm_name': row[14],
-                'm_phone': row[15],
-                'm_address': row[16]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(PRODUCT_FULL_DETAIL_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
-    finally:
-        conn.close()
 
 
 # ============================================
@@ -164,20 +168,7 @@ async def get_products_with_categories(
         curs.execute(sql, tuple(params))
         rows = curs.fetchall()
         
-        result = [{
-            'p_seq': row[0],
-            'p_name': row[1],
-            'p_price': row[2],
-            'p_stock': row[3],
-            'p_image': row[4],
-            'kind_name': row[5],
-            'color_name': row[6],
-            'size_name': row[7],
-            'gender_name': row[8],
-            'maker_name': row[9]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(PRODUCTS_WITH_CATEGORIES_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -222,20 +213,7 @@ async def get_products_by_maker_with_categories(maker_seq: int):
         curs.execute(sql, (maker_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'p_seq': row[0],
-            'p_name': row[1],
-            'p_price': row[2],
-            'p_stock': row[3],
-            'p_image': row[4],
-            'kind_name': row[5],
-            'color_name': row[6],
-            'size_name': row[7],
-            'gender_name': row[8],
-            'maker_name': row[9]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(PRODUCTS_WITH_CATEGORIES_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -304,20 +282,7 @@ async def get_products_by_category(
         curs.execute(sql, tuple(params))
         rows = curs.fetchall()
         
-        result = [{
-            'p_seq': row[0],
-            'p_name': row[1],
-            'p_price': row[2],
-            'p_stock': row[3],
-            'p_image': row[4],
-            'kind_name': row[5],
-            'color_name': row[6],
-            'size_name': row[7],
-            'gender_name': row[8],
-            'maker_name': row[9]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(PRODUCTS_WITH_CATEGORIES_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
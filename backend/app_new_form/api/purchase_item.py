@@ -5,11 +5,13 @@ PurchaseItem API - 구매 내역 CRUD
 Note: b_date (구매 날짜)로 여러 구매 항목을 하나의 주문으로 그룹화
 """
 
-from fastapi import APIRouter, Form
+from fastapi import APIRouter, Form, Query
 from pydantic import BaseModel
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -28,31 +30,90 @@ class PurchaseItem(BaseModel):
     b_status: Optional[str] = None
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+PURCHASE_ITEM_CODEC = RowCodec([
+    'b_seq', 'br_seq', 'u_seq', 'p_seq', 'b_price', 'b_quantity', 'b_date',
+    'b_status',
+])
+
+
+# ============================================
+# b_date 조건 (파티션 pruning)
+# purchase_item은 b_date 월 단위 RANGE 파티션 (database/manage_purchase_item_partitions.py)
+# b_date를 함수로 감싸지 않고 범위로 비교해야 필요한 파티션/인덱스 범위만 읽는다
+# ============================================
+def parse_datetime(value: str) -> datetime:
+    """ISO / 'YYYY-MM-DD HH:MM' 문자열 → timezone 없는 datetime"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
+def minute_range(order_datetime: str):
+    """주문 시각(분 단위) → [시작, 시작 + 1분) 범위"""
+    start = parse_datetime(order_datetime).replace(second=0, microsecond=0)
+    return start, start + timedelta(minutes=1)
+
+
+def since_clause(since: Optional[str], column: str = 'b_date'):
+    """since가 있으면 (' AND b_date >= %s', [since]) 반환"""
+    if not since:
+        return '', []
+    return f' AND {column} >= %s', [parse_datetime(since)]
+
+
 # ============================================
 # 전체 구매 내역 조회
 # ============================================
 @router.get("")
-async def select_purchase_items():
+async def select_purchase_items(
+    since: Optional[str] = Query(None, description="이 일시 이후 구매만 조회 (최근 파티션만 읽음)"),
+):
+    try:
+        condition, params = since_clause(since)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
+    curs.execute(f"""
         SELECT b_seq, br_seq, u_seq, p_seq, b_price, b_quantity, b_date, b_status 
         FROM purchase_item 
+        WHERE 1=1{condition}
         ORDER BY b_date DESC, b_seq
-    """)
+    """, params)
+    rows = curs.fetchall()
+    conn.close()
+    return RawJSONResponse(PURCHASE_ITEM_CODEC.dumps_results(rows))
+
+
+# ============================================
+# 날짜+시간(분 단위) 기반 주문 그룹화 조회 (같은 날짜+시간(분), 사용자, 지점)
+# /{purchase_item_seq} 보다 먼저 정의해야 함 (뒤에 있으면 by_datetime 이 ID로 해석되어 422)
+# ============================================
+@router.get("/by_datetime")
+async def select_purchase_items_by_datetime(
+    user_seq: int,
+    order_datetime: str,  # YYYY-MM-DD HH:MM format 또는 ISO format
+    branch_seq: int
+):
+    # 같은 분에 주문한 항목들을 하나로 묶음 (b_date 범위 비교 → 해당 월 파티션만 읽음)
+    try:
+        start, end = minute_range(order_datetime)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
+    conn = connect_db()
+    curs = conn.cursor()
+    curs.execute("""
+        SELECT b_seq, br_seq, u_seq, p_seq, b_price, b_quantity, b_date, b_status 
+        FROM purchase_item 
+        WHERE u_seq = %s 
+          AND b_date >= %s AND b_date < %s
+          AND br_seq = %s
+        ORDER BY b_date, b_seq
+    """, (user_seq, start, end, branch_seq))
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'b_seq': row[0],
-        'br_seq': row[1],
-        'u_seq': row[2],
-        'p_seq': row[3],
-        'b_price': row[4],
-        'b_quantity': row[5],
-        'b_date': row[6].isoformat() if row[6] else None,
-        'b_status': row[7]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(PURCHASE_ITEM_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -71,80 +132,49 @@ async def select_purchase_item(purchase_item_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "PurchaseItem not found"}
-    result = {
-        'b_seq': row[0],
-        'br_seq': row[1],
-        'u_seq': row[2],
-        'p_seq': row[3],
-        'b_price': row[4],
-        'b_quantity': row[5],
-        'b_date': row[6].isoformat() if row[6] else None,
-        'b_status': row[7]
-    }
-    return {"result": result}
+    return RawJSONResponse(PURCHASE_ITEM_CODEC.dumps_result(row))
 
 
 # ============================================
 # 고객별 구매 내역 조회
 # ============================================
 @router.get("/by_user/{user_seq}")
-async def select_purchase_items_by_user(user_seq: int):
+async def select_purchase_items_by_user(
+    user_seq: int,
+    since: Optional[str] = Query(None, description="이 일시 이후 구매만 조회 (최근 파티션만 읽음)"),
+):
+    try:
+        condition, params = since_clause(since)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
+    curs.execute(f"""
         SELECT b_seq, br_seq, u_seq, p_seq, b_price, b_quantity, b_date, b_status 
         FROM purchase_item 
-        WHERE u_seq = %s
+        WHERE u_seq = %s{condition}
         ORDER BY b_date DESC, b_seq
-    """, (user_seq,))
+    """, [user_seq] + params)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'b_seq': row[0],
-        'br_seq': row[1],
-        'u_seq': row[2],
-        'p_seq': row[3],
-        'b_price': row[4],
-        'b_quantity': row[5],
-        'b_date': row[6].isoformat() if row[6] else None,
-        'b_status': row[7]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(PURCHASE_ITEM_CODEC.dumps_results(rows))
 
 
 # ============================================
-# 날짜+시간(분 단위) 기반 주문 그룹화 조회 (같은 날짜+시간(분), 사용자, 지점)
+# 참조 무결성 확인
+# purchase_item을 파티션 테이블로 바꾸면 FOREIGN KEY(branch/user/product, pickup→purchase_item)를
+# 쓸 수 없으므로 쓰기 API에서 직접 확인 (database/renew/Partitioning/README.md)
 # ============================================
-@router.get("/by_datetime")
-async def select_purchase_items_by_datetime(
-    user_seq: int,
-    order_datetime: str,  # YYYY-MM-DD HH:MM format 또는 ISO format
-    branch_seq: int
-):
-    conn = connect_db()
-    curs = conn.cursor()
-    # datetime을 분 단위로 비교 (같은 분에 주문한 항목들을 하나로 묶음)
+REFERENCE_NOT_FOUND = "branch, user or product not found"
+
+
+def references_exist(curs, br_seq: int, u_seq: int, p_seq: int) -> bool:
     curs.execute("""
-        SELECT b_seq, br_seq, u_seq, p_seq, b_price, b_quantity, b_date, b_status 
-        FROM purchase_item 
-        WHERE u_seq = %s 
-          AND DATE_FORMAT(b_date, '%%Y-%%m-%%d %%H:%%i') = DATE_FORMAT(%s, '%%Y-%%m-%%d %%H:%%i')
-          AND br_seq = %s
-        ORDER BY b_date, b_seq
-    """, (user_seq, order_datetime, branch_seq))
-    rows = curs.fetchall()
-    conn.close()
-    result = [{
-        'b_seq': row[0],
-        'br_seq': row[1],
-        'u_seq': row[2],
-        'p_seq': row[3],
-        'b_price': row[4],
-        'b_quantity': row[5],
-        'b_date': row[6].isoformat() if row[6] else None,
-        'b_status': row[7]
-    } for row in rows]
-    return {"results": result}
+        SELECT 1 FROM branch br, user u, product p
+        WHERE br.br_seq = %s AND u.u_seq = %s AND p.p_seq = %s
+        FOR SHARE
+    """, (br_seq, u_seq, p_seq))
+    return curs.fetchone() is not None
 
 
 # ============================================
@@ -166,11 +196,18 @@ async def insert_purchase_item(
         
         conn = connect_db()
         curs = conn.cursor()
+        # 파티션 테이블은 FOREIGN KEY를 지원하지 않으므로 참조 행이 있을 때만 INSERT
         sql = """
             INSERT INTO purchase_item (br_seq, u_seq, p_seq, b_price, b_quantity, b_date, b_status) 
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            SELECT br.br_seq, u.u_seq, p.p_seq, %s, %s, %s, %s
+            FROM branch br, user u, product p
+            WHERE br.br_seq = %s AND u.u_seq = %s AND p.p_seq = %s
         """
-        curs.execute(sql, (br_seq, u_seq, p_seq, b_price, b_quantity, b_date_dt, b_status))
+        curs.execute(sql, (b_price, b_quantity, b_date_dt, b_status, br_seq, u_seq, p_seq))
+        if curs.rowcount == 0:
+            conn.rollback()
+            conn.close()
+            return {"result": "Error", "errorMsg": REFERENCE_NOT_FOUND}
         conn.commit()
         inserted_id = curs.lastrowid
         conn.close()
@@ -199,6 +236,9 @@ async def update_purchase_item(
         
         conn = connect_db()
         curs = conn.cursor()
+        if not references_exist(curs, br_seq, u_seq, p_seq):
+            conn.close()
+            return {"result": "Error", "errorMsg": REFERENCE_NOT_FOUND}
         sql = """
             UPDATE purchase_item 
             SET br_seq=%s, u_seq=%s, p_seq=%s, b_price=%s, b_quantity=%s, b_date=%s, b_status=%s 
@@ -206,6 +246,7 @@ async def update_purchase_item(
         """
         curs.execute(sql, (br_seq, u_seq, p_seq, b_price, b_quantity, b_date_dt, b_status, b_seq))
         conn.commit()
+        invalidate_detail('purchase_item', b_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -220,9 +261,19 @@ async def delete_purchase_item(purchase_item_seq: int):
     try:
         conn = connect_db()
         curs = conn.cursor()
-        sql = "DELETE FROM purchase_item WHERE b_seq=%s"
-        curs.execute(sql, (purchase_item_seq,))
+        # 수령 기록이 있는 구매는 삭제하지 않음 (기존 fk_pickup_purchase ON DELETE RESTRICT와 동일)
+        sql = """
+            DELETE FROM purchase_item 
+            WHERE b_seq=%s AND NOT EXISTS (SELECT 1 FROM pickup WHERE pickup.b_seq = %s)
+        """
+        curs.execute(sql, (purchase_item_seq, purchase_item_seq))
+        if curs.rowcount == 0:
+            curs.execute("SELECT 1 FROM pickup WHERE b_seq = %s LIMIT 1", (purchase_item_seq,))
+            if curs.fetchone() is not None:
+                conn.close()
+                return {"result": "Error", "errorMsg": "PurchaseItem is referenced by pickup"}
         conn.commit()
+        invalidate_detail('purchase_item', purchase_item_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
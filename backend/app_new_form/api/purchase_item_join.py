@@ -10,10 +10,41 @@ PurchaseItem 복합 쿼리 API
 from fastapi import APIRouter, Query
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.replicas import connect_read_db
+from app_new_form.database.detail_cache import detail_cache, CATALOG_NAME_TAGS
+from app_new_form.api.purchase_item import minute_range, since_clause
+from common.serialization import RowCodec, RawJSONResponse, dumps
 
 router = APIRouter()
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+PURCHASE_ITEM_WITH_DETAILS_CODEC = RowCodec([
+    'b_seq', 'b_price', 'b_quantity', 'b_date', 'b_status',
+    ('user', ['u_seq', 'u_id', 'u_name', 'u_phone']),
+    ('product', ['p_seq', 'p_name', 'p_price', 'p_image']),
+    ('branch', ['br_seq', 'br_name', 'br_address', 'br_phone']),
+])
+
+PURCHASE_ITEM_FULL_DETAIL_CODEC = RowCodec([
+    'b_seq', 'b_price', 'b_quantity', 'b_date', 'b_status',
+    ('user', ['u_seq', 'u_id', 'u_name', 'u_phone']),
+    ('product', [
+        'p_seq', 'p_name', 'p_price', 'p_stock', 'p_image', 'kind_name',
+        'color_name', 'size_name', 'gender_name', 'maker_name',
+    ]),
+    ('branch', ['br_seq', 'br_name', 'br_address', 'br_phone']),
+])
+
+PURCHASE_ITEMS_BY_USER_WITH_DETAILS_CODEC = RowCodec([
+    'b_seq', 'b_price', 'b_quantity', 'b_date', 'b_status',
+    ('product', ['p_seq', 'p_name', 'p_price', 'p_image']),
+    'branch_name',
+])
+
+
 # ============================================
 # PurchaseItem + User + Product + Branch (4테이블 JOIN)
 # ============================================
@@ -23,7 +54,7 @@ async def get_purchase_item_with_details(purchase_item_seq: int):
     특정 PurchaseItem + User + Product + Branch 정보
     JOIN: PurchaseItem + User + Product + Branch
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -58,33 +89,7 @@ async def get_purchase_item_with_details(purchase_item_seq: int):
         if row is None:
             return {"result": "Error", "message": "PurchaseItem not found"}
         
-        result = {
-            'b_seq': row[0],
-            'b_price': row[1],
-            'b_quantity': row[2],
-            'b_date': row[3].isoformat() if row[3] else None,
-            'b_status': row[4],
-            'user': {
-                'u_seq': row[5],
-                'u_id': row[6],
-                'u_name': row[7],
-                'u_phone': row[8]
-            },
-            'product': {
-                'p_seq': row[9],
-                'p_name': row[10],
-                'p_price': row[11],
-                'p_image': row[12]
-            },
-            'branch': {
-                'br_seq': row[13],
-                'br_name': row[14],
-                'br_address': row[15],
-                'br_phone': row[16]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(PURCHASE_ITEM_WITH_DETAILS_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -94,6 +99,62 @@ async def get_purchase_item_with_details(purchase_item_seq: int):
 # ============================================
 # PurchaseItem 전체 상세 (Product의 모든 카테고리 포함)
 # ============================================
+PURCHASE_ITEM_FULL_DETAIL_SQL = """
+    SELECT 
+        pi.b_seq,
+        pi.b_price,
+        pi.b_quantity,
+        pi.b_date,
+        pi.b_status,
+        u.u_seq,
+        u.u_id,
+        u.u_name,
+        u.u_phone,
+        p.p_seq,
+        p.p_name,
+        p.p_price,
+        p.p_stock,
+        p.p_image,
+        kc.kc_name,
+        cc.cc_name,
+        sc.sc_name,
+        gc.gc_name,
+        m.m_name,
+        br.br_seq,
+        br.br_name,
+        br.br_address,
+        br.br_phone
+    FROM purchase_item pi
+    JOIN user u ON pi.u_seq = u.u_seq
+    JOIN product p ON pi.p_seq = p.p_seq
+    JOIN kind_category kc ON p.kc_seq = kc.kc_seq
+    JOIN color_category cc ON p.cc_seq = cc.cc_seq
+    JOIN size_category sc ON p.sc_seq = sc.sc_seq
+    JOIN gender_category gc ON p.gc_seq = gc.gc_seq
+    JOIN maker m ON p.m_seq = m.m_seq
+    JOIN branch br ON pi.br_seq = br.br_seq
+    WHERE pi.b_seq = %s
+"""
+
+
+def fetch_purchase_item_full_detail(purchase_item_seq: int):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute(PURCHASE_ITEM_FULL_DETAIL_SQL, (purchase_item_seq,))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
+def purchase_item_detail_tags(row):
+    """상세 결과가 참조하는 행 (쓰기 라우터의 invalidate_detail 대상)"""
+    return [
+        ('purchase_item', row[0]), ('user', row[5]), ('product', row[9]),
+        ('branch', row[19]), ('maker', None),
+    ] + list(CATALOG_NAME_TAGS)
+
+
 @router.get("/purchase_items/{purchase_item_seq}/full_detail")
 async def get_purchase_item_full_detail(purchase_item_seq: int):
     """
@@ -101,106 +162,38 @@ async def get_purchase_item_full_detail(purchase_item_seq: int):
     JOIN: PurchaseItem + User + Product + Branch + 모든 카테고리 + Maker (9테이블)
     용도: 주문 상세 화면
     """
-    conn = connect_db()
-    curs = conn.cursor()
-    
     try:
-        sql = """
-        SELECT 
-            pi.b_seq,
-            pi.b_price,
-            pi.b_quantity,
-            pi.b_date,
-            pi.b_status,
-            u.u_seq,
-            u.u_id,
-            u.u_name,
-            u.u_phone,
-            p.p_seq,
-            p.p_name,
-            p.p_price,
-            p.p_stock,
-            p.p_image,
-            kc.kc_name,
-            cc.cc_name,
-            sc.sc_name,
-            gc.gc_name,
-            m.m_name,
-            br.br_seq,
-            br.br_name,
-            br.br_address,
-            br.br_phone
-        FROM purchase_item pi
-        JOIN user u ON pi.u_seq = u.u_seq
-        JOIN product p ON pi.p_seq = p.p_seq
-        JOIN kind_category kc ON p.kc_seq = kc.kc_seq
-        JOIN color_category cc ON p.cc_seq = cc.cc_seq
-        JOIN size_category sc ON p.sc_seq = sc.sc_seq
-        JOIN gender_category gc ON p.gc_seq = gc.gc_seq
-        JOIN maker m ON p.m_seq = m.m_seq
-        JOIN branch br ON pi.br_seq = br.br_seq
-        WHERE pi.b_seq = %s
-        """
-        curs.execute(sql, (purchase_item_seq,))
-        row = curs.fetchone()
+        row = await detail_cache.get_or_load(
+            ('purchase_item', purchase_item_seq), fetch_purchase_item_full_detail, purchase_item_seq, tags=purchase_item_detail_tags
+        )
         
         if row is None:
             return {"result": "Error", "message": "PurchaseItem not found"}
         
-        result = {
-            'b_seq': row[0],
-            'b_price': row[1],
-            'b_quantity': row[2],
-            'b_date': row[3].isoformat() if row[3] else None,
-            'b_status': row[4],
-            'user': {
-                'u_seq': row[5],
-                'u_id': row[6],
-                'u_name': row[7],
-                'u_phone': row[8]
-            },
-            'product': {
-                'p_seq': row[9],
-                'p_name': row[10],
-                'p_price': row[11],
-                'p_stock': row[12],
-                'p_image': row[13],
-                'kind_name': row[14],
-                'color_name': row[15],
-                'size_name': row[16],
-                'gender_name': row[17],
-                'maker_name': row[18]
-            },
-            'branch': {
-                'br_seq': row[19],
-                'br_name': row[20],
-                'br_address': row[21],
-                'br_phone': row[22]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(PURCHASE_ITEM_FULL_DETAIL_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
-    finally:
-        conn.close()
 
 
 # ============================================
 # 고객별 PurchaseItem 목록 + 상세 정보
 # ============================================
 @router.get("/purchase_items/by_user/{user_seq}/with_details")
-async def get_purchase_items_by_user_with_details(user_seq: int):
+async def get_purchase_items_by_user_with_details(
+    user_seq: int,
+    since: Optional[str] = Query(None, description="이 일시 이후 구매만 조회 (최근 파티션만 읽음)"),
+):
     """
     특정 고객의 모든 PurchaseItem + Product + Branch 정보
     JOIN: PurchaseItem + User + Product + Branch
     용도: 고객 주문 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
-        sql = """
+        condition, params = since_clause(since, 'pi.b_date')
+        sql = f"""
         SELECT 
             pi.b_seq,
             pi.b_price,
@@ -215,28 +208,13 @@ async def get_purchase_items_by_user_with_details(user_seq: int):
         FROM purchase_item pi
         JOIN product p ON pi.p_seq = p.p_seq
         JOIN branch br ON pi.br_seq = br.br_seq
-        WHERE pi.u_seq = %s
+        WHERE pi.u_seq = %s{condition}
         ORDER BY pi.b_date DESC, pi.b_seq DESC
         """
-        curs.execute(sql, (user_seq,))
+        curs.execute(sql, [user_seq] + params)
         rows = curs.fetchall()
         
-        result = [{
-            'b_seq': row[0],
-            'b_price': row[1],
-            'b_quantity': row[2],
-            'b_date': row[3].isoformat() if row[3] else None,
-            'b_status': row[4],
-            'product': {
-                'p_seq': row[5],
-                'p_name': row[6],
-                'p_price': row[7],
-                'p_image': row[8]
-            },
-            'branch_name': row[9]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(PURCHASE_ITEMS_BY_USER_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -258,7 +236,7 @@ async def get_purchase_items_by_datetime_with_details(
     용도: 주문 상세 화면 (여러 항목을 하나의 주문으로 표시)
     같은 분에 주문한 항목들을 하나의 주문으로 묶음
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -293,11 +271,12 @@ async def get_purchase_items_by_datetime_with_details(
         JOIN maker m ON p.m_seq = m.m_seq
         JOIN branch br ON pi.br_seq = br.br_seq
         WHERE pi.u_seq = %s 
-          AND DATE_FORMAT(pi.b_date, '%%Y-%%m-%%d %%H:%%i') = DATE_FORMAT(%s, '%%Y-%%m-%%d %%H:%%i')
+          AND pi.b_date >= %s AND pi.b_date < %s
           AND pi.br_seq = %s
         ORDER BY pi.b_date, pi.b_seq
         """
-        curs.execute(sql, (user_seq, order_datetime, branch_seq))
+        start, end = minute_range(order_datetime)
+        curs.execute(sql, (user_seq, start, end, branch_seq))
         rows = curs.fetchall()
         
         if not rows:
@@ -344,7 +323,7 @@ async def get_purchase_items_by_datetime_with_details(
         order_info['total_amount'] = total_amount
         order_info['item_count'] = len(rows)
         
-        return {"result": order_info}
+        return RawJSONResponse(dumps({"result": order_info}))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -355,26 +334,30 @@ async def get_purchase_items_by_datetime_with_details(
 # 고객별 주문 목록 (날짜+시간(분 단위) 기반 그룹화)
 # ============================================
 @router.get("/purchase_items/by_user/{user_seq}/orders")
-async def get_user_orders(user_seq: int):
+async def get_user_orders(
+    user_seq: int,
+    since: Optional[str] = Query(None, description="이 일시 이후 주문만 조회 (최근 파티션만 읽음)"),
+):
     """
     특정 고객의 주문 목록 (날짜+시간(분 단위), 지점으로 그룹화)
     JOIN: PurchaseItem + User + Product + Branch
     용도: 고객 주문 목록 화면
     같은 분에 주문한 항목들을 하나의 주문으로 묶음
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
         # 고유한 날짜+시간(분 단위)+지점 조합 목록 조회
-        sql_orders = """
+        condition, params = since_clause(since)
+        sql_orders = f"""
         SELECT DATE_FORMAT(b_date, '%%Y-%%m-%%d %%H:%%i') as order_datetime, br_seq, MIN(b_date) as order_time
         FROM purchase_item
-        WHERE u_seq = %s
+        WHERE u_seq = %s{condition}
         GROUP BY DATE_FORMAT(b_date, '%%Y-%%m-%%d %%H:%%i'), br_seq
         ORDER BY order_time DESC
         """
-        curs.execute(sql_orders, (user_seq,))
+        curs.execute(sql_orders, [user_seq] + params)
         order_rows = curs.fetchall()
         
         result = []
@@ -396,11 +379,12 @@ async def get_user_orders(user_seq: int):
             JOIN product p ON pi.p_seq = p.p_seq
             JOIN branch br ON pi.br_seq = br.br_seq
             WHERE pi.u_seq = %s 
-              AND DATE_FORMAT(pi.b_date, '%%Y-%%m-%%d %%H:%%i') = %s
+              AND pi.b_date >= %s AND pi.b_date < %s
               AND pi.br_seq = %s
             ORDER BY pi.b_date, pi.b_seq
             """
-            curs.execute(sql_items, (user_seq, order_datetime, branch_seq))
+            start, end = minute_range(order_datetime)
+            curs.execute(sql_items, (user_seq, start, end, branch_seq))
             item_rows = curs.fetchall()
             
             total_amount = sum(row[1] * row[2] for row in item_rows)
@@ -423,7 +407,7 @@ async def get_user_orders(user_seq: int):
             }
             result.append(order)
         
-        return {"results": result}
+        return RawJSONResponse(dumps({"results": result}))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
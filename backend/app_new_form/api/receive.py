@@ -5,9 +5,12 @@ Receive API - 입고(수주) CRUD
 
 from fastapi import APIRouter, Form
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.serialization import RowCodec, RawJSONResponse, dumps
 
 router = APIRouter()
 
@@ -24,6 +27,30 @@ class Receive(BaseModel):
     m_seq: int
 
 
+class ManifestItem(BaseModel):
+    rec_seq: Optional[int] = None  # 미리 등록된 입고 예정 행(rec_date 없음)을 처리할 때
+    p_seq: Optional[int] = None    # 새 입고 행을 추가할 때 (제조사는 제품에서 찾음)
+    rec_quantity: int = 0
+
+
+class ReceiveManifest(BaseModel):
+    manifest_id: str  # 명세서 ID (같은 ID 재전송은 한 번만 처리)
+    s_seq: int
+    items: List[ManifestItem]
+
+
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+RECEIVE_CODEC = RowCodec([
+    'rec_seq', 'rec_quantity', 'rec_date', 's_seq', 'p_seq', 'm_seq',
+])
+
+MANIFEST_CODEC = RowCodec([
+    'manifest_id', 's_seq', 'line_count', 'total_quantity', 'processed_at',
+])
+
+
 # ============================================
 # 전체 입고 내역 조회
 # ============================================
@@ -38,15 +65,7 @@ async def select_receives():
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'rec_seq': row[0],
-        'rec_quantity': row[1],
-        'rec_date': row[2].isoformat() if row[2] else None,
-        's_seq': row[3],
-        'p_seq': row[4],
-        'm_seq': row[5]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(RECEIVE_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -65,15 +84,7 @@ async def select_receive(receive_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "Receive not found"}
-    result = {
-        'rec_seq': row[0],
-        'rec_quantity': row[1],
-        'rec_date': row[2].isoformat() if row[2] else None,
-        's_seq': row[3],
-        'p_seq': row[4],
-        'm_seq': row[5]
-    }
-    return {"result": result}
+    return RawJSONResponse(RECEIVE_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -91,15 +102,7 @@ async def select_receives_by_product(product_seq: int):
     """, (product_seq,))
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'rec_seq': row[0],
-        'rec_quantity': row[1],
-        'rec_date': row[2].isoformat() if row[2] else None,
-        's_seq': row[3],
-        'p_seq': row[4],
-        'm_seq': row[5]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(RECEIVE_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -159,6 +162,7 @@ async def update_receive(
         """
         curs.execute(sql, (rec_quantity, rec_date_dt, s_seq, p_seq, m_seq, rec_seq))
         conn.commit()
+        invalidate_detail('receive', rec_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -178,12 +182,183 @@ async def process_receive(receive_seq: int):
         sql = "UPDATE receive SET rec_date=%s WHERE rec_seq=%s"
         curs.execute(sql, (rec_date_dt, receive_seq))
         conn.commit()
+        invalidate_detail('receive', receive_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
 
 
+# ============================================
+# 입고 명세서 일괄 처리 (트럭 1대 분량 입고를 요청 1번으로)
+# ============================================
+MAX_MANIFEST_ITEMS = 5000
+MANIFEST_ID_MAX_LENGTH = 64
+
+
+def validate_manifest(manifest: ReceiveManifest):
+    if not 0 < len(manifest.manifest_id) <= MANIFEST_ID_MAX_LENGTH:
+        raise ValueError(f"manifest_id는 1~{MANIFEST_ID_MAX_LENGTH}자여야 합니다")
+    if not manifest.items:
+        raise ValueError("items가 비어 있습니다")
+    if len(manifest.items) > MAX_MANIFEST_ITEMS:
+        raise ValueError(f"명세서 1건은 최대 {MAX_MANIFEST_ITEMS}행까지 처리할 수 있습니다 (요청 {len(manifest.items)}행)")
+    for index, item in enumerate(manifest.items):
+        if (item.rec_seq is None) == (item.p_seq is None):
+            raise ValueError(f"items[{index}]: rec_seq 또는 p_seq 중 하나만 지정해야 합니다")
+        if item.rec_seq is None and item.rec_quantity <= 0:
+            raise ValueError(f"items[{index}]: rec_quantity는 1 이상이어야 합니다")
+
+
+def apply_manifest(conn, manifest: ReceiveManifest, now: datetime):
+    """
+    명세서 1건을 한 트랜잭션으로 처리 (commit은 호출한 쪽에서)
+    1) receive_manifest 에 manifest_id 기록 → 이미 있으면 None (재전송)
+    2) 입고 예정 행: 조회 + 잠금 후 UPDATE 1번으로 rec_date 기록
+    3) 새 입고 행: 제품/제조사 확인 후 multi-row INSERT
+    4) 제품별 입고 수량 합계를 UPDATE 1번으로 재고에 반영
+
+    Returns:
+        dict: {p_seq: 증가 수량} 와 처리한 입고 예정 행 목록, 재전송이면 None
+
+    Raises:
+        ValueError: 없는/이미 처리된 입고 행, 없는 제품 (전체 rollback 대상)
+    """
+    curs = conn.cursor()
+    # 같은 manifest_id 가 먼저 커밋되면 rowcount = 0 (PK 잠금 대기 후 중복 판정)
+    curs.execute("""
+        INSERT INTO receive_manifest (manifest_id, s_seq, processed_at)
+        VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE manifest_id = manifest_id
+    """, (manifest.manifest_id, manifest.s_seq, now))
+    if curs.rowcount != 1:
+        return None
+
+    stock = {}
+    line_count = 0
+
+    pending_seqs = list(dict.fromkeys(item.rec_seq for item in manifest.items if item.rec_seq is not None))
+    if pending_seqs:
+        placeholders = ', '.join(['%s'] * len(pending_seqs))
+        curs.execute(f"""
+            SELECT rec_seq, p_seq, rec_quantity FROM receive
+            WHERE rec_seq IN ({placeholders}) AND rec_date IS NULL
+            FOR UPDATE
+        """, pending_seqs)
+        pending_rows = curs.fetchall()
+        found = {row[0] for row in pending_rows}
+        invalid = [seq for seq in pending_seqs if seq not in found]
+        if invalid:
+            raise ValueError(f"처리할 수 없는 입고 행 (없거나 이미 처리됨): {invalid}")
+        curs.execute(f"""
+            UPDATE receive SET rec_date = %s, manifest_id = %s
+            WHERE rec_seq IN ({placeholders})
+        """, [now, manifest.manifest_id] + pending_seqs)
+        for _, p_seq, quantity in pending_rows:
+            stock[p_seq] = stock.get(p_seq, 0) + (quantity or 0)
+        line_count += len(pending_rows)
+
+    new_items = [item for item in manifest.items if item.rec_seq is None]
+    if new_items:
+        product_seqs = sorted({item.p_seq for item in new_items})
+        curs.execute(f"""
+            SELECT p_seq, m_seq FROM product
+            WHERE p_seq IN ({', '.join(['%s'] * len(product_seqs))})
+        """, product_seqs)
+        makers = dict(curs.fetchall())
+        unknown = [seq for seq in product_seqs if seq not in makers]
+        if unknown:
+            raise ValueError(f"없는 제품: {unknown}")
+        # pymysql executemany 는 INSERT ... VALUES 를 multi-row INSERT 로 묶어서 보냄
+        curs.executemany("""
+            INSERT INTO receive (rec_quantity, rec_date, s_seq, p_seq, m_seq, manifest_id)
+            VALUES (%s, %s, %s, %s, %s, %s)
+        """, [
+            (item.rec_quantity, now, manifest.s_seq, item.p_seq, makers[item.p_seq], manifest.manifest_id)
+            for item in new_items
+        ])
+        for item in new_items:
+            stock[item.p_seq] = stock.get(item.p_seq, 0) + item.rec_quantity
+        line_count += len(new_items)
+
+    # 제품 번호 순서로 잠금 (동시 명세서끼리 교착 방지)
+    product_seqs = sorted(seq for seq, quantity in stock.items() if quantity)
+    if product_seqs:
+        curs.execute(f"""
+            UPDATE product
+            SET p_stock = p_stock + CASE p_seq {' '.join(['WHEN %s THEN %s'] * len(product_seqs))} END
+            WHERE p_seq IN ({', '.join(['%s'] * len(product_seqs))})
+            ORDER BY p_seq
+        """, [value for seq in product_seqs for value in (seq, stock[seq])] + product_seqs)
+
+    curs.execute("""
+        UPDATE receive_manifest SET line_count = %s, total_quantity = %s
+        WHERE manifest_id = %s
+    """, (line_count, sum(stock.values()), manifest.manifest_id))
+    return {"stock": stock, "processed": pending_seqs}
+
+
+def select_manifest(conn, manifest_id: str):
+    curs = conn.cursor()
+    curs.execute("""
+        SELECT manifest_id, s_seq, line_count, total_quantity, processed_at
+        FROM receive_manifest
+        WHERE manifest_id = %s
+    """, (manifest_id,))
+    return curs.fetchone()
+
+
+@router.post("/manifest/process")
+async def process_manifest(manifest: ReceiveManifest):
+    """
+    입고 명세서 처리: 입고 행 추가/처리 + 제품 재고 증가를 한 트랜잭션으로
+    같은 manifest_id 를 다시 보내면 처리하지 않고 처음 처리 결과를 반환 (duplicate: true)
+
+    요청:
+        {"manifest_id": "TRUCK-20250115-01", "s_seq": 3, "items": [
+            {"p_seq": 12, "rec_quantity": 40},
+            {"rec_seq": 881}
+        ]}
+    """
+    try:
+        validate_manifest(manifest)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
+
+    try:
+        conn = connect_db()
+        try:
+            applied = apply_manifest(conn, manifest, datetime.now())
+            if applied is None:
+                conn.rollback()
+            else:
+                conn.commit()
+            row = select_manifest(conn, manifest.manifest_id)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+
+    if applied is None:
+        return RawJSONResponse(dumps({"result": "OK", "duplicate": True, "manifest": MANIFEST_CODEC.to_dict(row)}))
+
+    if applied["stock"]:
+        table_versions.bump('product')
+    for product_seq in applied["stock"]:
+        invalidate_detail('product', product_seq)
+    for receive_seq in applied["processed"]:
+        invalidate_detail('receive', receive_seq)
+    return RawJSONResponse(dumps({
+        "result": "OK",
+        "duplicate": False,
+        "manifest": MANIFEST_CODEC.to_dict(row),
+        "stock": [{"p_seq": seq, "quantity": quantity} for seq, quantity in sorted(applied["stock"].items())],
+    }))
+
+
 # ============================================
 # 입고 내역 삭제
 # ============================================
@@ -195,6 +370,7 @@ async def delete_receive(receive_seq: int):
         sql = "DELETE FROM receive WHERE rec_seq=%s"
         curs.execute(sql, (receive_seq,))
         conn.commit()
+        invalidate_detail('receive', receive_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
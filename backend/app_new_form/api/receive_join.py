@@ -9,10 +9,52 @@ Receive 복합 쿼리 API
 from fastapi import APIRouter, Query
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.replicas import connect_read_db
+from app_new_form.database.detail_cache import detail_cache, CATALOG_NAME_TAGS
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+RECEIVE_WITH_DETAILS_CODEC = RowCodec([
+    'rec_seq', 'rec_quantity', 'rec_date',
+    ('staff', ['s_seq', 's_rank', 's_phone']),
+    ('product', ['p_seq', 'p_name', 'p_price', 'p_stock', 'p_image']),
+    ('maker', ['m_seq', 'm_name', 'm_phone', 'm_address']),
+])
+
+RECEIVE_FULL_DETAIL_CODEC = RowCodec([
+    'rec_seq', 'rec_quantity', 'rec_date',
+    ('staff', ['s_seq', 's_rank', 's_phone']),
+    ('product', [
+        'p_seq', 'p_name', 'p_price', 'p_stock', 'p_image', 'kind_name',
+        'color_name', 'size_name', 'gender_name',
+    ]),
+    ('maker', ['m_seq', 'm_name', 'm_phone', 'm_address']),
+])
+
+RECEIVES_BY_STAFF_WITH_DETAILS_CODEC = RowCodec([
+    'rec_seq', 'rec_quantity', 'rec_date',
+    ('product', ['p_name', 'p_price', 'p_image']),
+    'maker_name',
+])
+
+RECEIVES_BY_PRODUCT_WITH_DETAILS_CODEC = RowCodec([
+    'rec_seq', 'rec_quantity', 'rec_date',
+    ('staff', ['s_rank', 's_phone']),
+    ('maker', ['m_name', 'm_phone']),
+])
+
+RECEIVES_BY_MAKER_WITH_DETAILS_CODEC = RowCodec([
+    'rec_seq', 'rec_quantity', 'rec_date',
+    ('staff', ['s_rank', 's_phone']),
+    ('product', ['p_name', 'p_price', 'p_image']),
+])
+
+
 # ============================================
 # Receive + Staff + Product + Maker
 # ============================================
@@ -22,7 +64,7 @@ async def get_receive_with_details(receive_seq: int):
     특정 Receive + Staff + Product + Maker 정보
     JOIN: Receive + Staff + Product + Maker (4테이블)
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -55,31 +97,7 @@ async def get_receive_with_details(receive_seq: int):
         if row is None:
             return {"result": "Error", "message": "Receive not found"}
         
-        result = {
-            'rec_seq': row[0],
-            'rec_quantity': row[1],
-            'rec_date': row[2].isoformat() if row[2] else None,
-            'staff': {
-                's_seq': row[3],
-                's_rank': row[4],
-                's_phone': row[5]
-            },
-            'product': {
-                'p_seq': row[6],
-                'p_name': row[7],
-                'p_price': row[8],
-                'p_stock': row[9],
-                'p_image': row[10]
-            },
-            'maker': {
-                'm_seq': row[11],
-                'm_name': row[12],
-                'm_phone': row[13],
-                'm_address': row[14]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(RECEIVE_WITH_DETAILS_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -89,6 +107,56 @@ async def get_receive_with_details(receive_seq: int):
 # ============================================
 # Receive 전체 상세 (Product의 모든 카테고리 포함)
 # ============================================
+RECEIVE_FULL_DETAIL_SQL = """
+    SELECT 
+        rec.rec_seq,
+        rec.rec_quantity,
+        rec.rec_date,
+        s.s_seq,
+        s.s_rank,
+        s.s_phone,
+        p.p_seq,
+        p.p_name,
+        p.p_price,
+        p.p_stock,
+        p.p_image,
+        kc.kc_name,
+        cc.cc_name,
+        sc.sc_name,
+        gc.gc_name,
+        m.m_seq,
+        m.m_name,
+        m.m_phone,
+        m.m_address
+    FROM receive rec
+    JOIN staff s ON rec.s_seq = s.s_seq
+    JOIN product p ON rec.p_seq = p.p_seq
+    JOIN kind_category kc ON p.kc_seq = kc.kc_seq
+    JOIN color_category cc ON p.cc_seq = cc.cc_seq
+    JOIN size_category sc ON p.sc_seq = sc.sc_seq
+    JOIN gender_category gc ON p.gc_seq = gc.gc_seq
+    JOIN maker m ON rec.m_seq = m.m_seq
+    WHERE rec.rec_seq = %s
+"""
+
+
+def fetch_receive_full_detail(receive_seq: int):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute(RECEIVE_FULL_DETAIL_SQL, (receive_seq,))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
+def receive_detail_tags(row):
+    """상세 결과가 참조하는 행 (쓰기 라우터의 invalidate_detail 대상)"""
+    return [
+        ('receive', row[0]), ('staff', row[3]), ('product', row[6]), ('maker', row[15]),
+    ] + list(CATALOG_NAME_TAGS)
+
+
 @router.get("/receives/{receive_seq}/full_detail")
 async def get_receive_full_detail(receive_seq: int):
     """
@@ -96,80 +164,17 @@ async def get_receive_full_detail(receive_seq: int):
     JOIN: Receive + Staff + Product + Maker + 모든 카테고리 (9테이블)
     용도: 입고 상세 화면
     """
-    conn = connect_db()
-    curs = conn.cursor()
-    
     try:
-        sql = """
-        SELECT 
-            rec.rec_seq,
-            rec.rec_quantity,
-            rec.rec_date,
-            s.s_seq,
-            s.s_rank,
-            s.s_phone,
-            p.p_seq,
-            p.p_name,
-            p.p_price,
-            p.p_stock,
-            p.p_image,
-            kc.kc_name,
-            cc.cc_name,
-            sc.sc_name,
-            gc.gc_name,
-            m.m_seq,
-            m.m_name,
-            m.m_phone,
-            m.m_address
-        FROM receive rec
-        JOIN staff s ON rec.s_seq = s.s_seq
-        JOIN product p ON rec.p_seq = p.p_seq
-        JOIN kind_category kc ON p.kc_seq = kc.kc_seq
-        JOIN color_category cc ON p.cc_seq = cc.cc_seq
-        JOIN size_category sc ON p.sc_seq = sc.sc_seq
-        JOIN gender_category gc ON p.gc_seq = gc.gc_seq
-        JOIN maker m ON rec.m_seq = m.m_seq
-        WHERE rec.rec_seq = %s
-        """
-        curs.execute(sql, (receive_seq,))
-        row = curs.fetchone()
+        row = await detail_cache.get_or_load(
+            ('receive', receive_seq), fetch_receive_full_detail, receive_seq, tags=receive_detail_tags
+        )
         
         if row is None:
             return {"result": "Error", "message": "Receive not found"}
         
-        result = {
-            'rec_seq': row[0],
-            'rec_quantity': row[1],
-            'rec_date': row[2].isoformat() if row[2] else None,
-            'staff': {
-                's_seq': row[3],
-                's_rank': row[4],
-                's_phone': row[5]
-            },
-            'product': {
-                'p_seq': row[6],
-                'p_name': row[7],
-                'p_price': row[8],
-                'p_stock': row[9],
-                'p_image': row[10],
-                'kind_name': row[11],
-                'color_name': row[12],
-                'size_name': row[13],
-                'gender_name': row[14]
-            },
-            'maker': {
-                'm_seq': row[15],
-                'm_name': row[16],
-                'm_phone': row[17],
-                'm_address': row[18]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(RECEIVE_FULL_DETAIL_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
-    finally:
-        conn.close()
 
 
 # ============================================
@@ -182,7 +187,7 @@ async def get_receives_by_staff_with_details(staff_seq: int):
     JOIN: Receive + Staff + Product + Maker
     용도: 직원별 입고 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -204,19 +209,7 @@ async def get_receives_by_staff_with_details(staff_seq: int):
         curs.execute(sql, (staff_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'rec_seq': row[0],
-            'rec_quantity': row[1],
-            'rec_date': row[2].isoformat() if row[2] else None,
-            'product': {
-                'p_name': row[3],
-                'p_price': row[4],
-                'p_image': row[5]
-            },
-            'maker_name': row[6]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(RECEIVES_BY_STAFF_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -233,7 +226,7 @@ async def get_receives_by_product_with_details(product_seq: int):
     JOIN: Receive + Staff + Product + Maker
     용도: 제품별 입고 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -255,21 +248,7 @@ async def get_receives_by_product_with_details(product_seq: int):
         curs.execute(sql, (product_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'rec_seq': row[0],
-            'rec_quantity': row[1],
-            'rec_date': row[2].isoformat() if row[2] else None,
-            'staff': {
-                's_rank': row[3],
-                's_phone': row[4]
-            },
-            'maker': {
-                'm_name': row[5],
-                'm_phone': row[6]
-            }
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(RECEIVES_BY_PRODUCT_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -286,7 +265,7 @@ async def get_receives_by_maker_with_details(maker_seq: int):
     JOIN: Receive + Staff + Product + Maker
     용도: 제조사별 입고 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -309,22 +288,7 @@ async def get_receives_by_maker_with_details(maker_seq: int):
         curs.execute(sql, (maker_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'rec_seq': row[0],
-            'rec_quantity': row[1],
-            'rec_date': row[2].isoformat() if row[2] else None,
-            'staff': {
-                's_rank': row[3],
-                's_phone': row[4]
-            },
-            'product': {
-                'p_name': row[5],
-                'p_price': row[6],
-                'p_image': row[7]
-            }
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(RECEIVES_BY_MAKER_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -8,6 +8,8 @@ from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -26,6 +28,15 @@ class Refund(BaseModel):
     pic_seq: int
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+REFUND_CODEC = RowCodec([
+    'ref_seq', 'ref_date', 'ref_reason', 'ref_re_seq', 'ref_re_content',
+    'u_seq', 's_seq', 'pic_seq',
+])
+
+
 # ============================================
 # 전체 반품 내역 조회
 # ============================================
@@ -40,17 +51,7 @@ async def select_refunds():
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'ref_seq': row[0],
-        'ref_date': row[1].isoformat() if row[1] else None,
-        'ref_reason': row[2],
-        'ref_re_seq': row[3],
-        'ref_re_content': row[4],
-        'u_seq': row[5],
-        's_seq': row[6],
-        'pic_seq': row[7]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(REFUND_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -69,17 +70,7 @@ async def select_refund(refund_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "Refund not found"}
-    result = {
-        'ref_seq': row[0],
-        'ref_date': row[1].isoformat() if row[1] else None,
-        'ref_reason': row[2],
-        'ref_re_seq': row[3],
-        'ref_re_content': row[4],
-        'u_seq': row[5],
-        's_seq': row[6],
-        'pic_seq': row[7]
-    }
-    return {"result": result}
+    return RawJSONResponse(REFUND_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -97,17 +88,7 @@ async def select_refunds_by_user(user_seq: int):
     """, (user_seq,))
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'ref_seq': row[0],
-        'ref_date': row[1].isoformat() if row[1] else None,
-        'ref_reason': row[2],
-        'ref_re_seq': row[3],
-        'ref_re_content': row[4],
-        'u_seq': row[5],
-        's_seq': row[6],
-        'pic_seq': row[7]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(REFUND_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -171,6 +152,7 @@ async def update_refund(
         """
         curs.execute(sql, (ref_date_dt, ref_reason, ref_re_seq, ref_re_content, u_seq, s_seq, pic_seq, ref_seq))
         conn.commit()
+        invalidate_detail('refund', ref_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -190,6 +172,7 @@ async def process_refund(refund_seq: int):
         sql = "UPDATE refund SET ref_date=%s WHERE ref_seq=%s"
         curs.execute(sql, (ref_date_dt, refund_seq))
         conn.commit()
+        invalidate_detail('refund', refund_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -207,6 +190,7 @@ async def delete_refund(refund_seq: int):
         sql = "DELETE FROM refund WHERE ref_seq=%s"
         curs.execute(sql, (refund_seq,))
         conn.commit()
+        invalidate_detail('refund', refund_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -9,10 +9,54 @@ Refund 복합 쿼리 API
 from fastapi import APIRouter, Query
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.replicas import connect_read_db
+from app_new_form.database.detail_cache import detail_cache, CATALOG_NAME_TAGS
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+REFUND_WITH_DETAILS_CODEC = RowCodec([
+    'ref_seq', 'ref_date', 'ref_reason',
+    ('user', ['u_seq', 'u_name', 'u_phone']),
+    ('staff', ['s_seq', 's_rank', 's_phone']),
+    ('pickup', ['pic_seq', 'created_at']),
+    ('purchase_item', ['b_seq', 'b_price', 'b_quantity', 'b_date']),
+    ('product', ['p_seq', 'p_name', 'p_price', 'p_image']),
+    ('branch', ['br_seq', 'br_name']),
+])
+
+REFUND_FULL_DETAIL_CODEC = RowCodec([
+    'ref_seq', 'ref_date', 'ref_reason',
+    ('user', ['u_seq', 'u_name', 'u_phone']),
+    ('staff', ['s_seq', 's_rank', 's_phone']),
+    ('pickup', ['pic_seq', 'created_at']),
+    ('purchase_item', ['b_seq', 'b_price', 'b_quantity', 'b_date']),
+    ('product', [
+        'p_seq', 'p_name', 'p_price', 'p_image', 'kind_name', 'color_name',
+        'size_name', 'gender_name', 'maker_name',
+    ]),
+    ('branch', ['br_seq', 'br_name', 'br_address']),
+])
+
+REFUNDS_BY_USER_WITH_DETAILS_CODEC = RowCodec([
+    'ref_seq', 'ref_date', 'ref_reason',
+    ('staff', ['s_rank', 's_phone']),
+    ('product', ['p_name', 'p_image']),
+    ('purchase_item', ['b_price', 'b_quantity']),
+])
+
+REFUNDS_BY_STAFF_WITH_DETAILS_CODEC = RowCodec([
+    'ref_seq', 'ref_date', 'ref_reason',
+    ('user', ['u_name', 'u_phone']),
+    ('product', ['p_name', 'p_image']),
+    ('purchase_item', ['b_price', 'b_quantity']),
+])
+
+
 # ============================================
 # Refund + User + Staff + Pickup + PurchaseItem + Product + Branch
 # ============================================
@@ -22,7 +66,7 @@ async def get_refund_with_details(refund_seq: int):
     특정 Refund + User + Staff + Pickup + PurchaseItem + Product + Branch 정보
     JOIN: Refund + User + Staff + Pickup + PurchaseItem + Product + Branch (7테이블)
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -64,43 +108,7 @@ async def get_refund_with_details(refund_seq: int):
         if row is None:
             return {"result": "Error", "message": "Refund not found"}
         
-        result = {
-            'ref_seq': row[0],
-            'ref_date': row[1].isoformat() if row[1] else None,
-            'ref_reason': row[2],
-            'user': {
-                'u_seq': row[3],
-                'u_name': row[4],
-                'u_phone': row[5]
-            },
-            'staff': {
-                's_seq': row[6],
-                's_rank': row[7],
-                's_phone': row[8]
-            },
-            'pickup': {
-                'pic_seq': row[9],
-                'created_at': row[10].isoformat() if row[10] else None
-            },
-            'purchase_item': {
-                'b_seq': row[11],
-                'b_price': row[12],
-                'b_quantity': row[13],
-                'b_date': row[14].isoformat() if row[14] else None
-            },
-            'product': {
-                'p_seq': row[15],
-                'p_name': row[16],
-                'p_price': row[17],
-                'p_image': row[18]
-            },
-            'branch': {
-                'br_seq': row[19],
-                'br_name': row[20]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(REFUND_WITH_DETAILS_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -110,6 +118,69 @@ async def get_refund_with_details(refund_seq: int):
 # ============================================
 # Refund 전체 상세 (Product의 모든 카테고리 포함)
 # ============================================
+REFUND_FULL_DETAIL_SQL = """
+    SELECT 
+        ref.ref_seq,
+        ref.ref_date,
+        ref.ref_reason,
+        u.u_seq,
+        u.u_name,
+        u.u_phone,
+        s.s_seq,
+        s.s_rank,
+        s.s_phone,
+        pic.pic_seq,
+        pic.created_at,
+        pi.b_seq,
+        pi.b_price,
+        pi.b_quantity,
+        pi.b_date,
+        p.p_seq,
+        p.p_name,
+        p.p_price,
+        p.p_image,
+        kc.kc_name,
+        cc.cc_name,
+        sc.sc_name,
+        gc.gc_name,
+        m.m_name,
+        br.br_seq,
+        br.br_name,
+        br.br_address
+    FROM refund ref
+    JOIN user u ON ref.u_seq = u.u_seq
+    JOIN staff s ON ref.s_seq = s.s_seq
+    JOIN pickup pic ON ref.pic_seq = pic.pic_seq
+    JOIN purchase_item pi ON pic.b_seq = pi.b_seq
+    JOIN product p ON pi.p_seq = p.p_seq
+    JOIN kind_category kc ON p.kc_seq = kc.kc_seq
+    JOIN color_category cc ON p.cc_seq = cc.cc_seq
+    JOIN size_category sc ON p.sc_seq = sc.sc_seq
+    JOIN gender_category gc ON p.gc_seq = gc.gc_seq
+    JOIN maker m ON p.m_seq = m.m_seq
+    JOIN branch br ON pi.br_seq = br.br_seq
+    WHERE ref.ref_seq = %s
+"""
+
+
+def fetch_refund_full_detail(refund_seq: int):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute(REFUND_FULL_DETAIL_SQL, (refund_seq,))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
+def refund_detail_tags(row):
+    """상세 결과가 참조하는 행 (쓰기 라우터의 invalidate_detail 대상)"""
+    return [
+        ('refund', row[0]), ('user', row[3]), ('staff', row[6]), ('pickup', row[9]),
+        ('purchase_item', row[11]), ('product', row[15]), ('branch', row[24]), ('maker', None),
+    ] + list(CATALOG_NAME_TAGS)
+
+
 @router.get("/refunds/{refund_seq}/full_detail")
 async def get_refund_full_detail(refund_seq: int):
     """
@@ -117,106 +188,17 @@ async def get_refund_full_detail(refund_seq: int):
     JOIN: Refund + User + Staff + Pickup + PurchaseItem + Product + Branch + 모든 카테고리 + Maker (12테이블)
     용도: 반품 상세 화면
     """
-    conn = connect_db()
-    curs = conn.cursor()
-    
     try:
-        sql = """
-        SELECT 
-            ref.ref_seq,
-            ref.ref_date,
-            ref.ref_reason,
-            u.u_seq,
-            u.u_name,
-            u.u_phone,
-            s.s_seq,
-            s.s_rank,
-            s.s_phone,
-            pic.pic_seq,
-            pic.created_at,
-            pi.b_seq,
-            pi.b_price,
-            pi.b_quantity,
-            pi.b_date,
-            p.p_seq,
-            p.p_name,
-            p.p_price,
-            p.p_image,
-            kc.kc_name,
-            cc.cc_name,
-            sc.sc_name,
-            gc.gc_name,
-            m.m_name,
-            br.br_seq,
-            br.br_name,
-            br.br_address
-        FROM refund ref
-        JOIN user u ON ref.u_seq = u.u_seq
-        JOIN staff s ON ref.s_seq = s.s_seq
-        JOIN pickup pic ON ref.pic_seq = pic.pic_seq
-        JOIN purchase_item pi ON pic.b_seq = pi.b_seq
-        JOIN product p ON pi.p_seq = p.p_seq
-        JOIN kind_category kc ON p.kc_seq = kc.kc_seq
-        JOIN color_category cc ON p.cc_seq = cc.cc_seq
-        JOIN size_category sc ON p.sc_seq = sc.sc_seq
-        JOIN gender_category gc ON p.gc_seq = gc.gc_seq
-        JOIN maker m ON p.m_seq = m.m_seq
-        JOIN branch br ON pi.br_seq = br.br_seq
-        WHERE ref.ref_seq = %s
-        """
-        curs.execute(sql, (refund_seq,))
-        row = curs.fetchone()
+        row = await detail_cache.get_or_load(
+            ('refund', refund_seq), fetch_refund_full_detail, refund_seq, tags=refund_detail_tags
+        )
         
         if row is None:
             return {"result": "Error", "message": "Refund not found"}
         
-        result = {
-            'ref_seq': row[0],
-            'ref_date': row[1].isoformat() if row[1] else None,
-            'ref_reason': row[2],
-            'user': {
-                'u_seq': row[3],
-                'u_name': row[4],
-                'u_phone': row[5]
-            },
-            'staff': {
-                's_seq': row[6],
-                's_rank': row[7],
-                's_phone': row[8]
-            },
-            'pickup': {
-                'pic_seq': row[9],
-                'created_at': row[10].isoformat() if row[10] else None
-            },
-            'purchase_item': {
-                'b_seq': row[11],
-                'b_price': row[12],
-                'b_quantity': row[13],
-                'b_date': row[14].isoformat() if row[14] else None
-            },
-            'product': {
-                'p_seq': row[15],
-                'p_name': row[16],
-                'p_price': row[17],
-                'p_image': row[18],
-                'kind_name': row[19],
-                'color_name': row[20],
-                'size_name': row[21],
-                'gender_name': row[22],
-                'maker_name': row[23]
-            },
-            'branch': {
-                'br_seq': row[24],
-                'br_name': row[25],
-                'br_address': row[26]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(REFUND_FULL_DETAIL_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
-    finally:
-        conn.close()
 
 
 # ============================================
@@ -229,7 +211,7 @@ async def get_refunds_by_user_with_details(user_seq: int):
     JOIN: Refund + User + Staff + Pickup + PurchaseItem + Product
     용도: 고객 반품 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -255,25 +237,7 @@ async def get_refunds_by_user_with_details(user_seq: int):
         curs.execute(sql, (user_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'ref_seq': row[0],
-            'ref_date': row[1].isoformat() if row[1] else None,
-            'ref_reason': row[2],
-            'staff': {
-                's_rank': row[3],
-                's_phone': row[4]
-            },
-            'product': {
-                'p_name': row[5],
-                'p_image': row[6]
-            },
-            'purchase_item': {
-                'b_price': row[7],
-                'b_quantity': row[8]
-            }
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(REFUNDS_BY_USER_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -290,7 +254,7 @@ async def get_refunds_by_staff_with_details(staff_seq: int):
     JOIN: Refund + User + Staff + Pickup + PurchaseItem + Product
     용도: 직원별 반품 처리 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -316,25 +280,7 @@ async def get_refunds_by_staff_with_details(staff_seq: int):
         curs.execute(sql, (staff_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'ref_seq': row[0],
-            'ref_date': row[1].isoformat() if row[1] else None,
-            'ref_reason': row[2],
-            'user': {
-                'u_name': row[3],
-                'u_phone': row[4]
-            },
-            'product': {
-                'p_name': row[5],
-                'p_image': row[6]
-            },
-            'purchase_item': {
-                'b_price': row[7],
-                'b_quantity': row[8]
-            }
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(REFUNDS_BY_STAFF_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -3,11 +3,14 @@ Request API - 발주/품의 CRUD
 개별 실행: python request.py
 """
 
-from fastapi import APIRouter, Form
+from fastapi import APIRouter, Form, Query
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from common.fieldsets import FieldSet
+from common.serialization import RawJSONResponse, dumps
 
 router = APIRouter()
 
@@ -22,52 +25,160 @@ class Request(BaseModel):
     req_quantity: int = 0
     req_manappdate: Optional[datetime] = None
     req_dirappdate: Optional[datetime] = None
+    req_state: str = 'pending'
     s_seq: int
     p_seq: int
     m_seq: int
     s_superseq: Optional[int] = None
 
 
+class BulkTransition(BaseModel):
+    req_seqs: List[int]
+
+
+# ============================================
+# 조회 가능 컬럼 (fields= 화이트리스트, 기본 SELECT 순서와 동일)
+# ============================================
+REQUEST_FIELDS = FieldSet([
+    'req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate',
+    'req_dirappdate', 's_seq', 'p_seq', 'm_seq', 's_superseq', 'req_state',
+])
+FIELDS_DESCRIPTION = "쉼표로 구분한 응답 컬럼 (예: req_date,req_quantity), req_seq는 항상 포함. 생략하면 전체 컬럼"
+
+
+# ============================================
+# 결재 상태 (req_state)
+# ============================================
+# pending ──팀장 결재──▶ manager_approved ──이사 결재──▶ director_approved
+#    └──────────┴──반려──▶ rejected
+REQUEST_STATES = ('pending', 'manager_approved', 'director_approved', 'rejected')
+
+# 결재 동작 → (허용되는 현재 상태, 다음 상태, 결재 일시 컬럼)
+REQUEST_TRANSITIONS = {
+    'approve_manager': (('pending',), 'manager_approved', 'req_manappdate'),
+    'approve_director': (('manager_approved',), 'director_approved', 'req_dirappdate'),
+    'reject': (('pending', 'manager_approved'), 'rejected', None),
+}
+
+
+def state_from_dates(req_manappdate, req_dirappdate) -> str:
+    """결재 일시를 직접 넣는 추가/수정 API용: 일시로부터 상태 결정"""
+    if req_dirappdate is not None:
+        return 'director_approved'
+    if req_manappdate is not None:
+        return 'manager_approved'
+    return 'pending'
+
+
+def apply_transition(conn, request_seq: int, action: str, now: datetime):
+    """
+    현재 상태가 허용 상태일 때만 다음 상태로 변경 (조건부 UPDATE 1번, commit은 호출한 쪽에서)
+
+    Returns:
+        tuple: (성공 여부, 다음 상태 또는 현재 상태(None이면 발주 없음))
+    """
+    allowed, next_state, date_column = REQUEST_TRANSITIONS[action]
+    assignments = "req_state = %s" + (f", {date_column} = %s" if date_column else "")
+    params = [next_state] + ([now] if date_column else []) + [request_seq] + list(allowed)
+    curs = conn.cursor()
+    curs.execute(f"""
+        UPDATE request SET {assignments}
+        WHERE req_seq = %s AND req_state IN ({', '.join(['%s'] * len(allowed))})
+    """, params)
+    if curs.rowcount == 1:
+        return True, next_state
+    curs.execute("SELECT req_state FROM request WHERE req_seq = %s", (request_seq,))
+    row = curs.fetchone()
+    return False, row[0] if row else None
+
+
+def apply_transition_many(conn, request_seqs: list, action: str, now: datetime) -> tuple:
+    """
+    여러 발주를 한 트랜잭션에서 상태 변경 (commit은 호출한 쪽에서)
+    1) SELECT ... FOR UPDATE 로 현재 상태 확인 + 행 잠금
+    2) 허용 상태인 발주만 UPDATE ... WHERE req_seq IN (...) AND req_state IN (...) 1번
+
+    Returns:
+        tuple: (변경된 req_seq 목록, {req_seq: 현재 상태} (없는 발주는 포함하지 않음))
+    """
+    allowed, next_state, date_column = REQUEST_TRANSITIONS[action]
+    curs = conn.cursor()
+    curs.execute(f"""
+        SELECT req_seq, req_state FROM request
+        WHERE req_seq IN ({', '.join(['%s'] * len(request_seqs))})
+        FOR UPDATE
+    """, request_seqs)
+    current = {row[0]: row[1] for row in curs.fetchall()}
+    eligible = [seq for seq in request_seqs if current.get(seq) in allowed]
+    if eligible:
+        assignments = "req_state = %s" + (f", {date_column} = %s" if date_column else "")
+        curs.execute(f"""
+            UPDATE request SET {assignments}
+            WHERE req_seq IN ({', '.join(['%s'] * len(eligible))})
+              AND req_state IN ({', '.join(['%s'] * len(allowed))})
+        """, [next_state] + ([now] if date_column else []) + eligible + list(allowed))
+    return eligible, current
+
+
+async def transition_request(request_seq: int, action: str):
+    """결재 엔드포인트 공통 처리"""
+    try:
+        conn = connect_db()
+        try:
+            ok, state = apply_transition(conn, request_seq, action, datetime.now())
+            if not ok:
+                conn.rollback()
+                if state is None:
+                    return {"result": "Error", "message": "Request not found"}
+                return {"result": "Error", "errorMsg": f"현재 상태({state})에서는 {action} 처리를 할 수 없습니다"}
+            conn.commit()
+        finally:
+            conn.close()
+        invalidate_detail('request', request_seq)
+        return {"result": "OK", "req_state": state}
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+
+
 # ============================================
 # 전체 발주 내역 조회
 # ============================================
 @router.get("")
-async def select_requests():
+async def select_requests(
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    try:
+        projection = REQUEST_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT req_seq, req_date, req_content, req_quantity, req_manappdate, req_dirappdate, 
-               s_seq, p_seq, m_seq, s_superseq 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM request 
         ORDER BY req_date DESC, req_seq
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'req_seq': row[0],
-        'req_date': row[1].isoformat() if row[1] else None,
-        'req_content': row[2],
-        'req_quantity': row[3],
-        'req_manappdate': row[4].isoformat() if row[4] else None,
-        'req_dirappdate': row[5].isoformat() if row[5] else None,
-        's_seq': row[6],
-        'p_seq': row[7],
-        'm_seq': row[8],
-        's_superseq': row[9]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(projection.codec.dumps_results(rows))
 
 
 # ============================================
 # ID로 발주 내역 조회
 # ============================================
 @router.get("/{request_seq}")
-async def select_request(request_seq: int):
+async def select_request(
+    request_seq: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    try:
+        projection = REQUEST_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT req_seq, req_date, req_content, req_quantity, req_manappdate, req_dirappdate, 
-               s_seq, p_seq, m_seq, s_superseq 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM request 
         WHERE req_seq = %s
     """, (request_seq,))
@@ -75,19 +186,7 @@ async def select_request(request_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "Request not found"}
-    result = {
-        'req_seq': row[0],
-        'req_date': row[1].isoformat() if row[1] else None,
-        'req_content': row[2],
-        'req_quantity': row[3],
-        'req_manappdate': row[4].isoformat() if row[4] else None,
-        'req_dirappdate': row[5].isoformat() if row[5] else None,
-        's_seq': row[6],
-        'p_seq': row[7],
-        'm_seq': row[8],
-        's_superseq': row[9]
-    }
-    return {"result": result}
+    return RawJSONResponse(projection.codec.dumps_result(row))
 
 
 # ============================================
@@ -120,13 +219,14 @@ async def insert_request(
         
         conn = connect_db()
         curs = conn.cursor()
+        # req_date 생략 시 현재 시각 (결재함 keyset 정렬 기준이라 NOT NULL)
         sql = """
-            INSERT INTO request (req_date, req_content, req_quantity, req_manappdate, req_dirappdate, 
+            INSERT INTO request (req_date, req_content, req_quantity, req_manappdate, req_dirappdate, req_state, 
                                s_seq, p_seq, m_seq, s_superseq) 
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES (COALESCE(%s, NOW()), %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         curs.execute(sql, (req_date_dt, req_content, req_quantity, req_manappdate_dt, req_dirappdate_dt, 
-                          s_seq, p_seq, m_seq, s_superseq))
+                          state_from_dates(req_manappdate_dt, req_dirappdate_dt), s_seq, p_seq, m_seq, s_superseq))
         conn.commit()
         inserted_id = curs.lastrowid
         conn.close()
@@ -166,15 +266,19 @@ async def update_request(
         
         conn = connect_db()
         curs = conn.cursor()
+        # 반려된 발주는 수정으로 상태가 바뀌지 않음
         sql = """
             UPDATE request 
-            SET req_date=%s, req_content=%s, req_quantity=%s, req_manappdate=%s, req_dirappdate=%s, 
+            SET req_date=COALESCE(%s, req_date), req_content=%s, req_quantity=%s, req_manappdate=%s, req_dirappdate=%s, 
+                req_state=IF(req_state = 'rejected', 'rejected', %s), 
                 s_seq=%s, p_seq=%s, m_seq=%s, s_superseq=%s 
             WHERE req_seq=%s
         """
         curs.execute(sql, (req_date_dt, req_content, req_quantity, req_manappdate_dt, req_dirappdate_dt, 
+                          state_from_dates(req_manappdate_dt, req_dirappdate_dt),
                           s_seq, p_seq, m_seq, s_superseq, req_seq))
         conn.commit()
+        invalidate_detail('request', req_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -182,42 +286,81 @@ async def update_request(
 
 
 # ============================================
-# 팀장 결재 처리
+# 팀장 결재 처리 (pending → manager_approved)
 # ============================================
 @router.post("/request_seq/approve_manager")
 async def approve_request_manager(request_seq: int):
-    try:
-        req_manappdate_dt = datetime.now()
-        
-        conn = connect_db()
-        curs = conn.cursor()
-        sql = "UPDATE request SET req_manappdate=%s WHERE req_seq=%s"
-        curs.execute(sql, (req_manappdate_dt, request_seq))
-        conn.commit()
-        conn.close()
-        return {"result": "OK"}
-    except Exception as e:
-        return {"result": "Error", "errorMsg": str(e)}
+    return await transition_request(request_seq, 'approve_manager')
 
 
 # ============================================
-# 이사 결재 처리
+# 이사 결재 처리 (manager_approved → director_approved)
 # ============================================
 @router.post("/request_seq/approve_director")
 async def approve_request_director(request_seq: int):
+    return await transition_request(request_seq, 'approve_director')
+
+
+# ============================================
+# 반려 처리 (pending / manager_approved → rejected)
+# ============================================
+@router.post("/request_seq/reject")
+async def reject_request(request_seq: int):
+    return await transition_request(request_seq, 'reject')
+
+
+# ============================================
+# 일괄 결재/반려 (결재함 전체 처리)
+# ============================================
+MAX_BULK_REQUESTS = 1000
+
+
+@router.post("/bulk/{action}")
+async def bulk_transition_requests(action: str, body: BulkTransition):
+    """
+    action: approve_manager / approve_director / reject
+    요청: {"req_seqs": [101, 102, ...]} (최대 MAX_BULK_REQUESTS 건)
+
+    한 트랜잭션에서 현재 상태가 맞는 발주만 변경하고, 발주마다 결과를 돌려준다.
+        updated       : 변경됨
+        invalid_state : 현재 상태에서 처리 불가 (req_state에 현재 상태)
+        not_found     : 없는 발주
+    """
+    if action not in REQUEST_TRANSITIONS:
+        return {"result": "Error", "errorMsg": f"알 수 없는 처리: {action} (사용 가능: {', '.join(REQUEST_TRANSITIONS)})"}
+    request_seqs = list(dict.fromkeys(body.req_seqs))  # 중복 제거, 순서 유지
+    if not request_seqs:
+        return {"result": "Error", "errorMsg": "req_seqs가 비어 있습니다"}
+    if len(request_seqs) > MAX_BULK_REQUESTS:
+        return {"result": "Error", "errorMsg": f"한 번에 최대 {MAX_BULK_REQUESTS}건까지 처리할 수 있습니다 (요청 {len(request_seqs)}건)"}
+
+    next_state = REQUEST_TRANSITIONS[action][1]
     try:
-        req_dirappdate_dt = datetime.now()
-        
         conn = connect_db()
-        curs = conn.cursor()
-        sql = "UPDATE request SET req_dirappdate=%s WHERE req_seq=%s"
-        curs.execute(sql, (req_dirappdate_dt, request_seq))
-        conn.commit()
-        conn.close()
-        return {"result": "OK"}
+        try:
+            updated, current = apply_transition_many(conn, request_seqs, action, datetime.now())
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
 
+    for request_seq in updated:
+        invalidate_detail('request', request_seq)
+    updated = set(updated)
+    results = []
+    for request_seq in request_seqs:
+        if request_seq in updated:
+            results.append({"req_seq": request_seq, "outcome": "updated", "req_state": next_state})
+        elif request_seq in current:
+            results.append({"req_seq": request_seq, "outcome": "invalid_state", "req_state": current[request_seq]})
+        else:
+            results.append({"req_seq": request_seq, "outcome": "not_found"})
+    return RawJSONResponse(dumps({"result": "OK", "updated": len(updated), "results": results}))
+
 
 # ============================================
 # 발주 내역 삭제
@@ -230,6 +373,7 @@ async def delete_request(request_seq: int):
         sql = "DELETE FROM request WHERE req_seq=%s"
         curs.execute(sql, (request_seq,))
         conn.commit()
+        invalidate_detail('request', request_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -8,11 +8,68 @@ Request 복합 쿼리 API
 
 from fastapi import APIRouter, Query
 from typing import Optional
+from datetime import datetime
+from app_new_form.api.request import REQUEST_STATES
 from app_new_form.database.connection import connect_db
+from app_new_form.database.replicas import connect_read_db
+from app_new_form.database.detail_cache import detail_cache, CATALOG_NAME_TAGS
+from common.serialization import RowCodec, RawJSONResponse, dumps
 
 router = APIRouter()
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+REQUEST_WITH_DETAILS_CODEC = RowCodec([
+    'req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate',
+    'req_dirappdate', 's_superseq',
+    ('staff', ['s_seq', 's_rank', 's_phone']),
+    ('product', ['p_seq', 'p_name', 'p_price', 'p_stock', 'p_image']),
+    ('maker', ['m_seq', 'm_name', 'm_phone', 'm_address']),
+])
+
+REQUEST_FULL_DETAIL_CODEC = RowCodec([
+    'req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate',
+    'req_dirappdate', 's_superseq',
+    ('staff', ['s_seq', 's_rank', 's_phone']),
+    ('product', [
+        'p_seq', 'p_name', 'p_price', 'p_stock', 'p_image', 'kind_name',
+        'color_name', 'size_name', 'gender_name',
+    ]),
+    ('maker', ['m_seq', 'm_name', 'm_phone', 'm_address']),
+])
+
+REQUESTS_BY_STAFF_WITH_DETAILS_CODEC = RowCodec([
+    'req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate',
+    'req_dirappdate',
+    ('product', ['p_name', 'p_price', 'p_image']),
+    'maker_name',
+])
+
+REQUESTS_BY_STATUS_CODEC = RowCodec([
+    'req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate',
+    'req_dirappdate', 'req_state',
+    ('staff', ['s_rank', 's_phone']),
+    ('product', ['p_name', 'p_price']),
+    'maker_name',
+])
+
+REQUESTS_BY_PRODUCT_WITH_DETAILS_CODEC = RowCodec([
+    'req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate',
+    'req_dirappdate',
+    ('staff', ['s_rank', 's_phone']),
+    ('maker', ['m_name', 'm_phone']),
+])
+
+REQUESTS_BY_MAKER_WITH_DETAILS_CODEC = RowCodec([
+    'req_seq', 'req_date', 'req_content', 'req_quantity', 'req_manappdate',
+    'req_dirappdate',
+    ('staff', ['s_rank', 's_phone']),
+    ('product', ['p_name', 'p_price', 'p_image']),
+])
+
+
 # ============================================
 # Request + Staff + Product + Maker
 # ============================================
@@ -22,7 +79,7 @@ async def get_request_with_details(request_seq: int):
     특정 Request + Staff + Product + Maker 정보
     JOIN: Request + Staff + Product + Maker (4테이블)
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -59,35 +116,7 @@ async def get_request_with_details(request_seq: int):
         if row is None:
             return {"result": "Error", "message": "Request not found"}
         
-        result = {
-            'req_seq': row[0],
-            'req_date': row[1].isoformat() if row[1] else None,
-            'req_content': row[2],
-            'req_quantity': row[3],
-            'req_manappdate': row[4].isoformat() if row[4] else None,
-            'req_dirappdate': row[5].isoformat() if row[5] else None,
-            's_superseq': row[6],
-            'staff': {
-                's_seq': row[7],
-                's_rank': row[8],
-                's_phone': row[9]
-            },
-            'product': {
-                'p_seq': row[10],
-                'p_name': row[11],
-                'p_price': row[12],
-                'p_stock': row[13],
-                'p_image': row[14]
-            },
-            'maker': {
-                'm_seq': row[15],
-                'm_name': row[16],
-                'm_phone': row[17],
-                'm_address': row[18]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(REQUEST_WITH_DETAILS_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -97,6 +126,60 @@ async def get_request_with_details(request_seq: int):
 # ============================================
 # Request 전체 상세 (Product의 모든 카테고리 포함)
 # ============================================
+REQUEST_FULL_DETAIL_SQL = """
+    SELECT 
+        req.req_seq,
+        req.req_date,
+        req.req_content,
+        req.req_quantity,
+        req.req_manappdate,
+        req.req_dirappdate,
+        req.s_superseq,
+        s.s_seq,
+        s.s_rank,
+        s.s_phone,
+        p.p_seq,
+        p.p_name,
+        p.p_price,
+        p.p_stock,
+        p.p_image,
+        kc.kc_name,
+        cc.cc_name,
+        sc.sc_name,
+        gc.gc_name,
+        m.m_seq,
+        m.m_name,
+        m.m_phone,
+        m.m_address
+    FROM request req
+    JOIN staff s ON req.s_seq = s.s_seq
+    JOIN product p ON req.p_seq = p.p_seq
+    JOIN kind_category kc ON p.kc_seq = kc.kc_seq
+    JOIN color_category cc ON p.cc_seq = cc.cc_seq
+    JOIN size_category sc ON p.sc_seq = sc.sc_seq
+    JOIN gender_category gc ON p.gc_seq = gc.gc_seq
+    JOIN maker m ON req.m_seq = m.m_seq
+    WHERE req.req_seq = %s
+"""
+
+
+def fetch_request_full_detail(request_seq: int):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute(REQUEST_FULL_DETAIL_SQL, (request_seq,))
+        return curs.fetchone()
+    finally:
+        conn.close()
+
+
+def request_detail_tags(row):
+    """상세 결과가 참조하는 행 (쓰기 라우터의 invalidate_detail 대상)"""
+    return [
+        ('request', row[0]), ('staff', row[7]), ('product', row[10]), ('maker', row[19]),
+    ] + list(CATALOG_NAME_TAGS)
+
+
 @router.get("/requests/{request_seq}/full_detail")
 async def get_request_full_detail(request_seq: int):
     """
@@ -104,88 +187,17 @@ async def get_request_full_detail(request_seq: int):
     JOIN: Request + Staff + Product + Maker + 모든 카테고리 (9테이블)
     용도: 발주 상세 화면
     """
-    conn = connect_db()
-    curs = conn.cursor()
-    
     try:
-        sql = """
-        SELECT 
-            req.req_seq,
-            req.req_date,
-            req.req_content,
-            req.req_quantity,
-            req.req_manappdate,
-            req.req_dirappdate,
-            req.s_superseq,
-            s.s_seq,
-            s.s_rank,
-            s.s_phone,
-            p.p_seq,
-            p.p_name,
-            p.p_price,
-            p.p_stock,
-            p.p_image,
-            kc.kc_name,
-            cc.cc_name,
-            sc.sc_name,
-            gc.gc_name,
-            m.m_seq,
-            m.m_name,
-            m.m_phone,
-            m.m_address
-        FROM request req
-        JOIN staff s ON req.s_seq = s.s_seq
-        JOIN product p ON req.p_seq = p.p_seq
-        JOIN kind_category kc ON p.kc_seq = kc.kc_seq
-        JOIN color_category cc ON p.cc_seq = cc.cc_seq
-        JOIN size_category sc ON p.sc_seq = sc.sc_seq
-        JOIN gender_category gc ON p.gc_seq = gc.gc_seq
-        JOIN maker m ON req.m_seq = m.m_seq
-        WHERE req.req_seq = %s
-        """
-        curs.execute(sql, (request_seq,))
-        row = curs.fetchone()
+        row = await detail_cache.get_or_load(
+            ('request', request_seq), fetch_request_full_detail, request_seq, tags=request_detail_tags
+        )
         
         if row is None:
             return {"result": "Error", "message": "Request not found"}
         
-        result = {
-            'req_seq': row[0],
-            'req_date': row[1].isoformat() if row[1] else None,
-            'req_content': row[2],
-            'req_quantity': row[3],
-            'req_manappdate': row[4].isoformat() if row[4] else None,
-            'req_dirappdate': row[5].isoformat() if row[5] else None,
-            's_superseq': row[6],
-            'staff': {
-                's_seq': row[7],
-                's_rank': row[8],
-                's_phone': row[9]
-            },
-            'product': {
-                'p_seq': row[10],
-                'p_name': row[11],
-                'p_price': row[12],
-                'p_stock': row[13],
-                'p_image': row[14],
-                'kind_name': row[15],
-                'color_name': row[16],
-                'size_name': row[17],
-                'gender_name': row[18]
-            },
-            'maker': {
-                'm_seq': row[19],
-                'm_name': row[20],
-                'm_phone': row[21],
-                'm_address': row[22]
-            }
-        }
-        
-        return {"result": result}
+        return RawJSONResponse(REQUEST_FULL_DETAIL_CODEC.dumps_result(row))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
-    finally:
-        conn.close()
 
 
 # ============================================
@@ -198,7 +210,7 @@ async def get_requests_by_staff_with_details(staff_seq: int):
     JOIN: Request + Staff + Product + Maker
     용도: 직원별 발주 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -223,22 +235,7 @@ async def get_requests_by_staff_with_details(staff_seq: int):
         curs.execute(sql, (staff_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'req_seq': row[0],
-            'req_date': row[1].isoformat() if row[1] else None,
-            'req_content': row[2],
-            'req_quantity': row[3],
-            'req_manappdate': row[4].isoformat() if row[4] else None,
-            'req_dirappdate': row[5].isoformat() if row[5] else None,
-            'product': {
-                'p_name': row[6],
-                'p_price': row[7],
-                'p_image': row[8]
-            },
-            'maker_name': row[9]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(REQUESTS_BY_STAFF_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -246,30 +243,65 @@ async def get_requests_by_staff_with_details(staff_seq: int):
 
 
 # ============================================
-# 결재 상태별 Request 목록
+# 결재 상태별 Request 목록 (결재함, keyset 페이지)
 # ============================================
+BY_STATUS_LIMIT = 50
+BY_STATUS_MAX_LIMIT = 200
+
+
+def parse_cursor(cursor: str) -> tuple:
+    """next_cursor "2025-01-15T10:30:00,123" → (req_date, req_seq)"""
+    try:
+        req_date, req_seq = cursor.rsplit(',', 1)
+        return datetime.fromisoformat(req_date), int(req_seq)
+    except ValueError:
+        raise ValueError(f"cursor 형식이 올바르지 않습니다: {cursor}")
+
+
+def encode_cursor(req_date, req_seq) -> str:
+    return f"{req_date.isoformat()},{req_seq}"
+
+
 @router.get("/requests/by_status")
 async def get_requests_by_status(
-    status: str = Query(..., description="결재 상태: pending(대기), manager_approved(팀장승인), director_approved(이사승인), all(전체)")
+    status: str = Query(..., description="결재 상태: pending(대기), manager_approved(팀장승인), director_approved(이사승인), rejected(반려), all(전체)"),
+    limit: Optional[int] = Query(None, ge=1, le=BY_STATUS_MAX_LIMIT,
+                                 description=f"한 페이지 건수 (limit/cursor 생략 시 전체, cursor만 있으면 {BY_STATUS_LIMIT})"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (다음 페이지)"),
 ):
     """
     결재 상태별 Request 목록
     JOIN: Request + Staff + Product + Maker
     용도: 결재 화면
+
+    - req_state = ? 조건 + (req_date, req_seq) 역순 → idx_request_state_date 범위 스캔
+    - limit/cursor 를 모두 생략하면 기존처럼 전체 목록 ({"results": [...]}, 기존 클라이언트 호환)
+    - limit 또는 cursor 가 있으면 페이지 조회: 다음 페이지는 OFFSET 대신
+      마지막 행의 (req_date, req_seq) 이후부터 조회 (next_cursor)
     """
-    conn = connect_db()
+    if status != "all" and status not in REQUEST_STATES:
+        return {"result": "Error", "errorMsg": f"알 수 없는 상태: {status} (사용 가능: {', '.join(REQUEST_STATES)}, all)"}
+    conditions = []
+    params = []
+    if status != "all":
+        conditions.append("req.req_state = %s")
+        params.append(status)
+    if cursor:
+        try:
+            after_date, after_seq = parse_cursor(cursor)
+        except ValueError as e:
+            return {"result": "Error", "errorMsg": str(e)}
+        conditions.append("(req.req_date < %s OR (req.req_date = %s AND req.req_seq < %s))")
+        params.extend([after_date, after_date, after_seq])
+    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    paged = limit is not None or cursor is not None
+    if paged and limit is None:
+        limit = BY_STATUS_LIMIT
+
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
-        if status == "pending":
-            where_clause = "WHERE req.req_manappdate IS NULL AND req.req_dirappdate IS NULL"
-        elif status == "manager_approved":
-            where_clause = "WHERE req.req_manappdate IS NOT NULL AND req.req_dirappdate IS NULL"
-        elif status == "director_approved":
-            where_clause = "WHERE req.req_dirappdate IS NOT NULL"
-        else:  # all
-            where_clause = ""
-        
         sql = f"""
         SELECT 
             req.req_seq,
@@ -278,6 +310,7 @@ async def get_requests_by_status(
             req.req_quantity,
             req.req_manappdate,
             req.req_dirappdate,
+            req.req_state,
             s.s_rank,
             s.s_phone,
             p.p_name,
@@ -289,29 +322,24 @@ async def get_requests_by_status(
         JOIN maker m ON req.m_seq = m.m_seq
         {where_clause}
         ORDER BY req.req_date DESC, req.req_seq DESC
+        {"LIMIT %s" if paged else ""}
         """
-        curs.execute(sql)
+        if not paged:
+            curs.execute(sql, params)
+            return RawJSONResponse(dumps({"results": REQUESTS_BY_STATUS_CODEC.to_list(curs.fetchall())}))
+
+        # 다음 페이지 유무 확인용으로 1건 더 조회
+        curs.execute(sql, params + [limit + 1])
         rows = curs.fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][1], rows[-1][0])
         
-        result = [{
-            'req_seq': row[0],
-            'req_date': row[1].isoformat() if row[1] else None,
-            'req_content': row[2],
-            'req_quantity': row[3],
-            'req_manappdate': row[4].isoformat() if row[4] else None,
-            'req_dirappdate': row[5].isoformat() if row[5] else None,
-            'staff': {
-                's_rank': row[6],
-                's_phone': row[7]
-            },
-            'product': {
-                'p_name': row[8],
-                'p_price': row[9]
-            },
-            'maker_name': row[10]
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(dumps({
+            "results": REQUESTS_BY_STATUS_CODEC.to_list(rows),
+            "next_cursor": next_cursor,
+        }))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -328,7 +356,7 @@ async def get_requests_by_product_with_details(product_seq: int):
     JOIN: Request + Staff + Product + Maker
     용도: 제품별 발주 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -353,24 +381,7 @@ async def get_requests_by_product_with_details(product_seq: int):
         curs.execute(sql, (product_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'req_seq': row[0],
-            'req_date': row[1].isoformat() if row[1] else None,
-            'req_content': row[2],
-            'req_quantity': row[3],
-            'req_manappdate': row[4].isoformat() if row[4] else None,
-            'req_dirappdate': row[5].isoformat() if row[5] else None,
-            'staff': {
-                's_rank': row[6],
-                's_phone': row[7]
-            },
-            'maker': {
-                'm_name': row[8],
-                'm_phone': row[9]
-            }
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(REQUESTS_BY_PRODUCT_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
@@ -387,7 +398,7 @@ async def get_requests_by_maker_with_details(maker_seq: int):
     JOIN: Request + Staff + Product + Maker
     용도: 제조사별 발주 내역 화면
     """
-    conn = connect_db()
+    conn = connect_read_db()
     curs = conn.cursor()
     
     try:
@@ -413,25 +424,7 @@ async def get_requests_by_maker_with_details(maker_seq: int):
         curs.execute(sql, (maker_seq,))
         rows = curs.fetchall()
         
-        result = [{
-            'req_seq': row[0],
-            'req_date': row[1].isoformat() if row[1] else None,
-            'req_content': row[2],
-            'req_quantity': row[3],
-            'req_manappdate': row[4].isoformat() if row[4] else None,
-            'req_dirappdate': row[5].isoformat() if row[5] else None,
-            'staff': {
-                's_rank': row[6],
-                's_phone': row[7]
-            },
-            'product': {
-                'p_name': row[8],
-                'p_price': row[9],
-                'p_image': row[10]
-            }
-        } for row in rows]
-        
-        return {"results": result}
+        return RawJSONResponse(REQUESTS_BY_MAKER_WITH_DETAILS_CODEC.dumps_results(rows))
     except Exception as e:
         return {"result": "Error", "errorMsg": str(e)}
     finally:
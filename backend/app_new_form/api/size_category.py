@@ -7,6 +7,9 @@ from fastapi import APIRouter, Form
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from app_new_form.database.versions import table_versions
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -19,6 +22,14 @@ class SizeCategory(BaseModel):
     sc_name: str
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+SIZE_CATEGORY_CODEC = RowCodec([
+    'sc_seq', 'sc_name',
+])
+
+
 # ============================================
 # 전체 사이즈 카테고리 조회
 # ============================================
@@ -33,11 +44,7 @@ async def select_size_categories():
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'sc_seq': row[0],
-        'sc_name': row[1]
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(SIZE_CATEGORY_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -56,11 +63,7 @@ async def select_size_category(size_category_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "SizeCategory not found"}
-    result = {
-        'sc_seq': row[0],
-        'sc_name': row[1]
-    }
-    return {"result": result}
+    return RawJSONResponse(SIZE_CATEGORY_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -76,6 +79,7 @@ async def insert_size_category(
         sql = "INSERT INTO size_category (sc_name) VALUES (%s)"
         curs.execute(sql, (sc_name,))
         conn.commit()
+        table_versions.bump('size_category')
         inserted_id = curs.lastrowid
         conn.close()
         return {"result": "OK", "sc_seq": inserted_id}
@@ -97,6 +101,8 @@ async def update_size_category(
         sql = "UPDATE size_category SET sc_name=%s WHERE sc_seq=%s"
         curs.execute(sql, (sc_name, sc_seq))
         conn.commit()
+        table_versions.bump('size_category')
+        invalidate_detail('size_category', sc_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -114,6 +120,8 @@ async def delete_size_category(size_category_seq: int):
         sql = "DELETE FROM size_category WHERE sc_seq=%s"
         curs.execute(sql, (size_category_seq,))
         conn.commit()
+        table_versions.bump('size_category')
+        invalidate_detail('size_category', size_category_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -9,6 +9,9 @@ from fastapi import APIRouter, Form, UploadFile, File, Response
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import invalidate_detail
+from common.credentials import hash_if_plain_async, hash_password_async, needs_rehash, verify_password_async
+from common.serialization import RowCodec, RawJSONResponse
 
 router = APIRouter()
 
@@ -29,6 +32,16 @@ class Staff(BaseModel):
     s_quit_date: Optional[str] = None
 
 
+# ============================================
+# 응답 Codec (SELECT 컬럼 순서와 동일)
+# ============================================
+# 비밀번호 해시(s_password)는 조회 응답에 포함하지 않음
+STAFF_CODEC = RowCodec([
+    's_seq', 's_id', 'br_seq', 's_name', 's_rank', 's_phone',
+    's_superseq', 'created_at', 's_quit_date',
+])
+
+
 # ============================================
 # 전체 직원 조회 (이미지 제외)
 # ============================================
@@ -37,25 +50,13 @@ async def select_staffs():
     conn = connect_db()
     curs = conn.cursor()
     curs.execute("""
-        SELECT s_seq, s_id, br_seq, s_password, s_name, s_rank, s_phone, s_superseq, created_at, s_quit_date 
+        SELECT s_seq, s_id, br_seq, s_name, s_rank, s_phone, s_superseq, created_at, s_quit_date 
         FROM staff 
         ORDER BY s_seq
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        's_seq': row[0],
-        's_id': row[1],
-        'br_seq': row[2],
-        's_password': row[3],
-        's_name': row[4],
-        's_rank': row[5],
-        's_phone': row[6],
-        's_superseq': row[7],
-        'created_at': row[8].isoformat() if row[8] else None,
-        's_quit_date': row[9].isoformat() if row[9] else None
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(STAFF_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -66,7 +67,7 @@ async def select_staff(staff_seq: int):
     conn = connect_db()
     curs = conn.cursor()
     curs.execute("""
-        SELECT s_seq, s_id, br_seq, s_password, s_name, s_rank, s_phone, s_superseq, created_at, s_quit_date 
+        SELECT s_seq, s_id, br_seq, s_name, s_rank, s_phone, s_superseq, created_at, s_quit_date 
         FROM staff 
         WHERE s_seq = %s
     """, (staff_seq,))
@@ -74,19 +75,7 @@ async def select_staff(staff_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "Staff not found"}
-    result = {
-        's_seq': row[0],
-        's_id': row[1],
-        'br_seq': row[2],
-        's_password': row[3],
-        's_name': row[4],
-        's_rank': row[5],
-        's_phone': row[6],
-        's_superseq': row[7],
-        'created_at': row[8].isoformat() if row[8] else None,
-        's_quit_date': row[9].isoformat() if row[9] else None
-    }
-    return {"result": result}
+    return RawJSONResponse(STAFF_CODEC.dumps_result(row))
 
 
 # ============================================
@@ -97,26 +86,14 @@ async def select_staffs_by_branch(branch_seq: int):
     conn = connect_db()
     curs = conn.cursor()
     curs.execute("""
-        SELECT s_seq, s_id, br_seq, s_password, s_name, s_rank, s_phone, s_superseq, created_at, s_quit_date 
+        SELECT s_seq, s_id, br_seq, s_name, s_rank, s_phone, s_superseq, created_at, s_quit_date 
         FROM staff 
         WHERE br_seq = %s
         ORDER BY s_seq
     """, (branch_seq,))
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        's_seq': row[0],
-        's_id': row[1],
-        'br_seq': row[2],
-        's_password': row[3],
-        's_name': row[4],
-        's_rank': row[5],
-        's_phone': row[6],
-        's_superseq': row[7],
-        'created_at': row[8].isoformat() if row[8] else None,
-        's_quit_date': row[9].isoformat() if row[9] else None
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(STAFF_CODEC.dumps_results(rows))
 
 
 # ============================================
@@ -134,6 +111,7 @@ async def insert_staff(
     file: UploadFile = File(...)
 ):
     try:
+        s_password = await hash_if_plain_async(s_password)
         # 파일 읽기
         image_data = await file.read()
         
@@ -152,6 +130,53 @@ async def insert_staff(
         return {"result": "Error", "errorMsg": str(e)}
 
 
+# ============================================
+# 직원 로그인 (Form)
+# ============================================
+@router.post("/login")
+async def login_staff(
+    s_id: str = Form(...),
+    s_password: str = Form(...),
+):
+    """
+    직원 로그인 (비밀번호 검증은 KDF 전용 스레드풀에서 실행)
+    - 평문/이전 파라미터로 저장된 비밀번호는 로그인 성공 시 새 해시로 교체
+    """
+    try:
+        conn = connect_db()
+        curs = conn.cursor()
+        curs.execute("""
+            SELECT s_seq, s_password, s_name, s_rank, br_seq, s_quit_date
+            FROM staff 
+            WHERE s_id = %s
+        """, (s_id,))
+        row = curs.fetchone()
+        conn.close()
+        
+        # 아이디가 없어도 검증 시간을 동일하게 (verify_password_async(…, None) → False)
+        stored = row[1] if row else None
+        if not await verify_password_async(s_password, stored):
+            return {"result": "Error", "message": "아이디 또는 비밀번호가 올바르지 않습니다"}
+        if row[5] is not None:
+            return {"result": "Error", "message": "탈퇴한 계정입니다"}
+        
+        if needs_rehash(stored):
+            new_hash = await hash_password_async(s_password)
+            conn = connect_db()
+            curs = conn.cursor()
+            # 그 사이 비밀번호가 바뀌었으면 덮어쓰지 않음
+            curs.execute(
+                "UPDATE staff SET s_password=%s WHERE s_seq=%s AND s_password=%s",
+                (new_hash, row[0], stored)
+            )
+            conn.commit()
+            conn.close()
+        
+        return {"result": "OK", "s_seq": row[0], "s_name": row[2], "s_rank": row[3], "br_seq": row[4]}
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+
+
 # ============================================
 # 직원 수정 (이미지 제외 - Form)
 # ============================================
@@ -168,6 +193,7 @@ async def update_staff(
     s_quit_date: Optional[str] = Form(None),
 ):
     try:
+        s_password = await hash_if_plain_async(s_password)
         from datetime import datetime
         s_quit_date_dt = None
         if s_quit_date:
@@ -182,6 +208,7 @@ async def update_staff(
         """
         curs.execute(sql, (s_id, br_seq, s_password, s_name, s_phone, s_rank, s_superseq, s_quit_date_dt, s_seq))
         conn.commit()
+        invalidate_detail('staff', s_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -205,6 +232,7 @@ async def update_staff_with_image(
     file: UploadFile = File(...)
 ):
     try:
+        s_password = await hash_if_plain_async(s_password)
         from datetime import datetime
         s_quit_date_dt = None
         if s_quit_date:
@@ -222,6 +250,7 @@ async def update_staff_with_image(
         """
         curs.execute(sql, (s_id, br_seq, s_password, s_name, s_phone, s_rank, s_superseq, s_quit_date_dt, image_data, s_seq))
         conn.commit()
+        invalidate_detail('staff', s_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -284,6 +313,7 @@ async def delete_staff(staff_seq: int):
         sql = "DELETE FROM staff WHERE s_seq=%s"
         curs.execute(sql, (staff_seq,))
         conn.commit()
+        invalidate_detail('staff', staff_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -5,10 +5,16 @@ User API - 고객 계정 CRUD (Form 방식)
 Note: INSERT는 이미지 포함 필수, UPDATE는 이미지 제외/포함 두 가지 방식 제공
 """
 
-from fastapi import APIRouter, Form, UploadFile, File, Response
+from fastapi import APIRouter, Form, UploadFile, File, Response, Query
 from pydantic import BaseModel
 from typing import Optional
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import dimension_cache, invalidate_detail
+from app_new_form.database.identity_cache import invalidate_identity
+from common.credentials import hash_if_plain_async, hash_password_async, needs_rehash, verify_password_async
+from common.multiget import MAX_IDS, dumps_keyed, load_rows, parse_ids
+from common.fieldsets import FieldSet
+from common.serialization import RawJSONResponse
 
 router = APIRouter()
 
@@ -27,42 +33,80 @@ class User(BaseModel):
     u_quit_date: Optional[str] = None
 
 
+# ============================================
+# 조회 가능 컬럼 (fields= 화이트리스트, 기본 SELECT 순서와 동일)
+# ============================================
+# 비밀번호 해시(u_password)는 조회 응답/캐시에 포함하지 않음
+USER_FIELDS = FieldSet([
+    'u_seq', 'u_id', 'u_name', 'u_phone', 'u_address',
+    'created_at', 'u_quit_date',
+])
+FIELDS_DESCRIPTION = "쉼표로 구분한 응답 컬럼 (예: u_name,u_phone), u_seq는 항상 포함. 생략하면 전체 컬럼"
+
+
 # ============================================
 # 전체 고객 조회 (이미지 제외)
 # ============================================
 @router.get("")
-async def select_users():
+async def select_users(
+    ids: Optional[str] = Query(None, description=f"쉼표로 구분한 u_seq 목록 (최대 {MAX_IDS}개), 지정하면 u_seq별 결과 반환"),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    if ids is not None:
+        return await select_users_by_ids(ids, fields)
+    try:
+        projection = USER_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT u_seq, u_id, u_password, u_name, u_phone, u_address, created_at, u_quit_date 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM user 
         ORDER BY u_seq
     """)
     rows = curs.fetchall()
     conn.close()
-    result = [{
-        'u_seq': row[0],
-        'u_id': row[1],
-        'u_password': row[2],
-        'u_name': row[3],
-        'u_phone': row[4],
-        'u_address': row[5],
-        'created_at': row[6].isoformat() if row[6] else None,
-        'u_quit_date': row[7].isoformat() if row[7] else None
-    } for row in rows]
-    return {"results": result}
+    return RawJSONResponse(projection.codec.dumps_results(rows))
+
+
+# ============================================
+# 여러 ID로 고객 조회 (?ids=1,2,3)
+# ============================================
+USER_BY_IDS_SQL = """
+    SELECT u_seq, u_id, u_name, u_phone, u_address, created_at, u_quit_date
+    FROM user
+    WHERE u_seq IN ({ids})
+"""
+
+
+async def select_users_by_ids(ids: str, fields: Optional[str] = None):
+    """캐시(dimension_cache)에 없는 id만 IN (...) 1번으로 조회, 결과는 u_seq를 key로 반환"""
+    try:
+        projection = USER_FIELDS.resolve(fields)
+        seqs = parse_ids(ids)
+        rows = await load_rows(dimension_cache, 'user', seqs, connect_db, USER_BY_IDS_SQL)
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+    return RawJSONResponse(dumps_keyed(projection.codec, seqs, rows, pick=projection.pick))
 
 
 # ============================================
 # ID로 고객 조회 (이미지 제외)
 # ============================================
 @router.get("/{user_seq}")
-async def select_user(user_seq: int):
+async def select_user(
+    user_seq: int,
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+):
+    try:
+        projection = USER_FIELDS.resolve(fields)
+    except ValueError as e:
+        return {"result": "Error", "errorMsg": str(e)}
     conn = connect_db()
     curs = conn.cursor()
-    curs.execute("""
-        SELECT u_seq, u_id, u_password, u_name, u_phone, u_address, created_at, u_quit_date 
+    curs.execute(f"""
+        SELECT {projection.columns} 
         FROM user 
         WHERE u_seq = %s
     """, (user_seq,))
@@ -70,17 +114,7 @@ async def select_user(user_seq: int):
     conn.close()
     if row is None:
         return {"result": "Error", "message": "User not found"}
-    result = {
-        'u_seq': row[0],
-        'u_id': row[1],
-        'u_password': row[2],
-        'u_name': row[3],
-        'u_phone': row[4],
-        'u_address': row[5],
-        'created_at': row[6].isoformat() if row[6] else None,
-        'u_quit_date': row[7].isoformat() if row[7] else None
-    }
-    return {"result": result}
+    return RawJSONResponse(projection.codec.dumps_result(row))
 
 
 # ============================================
@@ -96,6 +130,7 @@ async def insert_user(
     file: UploadFile = File(...)
 ):
     try:
+        u_password = await hash_if_plain_async(u_password)
         # 파일 읽기
         image_data = await file.read()
         
@@ -114,6 +149,53 @@ async def insert_user(
         return {"result": "Error", "errorMsg": str(e)}
 
 
+# ============================================
+# 고객 로그인 (Form)
+# ============================================
+@router.post("/login")
+async def login_user(
+    u_id: str = Form(...),
+    u_password: str = Form(...),
+):
+    """
+    고객 로그인 (비밀번호 검증은 KDF 전용 스레드풀에서 실행)
+    - 평문/이전 파라미터로 저장된 비밀번호는 로그인 성공 시 새 해시로 교체
+    """
+    try:
+        conn = connect_db()
+        curs = conn.cursor()
+        curs.execute("""
+            SELECT u_seq, u_password, u_name, u_quit_date
+            FROM user 
+            WHERE u_id = %s
+        """, (u_id,))
+        row = curs.fetchone()
+        conn.close()
+        
+        # 아이디가 없어도 검증 시간을 동일하게 (verify_password_async(…, None) → False)
+        stored = row[1] if row else None
+        if not await verify_password_async(u_password, stored):
+            return {"result": "Error", "message": "아이디 또는 비밀번호가 올바르지 않습니다"}
+        if row[3] is not None:
+            return {"result": "Error", "message": "탈퇴한 계정입니다"}
+        
+        if needs_rehash(stored):
+            new_hash = await hash_password_async(u_password)
+            conn = connect_db()
+            curs = conn.cursor()
+            # 그 사이 비밀번호가 바뀌었으면 덮어쓰지 않음
+            curs.execute(
+                "UPDATE user SET u_password=%s WHERE u_seq=%s AND u_password=%s",
+                (new_hash, row[0], stored)
+            )
+            conn.commit()
+            conn.close()
+        
+        return {"result": "OK", "u_seq": row[0], "u_name": row[2]}
+    except Exception as e:
+        return {"result": "Error", "errorMsg": str(e)}
+
+
 # ============================================
 # 고객 수정 (이미지 제외 - Form)
 # ============================================
@@ -127,6 +209,7 @@ async def update_user(
     u_address: Optional[str] = Form(None),
 ):
     try:
+        u_password = await hash_if_plain_async(u_password)
         conn = connect_db()
         curs = conn.cursor()
         sql = """
@@ -136,6 +219,8 @@ async def update_user(
         """
         curs.execute(sql, (u_id, u_password, u_name, u_phone, u_address, user_seq))
         conn.commit()
+        invalidate_detail('user', user_seq)
+        invalidate_identity(user_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -156,6 +241,7 @@ async def update_user_with_image(
     file: UploadFile = File(...)
 ):
     try:
+        u_password = await hash_if_plain_async(u_password)
         # 파일 읽기
         image_data = await file.read()
         
@@ -168,6 +254,8 @@ async def update_user_with_image(
         """
         curs.execute(sql, (u_id, u_password, u_name, u_phone, u_address, image_data, user_seq))
         conn.commit()
+        invalidate_detail('user', user_seq)
+        invalidate_identity(user_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -230,6 +318,8 @@ async def delete_user(user_seq: int):
         sql = "DELETE FROM user WHERE u_seq=%s"
         curs.execute(sql, (user_seq,))
         conn.commit()
+        invalidate_detail('user', user_seq)
+        invalidate_identity(user_seq)
         conn.close()
         return {"result": "OK"}
     except Exception as e:
@@ -3,26 +3,40 @@
 새로운 ERD 구조용 (shoes_shop_db)
 """
 
-import pymysql
+import os
+import sys
 
+# 단독 실행 파일(app_new_form 폴더에서 python <파일>.py)에서도 common 패키지를 찾도록 backend 폴더 추가
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if BACKEND_DIR not in sys.path:
+    sys.path.append(BACKEND_DIR)
 
-DB_CONFIG = {
-    'host': 'cheng80.myqnapcloud.com',
-    'user': 'team0101',
-    'password': 'qwer1234',
-    'database': 'shoes_shop_db',  # 새로운 데이터베이스 이름
-    'charset': 'utf8mb4',
-    'port': 13306
-}
+from common.db_config import make_pool
+
+
+# 접속 정보/풀 크기/타임아웃은 환경변수 또는 backend/config/db.<DB_PROFILE>.env 에서 읽음 (common/db_config.py 참고)
+primary_pool = make_pool('primary', default_database='shoes_shop_db')
+analytics_pool = make_pool('analytics', default_database='shoes_shop_db')
+
+# pymysql.connect 인자 (직접 연결하는 스크립트용)
+DB_CONFIG = primary_pool.config
 
 
 def connect_db():
     """
-    데이터베이스 연결
+    데이터베이스 연결 (primary 풀, conn.close() 하면 풀로 반납)
     
     Returns:
         pymysql.Connection: 데이터베이스 연결 객체
     """
-    conn = pymysql.connect(**DB_CONFIG)
-    return conn
+    return primary_pool.connect()
 
+
+def connect_analytics_db():
+    """
+    집계/리포트용 데이터베이스 연결 (analytics 풀: 긴 타임아웃, 별도 세션 변수)
+    
+    Returns:
+        pymysql.Connection: 데이터베이스 연결 객체
+    """
+    return analytics_pool.connect()
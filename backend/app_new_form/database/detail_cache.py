@@ -0,0 +1,28 @@
+"""
+JOIN 상세(full_detail) 조회 캐시
+- 조회: *_join.py 의 full_detail 엔드포인트가 detail_cache.get_or_load() 사용
+- 무효화: 쓰기 라우터는 commit 직후 invalidate_detail('<테이블명>', seq) 호출
+- dimension_cache: 다건 조회(?ids=)용 제품/고객/지점/제조사 단일 행 캐시 (invalidate_detail 로 함께 무효화)
+"""
+
+from common.cache import TTLCache
+
+# 생성 후 거의 바뀌지 않는 기록(수령/반품/입고/발주/주문)의 상세 정보라 5분 유지
+detail_cache = TTLCache(max_entries=2048, ttl=300)
+
+# 주문 내역/장바구니 화면에서 여러 개씩 조회하는 행 (재고/가격 변경은 invalidate_detail 로 즉시 반영, 1분 유지)
+dimension_cache = TTLCache(max_entries=20000, ttl=60)
+
+# 상세 결과에 이름만 포함되는(seq 없음) 테이블은 테이블 단위 태그로 묶는다
+CATALOG_NAME_TAGS = (
+    ('kind_category', None),
+    ('color_category', None),
+    ('size_category', None),
+    ('gender_category', None),
+)
+
+
+def invalidate_detail(table: str, seq=None):
+    """table의 seq 행을 참조하는 상세 캐시 제거 (테이블 단위 태그 포함)"""
+    detail_cache.invalidate_tag((table, seq), (table, None))
+    dimension_cache.invalidate_tag((table, seq))
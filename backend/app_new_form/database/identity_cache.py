@@ -0,0 +1,20 @@
+"""
+소셜 로그인 identity 캐시
+(provider, provider_subject) → 사용자 요약 row (u_seq, u_name, u_email, u_phone, u_address, registration_completed)
+- 조회: auth.social_login
+- 무효화: 회원가입 완료 / 사용자 수정·삭제 시 invalidate_identity(u_seq)
+"""
+
+from common.cache import TTLCache
+
+# 앱 실행 시마다 로그인하므로 활성 사용자 수 정도로 잡고, 10분 지나면 DB에서 다시 확인
+identity_cache = TTLCache(max_entries=10000, ttl=600)
+
+
+def invalidate_identity(user_seq: int):
+    """user_seq 사용자에 연결된 모든 identity 캐시 제거"""
+    identity_cache.invalidate_tag(('user', user_seq))
+
+
+# Idempotency-Key 헤더로 재시도된 로그인 요청에 같은 응답을 돌려주기 위한 캐시 (24시간)
+idempotency_cache = TTLCache(max_entries=10000, ttl=86400)
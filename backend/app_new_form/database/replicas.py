@@ -0,0 +1,37 @@
+"""
+읽기 replica 라우팅 (읽기/쓰기 분리)
+- 조회: *_join.py 의 목록/상세 GET 핸들러가 connect_read_db() 사용
+  (조건부 GET(ETag) 대상 경로는 제외: product_join 은 primary 에서 조회)
+- 쓰기, 캐시 적재(full_detail 로더): 기존 connect_db() (primary 풀)
+- replica 목록: 환경변수 DB_REPLICAS="host1:3306,host2:3306"
+  계정/DB 이름/풀 크기/타임아웃은 replica 풀 설정 (DB_REPLICA_*, common/db_config.py 참고)
+  지정하지 않으면 connect_read_db()도 primary에 연결 (기존 동작과 같음)
+"""
+
+import os
+
+from app_new_form.database.connection import primary_pool
+from common.db_config import ConnectionPool, pool_settings
+from common.replicas import ReplicaRouter, parse_replicas
+
+# pool_settings 가 프로필 파일을 먼저 로드하므로 DB_REPLICAS 도 프로필에 둘 수 있음
+_replica_settings = pool_settings('replica', default_database='shoes_shop_db')
+REPLICA_CONFIGS = parse_replicas(os.environ.get('DB_REPLICAS', ''), _replica_settings['config'])
+replica_pools = [
+    ConnectionPool(f'replica{index + 1}', config, size=_replica_settings['pool_size'])
+    for index, config in enumerate(REPLICA_CONFIGS)
+]
+db_router = ReplicaRouter(primary_pool, replica_pools, retry_after=float(os.environ.get('DB_REPLICA_RETRY', 30)))
+
+# 쓰기 후 이 시간(초) 동안 같은 클라이언트의 읽기는 primary 로 (replica 복제 지연보다 길게)
+PIN_SECONDS = int(os.environ.get('DB_PIN_SECONDS', 5))
+
+
+def connect_read_db():
+    """
+    조회 전용 데이터베이스 연결 (replica, 최근 쓰기한 클라이언트/replica 장애 시 primary)
+
+    Returns:
+        pymysql.Connection: 데이터베이스 연결 객체
+    """
+    return db_router.connect_read()
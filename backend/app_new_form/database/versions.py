@@ -0,0 +1,11 @@
+"""
+테이블 변경 카운터 (조건부 GET용)
+쓰기 핸들러는 commit 직후 table_versions.bump('<테이블명>') 를 호출한다.
+"""
+
+from common.versioning import TableVersions
+
+table_versions = TableVersions()
+
+# 제품 상세/목록 JOIN이 참조하는 테이블
+CATALOG_TABLES = ('product', 'kind_category', 'color_category', 'size_category', 'gender_category', 'maker')
@@ -5,6 +5,12 @@ FastAPI 메인 애플리케이션 - 새로운 ERD 구조
 
 from fastapi import FastAPI
 from app_new_form.database.connection import connect_db
+from app_new_form.database.detail_cache import detail_cache, dimension_cache
+from app_new_form.database.replicas import db_router, PIN_SECONDS
+from app_new_form.database.versions import table_versions, CATALOG_TABLES
+from common.compression import add_compression
+from common.replicas import ReadYourWritesMiddleware
+from common.versioning import ConditionalGetMiddleware
 
 # 기본 라우터 import
 from app_new_form.api import branch
@@ -16,11 +22,15 @@ from app_new_form.api import color_category
 from app_new_form.api import size_category
 from app_new_form.api import gender_category
 from app_new_form.api import product
+from app_new_form.api import product_import
 from app_new_form.api import purchase_item
 from app_new_form.api import pickup
 from app_new_form.api import refund
 from app_new_form.api import receive
 from app_new_form.api import request
+from app_new_form.api import auth
+from app_new_form.api import batch
+from app_new_form.api import branch_dashboard
 
 # JOIN 라우터 import
 from app_new_form.api import product_join
@@ -33,8 +43,27 @@ from app_new_form.api import request_join
 app = FastAPI(title="Shoes Store API - 새로운 ERD 구조")
 ip_address = '127.0.0.1'
 
+# 응답 압축 (gzip/br/zstd, 1KB 이상 JSON 응답)
+add_compression(app)
+
+# 조건부 GET (ETag/Last-Modified): 카탈로그/카테고리 조회는 테이블 버전이 같으면 DB 조회 없이 304
+app.add_middleware(ConditionalGetMiddleware, versions=table_versions, rules=[
+    (r'^/api/products/products/', CATALOG_TABLES),
+    (r'^/api/products(/\d+|/by_maker/\d+)?$', ('product',)),
+    (r'^/api/kind_categories(/\d+)?$', ('kind_category',)),
+    (r'^/api/color_categories(/\d+)?$', ('color_category',)),
+    (r'^/api/size_categories(/\d+)?$', ('size_category',)),
+    (r'^/api/gender_categories(/\d+)?$', ('gender_category',)),
+    (r'^/api/makers(/\d+)?$', ('maker',)),
+    (r'^/api/branches(/\d+)?$', ('branch',)),
+])
+
+# 읽기/쓰기 분리: 쓰기 성공 후 PIN_SECONDS 동안 같은 클라이언트의 JOIN 조회는 replica 대신 primary 로
+app.add_middleware(ReadYourWritesMiddleware, router=db_router, pin_seconds=PIN_SECONDS, read_paths=(batch.BATCH_PATH,))
+
 # 기본 CRUD 라우터 등록
 app.include_router(branch.router, prefix="/api/branches", tags=["branches"])
+app.include_router(branch_dashboard.router, prefix="/api/branches", tags=["branches-dashboard"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
 app.include_router(staff.router, prefix="/api/staffs", tags=["staffs"])
 app.include_router(maker.router, prefix="/api/makers", tags=["makers"])
@@ -43,11 +72,14 @@ app.include_router(color_category.router, prefix="/api/color_categories", tags=[
 app.include_router(size_category.router, prefix="/api/size_categories", tags=["size_categories"])
 app.include_router(gender_category.router, prefix="/api/gender_categories", tags=["gender_categories"])
 app.include_router(product.router, prefix="/api/products", tags=["products"])
+app.include_router(product_import.router, prefix="/api/product_imports", tags=["products"])
 app.include_router(purchase_item.router, prefix="/api/purchase_items", tags=["purchase_items"])
 app.include_router(pickup.router, prefix="/api/pickups", tags=["pickups"])
 app.include_router(refund.router, prefix="/api/refunds", tags=["refunds"])
 app.include_router(receive.router, prefix="/api/receives", tags=["receives"])
 app.include_router(request.router, prefix="/api/requests", tags=["requests"])
+app.include_router(auth.router, prefix="/api", tags=["auth"])
+app.include_router(batch.router, prefix="/api", tags=["batch"])
 
 # JOIN 라우터 등록
 app.include_router(product_join.router, prefix="/api/products", tags=["products-join"])
@@ -66,6 +98,7 @@ async def root():
         "status": "running",
         "endpoints": {
             "branches": "/api/branches",
+            "branch_dashboard": "/api/branches/{id}/dashboard (지점 업무 시작 화면)",
             "users": "/api/users",
             "staffs": "/api/staffs",
             "makers": "/api/makers",
@@ -73,12 +106,15 @@ async def root():
             "color_categories": "/api/color_categories",
             "size_categories": "/api/size_categories",
             "gender_categories": "/api/gender_categories",
-            "products": "/api/products",
+            "products": "/api/products (?ids=1,2,3 다건 조회)",
+            "product_imports": "/api/product_imports (CSV/JSONL 일괄 등록)",
             "purchase_items": "/api/purchase_items",
             "pickups": "/api/pickups",
             "refunds": "/api/refunds",
             "receives": "/api/receives",
-            "requests": "/api/requests"
+            "requests": "/api/requests",
+            "auth": "/api/auth/social/login",
+            "batch": "/api/batch"
         },
         "join_endpoints": {
             "products_join": "/api/products/{id}/full_detail, /api/products/with_categories",
@@ -91,6 +127,35 @@ async def root():
     }
 
 
+@app.get("/metrics/singleflight", tags=["metrics"])
+async def get_singleflight_metrics():
+    """제품 조회 요청 병합 통계 (leaders = 실제 DB 조회 수)"""
+    return {
+        "result": {
+            "product": product.product_flight.stats(),
+            "product_full_detail": product_join.product_detail_flight.stats(),
+        }
+    }
+
+
+@app.get("/metrics/detail_cache", tags=["metrics"])
+async def get_detail_cache_metrics():
+    """full_detail JOIN 조회 캐시 통계 (hit/miss/eviction)"""
+    return {"result": detail_cache.stats()}
+
+
+@app.get("/metrics/dimension_cache", tags=["metrics"])
+async def get_dimension_cache_metrics():
+    """다건 조회(?ids=) 제품/고객/지점/제조사 행 캐시 통계"""
+    return {"result": dimension_cache.stats()}
+
+
+@app.get("/metrics/db_routing", tags=["metrics"])
+async def get_db_routing_metrics():
+    """읽기 replica 라우팅 통계 (replica별 조회 수, primary 대체/고정 횟수)"""
+    return {"result": db_router.stats()}
+
+
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
@@ -0,0 +1,4 @@
+"""
+공통 모듈
+여러 앱(app, app_basic_form, app_new_form)에서 함께 사용하는 유틸리티
+"""
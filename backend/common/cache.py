@@ -0,0 +1,187 @@
+"""
+Read-through 캐시 (TTL + LRU)
+- 최대 항목 수(max_entries)를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+- 항목마다 만료 시간(ttl) 적용
+- 태그로 묶어서 무효화: 상세 JOIN 결과에 ('user', 3), ('product', 12) 처럼
+  참조한 행을 태그로 달아 두고, 쓰기 핸들러에서 해당 태그를 무효화한다
+- hit / miss / eviction / expiration / invalidation 통계 제공
+
+사용 예:
+    detail_cache = TTLCache(max_entries=2048, ttl=300)
+
+    row = await detail_cache.get_or_load(('pickup', pickup_seq), fetch_row, pickup_seq, tags=row_tags)
+    ...
+    detail_cache.invalidate_tag(('user', user_seq))   # user 수정 후
+
+주의:
+    프로세스 메모리 캐시이므로 워커 1개 기준이다. (common/versioning.py 와 동일)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from starlette.concurrency import run_in_threadpool
+
+
+class TTLCache:
+    """
+    크기 제한(LRU) + TTL 캐시
+
+    Args:
+        max_entries: 최대 항목 수
+        ttl: 항목 유지 시간(초)
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> (value, expires_at, tags)
+        self._tags = {}                 # tag -> set(key)
+        self._generation = 0            # 무효화할 때마다 증가 (조회 중 무효화된 결과는 저장하지 않음)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ============================================
+    # 조회 / 저장
+    # ============================================
+    def get(self, key):
+        """
+        Returns:
+            tuple: (hit 여부, 값)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            if entry[1] < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def set(self, key, value, tags=(), generation=None):
+        """
+        값 저장. generation을 넘기면 그 이후 무효화가 있었을 때는 저장하지 않는다.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            tags = tuple(tags)
+            self._entries[key] = (value, time.monotonic() + self.ttl, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    async def get_or_load(self, key, loader, *args, tags=None):
+        """
+        캐시에 있으면 반환, 없으면 loader(*args)를 스레드풀에서 실행해 저장 후 반환
+
+        Args:
+            loader: 동기 조회 함수 (pymysql)
+            tags: 결과값을 받아 태그 목록을 돌려주는 함수 (선택)
+
+        결과가 None(행 없음)이면 저장하지 않는다.
+        """
+        hit, value = self.get(key)
+        if hit:
+            return value
+        generation = self._generation
+        value = await run_in_threadpool(loader, *args)
+        if value is not None:
+            self.set(key, value, tags(value) if tags else (), generation=generation)
+        return value
+
+    async def get_or_load_many(self, ids, key, loader, tags=None) -> dict:
+        """
+        여러 id를 한 번에 조회: 캐시에 없는 id만 모아서 loader(missing_ids)를 1번 실행
+
+        Args:
+            key: id → 캐시 key 변환 함수
+            loader: 동기 조회 함수, {id: 값} 반환 (없는 id는 생략)
+            tags: 결과값을 받아 태그 목록을 돌려주는 함수 (선택)
+
+        Returns:
+            dict: {id: 값} (캐시/DB 어디에도 없는 id는 포함하지 않음)
+        """
+        found = {}
+        missing = []
+        for item in ids:
+            hit, value = self.get(key(item))
+            if hit:
+                found[item] = value
+            else:
+                missing.append(item)
+        if missing:
+            generation = self._generation
+            loaded = await run_in_threadpool(loader, missing)
+            for item, value in loaded.items():
+                self.set(key(item), value, tags(value) if tags else (), generation=generation)
+                found[item] = value
+        return found
+
+    # ============================================
+    # 무효화
+    # ============================================
+    def invalidate(self, key):
+        with self._lock:
+            self._generation += 1
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def invalidate_tag(self, *tags):
+        """태그가 하나라도 달린 항목 모두 제거"""
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._tags.clear()
+
+    def _remove(self, key):
+        # self._lock 안에서만 호출
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    # ============================================
+    # 통계
+    # ============================================
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
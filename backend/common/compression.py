@@ -0,0 +1,353 @@
+"""
+응답 압축 미들웨어 (gzip / brotli / zstd)
+- Accept-Encoding 협상 (q 값 반영, 동률이면 br > zstd > gzip 순)
+- 최소 크기(minimum_size) 미만 응답은 압축하지 않음
+- Content-Type별 압축 레벨 지정 (JSON은 높게, NDJSON 스트림은 빠르게)
+- 스트리밍 응답(NDJSON 등)은 chunk마다 flush하면서 압축
+- 절약한 바이트 수와 압축에 쓴 CPU 시간을 CompressionStats로 집계
+
+brotli, zstandard 패키지는 선택사항이며, 설치되지 않은 인코딩은 협상에서 제외된다.
+
+사용법:
+    from common.compression import add_compression
+    add_compression(app)   # 미들웨어 + GET /metrics/compression 등록
+"""
+
+import threading
+import time
+import zlib
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+
+# ============================================
+# 설정
+# ============================================
+DEFAULT_MINIMUM_SIZE = 1024
+
+# Content-Type 접두어별 압축 레벨 (앞에서부터 먼저 일치하는 항목 사용)
+DEFAULT_LEVELS = [
+    ('application/x-ndjson', {'br': 4, 'zstd': 3, 'gzip': 5}),
+    ('application/json', {'br': 6, 'zstd': 6, 'gzip': 6}),
+    ('text/', {'br': 5, 'zstd': 5, 'gzip': 6}),
+]
+
+# 동률일 때 서버 선호 순서
+ENCODING_PREFERENCE = ['br', 'zstd', 'gzip']
+
+# 스트리밍으로 압축할 Content-Type
+STREAMING_TYPES = ('application/x-ndjson',)
+
+
+def available_encodings():
+    """현재 환경에서 사용 가능한 인코딩 목록"""
+    encodings = []
+    if brotli is not None:
+        encodings.append('br')
+    if zstandard is not None:
+        encodings.append('zstd')
+    encodings.append('gzip')
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str, supported=None):
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩 선택
+
+    Returns:
+        str | None: 'br', 'zstd', 'gzip' 중 하나 또는 압축 불가 시 None
+    """
+    supported = supported or available_encodings()
+    weights = {}
+    wildcard = None
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token == '*':
+            wildcard = q
+        else:
+            weights[token] = q
+
+    best = None
+    best_q = 0.0
+    for encoding in ENCODING_PREFERENCE:
+        if encoding not in supported:
+            continue
+        q = weights.get(encoding, wildcard if wildcard is not None else 0.0)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+# ============================================
+# 압축기
+# ============================================
+class _Compressor:
+    """인코딩별 스트리밍 압축기 공통 인터페이스"""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == 'gzip':
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        elif encoding == 'br':
+            self._obj = brotli.Compressor(quality=level)
+        elif encoding == 'zstd':
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+        else:
+            raise ValueError(f"unsupported encoding: {encoding}")
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """data 압축. flush=True면 지금까지의 입력을 클라이언트가 바로 풀 수 있게 내보냄"""
+        if self.encoding == 'br':
+            out = self._obj.process(data)
+            return out + self._obj.flush() if flush else out
+        out = self._obj.compress(data)
+        if not flush:
+            return out
+        if self.encoding == 'gzip':
+            return out + self._obj.flush(zlib.Z_SYNC_FLUSH)
+        return out + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        """스트림 종료 (trailer 포함)"""
+        if self.encoding == 'br':
+            return self._obj.finish()
+        return self._obj.flush()
+
+
+# ============================================
+# 통계
+# ============================================
+class CompressionStats:
+    """압축 통계 (프로세스 단위, 스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.compressed = 0
+            self.skipped = 0
+            self.bytes_in = 0
+            self.bytes_out = 0
+            self.cpu_seconds = 0.0
+            self.by_encoding = {}
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float):
+        with self._lock:
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+            self.cpu_seconds += cpu_seconds
+            entry = self.by_encoding.setdefault(
+                encoding, {'responses': 0, 'bytes_in': 0, 'bytes_out': 0, 'cpu_ms': 0.0}
+            )
+            entry['bytes_in'] += bytes_in
+            entry['bytes_out'] += bytes_out
+            entry['cpu_ms'] += cpu_seconds * 1000
+
+    def count(self, encoding):
+        with self._lock:
+            if encoding is None:
+                self.skipped += 1
+            else:
+                self.compressed += 1
+                self.by_encoding[encoding]['responses'] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                'compressed_responses': self.compressed,
+                'skipped_responses': self.skipped,
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'bytes_saved': self.bytes_in - self.bytes_out,
+                'ratio': round(self.bytes_out / self.bytes_in, 4) if self.bytes_in else None,
+                'cpu_ms': round(self.cpu_seconds * 1000, 3),
+                'by_encoding': {k: dict(v, cpu_ms=round(v['cpu_ms'], 3)) for k, v in self.by_encoding.items()},
+            }
+
+
+compression_stats = CompressionStats()
+
+
+# ============================================
+# ASGI 미들웨어
+# ============================================
+class CompressionMiddleware:
+    """
+    응답 본문을 협상된 인코딩으로 압축하는 ASGI 미들웨어
+
+    Args:
+        app: 감쌀 ASGI 앱
+        minimum_size: 이 크기(bytes) 미만인 응답은 압축하지 않음
+        levels: [(content-type 접두어, {인코딩: 레벨}), ...]
+        stats: 통계 수집 객체 (기본: 모듈 전역 compression_stats)
+    """
+
+    def __init__(self, app, minimum_size: int = DEFAULT_MINIMUM_SIZE, levels=None, stats=None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = levels or DEFAULT_LEVELS
+        self.stats = stats or compression_stats
+        self.supported = available_encodings()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        accept = ''
+        for key, value in scope.get('headers', []):
+            if key == b'accept-encoding':
+                accept = value.decode('latin-1')
+                break
+        encoding = negotiate_encoding(accept, self.supported) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder)
+
+    def level_for(self, content_type: str, encoding: str):
+        """Content-Type에 맞는 압축 레벨 (압축 대상이 아니면 None)"""
+        for prefix, levels in self.levels:
+            if content_type.startswith(prefix):
+                return levels.get(encoding)
+        return None
+
+
+class _CompressionResponder:
+    """요청 1건의 send 호출을 가로채 본문을 압축"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.mw = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start_message = None
+        self.passthrough = False
+        self.level = None
+        self.streaming = False
+        self.buffer = []
+        self.buffered = 0
+        self.compressor = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.cpu = 0.0
+
+    async def __call__(self, message):
+        if message['type'] == 'http.response.start':
+            await self._on_start(message)
+            return
+        if self.passthrough or message['type'] != 'http.response.body':
+            await self.send(message)
+            return
+
+        body = message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+        if self.compressor is None:
+            self.buffer.append(body)
+            self.buffered += len(body)
+            if more_body and (self.buffered == 0 or (not self.streaming and self.buffered < self.mw.minimum_size)):
+                return
+            if not more_body and self.buffered < self.mw.minimum_size:
+                # 전체 응답이 최소 크기 미만: 원본 그대로 전송
+                self.mw.stats.count(None)
+                await self.send(self.start_message)
+                await self.send({'type': 'http.response.body', 'body': b''.join(self.buffer), 'more_body': False})
+                return
+            body = b''.join(self.buffer)
+            self.buffer = []
+            self.compressor = _Compressor(self.encoding, self.level)
+            if not more_body:
+                # 단일 본문: 압축 후 Content-Length까지 채워서 전송
+                data = self._compress(body, more_body)
+                await self._send_start(content_length=len(data))
+                await self.send({'type': 'http.response.body', 'body': data, 'more_body': False})
+                self._record()
+                return
+            await self._send_start()
+
+        data = self._compress(body, more_body)
+        if data or not more_body:
+            await self.send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+        if not more_body:
+            self._record()
+
+    async def _on_start(self, message):
+        headers = {k.lower(): v for k, v in message.get('headers', [])}
+        content_type = headers.get(b'content-type', b'').decode('latin-1').lower()
+        status = message['status']
+        self.level = self.mw.level_for(content_type, self.encoding)
+        if self.level is None or b'content-encoding' in headers or status in (204, 304):
+            self.passthrough = True
+            self.mw.stats.count(None)
+            await self.send(message)
+            return
+        self.streaming = content_type.startswith(STREAMING_TYPES)
+        self.start_message = message
+
+    async def _send_start(self, content_length=None):
+        headers = [
+            (k, v) for k, v in self.start_message.get('headers', [])
+            if k.lower() not in (b'content-length', b'content-encoding')
+        ]
+        headers.append((b'content-encoding', self.encoding.encode('latin-1')))
+        if not any(k.lower() == b'vary' for k, _ in headers):
+            headers.append((b'vary', b'Accept-Encoding'))
+        if content_length is not None:
+            headers.append((b'content-length', str(content_length).encode('latin-1')))
+        await self.send(dict(self.start_message, headers=headers))
+
+    def _record(self):
+        self.mw.stats.record(self.encoding, self.bytes_in, self.bytes_out, self.cpu)
+        self.mw.stats.count(self.encoding)
+
+    def _compress(self, body: bytes, more_body: bool) -> bytes:
+        # 스트리밍 응답은 chunk마다 flush해서 클라이언트가 줄 단위로 바로 읽을 수 있게 함
+        started = time.thread_time()
+        data = self.compressor.compress(body, flush=more_body and self.streaming)
+        if not more_body:
+            data += self.compressor.finish()
+        self.cpu += time.thread_time() - started
+        self.bytes_in += len(body)
+        self.bytes_out += len(data)
+        return data
+
+
+# ============================================
+# 앱 등록 헬퍼
+# ============================================
+def add_compression(app, minimum_size: int = DEFAULT_MINIMUM_SIZE, levels=None):
+    """
+    FastAPI 앱에 압축 미들웨어와 통계 엔드포인트(GET /metrics/compression) 등록
+    """
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size, levels=levels)
+
+    @app.get("/metrics/compression", tags=["metrics"])
+    async def get_compression_metrics():
+        """응답 압축 통계 (절약 바이트, CPU 시간)"""
+        return {
+            "result": compression_stats.snapshot(),
+            "encodings": available_encodings(),
+            "minimum_size": minimum_size,
+        }
@@ -0,0 +1,162 @@
+"""
+비밀번호 해시 / 검증 (scrypt)
+- 메모리 하드 KDF인 scrypt(hashlib 표준 라이브러리) 사용
+- 저장 형식: scrypt$<log2 N>$<r>$<p>$<salt base64>$<hash base64>
+- 평문으로 저장된 기존 비밀번호도 검증 가능 (needs_rehash()가 True → 로그인 성공 시 해시로 교체)
+- async 핸들러에서는 *_async 함수 사용: 전용 스레드풀에서 실행하고 동시 실행 수를 제한해
+  이벤트 루프가 KDF 계산(요청당 수십 ms, 16MB 메모리)에 묶이지 않게 한다
+
+사용 예:
+    stored = await hash_password_async(password)
+    if await verify_password_async(password, stored):
+        if needs_rehash(stored):
+            ...
+"""
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+# ============================================
+# 설정
+# ============================================
+SCHEME = 'scrypt'
+LOG2_N = 14          # N = 16384
+R = 8                # 메모리 사용량 = 128 * N * r = 16MB
+P = 1
+SALT_BYTES = 16
+DKLEN = 32
+MAXMEM = 64 * 1024 * 1024
+
+# 저장된 해시로 인정하는 파라미터 범위 (이전 설정으로 만든 해시 검증용)
+LOG2_N_RANGE = (10, 20)
+R_RANGE = (1, 32)
+P_RANGE = (1, 16)
+SALT_BYTES_RANGE = (8, 64)
+DKLEN_RANGE = (16, 64)
+
+# KDF 전용 스레드 수 (hashlib.scrypt는 계산 중 GIL을 놓으므로 스레드로도 병렬 실행됨)
+KDF_WORKERS = int(os.environ.get('KDF_WORKERS', min(4, os.cpu_count() or 1)))
+
+_executor = ThreadPoolExecutor(max_workers=KDF_WORKERS, thread_name_prefix='kdf')
+# 실행 중인 KDF 수 제한: 초과 요청은 스레드풀 큐가 아니라 이벤트 루프에서 대기
+# (클라이언트가 끊긴 요청은 대기 중에 취소되어 CPU를 쓰지 않음)
+_semaphores = weakref.WeakKeyDictionary()   # 이벤트 루프별 Semaphore
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + '=' * (-len(text) % 4), validate=True)
+
+
+def _derive(password: str, salt: bytes, log2_n: int, r: int, p: int, dklen: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode('utf-8'), salt=salt, n=1 << log2_n, r=r, p=p, maxmem=MAXMEM, dklen=dklen
+    )
+
+
+# ============================================
+# 동기 함수 (스크립트 / 스레드풀용)
+# ============================================
+def is_hashed(stored) -> bool:
+    return isinstance(stored, str) and stored.startswith(SCHEME + '$')
+
+
+def parse_hash(stored):
+    """
+    scrypt 해시 문자열 → (log2 N, r, p, salt, digest). 형식/파라미터가 올바르지 않으면 None
+    (필드 수, base64, N/r/p 범위, scrypt 메모리 한도까지 확인)
+    """
+    if not is_hashed(stored):
+        return None
+    parts = stored.split('$')
+    if len(parts) != 6:
+        return None
+    try:
+        log2_n, r, p = (int(part) for part in parts[1:4])
+        salt, digest = _unb64(parts[4]), _unb64(parts[5])
+    except (ValueError, TypeError):
+        return None
+    ranges = ((log2_n, LOG2_N_RANGE), (r, R_RANGE), (p, P_RANGE),
+              (len(salt), SALT_BYTES_RANGE), (len(digest), DKLEN_RANGE))
+    if not all(low <= value <= high for value, (low, high) in ranges):
+        return None
+    if 128 * (1 << log2_n) * r > MAXMEM:
+        return None
+    return log2_n, r, p, salt, digest
+
+
+def hash_password(password: str, salt: bytes = None) -> str:
+    """salt를 지정하면 항상 같은 해시 (테스트 데이터 생성용), 기본은 무작위 salt"""
+    salt = salt if salt is not None else os.urandom(SALT_BYTES)
+    digest = _derive(password, salt, LOG2_N, R, P, DKLEN)
+    return f'{SCHEME}${LOG2_N}${R}${P}${_b64(salt)}${_b64(digest)}'
+
+
+def verify_password(password: str, stored) -> bool:
+    """
+    비밀번호 검증. stored가 해시가 아니면 기존 평문 저장값과 비교한다.
+    stored가 None(사용자 없음)이어도 같은 시간이 걸리도록 더미 해시로 계산 후 False 반환
+    """
+    if stored is None:
+        _derive(password, b'\0' * SALT_BYTES, LOG2_N, R, P, DKLEN)
+        return False
+    if not is_hashed(stored):
+        return hmac.compare_digest(password.encode('utf-8'), str(stored).encode('utf-8'))
+    parsed = parse_hash(stored)
+    if parsed is None:
+        return False
+    log2_n, r, p, salt, expected = parsed
+    return hmac.compare_digest(_derive(password, salt, log2_n, r, p, len(expected)), expected)
+
+
+def is_current_hash(stored) -> bool:
+    """현재 설정(LOG2_N, R, P, SALT_BYTES, DKLEN)과 정확히 같은 파라미터로 만든 해시면 True"""
+    parsed = parse_hash(stored)
+    if parsed is None:
+        return False
+    log2_n, r, p, salt, digest = parsed
+    return (log2_n, r, p, len(salt), len(digest)) == (LOG2_N, R, P, SALT_BYTES, DKLEN)
+
+
+def needs_rehash(stored) -> bool:
+    """평문이거나 현재 설정과 다른 파라미터로 만든 해시면 True"""
+    return not is_current_hash(stored)
+
+
+# ============================================
+# async 함수 (FastAPI 핸들러용)
+# ============================================
+async def _run(func, *args):
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(KDF_WORKERS)
+    async with semaphore:
+        return await loop.run_in_executor(_executor, func, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run(hash_password, password)
+
+
+async def verify_password_async(password: str, stored) -> bool:
+    return await _run(verify_password, password, stored)
+
+
+async def hash_if_plain_async(password: str) -> str:
+    """
+    평문이면 해시, 현재 설정으로 만든 scrypt 해시면 그대로 반환 (이중 해시 방지)
+    그 외 'scrypt$' 형식 값은 평문으로 보고 해시한다
+    (깨진 해시나 KDF 비용을 키운 해시를 클라이언트가 직접 저장해 /login 을 느리게 만들지 못하도록)
+    """
+    if is_current_hash(password):
+        return password
+    return await hash_password_async(password)
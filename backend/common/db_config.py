@@ -0,0 +1,229 @@
+"""
+DB 접속 설정 (환경변수 + 프로필 파일) 및 이름 있는 연결 풀
+- 프로필: DB_PROFILE (기본 remote) → backend/config/db.<프로필>.env 로드
+  우선순위: 실제 환경변수 > backend/.env (개인 설정, git 제외) > 프로필 파일 > 코드 기본값
+- 풀: primary / replica / analytics 각각 접속 정보, 풀 크기, 타임아웃, 세션 변수를 따로 지정
+    접속 정보  DB_<풀>_HOST / PORT / USER / PASSWORD / NAME  (없으면 DB_HOST 등 공통 값)
+    튜닝 값    DB_<풀>_POOL_SIZE / CONNECT_TIMEOUT / READ_TIMEOUT / WRITE_TIMEOUT / SESSION
+  예) DB_ANALYTICS_READ_TIMEOUT=300
+      DB_ANALYTICS_SESSION="max_execution_time=60000, transaction_isolation='READ-COMMITTED'"
+- ConnectionPool: 반납된 연결을 pool_size 개까지 보관했다가 재사용 (초과분은 바로 닫음, 대기 없음)
+  반납 시 rollback 으로 열린 트랜잭션/스냅샷을 정리하므로 다음 요청이 이전 트랜잭션을 보지 않는다.
+
+python-dotenv 가 없으면 프로필 파일 없이 환경변수만 사용한다.
+
+사용 예 (각 앱의 database/connection.py):
+    primary_pool = make_pool('primary', default_database='shoes_shop_db')
+    DB_CONFIG = primary_pool.config         # pymysql.connect 인자 (기존 코드 호환)
+
+    conn = primary_pool.connect()           # conn.close() 하면 풀로 반납
+"""
+
+import os
+import threading
+import time
+from collections import deque
+
+import pymysql
+
+try:
+    from dotenv import load_dotenv
+except ImportError:  # python-dotenv 미설치
+    load_dotenv = None
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_DIR = os.path.join(BACKEND_DIR, 'config')
+DEFAULT_PROFILE = 'remote'
+
+CONNECTION_KEYS = ('HOST', 'PORT', 'USER', 'PASSWORD', 'NAME')
+
+# 풀별 기본 튜닝 값 (환경변수/프로필로 변경)
+POOL_DEFAULTS = {
+    'primary': {'POOL_SIZE': 10, 'CONNECT_TIMEOUT': 10, 'READ_TIMEOUT': None, 'WRITE_TIMEOUT': None, 'SESSION': ''},
+    'replica': {'POOL_SIZE': 10, 'CONNECT_TIMEOUT': 2, 'READ_TIMEOUT': 30, 'WRITE_TIMEOUT': 30, 'SESSION': ''},
+    'analytics': {'POOL_SIZE': 2, 'CONNECT_TIMEOUT': 10, 'READ_TIMEOUT': 300, 'WRITE_TIMEOUT': 60,
+                  'SESSION': "transaction_isolation='READ-COMMITTED'"},
+}
+
+_profile_lock = threading.Lock()
+_profile_loaded = None
+
+
+# ============================================
+# 프로필 로드
+# ============================================
+def load_profile() -> str:
+    """backend/.env → config/db.<DB_PROFILE>.env 순서로 로드 (이미 있는 환경변수는 덮어쓰지 않음)"""
+    global _profile_loaded
+    with _profile_lock:
+        if _profile_loaded is None:
+            if load_dotenv is not None:
+                load_dotenv(os.path.join(BACKEND_DIR, '.env'), override=False)
+            profile = os.environ.get('DB_PROFILE', DEFAULT_PROFILE)
+            path = os.path.join(CONFIG_DIR, f'db.{profile}.env')
+            if load_dotenv is not None and os.path.exists(path):
+                load_dotenv(path, override=False)
+            _profile_loaded = profile
+        return _profile_loaded
+
+
+def _env(pool: str, key: str, inherit: bool):
+    value = os.environ.get(f'DB_{pool.upper()}_{key}')
+    if value is None and inherit:
+        value = os.environ.get(f'DB_{key}')
+    return value
+
+
+def _seconds(value):
+    return None if value in (None, '', 'none') else float(value)
+
+
+def pool_settings(pool: str, default_database: str) -> dict:
+    """풀 이름의 설정 → {'config': pymysql.connect 인자, 'pool_size': int}"""
+    load_profile()
+    if pool not in POOL_DEFAULTS:
+        raise ValueError(f"알 수 없는 풀: {pool} ({', '.join(POOL_DEFAULTS)})")
+    tuning = {key: _env(pool, key, inherit=False) for key in POOL_DEFAULTS[pool]}
+    tuning = {key: POOL_DEFAULTS[pool][key] if value is None else value for key, value in tuning.items()}
+    host, port, user, password, database = (_env(pool, key, inherit=True) for key in CONNECTION_KEYS)
+
+    config = {
+        'host': host or '127.0.0.1',
+        'user': user or 'root',
+        'password': password or '',
+        'database': database or default_database,
+        'charset': 'utf8mb4',
+        'port': int(port or 3306),
+        'connect_timeout': _seconds(tuning['CONNECT_TIMEOUT']),
+        'read_timeout': _seconds(tuning['READ_TIMEOUT']),
+        'write_timeout': _seconds(tuning['WRITE_TIMEOUT']),
+    }
+    if tuning['SESSION']:
+        config['init_command'] = f"SET SESSION {tuning['SESSION']}"
+    return {'config': config, 'pool_size': int(tuning['POOL_SIZE'])}
+
+
+def make_pool(pool: str, default_database: str) -> 'ConnectionPool':
+    settings = pool_settings(pool, default_database)
+    return ConnectionPool(pool, settings['config'], size=settings['pool_size'])
+
+
+# ============================================
+# 연결 풀
+# ============================================
+class PooledConnection:
+    """pymysql 연결 래퍼: close() 하면 실제로 닫지 않고 풀로 반납 (나머지 속성은 그대로 위임)"""
+
+    def __init__(self, pool, conn, created_at: float):
+        self._pool = pool
+        self._conn = conn
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise pymysql.err.InterfaceError(0, '이미 반납된 연결입니다.')
+        return getattr(self._conn, name)
+
+    def close(self):
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self._pool._release(conn, self._created_at)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Args:
+        name: 풀 이름 (통계 표시용)
+        config: pymysql.connect 인자
+        size: 보관할 유휴 연결 최대 수 (0이면 풀 없이 매번 연결/종료)
+        recycle: 이 시간(초)보다 오래된 연결은 재사용하지 않음 (서버 wait_timeout 보다 짧게)
+        ping_after: 이 시간(초) 이상 쉬었던 연결은 ping 으로 확인 후 사용
+    """
+
+    def __init__(self, name: str, config: dict, size: int = 10, recycle: float = 3600, ping_after: float = 30):
+        self.name = name
+        self.config = config
+        self.size = size
+        self.recycle = recycle
+        self.ping_after = ping_after
+        self._idle = deque()
+        self._lock = threading.Lock()
+        # 통계
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def connect(self):
+        while True:
+            with self._lock:
+                item = self._idle.pop() if self._idle else None
+            if item is None:
+                break
+            conn, created_at, idle_since = item
+            now = time.monotonic()
+            if now - created_at > self.recycle or (now - idle_since > self.ping_after and not self._alive(conn)):
+                self._discard(conn)
+                continue
+            with self._lock:
+                self.reused += 1
+            return PooledConnection(self, conn, created_at)
+
+        conn = pymysql.connect(**self.config)
+        with self._lock:
+            self.created += 1
+        return PooledConnection(self, conn, time.monotonic())
+
+    @staticmethod
+    def _alive(conn) -> bool:
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except pymysql.MySQLError:
+            return False
+
+    def _discard(self, conn):
+        with self._lock:
+            self.discarded += 1
+        try:
+            conn.close()
+        except pymysql.MySQLError:
+            pass
+
+    def _release(self, conn, created_at: float):
+        if not conn.open:
+            return
+        try:
+            conn.rollback()  # 커밋하지 않은 트랜잭션/읽기 스냅샷 정리
+        except pymysql.MySQLError:
+            self._discard(conn)
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((conn, created_at, time.monotonic()))
+                return
+        conn.close()
+
+    def clear(self):
+        """유휴 연결 모두 종료"""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn, _, _ in idle:
+            self._discard(conn)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'host': f"{self.config['host']}:{self.config['port']}",
+                'database': self.config['database'],
+                'size': self.size,
+                'idle': len(self._idle),
+                'created': self.created,
+                'reused': self.reused,
+                'discarded': self.discarded,
+            }
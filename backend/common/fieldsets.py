@@ -0,0 +1,86 @@
+"""
+Sparse fieldset (fields= 쿼리 파라미터)
+- 리소스마다 조회 가능한 컬럼 목록(화이트리스트)을 정해 두고, 요청한 컬럼만 SELECT / 직렬화
+- 목록/썸네일 화면에서 p_description, req_content 같은 긴 TEXT 컬럼을 읽지 않도록 해서
+  응답 크기와 DB I/O를 줄이고, 인덱스에 포함된 컬럼만 요청하면 커버링 인덱스로 처리된다
+- 첫 번째 컬럼(PK)은 항상 포함, 출력 순서는 요청 순서와 관계없이 화이트리스트 순서
+- 화이트리스트에 없는 이름이 있으면 ValueError (컬럼 이름은 화이트리스트 값만 SQL에 들어감)
+
+사용 예:
+    PRODUCT_FIELDS = FieldSet([
+        'p_seq', 'm_seq', 'p_name', 'p_price', 'p_image', 'p_description',
+    ])
+
+    projection = PRODUCT_FIELDS.resolve(fields)            # fields="p_name,p_price"
+    curs.execute(f"SELECT {projection.columns} FROM product ORDER BY p_seq")
+    return RawJSONResponse(projection.codec.dumps_results(curs.fetchall()))
+"""
+
+import threading
+
+from common.serialization import RowCodec
+
+
+class Projection:
+    """
+    fields= 해석 결과
+
+    Attributes:
+        names: 선택된 컬럼 이름 (화이트리스트 순서)
+        columns: SELECT 절에 넣을 컬럼 목록 문자열
+        codec: 선택된 컬럼용 RowCodec
+        indexes: 전체 컬럼 row에서 선택된 컬럼 위치 (캐시에 전체 row가 있을 때 pick 에 사용)
+    """
+
+    def __init__(self, names: tuple, all_names: tuple):
+        self.names = names
+        self.columns = ', '.join(names)
+        self.codec = RowCodec(list(names))
+        self.indexes = tuple(all_names.index(name) for name in names)
+        self.is_full = names == all_names
+
+    def pick(self, row) -> tuple:
+        """전체 컬럼 row → 선택된 컬럼만 남긴 row"""
+        if self.is_full:
+            return row
+        return tuple(row[index] for index in self.indexes)
+
+
+class FieldSet:
+    """
+    리소스별 조회 가능 컬럼 화이트리스트
+
+    Args:
+        columns: 조회 가능한 컬럼 (기본 SELECT 순서, 첫 번째는 PK)
+    """
+
+    def __init__(self, columns):
+        self.names = tuple(columns)
+        self.key = self.names[0]
+        self._allowed = frozenset(self.names)
+        self._lock = threading.Lock()
+        self._projections = {}  # 선택된 컬럼 tuple -> Projection (조합마다 1번만 생성)
+        self.full = self._get(self.names)
+
+    def resolve(self, fields=None) -> Projection:
+        """
+        fields 문자열("p_name,p_price") → Projection. None/빈 값이면 전체 컬럼.
+
+        Raises:
+            ValueError: 화이트리스트에 없는 필드
+        """
+        if fields is None or not fields.strip():
+            return self.full
+        requested = {part.strip() for part in fields.split(',') if part.strip()}
+        unknown = sorted(requested - self._allowed)
+        if unknown:
+            raise ValueError(f"알 수 없는 필드: {', '.join(unknown)} (사용 가능: {', '.join(self.names)})")
+        requested.add(self.key)
+        return self._get(tuple(name for name in self.names if name in requested))
+
+    def _get(self, names: tuple) -> Projection:
+        with self._lock:
+            projection = self._projections.get(names)
+            if projection is None:
+                projection = self._projections[names] = Projection(names, self.names)
+            return projection
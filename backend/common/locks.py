@@ -0,0 +1,36 @@
+"""
+key별 asyncio Lock
+- 같은 key 요청은 한 번에 하나만 실행 (같은 워커 안에서)
+- 기다리는 요청이 없으면 Lock 객체를 바로 정리하므로 key 수가 많아도 메모리가 늘지 않는다
+
+사용 예:
+    signup_locks = KeyedLock()
+
+    async with signup_locks.hold((provider, provider_subject)):
+        ...
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+
+class KeyedLock:
+    def __init__(self):
+        self._locks = {}   # key -> [asyncio.Lock, 대기+보유 수]
+
+    @asynccontextmanager
+    async def hold(self, key):
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._locks.pop(key, None)
+
+    def __len__(self):
+        return len(self._locks)
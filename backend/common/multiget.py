@@ -0,0 +1,69 @@
+"""
+다건 조회 (multi-get)
+- ids 쿼리 파라미터 파싱: "3,1,3,7" → [3, 1, 7] (중복 제거, 순서 유지, 최대 개수 제한)
+- 캐시(TTLCache)에 있는 행은 그대로 쓰고, 없는 id만 IN (...) 쿼리 1번으로 조회
+- 응답: {"results": {"3": {...}, "1": {...}}, "missing": [7]}  (id를 key로, 없는 id는 missing)
+
+사용 예:
+    ids = parse_ids(ids_param)
+    rows = await load_rows(dimension_cache, 'product', ids, connect_db, PRODUCT_BY_IDS_SQL)
+    return RawJSONResponse(dumps_keyed(PRODUCT_CODEC, ids, rows))
+
+SQL의 첫 번째 컬럼은 id, WHERE 절에는 IN ({ids}) 자리 표시를 둔다.
+"""
+
+from common.serialization import dumps
+
+MAX_IDS = 100
+
+
+def parse_ids(value: str, limit: int = MAX_IDS) -> list:
+    """쉼표로 구분된 id 문자열 → 정수 목록 (형식 오류/개수 초과 시 ValueError)"""
+    ids = []
+    seen = set()
+    for part in value.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if not part.isdigit():
+            raise ValueError(f"ids 형식이 올바르지 않습니다: {part}")
+        item = int(part)
+        if item not in seen:
+            seen.add(item)
+            ids.append(item)
+    if not ids:
+        raise ValueError("ids가 비어 있습니다")
+    if len(ids) > limit:
+        raise ValueError(f"ids는 최대 {limit}개까지 조회할 수 있습니다 (요청 {len(ids)}개)")
+    return ids
+
+
+def fetch_by_ids(connect, sql: str, ids: list) -> dict:
+    """sql의 {ids} 자리에 id 수만큼 %s를 넣어 1번 조회 → {첫 컬럼 값: row}"""
+    conn = connect()
+    try:
+        curs = conn.cursor()
+        curs.execute(sql.format(ids=', '.join(['%s'] * len(ids))), ids)
+        return {row[0]: row for row in curs.fetchall()}
+    finally:
+        conn.close()
+
+
+async def load_rows(cache, table: str, ids: list, connect, sql: str) -> dict:
+    """캐시 key/태그는 (table, id) → 쓰기 후 cache.invalidate_tag((table, id)) 로 무효화"""
+    return await cache.get_or_load_many(
+        ids, lambda item: (table, item), lambda missing: fetch_by_ids(connect, sql, missing),
+        tags=lambda row: ((table, row[0]),),
+    )
+
+
+def dumps_keyed(codec, ids: list, rows: dict, pick=None) -> bytes:
+    """
+    요청 순서대로 {"results": {"<id>": {...}}, "missing": [...]} JSON bytes
+    pick: 캐시 row에서 응답 컬럼만 고르는 함수 (fields= 사용 시 Projection.pick)
+    """
+    convert = codec.to_dict if pick is None else (lambda row: codec.to_dict(pick(row)))
+    return dumps({
+        "results": {str(item): convert(rows[item]) for item in ids if item in rows},
+        "missing": [item for item in ids if item not in rows],
+    })
@@ -0,0 +1,160 @@
+"""
+읽기/쓰기 분리 (primary + read replica)
+- ReplicaRouter: 쓰기는 primary, 읽기는 replica 들을 round-robin 으로 연결
+  replica 연결 실패 시 다음 replica → 모두 실패하면 primary 로 대체하고,
+  실패한 replica 는 retry_after 초 동안 제외
+- ReadYourWritesMiddleware: 쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 pin 쿠키를 내려주고,
+  쿠키가 살아 있는 동안(pin_seconds) 그 클라이언트의 읽기는 primary 로 보냄 (복제 지연 중에도 자기 쓰기 확인 가능)
+
+주의:
+    replica 가 없으면 connect_read()는 항상 primary 를 반환하므로 기존 동작과 같다.
+    pin 쿠키는 "최근에 썼다"는 표시일 뿐 권한 정보가 아니다 (조작해도 primary 로 읽는 것 외에 영향 없음).
+    쿼리 도중 replica 가 끊긴 경우는 핸들러의 기존 에러 응답으로 처리되고, 다음 연결부터 제외된다.
+
+사용 예:
+    db_router = ReplicaRouter(primary_pool, [ConnectionPool('replica1', replica_config)])
+    app.add_middleware(ReadYourWritesMiddleware, router=db_router)
+
+    conn = db_router.connect_read()     # GET 조회 핸들러
+    conn = db_router.connect_primary()  # 쓰기 / 캐시 적재
+"""
+
+import contextvars
+import itertools
+import threading
+import time
+
+import pymysql
+
+# 현재 요청이 primary 로 고정되었는지 (미들웨어가 요청마다 설정)
+_pinned = contextvars.ContextVar('db_pinned', default=False)
+
+WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+def parse_replicas(value: str, base_config: dict) -> list:
+    """'host1:3306,host2' → base_config 에서 host/port 만 바꾼 설정 목록"""
+    configs = []
+    for item in (value or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.partition(':')
+        configs.append(dict(base_config, host=host, port=int(port) if port else base_config.get('port', 3306)))
+    return configs
+
+
+class ReplicaRouter:
+    """
+    Args:
+        primary: 쓰기용 연결 풀 (common.db_config.ConnectionPool)
+        replicas: 읽기용 연결 풀 목록 (빈 목록이면 primary만 사용)
+            장애 시 primary 대체까지 걸리는 시간은 replica 풀의 connect_timeout
+        retry_after: 연결 실패한 replica 를 제외할 시간(초)
+    """
+
+    def __init__(self, primary, replicas: list = (), retry_after: float = 30.0):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.retry_after = retry_after
+        self._next = itertools.count()
+        self._down_until = [0.0] * len(self.replicas)
+        self._lock = threading.Lock()
+        # 통계
+        self.primary_reads = 0
+        self.pinned_reads = 0
+        self.replica_reads = [0] * len(self.replicas)
+        self.failovers = 0
+
+    def connect_primary(self):
+        return self.primary.connect()
+
+    def connect_read(self):
+        """읽기 연결: pin 된 요청 → primary, 아니면 사용 가능한 replica, 모두 실패하면 primary"""
+        if _pinned.get():
+            with self._lock:
+                self.pinned_reads += 1
+            return self.connect_primary()
+        count = len(self.replicas)
+        start = next(self._next)
+        for offset in range(count):
+            index = (start + offset) % count
+            if self._down_until[index] > time.monotonic():
+                continue
+            try:
+                conn = self.replicas[index].connect()
+            except pymysql.MySQLError:
+                with self._lock:
+                    self._down_until[index] = time.monotonic() + self.retry_after
+                    self.failovers += 1
+                continue
+            with self._lock:
+                self.replica_reads[index] += 1
+            return conn
+        with self._lock:
+            self.primary_reads += 1
+        return self.connect_primary()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                'replicas': [dict(
+                    pool.stats(),
+                    reads=self.replica_reads[index],
+                    available=self._down_until[index] <= now,
+                ) for index, pool in enumerate(self.replicas)],
+                'primary': self.primary.stats(),
+                'primary_reads': self.primary_reads,
+                'pinned_reads': self.pinned_reads,
+                'failovers': self.failovers,
+            }
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 성공 후 pin_seconds 동안 같은 클라이언트의 읽기를 primary 로 고정
+
+    Args:
+        router: ReplicaRouter (replica 가 없으면 쿠키를 내려주지 않음)
+        pin_seconds: 고정 시간(초), replica 복제 지연보다 길게 설정
+        cookie_name: pin 쿠키 이름
+        read_paths: POST 지만 조회만 하는 경로 (쓰기로 보지 않음, 예: /api/batch)
+    """
+
+    def __init__(self, app, router: ReplicaRouter, pin_seconds: int = 5, cookie_name: str = 'db_pin',
+                 read_paths=()):
+        self.app = app
+        self.router = router
+        self.read_paths = tuple(read_paths)
+        self.pin_seconds = pin_seconds
+        self.cookie_name = cookie_name
+        self._cookie_prefix = f'{cookie_name}='.encode('latin-1')
+        self._set_cookie = (f'{cookie_name}=1; Max-Age={pin_seconds}; Path=/; HttpOnly; SameSite=Lax').encode('latin-1')
+
+    def _has_pin(self, headers) -> bool:
+        for name, value in headers:
+            if name == b'cookie':
+                for part in value.split(b';'):
+                    if part.strip().startswith(self._cookie_prefix):
+                        return True
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or not self.router.replicas:
+            await self.app(scope, receive, send)
+            return
+
+        is_write = scope['method'] in WRITE_METHODS and scope['path'] not in self.read_paths
+        token = _pinned.set(is_write or self._has_pin(scope['headers']))
+
+        async def send_wrapper(message):
+            # 쓰기 요청이 성공(2xx/3xx)했을 때만 pin 쿠키 설정
+            if is_write and message['type'] == 'http.response.start' and message['status'] < 400:
+                message = dict(message, headers=list(message.get('headers', [])) + [(b'set-cookie', self._set_cookie)])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _pinned.reset(token)
@@ -0,0 +1,110 @@
+"""
+Row → JSON 직렬화 레이어
+- 쿼리별 컬럼 구성을 한 번만 컴파일해서 튜플 row를 dict로 변환 (RowCodec)
+- 변환 결과를 JSON bytes로 바로 인코딩 (orjson 설치 시 사용, 없으면 json 모듈)
+- FastAPI의 jsonable_encoder를 거치지 않도록 RawJSONResponse로 반환
+
+사용 예:
+    PRODUCT_CODEC = RowCodec([
+        'p_seq', 'p_name',
+        ('maker', ['m_seq', 'm_name']),
+    ])
+    return RawJSONResponse(PRODUCT_CODEC.dumps_results(rows))
+"""
+
+import json
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json 사용
+    orjson = None
+
+
+# ============================================
+# JSON 인코딩
+# ============================================
+def _default(value):
+    """기본 인코더가 처리하지 못하는 DB 타입 변환 (DECIMAL, DATETIME, TIME 등)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+if orjson is not None:
+    def dumps(obj) -> bytes:
+        """객체를 JSON bytes로 인코딩 (orjson)"""
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def dumps(obj) -> bytes:
+        """객체를 JSON bytes로 인코딩 (표준 json)"""
+        return json.dumps(
+            obj,
+            default=_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+class RawJSONResponse(Response):
+    """이미 인코딩된 JSON bytes를 그대로 내보내는 응답"""
+    media_type = "application/json"
+
+
+# ============================================
+# Row Codec
+# ============================================
+class RowCodec:
+    """
+    SELECT 컬럼 순서와 응답 필드 구조를 묶은 변환기
+
+    fields 항목:
+        - 'name'              : row의 다음 컬럼을 name 키로 출력
+        - ('group', [...])    : 하위 dict로 묶어서 출력 (중첩 가능)
+
+    생성 시 row → dict 변환 함수를 한 번 컴파일해 두고, 요청마다 재사용한다.
+    """
+
+    def __init__(self, fields):
+        self.fields = list(fields)
+        self.names = []  # 평탄화한 출력 경로 (컬럼 순서와 동일)
+        expr = self._build(self.fields, (), [0])
+        self.width = len(self.names)
+        self._convert = eval(f"lambda r: {expr}", {})  # noqa: S307 - 키는 repr로만 삽입됨
+
+    def _build(self, fields, prefix, counter):
+        parts = []
+        for field in fields:
+            if isinstance(field, tuple):
+                name, children = field
+                parts.append(f"{name!r}: {self._build(children, prefix + (name,), counter)}")
+            else:
+                parts.append(f"{field!r}: r[{counter[0]}]")
+                self.names.append(".".join(prefix + (field,)))
+                counter[0] += 1
+        return "{" + ", ".join(parts) + "}"
+
+    def to_dict(self, row) -> dict:
+        """row 1건을 dict로 변환"""
+        return self._convert(row)
+
+    def to_list(self, rows) -> list:
+        """row 목록을 dict 목록으로 변환"""
+        convert = self._convert
+        return [convert(row) for row in rows]
+
+    def dumps_result(self, row) -> bytes:
+        """단건 조회 응답 {"result": {...}} 를 JSON bytes로 인코딩"""
+        return dumps({"result": self._convert(row)})
+
+    def dumps_results(self, rows) -> bytes:
+        """목록 조회 응답 {"results": [...]} 를 JSON bytes로 인코딩"""
+        convert = self._convert
+        return dumps({"results": [convert(row) for row in rows]})
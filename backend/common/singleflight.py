@@ -0,0 +1,103 @@
+"""
+Single-flight 요청 병합
+- 같은 key로 동시에 들어온 조회는 DB 쿼리 1번을 공유 (먼저 온 요청이 실행, 나머지는 결과 대기)
+- ttl > 0 이면 완료된 결과를 짧게(micro-cache) 보관해서 직후 요청도 재사용
+- 실패(예외)는 대기 중인 요청에만 전달하고 캐시하지 않음
+
+사용 예:
+    product_detail_flight = SingleFlight(ttl=1.0)
+
+    row = await product_detail_flight.do(('full_detail', product_seq), fetch_row, product_seq)
+
+key에 테이블 버전(table_versions.versions(...))을 함께 넣으면 쓰기 직후에는 자동으로 새 key가 된다.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+from starlette.concurrency import run_in_threadpool
+
+
+class SingleFlight:
+    """
+    key별 진행 중인 조회를 공유하는 병합기
+
+    Args:
+        ttl: 완료된 결과 보관 시간(초). 0이면 진행 중인 요청만 병합
+        max_entries: micro-cache 최대 항목 수 (오래된 것부터 제거)
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._inflight = {}
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+        self.cache_hits = 0
+
+    async def do(self, key, func, *args):
+        """
+        key에 대한 결과 반환. func(*args)는 동기 함수(pymysql 조회)이며 스레드풀에서 실행된다.
+        """
+        if self.ttl > 0:
+            cached = self._cached(key)
+            if cached is not None:
+                return cached[0]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(self._run(key, func, args))
+            self._inflight[key] = task
+        else:
+            self.followers += 1
+        # 요청 1건이 취소(클라이언트 연결 끊김)되어도 공유 중인 조회는 계속 진행
+        return await asyncio.shield(task)
+
+    async def _run(self, key, func, args):
+        try:
+            result = await run_in_threadpool(func, *args)
+        finally:
+            self._inflight.pop(key, None)
+        if self.ttl > 0:
+            with self._lock:
+                self._results[key] = (result, time.monotonic() + self.ttl)
+                self._results.move_to_end(key)
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+        return result
+
+    def _cached(self, key):
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._results[key]
+                return None
+            self.cache_hits += 1
+            return (entry[0],)
+
+    def forget(self, key):
+        """micro-cache에서 key 제거"""
+        with self._lock:
+            self._results.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            cached = len(self._results)
+        return {
+            'leaders': self.leaders,
+            'followers': self.followers,
+            'cache_hits': self.cache_hits,
+            'inflight': len(self._inflight),
+            'cached': cached,
+        }
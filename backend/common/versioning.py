@@ -0,0 +1,157 @@
+"""
+테이블 버전 관리 및 조건부 GET (ETag / Last-Modified)
+- TableVersions: 테이블별 변경 카운터. 쓰기 핸들러가 commit 후 bump() 호출
+- ConditionalGetMiddleware: 경로별로 의존 테이블을 지정해 두면
+  If-None-Match 가 일치할 때 라우터(=DB)까지 가지 않고 304 응답
+
+주의:
+    If-Modified-Since 는 초 단위라 같은 초 안에 응답 후 다시 변경되면 구분할 수 없다.
+    이 미들웨어는 항상 strong ETag를 붙이므로 304 판단은 ETag로만 하고,
+    Last-Modified 는 참고용으로만 내려준다 (If-Modified-Since 만 보낸 요청은 200).
+    카운터는 프로세스 메모리에 있으므로 워커 1개(uvicorn 기본 실행) 기준이다.
+    API를 거치지 않고 DB를 직접 수정한 경우(더미 데이터 스크립트 등)에는
+    서버를 재시작하거나 bump()를 호출해야 한다. 재시작하면 epoch가 바뀌어 모든 ETag가 무효화된다.
+"""
+
+import hashlib
+import re
+import threading
+import time
+import uuid
+from email.utils import formatdate
+
+
+# ============================================
+# 테이블 버전
+# ============================================
+class TableVersions:
+    """테이블별 변경 카운터와 마지막 변경 시각"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._modified = {}
+        self.epoch = uuid.uuid4().hex[:8]
+        self.started_at = time.time()
+
+    def bump(self, *tables):
+        """테이블 변경 기록 (쓰기 핸들러에서 commit 직후 호출)"""
+        now = time.time()
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+                self._modified[table] = now
+
+    def versions(self, tables) -> tuple:
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def last_modified(self, tables) -> float:
+        """테이블들 중 가장 최근 변경 시각 (변경 이력이 없으면 서버 시작 시각)"""
+        with self._lock:
+            return max([self._modified.get(table, self.started_at) for table in tables] or [self.started_at])
+
+    def etag(self, tables, key: str = '') -> str:
+        """테이블 버전 + 요청 key(경로, 쿼리 등)로 만든 strong ETag"""
+        raw = f"{self.epoch}|{','.join(tables)}|{self.versions(tables)}|{key}"
+        return '"' + hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20] + '"'
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {'epoch': self.epoch, 'versions': dict(self._versions)}
+
+
+# ============================================
+# 조건부 GET 미들웨어
+# ============================================
+ERROR_BODY_PREFIX = b'{"result":"Error"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == '*':
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ConditionalGetMiddleware:
+    """
+    GET/HEAD 요청에 ETag, Last-Modified 를 붙이고, 클라이언트 캐시가 최신이면 304 응답
+
+    Args:
+        app: 감쌀 ASGI 앱
+        versions: TableVersions 인스턴스
+        rules: [(경로 정규식, (테이블, ...)), ...] - 앞에서부터 먼저 일치하는 규칙 사용
+    """
+
+    def __init__(self, app, versions: TableVersions, rules):
+        self.app = app
+        self.versions = versions
+        self.rules = [(re.compile(pattern), tuple(tables)) for pattern, tables in rules]
+
+    def tables_for(self, path: str):
+        for pattern, tables in self.rules:
+            if pattern.match(path):
+                return tables
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] not in ('GET', 'HEAD'):
+            await self.app(scope, receive, send)
+            return
+        tables = self.tables_for(scope['path'])
+        if tables is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode('latin-1'): v.decode('latin-1') for k, v in scope.get('headers', [])}
+        # 압축 인코딩별로 표현이 달라지므로 Accept-Encoding도 key에 포함
+        key = '|'.join([
+            scope['path'],
+            scope.get('query_string', b'').decode('latin-1'),
+            headers.get('accept-encoding', ''),
+        ])
+        # DB 조회 전에 버전을 읽어야 조회 중 변경이 생겨도 다음 요청에서 다시 받게 된다
+        etag = self.versions.etag(tables, key)
+        modified = int(self.versions.last_modified(tables))
+        validators = [
+            (b'etag', etag.encode('latin-1')),
+            (b'last-modified', formatdate(modified, usegmt=True).encode('latin-1')),
+            (b'cache-control', b'no-cache'),
+        ]
+
+        if self._is_fresh(headers, etag):
+            await send({'type': 'http.response.start', 'status': 304, 'headers': validators})
+            await send({'type': 'http.response.body', 'body': b''})
+            return
+
+        pending = []
+
+        async def send_with_validators(message):
+            # 이 API는 오류도 200 + {"result": "Error"} 로 응답하므로,
+            # 첫 본문을 확인한 뒤 정상 응답에만 ETag를 붙인다 (오류 응답이 캐시되지 않도록)
+            if message['type'] == 'http.response.start' and message['status'] == 200:
+                pending.append(message)
+                return
+            if pending and message['type'] == 'http.response.body':
+                start = pending.pop()
+                if not message.get('body', b'').startswith(ERROR_BODY_PREFIX):
+                    start = dict(start, headers=list(start.get('headers', [])) + validators)
+                await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
+
+    @staticmethod
+    def _is_fresh(headers: dict, etag: str) -> bool:
+        # strong ETag가 항상 있으므로 If-Modified-Since 는 무시한다 (RFC 7232 3.3 과 같은 우선순위)
+        # 초 단위 비교로는 같은 초 안의 변경을 놓쳐 오래된 캐시에 304를 줄 수 있다
+        if_none_match = headers.get('if-none-match')
+        if if_none_match is None:
+            return False
+        return _etag_matches(if_none_match, etag)
@@ -0,0 +1,269 @@
+"""
+Write-behind 버퍼 (INSERT 지연 일괄 처리)
+- 요청 핸들러는 행을 메모리 큐(크기 제한)에 넣고 바로 응답
+- 백그라운드 작업이 batch_size 개가 모이거나 flush_interval 초가 지나면 multi-row INSERT 1번으로 저장
+- 큐가 가득 차면 submit()이 자리가 날 때까지 대기 (메모리 무제한 증가 방지)
+- DB 장애(연결/운영 오류)로 저장에 실패한 행은 spill 파일(JSON Lines)에 기록, 다음 flush 성공 시 다시 INSERT
+- 데이터 오류(IntegrityError/DataError, 예: FK에 없는 cid)로 배치가 거부되면 한 행씩 다시 저장하고,
+  거부된 행만 dead-letter 파일에 기록 (잘못된 행 1개 때문에 나머지 행이 spill/재처리를 반복하지 않도록)
+- 종료(stop) 시 큐에 남은 행을 모두 flush (실패분은 spill)
+- 큐 길이, flush 지연 시간 등 통계 제공
+
+주의:
+    응답 시점에는 아직 DB에 저장되지 않았으므로 INSERT id를 돌려줄 수 없다.
+    데이터 오류도 응답 후에 발생하므로, 호출하는 쪽에서 미리 확인할 수 있는 값(FK 등)은 submit 전에 확인한다.
+    dead-letter 된 행은 자동으로 다시 저장하지 않는다 (원인을 확인한 뒤 수동 처리).
+    프로세스가 강제 종료(kill -9)되면 큐에 있던 행은 유실된다.
+
+사용 예:
+    writer = WriteBehindBuffer(
+        'INSERT INTO LoginHistory (cid, loginTime) VALUES (%s, %s)',
+        connect_db, spill_path='spill/login_history.jsonl',
+    )
+    await writer.start()          # lifespan 시작
+    await writer.submit((cid, login_time))
+    await writer.stop()           # lifespan 종료
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+import pymysql
+from starlette.concurrency import run_in_threadpool
+
+# 같은 행을 다시 INSERT 해도 계속 실패하는 오류 (spill 후 재처리하지 않고 행 단위로 걸러냄)
+DATA_ERRORS = (pymysql.err.IntegrityError, pymysql.err.DataError)
+
+
+class WriteBehindBuffer:
+    """
+    Args:
+        insert_sql: 'INSERT INTO t (a, b) VALUES (%s, %s)' 형태 (executemany가 multi-row INSERT로 묶음)
+        connect: DB 연결 함수 (connect_db)
+        max_queue: 큐 최대 행 수
+        batch_size: 한 번에 INSERT할 최대 행 수
+        flush_interval: 행이 batch_size 미만이어도 이 시간(초)이 지나면 flush
+        spill_path: 저장 실패 행을 기록할 파일 (None이면 기록하지 않고 버림)
+        dead_letter_path: 데이터 오류로 거부된 행을 기록할 파일
+            (None이면 spill_path 옆의 *.rejected.jsonl, spill_path도 None이면 기록하지 않고 버림)
+        on_flush: on_flush(curs, rows) - INSERT와 같은 트랜잭션에서 추가로 실행할 작업 (요약 테이블 갱신 등)
+    """
+
+    def __init__(self, insert_sql: str, connect, max_queue: int = 10000, batch_size: int = 500,
+                 flush_interval: float = 0.5, spill_path: str = None, dead_letter_path: str = None,
+                 on_flush=None):
+        self.insert_sql = insert_sql
+        self.connect = connect
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_path = spill_path
+        if dead_letter_path is None and spill_path:
+            dead_letter_path = os.path.splitext(spill_path)[0] + '.rejected.jsonl'
+        self.dead_letter_path = dead_letter_path
+        self.on_flush = on_flush
+        self._queue = None
+        self._task = None
+        self._spill_lock = threading.Lock()
+        # 통계
+        self.enqueued = 0
+        self.flushed_rows = 0
+        self.flushes = 0
+        self.failures = 0
+        self.spilled_rows = 0
+        self.replayed_rows = 0
+        self.dead_lettered_rows = 0
+        self.last_flush_ms = None
+        self.max_flush_ms = 0.0
+        self.total_flush_ms = 0.0
+
+    # ============================================
+    # 시작 / 종료
+    # ============================================
+    async def start(self):
+        if self._task is not None:
+            return
+        # 이전 실행에서 남은 spill 파일 먼저 재처리 (재처리 도중 종료된 파일 포함)
+        if self.spill_path and os.path.exists(self.spill_path + '.replaying') and not os.path.exists(self.spill_path):
+            os.replace(self.spill_path + '.replaying', self.spill_path)
+        await run_in_threadpool(self._replay_spill)
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """남은 행을 모두 flush하고 백그라운드 작업 종료"""
+        if self._task is None:
+            return
+        await self._queue.put(None)     # 종료 신호
+        await self._task
+        self._task = None
+
+    # ============================================
+    # 적재
+    # ============================================
+    async def submit(self, row: tuple):
+        """
+        행을 큐에 추가. 큐가 가득 찼으면 자리가 날 때까지 대기
+        start() 전이면 (개별 실행 등) 바로 INSERT
+        """
+        if self._task is None:
+            await run_in_threadpool(self._write, [row])
+            return
+        await self._queue.put(row)
+        self.enqueued += 1
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            item = await self._queue.get()
+            if item is None:
+                stopping = True
+            else:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+            if stopping:
+                # 종료 신호 뒤에 남은 행까지 모두 모음
+                while not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item is not None:
+                        batch.append(item)
+            for start in range(0, len(batch), self.batch_size):
+                await run_in_threadpool(self._flush, batch[start:start + self.batch_size])
+
+    # ============================================
+    # DB 저장 / spill
+    # ============================================
+    def _write(self, rows):
+        conn = self.connect()
+        try:
+            curs = conn.cursor()
+            curs.executemany(self.insert_sql, rows)
+            if self.on_flush is not None:
+                self.on_flush(curs, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _store(self, rows) -> tuple:
+        """
+        rows 저장. 데이터 오류로 배치가 거부되면 어느 행인지 알 수 없으므로 한 행씩 다시 저장하고
+        거부된 행만 dead-letter. 연결/운영 오류는 그 시점에 저장하지 못한 행을 돌려준다 (spill 대상)
+
+        Returns:
+            tuple: (저장한 행 수, 저장하지 못한 행 목록, 오류)
+        """
+        try:
+            self._write(rows)
+            return len(rows), [], None
+        except DATA_ERRORS:
+            pass
+        except Exception as e:
+            return 0, rows, e
+        written = 0
+        for index, row in enumerate(rows):
+            try:
+                self._write([row])
+                written += 1
+            except DATA_ERRORS as e:
+                self._dead_letter(row, e)
+            except Exception as e:
+                return written, rows[index:], e
+        return written, [], None
+
+    def _flush(self, rows):
+        started = time.perf_counter()
+        written, pending, error = self._store(rows)
+        self.flushed_rows += written
+        if pending:
+            self.failures += 1
+            self._spill(pending, error)
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.flushes += 1
+        self.last_flush_ms = round(elapsed_ms, 3)
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self.total_flush_ms += elapsed_ms
+        # DB가 살아났으면 spill 된 행도 이어서 저장
+        self._replay_spill()
+
+    def _spill(self, rows, error):
+        if not self.spill_path:
+            print(f"❌ write-behind 저장 실패, {len(rows)}건 버림: {error}")
+            return
+        with self._spill_lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.spill_path)), exist_ok=True)
+            with open(self.spill_path, 'a', encoding='utf-8') as f:
+                for row in rows:
+                    f.write(json.dumps(list(row), ensure_ascii=False, default=str) + '\n')
+            self.spilled_rows += len(rows)
+        print(f"⚠️  write-behind 저장 실패, {len(rows)}건 spill: {error}")
+
+    def _dead_letter(self, row, error):
+        self.dead_lettered_rows += 1
+        if not self.dead_letter_path:
+            print(f"❌ write-behind 데이터 오류, 1건 버림: {error} {row!r}")
+            return
+        with self._spill_lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.dead_letter_path)), exist_ok=True)
+            with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'row': list(row), 'error': str(error), 'at': datetime.now().isoformat()},
+                                   ensure_ascii=False, default=str) + '\n')
+        print(f"⚠️  write-behind 데이터 오류, 1건 dead-letter: {error}")
+
+    def _replay_spill(self):
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return
+        with self._spill_lock:
+            replaying = self.spill_path + '.replaying'
+            os.replace(self.spill_path, replaying)
+        with open(replaying, encoding='utf-8') as f:
+            rows = [tuple(json.loads(line)) for line in f if line.strip()]
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start:start + self.batch_size]
+            written, pending, error = self._store(chunk)
+            self.replayed_rows += written
+            if pending:
+                # 아직 저장 못 한 나머지는 다시 spill 파일로
+                self._spill(pending + rows[start + len(chunk):], error)
+                break
+        os.remove(replaying)
+
+    # ============================================
+    # 통계
+    # ============================================
+    def stats(self) -> dict:
+        return {
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_queue': self.max_queue,
+            'running': self._task is not None,
+            'enqueued': self.enqueued,
+            'flushed_rows': self.flushed_rows,
+            'flushes': self.flushes,
+            'failures': self.failures,
+            'spilled_rows': self.spilled_rows,
+            'replayed_rows': self.replayed_rows,
+            'dead_lettered_rows': self.dead_lettered_rows,
+            'last_flush_ms': self.last_flush_ms,
+            'avg_flush_ms': round(self.total_flush_ms / self.flushes, 3) if self.flushes else None,
+            'max_flush_ms': round(self.max_flush_ms, 3),
+        }
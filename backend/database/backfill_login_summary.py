@@ -0,0 +1,79 @@
+"""
+LoginHistory → LoginSummary 백필
+- 고객 ID 범위(batch) 단위로 고객별 최신 로그인 1행 + 로그인 건수를 계산해 upsert
+- 범위마다 커밋하므로 긴 잠금 없이 운영 중에도 실행 가능, 여러 번 실행해도 결과 동일
+- 이미 있는 LoginSummary 행은 되돌리지 않음:
+    - loginCount 는 더 큰 값 유지 (prune_login_history.py 로 이력을 지운 뒤 실행해도 줄어들지 않음)
+    - 상태 컬럼(lStatus 등)은 이력의 최신 로그인이 요약보다 새로울 때만 갱신
+      (PATCH /by_customer/{cid}/status 로 바꾼 상태를 덮어쓰지 않음)
+
+사용법 (backend 폴더에서):
+    python database/backfill_login_summary.py
+    python database/backfill_login_summary.py --batch 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.connection import connect_db
+
+BACKFILL_SQL = """
+INSERT INTO LoginSummary (cid, lastLoginTime, lStatus, lVersion, lAddress, lPaymentMethod, loginCount)
+SELECT cid, loginTime, lStatus, lVersion, lAddress, lPaymentMethod, cnt
+FROM (
+    SELECT h.cid, h.loginTime, h.lStatus, h.lVersion, h.lAddress, h.lPaymentMethod,
+           ROW_NUMBER() OVER (PARTITION BY h.cid ORDER BY h.loginTime DESC, h.id DESC) AS rn,
+           COUNT(*) OVER (PARTITION BY h.cid) AS cnt
+    FROM LoginHistory h
+    WHERE h.cid >= %s AND h.cid < %s
+) latest
+WHERE rn = 1
+ON DUPLICATE KEY UPDATE
+    lStatus = IF(VALUES(lastLoginTime) > IFNULL(lastLoginTime, ''), VALUES(lStatus), lStatus),
+    lVersion = IF(VALUES(lastLoginTime) > IFNULL(lastLoginTime, ''), VALUES(lVersion), lVersion),
+    lAddress = IF(VALUES(lastLoginTime) > IFNULL(lastLoginTime, ''), VALUES(lAddress), lAddress),
+    lPaymentMethod = IF(VALUES(lastLoginTime) > IFNULL(lastLoginTime, ''), VALUES(lPaymentMethod), lPaymentMethod),
+    lastLoginTime = GREATEST(IFNULL(lastLoginTime, ''), IFNULL(VALUES(lastLoginTime), '')),
+    loginCount = GREATEST(loginCount, VALUES(loginCount))
+"""
+
+
+def backfill(batch: int):
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute("SELECT MIN(cid), MAX(cid) FROM LoginHistory")
+        min_cid, max_cid = curs.fetchone()
+        if min_cid is None:
+            print("LoginHistory가 비어 있습니다.")
+            return
+
+        print(f"LoginSummary 백필 중... (cid {min_cid} ~ {max_cid}, batch {batch})")
+        started = time.perf_counter()
+        customers = 0
+        for start in range(min_cid, max_cid + 1, batch):
+            curs.execute(BACKFILL_SQL, (start, start + batch))
+            conn.commit()
+            # ON DUPLICATE KEY UPDATE: 신규 1, 변경 2, 동일 0
+            customers += curs.rowcount
+            print(f"  ✅ cid {start} ~ {min(start + batch - 1, max_cid)} 완료")
+
+        curs.execute("SELECT COUNT(*) FROM LoginSummary")
+        total = curs.fetchone()[0]
+        print(f"\n🎉 백필 완료: LoginSummary {total}행 ({time.perf_counter() - started:.1f}초)")
+    except Exception as e:
+        print(f"❌ 에러 발생: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LoginHistory → LoginSummary 백필")
+    parser.add_argument('--batch', type=int, default=1000, help='한 번에 처리할 고객 ID 범위')
+    args = parser.parse_args()
+    backfill(args.batch)
@@ -0,0 +1,110 @@
+"""
+기존 평문 비밀번호를 scrypt 해시로 일괄 변환 (app_new_form: user.u_password, staff.s_password)
+
+- PK 순서대로 batch 단위(keyset)로 읽고, 해시 계산은 프로세스 풀에서 병렬 실행
+- UPDATE는 "읽었을 때의 값과 같을 때만" 적용 → 실행 중 API로 바뀐 비밀번호는 덮어쓰지 않음
+- 이미 해시된 행은 건너뛰므로 중단 후 다시 실행해도 안전
+- 변환하지 않은 행도 로그인 시 자동으로 해시로 교체된다 (common/credentials.py needs_rehash)
+
+사용법 (backend 폴더에서):
+    python database/hash_existing_passwords.py                 # user, staff 모두
+    python database/hash_existing_passwords.py --table staff
+    python database/hash_existing_passwords.py --batch 200 --workers 8
+    python database/hash_existing_passwords.py --dry-run       # 대상 건수만 확인
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_new_form.database.connection import connect_db
+from common.credentials import hash_password, SCHEME
+
+# 테이블별 (PK 컬럼, 비밀번호 컬럼)
+TARGETS = {
+    'user': ('u_seq', 'u_password'),
+    'staff': ('s_seq', 's_password'),
+}
+
+
+def _hash_rows(rows):
+    """프로세스 풀 작업: [(pk, 평문), ...] → [(해시, pk, 평문), ...]"""
+    return [(hash_password(plain), pk, plain) for pk, plain in rows]
+
+
+def count_plain(curs, table: str) -> int:
+    pk, col = TARGETS[table]
+    curs.execute(f"SELECT COUNT(*) FROM {table} WHERE {col} NOT LIKE %s", (SCHEME + '$%',))
+    return curs.fetchone()[0]
+
+
+def migrate_table(table: str, batch: int, workers: int, dry_run: bool):
+    pk, col = TARGETS[table]
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        total = count_plain(curs, table)
+        print(f"\n📋 {table}.{col}: 평문 {total}건")
+        if dry_run or total == 0:
+            return 0
+
+        started = time.perf_counter()
+        updated = 0
+        last_pk = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                curs.execute(f"""
+                    SELECT {pk}, {col} FROM {table}
+                    WHERE {pk} > %s AND {col} NOT LIKE %s
+                    ORDER BY {pk}
+                    LIMIT %s
+                """, (last_pk, SCHEME + '$%', batch))
+                rows = curs.fetchall()
+                if not rows:
+                    break
+                last_pk = rows[-1][0]
+
+                # batch를 worker 수만큼 나눠서 병렬 해시
+                size = max(1, -(-len(rows) // workers))
+                chunks = [rows[i:i + size] for i in range(0, len(rows), size)]
+                params = [item for result in pool.map(_hash_rows, chunks) for item in result]
+
+                curs.executemany(
+                    f"UPDATE {table} SET {col}=%s WHERE {pk}=%s AND {col}=%s",
+                    params
+                )
+                conn.commit()
+                updated += curs.rowcount
+                elapsed = time.perf_counter() - started
+                print(f"   ✅ {updated}/{total}건 ({updated / elapsed:.0f}건/초)")
+        return updated
+    except Exception as e:
+        print(f"❌ 에러 발생: {e}")
+        conn.rollback()
+        return 0
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="평문 비밀번호 → scrypt 해시 일괄 변환")
+    parser.add_argument('--table', choices=list(TARGETS) + ['all'], default='all')
+    parser.add_argument('--batch', type=int, default=500, help='한 번에 읽고 커밋할 행 수')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='해시 계산 프로세스 수')
+    parser.add_argument('--dry-run', action='store_true', help='대상 건수만 출력')
+    args = parser.parse_args()
+
+    tables = list(TARGETS) if args.table == 'all' else [args.table]
+    print("=" * 60)
+    print(f"🔐 비밀번호 해시 변환 (batch={args.batch}, workers={args.workers})")
+    print("=" * 60)
+    total = sum(migrate_table(table, args.batch, args.workers, args.dry_run) for table in tables)
+    print(f"\n🎉 완료: {total}건 변환")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+제품 카탈로그 파일(CSV / JSONL) 일괄 등록 (app_new_form: product)
+
+- API(POST /api/product_imports)와 같은 처리: app_new_form/api/product_import.py import_stream
+- 파일을 한 줄씩 읽어 청크 단위로 검증 + multi-row upsert (청크마다 commit)
+- 기존 제품은 파일에 값이 있는 컬럼만 갱신 (p_stock 은 갱신하지 않음), 이름이 다른 기존 제품과 겹치면 충돌 오류
+- 중간에 실패하면 commit 된 마지막 줄 번호를 출력 (그 다음 줄부터 다시 실행)
+- 카테고리/제조사는 이름으로 지정 (kc_name, cc_name, sc_name, gc_name, m_name), 없는 이름은 오류 행으로 보고
+- 실행 중인 API 서버의 제품 캐시는 비우지 않으므로, 서버 캐시 TTL(최대 5분) 동안 이전 값이 보일 수 있음
+
+사용법 (backend 폴더에서):
+    python database/import_products.py catalog.csv
+    python database/import_products.py catalog.jsonl --chunk 2000
+    python database/import_products.py catalog.csv --dry-run --errors errors.jsonl
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_new_form.database.connection import connect_db
+from app_new_form.api.product_import import CHUNK_ROWS, detect_format, import_stream
+
+
+def print_progress(report):
+    print(f"  ... {report['total']:,}행 처리 (성공 {report['upserted']:,}, 오류 {report['failed']:,})", end='\r')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제품 카탈로그 CSV/JSONL 일괄 등록")
+    parser.add_argument('path', help='CSV(헤더 포함) 또는 JSONL 파일')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help='생략하면 확장자로 판단')
+    parser.add_argument('--chunk', type=int, default=CHUNK_ROWS, help='한 번에 upsert 할 행 수')
+    parser.add_argument('--dry-run', action='store_true', help='검증만 하고 저장하지 않음')
+    parser.add_argument('--errors', help='오류 행을 JSONL로 저장할 파일 (최대 1000행)')
+    args = parser.parse_args()
+
+    fmt = detect_format(args.path, args.format)
+    conn = connect_db()
+    try:
+        with open(args.path, encoding='utf-8-sig', newline='') as stream:
+            report = import_stream(stream, fmt, conn, chunk_rows=args.chunk, dry_run=args.dry_run,
+                                   progress=print_progress)
+    finally:
+        conn.close()
+
+    print()
+    if 'error' in report:
+        print(f"❌ 처리 중 오류: {report['error']}")
+        if report['committed_through_line']:
+            print(f"   {report['committed_through_line']}행까지 저장됨 (그 다음 줄부터 다시 실행)")
+        else:
+            print("   저장된 행 없음")
+    print(f"{'🧪 검증 완료 (dry-run)' if args.dry_run else '🎉 등록 완료'}: "
+          f"{report['total']:,}행 중 성공 {report['upserted']:,} (새 제품 {report['inserted']:,}, 갱신 {report['updated']:,}), "
+          f"오류 {report['failed']:,} ({report['elapsed_ms'] / 1000:.1f}초, {report['rows_per_sec'] or 0:,} rows/s)")
+    for item in report['errors'][:20]:
+        print(f"  ❌ {item['line']}행: {', '.join(item['errors'])}")
+    if report['failed'] > 20:
+        print(f"  ... 외 {report['failed'] - 20:,}행")
+    if args.errors and report['errors']:
+        with open(args.errors, 'w', encoding='utf-8') as out:
+            for item in report['errors']:
+                out.write(json.dumps(item, ensure_ascii=False) + '\n')
+        print(f"  📄 오류 행: {args.errors}")
+    if 'error' in report:
+        return 2
+    return 1 if report['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,6 +27,7 @@ USE shoes_store_db;
 -- ============================================
 SET FOREIGN_KEY_CHECKS = 0;
 
+DROP TABLE IF EXISTS LoginSummary;
 DROP TABLE IF EXISTS LoginHistory;
 DROP TABLE IF EXISTS PurchaseItem;
 DROP TABLE IF EXISTS Purchase;
@@ -151,7 +152,22 @@ CREATE TABLE LoginHistory (
     lAddress VARCHAR(255),
     lPaymentMethod VARCHAR(100),
     FOREIGN KEY (cid) REFERENCES Customer(id) ON DELETE CASCADE,
-    INDEX idx_login_history_cid (cid)
+    INDEX idx_login_history_cid_time (cid, loginTime),
+    INDEX idx_login_history_time (loginTime)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- LoginSummary (고객별 최신 로그인 상태, 고객당 1행)
+-- LoginHistory는 추가만 하는 이력, 상태 변경/최신 로그인 조회는 이 테이블에서 O(1)
+CREATE TABLE LoginSummary (
+    cid INT PRIMARY KEY,
+    lastLoginTime VARCHAR(50),
+    lStatus VARCHAR(50),
+    lVersion DECIMAL(5,2),
+    lAddress VARCHAR(255),
+    lPaymentMethod VARCHAR(100),
+    loginCount INT NOT NULL DEFAULT 0,
+    updatedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (cid) REFERENCES Customer(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- ============================================
@@ -371,6 +387,17 @@ INSERT INTO LoginHistory (cid, loginTime, lStatus, lVersion, lAddress, lPaymentM
 (5, '2025-12-12 07:20', '2', 1.0, '강남구', 'KaKaoPay'),
 (6, '2023-12-12 07:20', '1', 1.0, '강남구', 'KaKaoPay');
 
+-- LoginSummary (LoginHistory에서 고객별 최신 로그인 1행 + 건수)
+INSERT INTO LoginSummary (cid, lastLoginTime, lStatus, lVersion, lAddress, lPaymentMethod, loginCount)
+SELECT cid, loginTime, lStatus, lVersion, lAddress, lPaymentMethod, cnt
+FROM (
+    SELECT h.*,
+           ROW_NUMBER() OVER (PARTITION BY cid ORDER BY loginTime DESC, id DESC) AS rn,
+           COUNT(*) OVER (PARTITION BY cid) AS cnt
+    FROM LoginHistory h
+) latest
+WHERE rn = 1;
+
 -- ============================================
 -- 초기화 완료
 -- ============================================
@@ -0,0 +1,304 @@
+"""
+purchase_item 월 파티션 관리 (app_new_form)
+- 미래 파티션 미리 생성: 현재 월 ~ +ahead 개월 파티션이 없으면 pmax(MAXVALUE)에서 분리
+- 오래된 파티션 보관: retain 개월보다 오래된 월은 purchase_item_history(압축 테이블) 또는
+  gzip JSON Lines 파일로 옮긴 뒤 DROP PARTITION (구매 행은 대량 DELETE 없음)
+- 그 월의 구매를 참조하는 수령(pickup)/반품(refund) 행도 같이 pickup_history / refund_history
+  (또는 파일)로 옮기고 삭제 → 남은 pickup 이 없는 구매를 가리키는 일이 없음
+- 처리 전 반품(ref_date 없음)이 있는 파티션은 건너뜀 (지점 대시보드에서 처리해야 하므로),
+  --force 일 때만 같이 보관
+- 매일 cron으로 실행, 여러 번 실행해도 결과 동일
+
+먼저 database/renew/Partitioning/partition_purchase_item.sql 실행 후 --init 으로 파티션 생성
+
+사용법 (backend 폴더에서):
+    python database/manage_purchase_item_partitions.py --init           # 최초 1회: 월 파티션으로 변환
+    python database/manage_purchase_item_partitions.py                  # 미래 파티션 생성 + 보관
+    python database/manage_purchase_item_partitions.py --retain 36 --ahead 6
+    python database/manage_purchase_item_partitions.py --archive file --archive-dir /backup/purchase_item
+    python database/manage_purchase_item_partitions.py --dry-run        # 실행할 DDL만 출력
+    python database/manage_purchase_item_partitions.py --force          # 처리 전 반품이 있는 파티션도 보관
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+from datetime import date, datetime
+
+import pymysql
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_new_form.database.connection import connect_db
+
+TABLE = 'purchase_item'
+HISTORY_TABLE = 'purchase_item_history'
+COLUMNS = 'b_seq, br_seq, u_seq, p_seq, b_price, b_quantity, b_date, b_tnum, b_status'
+MAX_PARTITION = 'pmax'
+
+# 보관하는 구매를 참조하는 행 (refund → pickup → purchase_item, 삭제는 이 순서로)
+PICKUP_HISTORY_TABLE = 'pickup_history'
+PICKUP_COLUMNS = 'pic_seq, b_seq, u_seq, created_at'
+REFUND_HISTORY_TABLE = 'refund_history'
+REFUND_COLUMNS = 'ref_seq, ref_date, ref_reason, ref_re_seq, ref_re_content, u_seq, s_seq, pic_seq'
+
+
+# ============================================
+# 월 계산
+# ============================================
+def month_start(value) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"p{month:%Y%m}"
+
+
+def partition_clause(month: date) -> str:
+    """[month, 다음 달) 범위 파티션"""
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1):%Y-%m-%d}')"
+
+
+# ============================================
+# 현재 파티션 조회
+# ============================================
+def list_partitions(curs):
+    """[(파티션 이름, 상한 date 또는 None(MAXVALUE)), ...] (파티션이 없으면 빈 목록)"""
+    curs.execute("""
+        SELECT PARTITION_NAME, PARTITION_DESCRIPTION
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+        ORDER BY PARTITION_ORDINAL_POSITION
+    """, (TABLE,))
+    partitions = []
+    for name, description in curs.fetchall():
+        if description == 'MAXVALUE':
+            partitions.append((name, None))
+        else:
+            # RANGE COLUMNS 상한: '2025-02-01 00:00:00' (따옴표 포함)
+            partitions.append((name, datetime.fromisoformat(description.strip("'")).date()))
+    return partitions
+
+
+def execute(conn, sql: str, dry_run: bool, params=None):
+    return execute_all(conn, [sql], dry_run, params)[0]
+
+
+def execute_all(conn, statements: list, dry_run: bool, params=None):
+    """여러 문장을 한 트랜잭션으로 실행 → 문장별 영향받은 행 수"""
+    counts = []
+    curs = conn.cursor()
+    for sql in statements:
+        print(f"   {' '.join(sql.split())}")
+        if not dry_run:
+            curs.execute(sql, params)
+        counts.append(0 if dry_run else curs.rowcount)
+    if not dry_run:
+        conn.commit()
+    return counts
+
+
+# ============================================
+# 최초 변환
+# ============================================
+def init_partitions(conn, ahead: int, dry_run: bool):
+    curs = conn.cursor()
+    if list_partitions(curs):
+        print("ℹ️  이미 파티션 테이블입니다. --init 없이 실행하세요.")
+        return
+    curs.execute(f"SELECT MIN(b_date) FROM {TABLE}")
+    oldest = curs.fetchone()[0]
+    current = month_start(date.today())
+    first = month_start(oldest) if oldest else current
+    last = add_months(current, ahead)
+
+    months = []
+    month = first
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+
+    print(f"📦 {TABLE} 월 파티션 변환: {partition_name(first)} ~ {partition_name(last)} ({len(months)}개 + {MAX_PARTITION})")
+    clauses = [partition_clause(month) for month in months]
+    clauses.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    execute(conn, f"ALTER TABLE {TABLE} PARTITION BY RANGE COLUMNS(b_date) ({', '.join(clauses)})", dry_run)
+
+
+# ============================================
+# 미래 파티션 생성
+# ============================================
+def ensure_future_partitions(conn, ahead: int, dry_run: bool):
+    partitions = list_partitions(conn.cursor())
+    if not partitions:
+        print("❌ 파티션 테이블이 아닙니다. 먼저 --init 을 실행하세요.")
+        return False
+    # 마지막 월 파티션 다음 달부터 필요한 만큼 pmax에서 분리 (pmax가 비어 있으면 즉시 완료)
+    bounds = [bound for _, bound in partitions if bound is not None]
+    month = max(bounds) if bounds else month_start(date.today())
+    last = add_months(month_start(date.today()), ahead)
+    months = []
+    while month <= last:
+        months.append(month)
+        month = add_months(month, 1)
+
+    if not months:
+        print(f"✅ 미래 파티션 충분 (~ {partition_name(add_months(max(bounds), -1))})")
+        return True
+    print(f"📅 미래 파티션 생성: {', '.join(partition_name(m) for m in months)}")
+    clauses = [partition_clause(m) for m in months]
+    clauses.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    execute(conn, f"ALTER TABLE {TABLE} REORGANIZE PARTITION {MAX_PARTITION} INTO ({', '.join(clauses)})", dry_run)
+    return True
+
+
+# ============================================
+# 오래된 파티션 보관
+# ============================================
+def qualified(columns: str, alias: str) -> str:
+    return ', '.join(f"{alias}.{column.strip()}" for column in columns.split(','))
+
+
+def dependent_selects(name: str) -> dict:
+    """파티션 name 의 구매를 참조하는 행 조회 FROM/JOIN 절 (보관/삭제에서 같이 사용)"""
+    pickups = f"pickup pk JOIN {TABLE} PARTITION ({name}) pi ON pi.b_seq = pk.b_seq"
+    return {
+        'pickup': pickups,
+        'refund': f"refund rf JOIN pickup pk ON pk.pic_seq = rf.pic_seq JOIN {TABLE} PARTITION ({name}) pi ON pi.b_seq = pk.b_seq",
+    }
+
+
+def delete_dependents(name: str) -> list:
+    joins = dependent_selects(name)
+    return [
+        f"DELETE rf FROM {joins['refund']}",
+        f"DELETE pk FROM {joins['pickup']}",
+    ]
+
+
+def archive_to_table(conn, name: str, dry_run: bool):
+    """
+    반품/수령/구매 행을 history 테이블로 복사 + 반품/수령 행 삭제 (한 트랜잭션)
+    INSERT IGNORE: 복사 후 DROP 전에 중단되었다가 다시 실행해도 중복 없음
+    """
+    joins = dependent_selects(name)
+    counts = execute_all(conn, [
+        f"""INSERT IGNORE INTO {REFUND_HISTORY_TABLE} ({REFUND_COLUMNS})
+            SELECT {qualified(REFUND_COLUMNS, 'rf')} FROM {joins['refund']}""",
+        f"""INSERT IGNORE INTO {PICKUP_HISTORY_TABLE} ({PICKUP_COLUMNS})
+            SELECT {qualified(PICKUP_COLUMNS, 'pk')} FROM {joins['pickup']}""",
+        f"""INSERT IGNORE INTO {HISTORY_TABLE} ({COLUMNS})
+            SELECT {COLUMNS} FROM {TABLE} PARTITION ({name})""",
+    ] + delete_dependents(name), dry_run)
+    return {'refund': counts[0], 'pickup': counts[1], TABLE: counts[2]}
+
+
+def write_jsonl_gz(conn, sql: str, columns: str, path: str, dry_run: bool, keep_empty: bool = True):
+    print(f"   {' '.join(sql.split())} → {path}")
+    if dry_run:
+        return 0
+    names = [column.strip() for column in columns.split(',')]
+    # 서버 측 커서로 한 행씩 읽어서 메모리 사용량 일정하게 유지
+    curs = conn.cursor(pymysql.cursors.SSCursor)
+    written = 0
+    with gzip.open(path + '.tmp', 'wt', encoding='utf-8') as f:
+        curs.execute(sql)
+        for row in curs:
+            f.write(json.dumps(dict(zip(names, row)), ensure_ascii=False, default=str) + '\n')
+            written += 1
+    curs.close()
+    if written or keep_empty:
+        os.replace(path + '.tmp', path)
+    else:
+        os.remove(path + '.tmp')
+    return written
+
+
+def archive_to_file(conn, name: str, archive_dir: str, dry_run: bool):
+    """
+    반품/수령/구매 행을 gzip 파일로 저장한 뒤 반품/수령 행 삭제
+    반품/수령 파일은 실행 시각을 붙여 새로 만듦 (삭제 후 DROP 전에 중단되었다가 다시 실행해도
+    이전 실행에서 옮긴 행이 들어 있는 파일을 빈 파일로 덮어쓰지 않도록)
+    """
+    if not dry_run:
+        os.makedirs(archive_dir, exist_ok=True)
+    joins = dependent_selects(name)
+    run = f"{datetime.now():%Y%m%d%H%M%S}"
+    counts = {
+        'refund': write_jsonl_gz(
+            conn, f"SELECT {qualified(REFUND_COLUMNS, 'rf')} FROM {joins['refund']} ORDER BY rf.ref_seq",
+            REFUND_COLUMNS, os.path.join(archive_dir, f"refund_{name}_{run}.jsonl.gz"), dry_run, keep_empty=False),
+        'pickup': write_jsonl_gz(
+            conn, f"SELECT {qualified(PICKUP_COLUMNS, 'pk')} FROM {joins['pickup']} ORDER BY pk.pic_seq",
+            PICKUP_COLUMNS, os.path.join(archive_dir, f"pickup_{name}_{run}.jsonl.gz"), dry_run, keep_empty=False),
+        TABLE: write_jsonl_gz(
+            conn, f"SELECT {COLUMNS} FROM {TABLE} PARTITION ({name}) ORDER BY b_seq",
+            COLUMNS, os.path.join(archive_dir, f"{TABLE}_{name}.jsonl.gz"), dry_run),
+    }
+    execute_all(conn, delete_dependents(name), dry_run)
+    return counts
+
+
+def archive_old_partitions(conn, retain: int, mode: str, archive_dir: str, dry_run: bool, force: bool = False):
+    cutoff = add_months(month_start(date.today()), -retain)
+    expired = [(name, bound) for name, bound in list_partitions(conn.cursor()) if bound is not None and bound <= cutoff]
+    if not expired:
+        print(f"✅ 보관 대상 없음 ({cutoff:%Y-%m} 이전 파티션 없음)")
+        return
+    if mode == 'none':
+        print(f"ℹ️  보관 대상 {len(expired)}개 ({', '.join(name for name, _ in expired)}), --archive none 이므로 유지")
+        return
+
+    curs = conn.cursor()
+    for name, bound in expired:
+        curs.execute(f"SELECT COUNT(*) FROM {dependent_selects(name)['refund']} WHERE rf.ref_date IS NULL")
+        open_refunds = curs.fetchone()[0]
+        if open_refunds and not force:
+            print(f"⏭️  {name} (< {bound}) 건너뜀: 처리 전 반품 {open_refunds}건 (처리 후 다시 실행, 같이 보관하려면 --force)")
+            continue
+        print(f"🗄️  {name} (< {bound}) 보관 → {mode}" + (f" ⚠️ 처리 전 반품 {open_refunds}건 포함 (--force)" if open_refunds else ""))
+        if mode == 'table':
+            counts = archive_to_table(conn, name, dry_run)
+        else:
+            counts = archive_to_file(conn, name, archive_dir, dry_run)
+        execute(conn, f"ALTER TABLE {TABLE} DROP PARTITION {name}", dry_run)
+        print(f"   ✅ 구매 {counts[TABLE]}건, 수령 {counts['pickup']}건, 반품 {counts['refund']}건 보관")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="purchase_item 월 파티션 관리")
+    parser.add_argument('--init', action='store_true', help='일반 테이블을 월 파티션 테이블로 변환 (최초 1회)')
+    parser.add_argument('--ahead', type=int, default=3, help='미리 만들어 둘 미래 파티션 개월 수')
+    parser.add_argument('--retain', type=int, default=24, help='purchase_item에 남겨 둘 개월 수')
+    parser.add_argument('--archive', choices=['table', 'file', 'none'], default='table',
+                        help=f'보관 방식: {HISTORY_TABLE} 테이블 / gzip 파일 / 보관하지 않음')
+    parser.add_argument('--archive-dir', default='archive', help='--archive file 일 때 저장 폴더')
+    parser.add_argument('--dry-run', action='store_true', help='실행할 DDL만 출력')
+    parser.add_argument('--force', action='store_true', help='처리 전 반품(ref_date 없음)이 있는 파티션도 보관 + DROP')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"🧩 {TABLE} 파티션 관리 (ahead={args.ahead}, retain={args.retain}, archive={args.archive})")
+    print("=" * 60)
+    conn = connect_db()
+    try:
+        if args.init:
+            init_partitions(conn, args.ahead, args.dry_run)
+            return
+        if ensure_future_partitions(conn, args.ahead, args.dry_run):
+            archive_old_partitions(conn, args.retain, args.archive, args.archive_dir, args.dry_run, args.force)
+    except Exception as e:
+        print(f"❌ 에러 발생: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
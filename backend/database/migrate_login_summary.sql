@@ -0,0 +1,40 @@
+-- ============================================
+-- LoginSummary 도입 (기존 DB용 마이그레이션)
+-- ============================================
+--
+-- 변경 내용:
+--   1. LoginSummary 테이블 생성 (고객별 최신 로그인 상태 1행)
+--   2. LoginHistory 인덱스 변경
+--      - idx_login_history_cid_time (cid, loginTime): 고객별 최신 이력 조회 / 백필
+--      - idx_login_history_time (loginTime): 보존 기간 정리(prune_login_history.py)
+--      - idx_login_history_cid 는 (cid, loginTime) 인덱스가 대신하므로 제거
+--
+-- 실행 후:
+--   python database/backfill_login_summary.py   # 기존 이력으로 LoginSummary 채우기
+--
+-- 보존 정책:
+--   LoginHistory는 추가만 하는 이력이므로 prune_login_history.py로 오래된 행을 주기적으로 삭제한다.
+--   (MySQL 파티셔닝은 외래키가 있는 테이블에 사용할 수 없고 loginTime이 VARCHAR라
+--    RANGE 파티션 키로도 부적합하여, 인덱스 기반 batch 삭제 방식을 사용)
+-- ============================================
+
+USE shoes_store_db;
+
+CREATE TABLE IF NOT EXISTS LoginSummary (
+    cid INT PRIMARY KEY,
+    lastLoginTime VARCHAR(50),
+    lStatus VARCHAR(50),
+    lVersion DECIMAL(5,2),
+    lAddress VARCHAR(255),
+    lPaymentMethod VARCHAR(100),
+    loginCount INT NOT NULL DEFAULT 0,
+    updatedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (cid) REFERENCES Customer(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+ALTER TABLE LoginHistory
+    ADD INDEX idx_login_history_cid_time (cid, loginTime),
+    ADD INDEX idx_login_history_time (loginTime),
+    DROP INDEX idx_login_history_cid;
+
+SELECT 'LoginSummary migration completed!' AS Status;
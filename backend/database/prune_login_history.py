@@ -0,0 +1,61 @@
+"""
+LoginHistory 보존 기간 정리
+- loginTime이 기준일보다 오래된 이력을 batch 단위로 삭제 (batch마다 커밋 → 짧은 잠금)
+- 고객별 최신 상태와 누적 로그인 건수는 LoginSummary에 남아 있으므로 이력만 정리된다
+- cron 등으로 매일 실행
+
+사용법 (backend 폴더에서):
+    python database/prune_login_history.py                  # 365일 이전 이력 삭제
+    python database/prune_login_history.py --days 90
+    python database/prune_login_history.py --dry-run        # 삭제 대상 건수만 확인
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database.connection import connect_db
+
+
+def prune(days: int, batch: int, pause: float, dry_run: bool):
+    # loginTime은 'YYYY-MM-DD HH:MM' 형식 문자열이므로 문자열 비교로 기간 판단
+    cutoff = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M')
+    conn = connect_db()
+    curs = conn.cursor()
+    try:
+        curs.execute("SELECT COUNT(*) FROM LoginHistory WHERE loginTime < %s", (cutoff,))
+        target = curs.fetchone()[0]
+        print(f"LoginHistory 정리: {cutoff} 이전 {target}건 (보존 {days}일)")
+        if dry_run or target == 0:
+            return
+
+        deleted = 0
+        started = time.perf_counter()
+        while True:
+            curs.execute("DELETE FROM LoginHistory WHERE loginTime < %s LIMIT %s", (cutoff, batch))
+            conn.commit()
+            if curs.rowcount == 0:
+                break
+            deleted += curs.rowcount
+            print(f"  ✅ {deleted}/{target}건 삭제")
+            time.sleep(pause)   # 복제 지연/다른 쓰기와의 경합 완화
+        print(f"\n🎉 정리 완료: {deleted}건 삭제 ({time.perf_counter() - started:.1f}초)")
+    except Exception as e:
+        print(f"❌ 에러 발생: {e}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오래된 LoginHistory 삭제")
+    parser.add_argument('--days', type=int, default=365, help='보존 기간(일)')
+    parser.add_argument('--batch', type=int, default=5000, help='한 번에 삭제할 행 수')
+    parser.add_argument('--pause', type=float, default=0.1, help='batch 사이 대기(초)')
+    parser.add_argument('--dry-run', action='store_true', help='삭제 대상 건수만 출력')
+    args = parser.parse_args()
+    prune(args.days, args.batch, args.pause, args.dry_run)
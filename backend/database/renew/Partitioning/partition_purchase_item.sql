@@ -0,0 +1,95 @@
+/* =========================================================
+   purchase_item 월 단위 RANGE 파티션 준비
+   
+   - 거의 모든 조회가 최근 구매 (ORDER BY b_date DESC, 최근 N개월) 이므로
+     b_date 기준 월 파티션으로 나누면 오래된 파티션은 읽지 않는다 (partition pruning)
+   - 오래된 월은 파티션 단위로 purchase_item_history(압축)로 옮기고 DROP PARTITION
+     → 대량 DELETE 없이 즉시 정리
+     (그 월의 구매를 참조하는 pickup/refund 행은 pickup_history/refund_history 로 같이 옮김)
+   
+   MySQL 파티션 제약:
+   1) 파티션 테이블은 FOREIGN KEY를 가질 수도, 참조될 수도 없음
+      → fk_purchase_branch/user/product, fk_pickup_purchase 제거
+      → 참조 확인은 API가 대신 수행 (purchase_item.py references_exist, pickup.py purchase_exists)
+   2) 모든 UNIQUE/PK에 파티션 키가 포함되어야 함
+      → PRIMARY KEY (b_seq) → (b_seq, b_date)
+      → b_seq는 AUTO_INCREMENT이므로 여전히 유일
+   
+   실행 순서:
+     1) 이 파일 실행 (FK/PK/인덱스 변경 + history 테이블 생성)
+     2) python database/manage_purchase_item_partitions.py --init
+        (기존 데이터의 최소 월 ~ 현재 + 3개월로 파티션 생성)
+     3) 매일 cron: python database/manage_purchase_item_partitions.py
+========================================================= */
+
+USE shoes_shop_db;
+
+-- 1) purchase_item을 참조/참조하는 FOREIGN KEY 제거
+ALTER TABLE pickup
+  DROP FOREIGN KEY fk_pickup_purchase;
+
+ALTER TABLE purchase_item
+  DROP FOREIGN KEY fk_purchase_branch,
+  DROP FOREIGN KEY fk_purchase_user,
+  DROP FOREIGN KEY fk_purchase_product;
+
+-- 2) PK에 파티션 키 포함 + 최근 구매 조회용 인덱스
+--    (u_seq, b_date): 고객별 최근 주문 (by_user ... ORDER BY b_date DESC)
+--    (br_seq, b_date): 지점별 최근 주문
+ALTER TABLE purchase_item
+  DROP PRIMARY KEY,
+  ADD PRIMARY KEY (b_seq, b_date),
+  ADD INDEX idx_purchase_item_u_seq_date (u_seq, b_date),
+  ADD INDEX idx_purchase_item_br_seq_date (br_seq, b_date),
+  DROP INDEX idx_purchase_item_u_seq,
+  DROP INDEX idx_purchase_item_br_seq;
+
+-- 3) 보관 기간이 지난 구매 내역 (압축 저장, 조회 빈도 낮음)
+CREATE TABLE IF NOT EXISTS purchase_item_history (
+  b_seq       INT NOT NULL COMMENT '구매 고유 ID',
+  br_seq      INT NOT NULL COMMENT '수령 지점 ID',
+  u_seq       INT NOT NULL COMMENT '구매 고객 ID',
+  p_seq       INT NOT NULL COMMENT '구매 제품 ID',
+  b_price     INT DEFAULT 0 COMMENT '구매 당시 가격',
+  b_quantity  INT DEFAULT 1 COMMENT '구매 수량',
+  b_date      DATETIME NOT NULL COMMENT '구매 일시',
+  b_tnum      VARCHAR(100) COMMENT '결제 트랜잭션 번호',
+  b_status    VARCHAR(50) COMMENT '상품주문상태',
+  archived_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관 처리 일시',
+  
+  PRIMARY KEY (b_seq),
+  INDEX idx_purchase_item_history_u_seq_date (u_seq, b_date)
+) ENGINE=InnoDB ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8
+  DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='보관된 구매 내역';
+
+-- 4) 보관하는 구매를 참조하는 수령/반품 기록 (구매와 같이 옮김, FK 없음)
+CREATE TABLE IF NOT EXISTS pickup_history (
+  pic_seq     INT NOT NULL COMMENT '수령 고유 ID',
+  b_seq       INT NOT NULL COMMENT '구매 ID',
+  u_seq       INT NOT NULL COMMENT '고객 번호',
+  created_at  DATETIME NOT NULL COMMENT '수령 완료 일시',
+  archived_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관 처리 일시',
+  
+  PRIMARY KEY (pic_seq),
+  INDEX idx_pickup_history_b_seq (b_seq)
+) ENGINE=InnoDB ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8
+  DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='보관된 수령 기록';
+
+CREATE TABLE IF NOT EXISTS refund_history (
+  ref_seq        INT NOT NULL COMMENT '반품 고유 ID',
+  ref_date       DATETIME COMMENT '반품 처리 일시',
+  ref_reason     VARCHAR(255) COMMENT '반품 사유',
+  ref_re_seq     INT COMMENT '반품 사유 번호',
+  ref_re_content VARCHAR(255) COMMENT '반품 사유 내용',
+  u_seq          INT NOT NULL COMMENT '반품 요청 고객 ID',
+  s_seq          INT NOT NULL COMMENT '반품 처리 직원 ID',
+  pic_seq        INT NOT NULL COMMENT '수령 ID',
+  archived_at    DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '보관 처리 일시',
+  
+  PRIMARY KEY (ref_seq),
+  INDEX idx_refund_history_pic_seq (pic_seq)
+) ENGINE=InnoDB ROW_FORMAT=COMPRESSED KEY_BLOCK_SIZE=8
+  DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='보관된 반품 기록';
+
+-- 확인
+SHOW CREATE TABLE purchase_item;
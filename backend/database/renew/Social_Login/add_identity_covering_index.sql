@@ -0,0 +1,28 @@
+/* =========================================================
+   user_auth_identities 로그인 조회용 커버링 인덱스
+   
+   대상 쿼리 (app_new_form/api/auth.py social_login):
+     SELECT u.* FROM user_auth_identities a
+     JOIN user u ON u.u_seq = a.u_seq
+     WHERE a.provider = ? AND a.provider_subject = ?
+   
+   - idx_provider_subject (provider, provider_subject) UNIQUE 는 그대로 유지 (중복 가입 방지)
+   - (provider, provider_subject, u_seq) 인덱스만 읽고 user PK로 바로 JOIN
+     → identity 행(클러스터 인덱스) 추가 조회 없음
+   - idx_user_auth_provider (provider) 는 위 인덱스들의 선두 컬럼과 겹치므로 제거
+   
+   실행 후 EXPLAIN 에서 a 테이블 Extra = 'Using index' 확인
+========================================================= */
+
+USE shoes_shop_db;
+
+ALTER TABLE user_auth_identities
+  ADD INDEX idx_provider_subject_user (provider, provider_subject, u_seq),
+  DROP INDEX idx_user_auth_provider;
+
+-- 확인
+EXPLAIN
+SELECT u.u_seq, u.u_name, u.u_email, u.u_phone, u.u_address, u.registration_completed
+FROM user_auth_identities a
+JOIN user u ON u.u_seq = a.u_seq
+WHERE a.provider = 'google' AND a.provider_subject = 'test-subject';
@@ -0,0 +1,32 @@
+/* =========================================================
+   product 목록/썸네일 조회용 커버링 인덱스 (fields= sparse fieldset)
+   
+   대상 쿼리 (app_new_form/api/product.py, fields=p_name,p_price,p_image):
+     SELECT p_seq, m_seq, p_name, p_price, p_image FROM product WHERE m_seq = ? ORDER BY p_seq
+     SELECT p_seq, m_seq, p_name, p_price, p_image FROM product ORDER BY p_seq
+   
+   - (m_seq, p_name, p_price, p_image) + InnoDB 보조 인덱스에 포함되는 PK(p_seq)
+     → 목록 화면 컬럼만 요청하면 p_description(TEXT)이 있는 클러스터 인덱스를 읽지 않음
+   - idx_product_m_seq (m_seq) 는 새 인덱스의 선두 컬럼과 겹치므로 제거
+     (fk_product_maker 는 새 인덱스를 사용)
+   
+   실행 후 EXPLAIN 에서 key = idx_product_maker_list, Extra = 'Using index; Using filesort' 확인
+   - Using index: 인덱스만 읽음 (클러스터 인덱스/TEXT 컬럼 접근 없음)
+   - Using filesort: 인덱스 안에서는 m_seq 다음이 p_name 순서라 ORDER BY p_seq 는 정렬이 필요
+     (정렬 대상은 제조사 1곳의 제품 행뿐이므로 메모리 정렬)
+   - WHERE 없는 전체 목록(ORDER BY p_seq)은 옵티마이저가 PK 순서 스캔을 고를 수 있음 (정렬 없음, 커버링 아님)
+   fields 에 인덱스 밖 컬럼(p_description, p_stock 등)이 있으면 기존처럼 PK 조회
+========================================================= */
+
+USE shoes_shop_db;
+
+ALTER TABLE product
+  ADD INDEX idx_product_maker_list (m_seq, p_name, p_price, p_image),
+  DROP INDEX idx_product_m_seq;
+
+-- 확인
+EXPLAIN
+SELECT p_seq, m_seq, p_name, p_price, p_image
+FROM product
+WHERE m_seq = 1
+ORDER BY p_seq;
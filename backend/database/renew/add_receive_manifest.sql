@@ -0,0 +1,28 @@
+/* =========================================================
+   입고 명세서(manifest) 일괄 처리용 테이블/컬럼
+   
+   대상 API (app_new_form/api/receive.py process_manifest):
+     POST /api/receives/manifest/process  {"manifest_id": "...", "s_seq": 1, "items": [...]}
+   
+   - receive_manifest: 처리한 명세서 1건당 1행 (manifest_id PK)
+     → 같은 manifest_id 재전송(네트워크 재시도 등)은 PK 중복으로 걸러서 재고를 두 번 올리지 않음
+   - receive.manifest_id: 어떤 명세서로 입고된 행인지 (명세서별 입고 내역 조회)
+========================================================= */
+
+USE shoes_shop_db;
+
+CREATE TABLE receive_manifest (
+  manifest_id    VARCHAR(64) NOT NULL PRIMARY KEY COMMENT '입고 명세서 ID (클라이언트/납품업체 발급, 멱등 키)',
+  s_seq          INT NOT NULL COMMENT '입고 처리 직원 ID(FK)',
+  line_count     INT NOT NULL DEFAULT 0 COMMENT '처리한 입고 행 수',
+  total_quantity INT NOT NULL DEFAULT 0 COMMENT '총 입고 수량',
+  processed_at   DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '처리 일시',
+  
+  CONSTRAINT fk_receive_manifest_staff
+    FOREIGN KEY (s_seq) REFERENCES staff(s_seq)
+    ON DELETE RESTRICT ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='입고 명세서 처리 기록 (멱등 처리)';
+
+ALTER TABLE receive
+  ADD COLUMN manifest_id VARCHAR(64) NULL COMMENT '입고 명세서 ID (일괄 입고 시)' AFTER m_seq,
+  ADD INDEX idx_receive_manifest_id (manifest_id);
@@ -0,0 +1,53 @@
+/* =========================================================
+   request 결재 상태 컬럼 (req_state) + 결재함 조회 인덱스
+   
+   상태 전이 (app_new_form/api/request.py REQUEST_TRANSITIONS):
+     pending ──팀장 결재──▶ manager_approved ──이사 결재──▶ director_approved
+        └──────────┴──반려──▶ rejected
+   
+   대상 쿼리 (app_new_form/api/request_join.py get_requests_by_status):
+     ... WHERE req.req_state = ?
+           AND (req.req_date < ? OR (req.req_date = ? AND req.req_seq < ?))
+         ORDER BY req.req_date DESC, req.req_seq DESC LIMIT ?
+   
+   - 기존: req_manappdate / req_dirappdate IS NULL 조합 조건 → 인덱스로 처리 불가 (전체 스캔 + filesort)
+   - (req_state, req_date) + InnoDB 보조 인덱스에 포함되는 PK(req_seq)
+     → 상태별 결재함이 인덱스 범위 스캔 (정렬 없음, keyset 페이지 이동도 같은 범위 스캔)
+   - keyset 비교를 위해 req_date 를 NOT NULL 로 변경 (NULL 은 결재 일시 또는 현재 시각으로 채움)
+   - idx_request_req_manappdate / idx_request_req_dirappdate 는 더 이상 쓰는 조회가 없으므로 제거
+   
+   실행 후 EXPLAIN 에서 type = 'range' 또는 'ref', key = idx_request_state_date 확인
+========================================================= */
+
+USE shoes_shop_db;
+
+-- 1. 컬럼 추가
+ALTER TABLE request
+  ADD COLUMN req_state ENUM('pending', 'manager_approved', 'director_approved', 'rejected')
+    NOT NULL DEFAULT 'pending' COMMENT '결재 상태' AFTER req_dirappdate;
+
+-- 2. 기존 결재 일시로 상태 채우기
+UPDATE request
+SET req_state = CASE
+      WHEN req_dirappdate IS NOT NULL THEN 'director_approved'
+      WHEN req_manappdate IS NOT NULL THEN 'manager_approved'
+      ELSE 'pending'
+    END,
+    req_date = COALESCE(req_date, req_manappdate, req_dirappdate, NOW());
+
+-- 3. req_date NOT NULL + 인덱스 교체
+ALTER TABLE request
+  MODIFY COLUMN req_date DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '발주 요청 일시',
+  ADD INDEX idx_request_state_date (req_state, req_date),
+  DROP INDEX idx_request_req_manappdate,
+  DROP INDEX idx_request_req_dirappdate;
+
+-- 확인
+SELECT req_state, COUNT(*) FROM request GROUP BY req_state;
+
+EXPLAIN
+SELECT req_seq, req_date
+FROM request
+WHERE req_state = 'pending'
+ORDER BY req_date DESC, req_seq DESC
+LIMIT 50;
@@ -183,7 +183,7 @@ CREATE TABLE product (
     ON DELETE RESTRICT ON UPDATE CASCADE,
   
   INDEX idx_product_p_name (p_name),
-  INDEX idx_product_m_seq (m_seq),
+  INDEX idx_product_maker_list (m_seq, p_name, p_price, p_image),  -- 목록 조회 커버링 인덱스 (fields=)
   INDEX idx_product_kc_seq (kc_seq),
   INDEX idx_product_cc_seq (cc_seq),
   INDEX idx_product_sc_seq (sc_seq),
@@ -291,6 +291,7 @@ CREATE TABLE receive (
   s_seq        INT NOT NULL COMMENT '입고 처리 직원 ID(FK)',
   p_seq        INT NOT NULL COMMENT '입고 제품 ID(FK)',
   m_seq        INT NOT NULL COMMENT '제조사 ID(FK)',
+  manifest_id  VARCHAR(64) NULL COMMENT '입고 명세서 ID (일괄 입고 시)',
   
   CONSTRAINT fk_receive_staff  
     FOREIGN KEY (s_seq) REFERENCES staff(s_seq)
@@ -305,20 +306,39 @@ CREATE TABLE receive (
   INDEX idx_receive_s_seq (s_seq),
   INDEX idx_receive_p_seq (p_seq),
   INDEX idx_receive_m_seq (m_seq),
-  INDEX idx_receive_rec_date (rec_date)
+  INDEX idx_receive_rec_date (rec_date),
+  INDEX idx_receive_manifest_id (manifest_id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='제조사 입고 처리';
 
+/* =========================================================
+   RECEIVE_MANIFEST : 입고 명세서 처리 기록 (일괄 입고 멱등 처리)
+========================================================= */
+DROP TABLE IF EXISTS receive_manifest;
+CREATE TABLE receive_manifest (
+  manifest_id    VARCHAR(64) NOT NULL PRIMARY KEY COMMENT '입고 명세서 ID (클라이언트/납품업체 발급, 멱등 키)',
+  s_seq          INT NOT NULL COMMENT '입고 처리 직원 ID(FK)',
+  line_count     INT NOT NULL DEFAULT 0 COMMENT '처리한 입고 행 수',
+  total_quantity INT NOT NULL DEFAULT 0 COMMENT '총 입고 수량',
+  processed_at   DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '처리 일시',
+  
+  CONSTRAINT fk_receive_manifest_staff
+    FOREIGN KEY (s_seq) REFERENCES staff(s_seq)
+    ON DELETE RESTRICT ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='입고 명세서 처리 기록 (멱등 처리)';
+
 /* =========================================================
    REQUEST : 발주/품의
 ========================================================= */
 DROP TABLE IF EXISTS request;
 CREATE TABLE request (
   req_seq        INT AUTO_INCREMENT PRIMARY KEY COMMENT '발주/품의 고유 ID(PK)',
-  req_date       DATETIME COMMENT '발주 요청 일시',
+  req_date       DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '발주 요청 일시',
   req_content    TEXT COMMENT '발주 내용',
   req_quantity   INT DEFAULT 0 COMMENT '발주 수량',
   req_manappdate DATETIME COMMENT '팀장 결재 일시',
   req_dirappdate DATETIME COMMENT '이사 결재 일시',
+  req_state      ENUM('pending', 'manager_approved', 'director_approved', 'rejected')
+                 NOT NULL DEFAULT 'pending' COMMENT '결재 상태',
   s_seq          INT NOT NULL COMMENT '발주 요청 직원 ID(FK)',
   p_seq          INT NOT NULL COMMENT '발주 제품 ID(FK)',
   m_seq          INT NOT NULL COMMENT '제조사 ID(FK)',
@@ -338,7 +358,6 @@ CREATE TABLE request (
   INDEX idx_request_p_seq (p_seq),
   INDEX idx_request_m_seq (m_seq),
   INDEX idx_request_req_date (req_date),
-  INDEX idx_request_req_manappdate (req_manappdate),
-  INDEX idx_request_req_dirappdate (req_dirappdate)
+  INDEX idx_request_state_date (req_state, req_date)  -- 결재 상태별 목록 (keyset 페이지)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='재고 부족 시 발주/품의 기록';
 
@@ -4,6 +4,7 @@
 
 -- Drop existing tables if they exist (in reverse dependency order)
 SET FOREIGN_KEY_CHECKS = 0;
+DROP TABLE IF EXISTS LoginSummary;
 DROP TABLE IF EXISTS LoginHistory;
 DROP TABLE IF EXISTS PurchaseItem;
 DROP TABLE IF EXISTS Purchase;
@@ -141,6 +142,23 @@ CREATE TABLE LoginHistory (
     lAddress VARCHAR(255),
     lPaymentMethod VARCHAR(100),
     FOREIGN KEY (cid) REFERENCES Customer(id) ON DELETE CASCADE,
-    INDEX idx_login_history_cid (cid)
+    INDEX idx_login_history_cid_time (cid, loginTime),
+    INDEX idx_login_history_time (loginTime)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================
+-- LoginSummary (고객별 최신 로그인 상태, 고객당 1행)
+-- ============================================
+-- LoginHistory는 추가만 하는 이력, 상태 변경/최신 로그인 조회는 이 테이블에서 O(1)
+CREATE TABLE LoginSummary (
+    cid INT PRIMARY KEY,
+    lastLoginTime VARCHAR(50),
+    lStatus VARCHAR(50),
+    lVersion DECIMAL(5,2),
+    lAddress VARCHAR(255),
+    lPaymentMethod VARCHAR(100),
+    loginCount INT NOT NULL DEFAULT 0,
+    updatedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (cid) REFERENCES Customer(id) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 